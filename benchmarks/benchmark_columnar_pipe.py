@@ -0,0 +1,86 @@
+"""
+Benchmark of the memory held by a batch of preprocessed, VADER-scored and LDA-modelled posts, as a
+list of dicts in a Pipe against columns in a ColumnarPipe.
+
+LDA needs the spaCy and NLTK resources (see `python -m datamanagement.provision`).
+
+Run from the repository root:
+    python -m benchmarks.benchmark_columnar_pipe [post_count]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.datamanagement.filters import ColumnarPipe, Pipe, PreprocessingFilter, TokenizationFilter
+from src.datamanagement.transformationmodels.lda_topic_modeling import LDATopicModeling
+from src.datamanagement.transformationmodels.vader_sentiment_analysis import VaderSentimentAnalysis
+
+WORDS = ["the", "market", "is", "Crashing!", "I", "love", "this", "stock", "and", "it's", "going", "to",
+         "the", "moon...", "not", "sure", "about", "that", "#yolo", "what", "a", "great", "day"]
+
+
+def generate_posts(post_count, seed=42):
+    generator = random.Random(seed)
+
+    def text(word_count):
+        return " ".join(generator.choice(WORDS) for _ in range(word_count))
+
+    return [
+        {
+            "_id": f"{index:024x}",
+            "subreddit": "stocks",
+            "created_utc": 1700000000.0 + index,
+            "title": text(10),
+            "selftext": text(40),
+            "comments": [text(generator.randint(5, 30)) for _ in range(generator.randint(0, 10))]
+        }
+        for index in range(post_count)
+    ]
+
+
+def run(pipe, post_count):
+    # The raw posts are only referenced by the pipe, as when they are loaded from the source
+    pipe.set_data(generate_posts(post_count))
+    PreprocessingFilter(tokenization_filter=TokenizationFilter(backend='fast')).execute(pipe)
+
+    # The LDA models of every run are seeded alike through NumPy's global random state
+    np.random.seed(42)
+    for model in (VaderSentimentAnalysis(), LDATopicModeling(passes=2, corpus_mode=True)):
+        if isinstance(pipe, ColumnarPipe):
+            pipe.set_columns(model.apply_columns(pipe.get_columns()))
+        else:
+            pipe.set_data(model.apply(pipe.get_data()))
+    return pipe
+
+
+def measure(pipe_class, post_count):
+    # Time without tracing, then trace a second run for the memory still held by the pipe
+    start = time.perf_counter()
+    pipe = run(pipe_class(), post_count)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    traced_pipe = run(pipe_class(), post_count)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced_pipe
+
+    return pipe, elapsed, held, peak
+
+
+def main(post_count=5_000):
+    dict_pipe, dict_time, dict_held, dict_peak = measure(Pipe, post_count)
+    columnar_pipe, columnar_time, columnar_held, columnar_peak = measure(ColumnarPipe, post_count)
+
+    print(f"posts: {post_count}")
+    print(f"dicts:    held {dict_held / 2 ** 20:.1f} MiB, peak {dict_peak / 2 ** 20:.1f} MiB ({dict_time:.2f}s)")
+    print(f"columnar: held {columnar_held / 2 ** 20:.1f} MiB, peak {columnar_peak / 2 ** 20:.1f} MiB "
+          f"({columnar_time:.2f}s)")
+    print(f"identical output: {columnar_pipe.get_data() == dict_pipe.get_data()}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
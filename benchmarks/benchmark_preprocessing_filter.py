@@ -0,0 +1,78 @@
+"""
+Benchmark of the three-filter preprocessing sequence against the fused PreprocessingFilter,
+with the 'nltk' and 'fast' tokenizer backends, on comment-heavy posts.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_preprocessing_filter [post_count]
+"""
+import copy
+import random
+import sys
+import time
+import tracemalloc
+
+from src.datamanagement.filters import (Pipe, PreprocessingFilter, TextCleaningFilter, TokenizationFilter,
+                                        StopWordFilter)
+
+WORDS = ["the", "market", "is", "Crashing!", "I", "love", "this", "stock", "and", "it's", "going", "to",
+         "the", "moon...", "not", "sure", "about", "that", "#yolo", "what", "a", "great", "day"]
+
+
+def generate_posts(post_count, seed=42):
+    generator = random.Random(seed)
+
+    def text(word_count):
+        return " ".join(generator.choice(WORDS) for _ in range(word_count))
+
+    return [
+        {
+            "title": text(10),
+            "selftext": text(60),
+            "comments": [text(generator.randint(5, 40)) for _ in range(generator.randint(20, 100))]
+        }
+        for _ in range(post_count)
+    ]
+
+
+def run(filters, posts):
+    pipe = Pipe()
+    pipe.set_data(copy.deepcopy(posts))
+    for pipe_filter in filters:
+        pipe_filter.execute(pipe)
+    return pipe.get_data()
+
+
+def measure(filters, posts):
+    # Time without tracing, then trace a second run for the peak allocations
+    start = time.perf_counter()
+    data = run(filters, posts)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run(filters, posts)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return data, elapsed, peak
+
+
+def main(post_count=1_000):
+    posts = generate_posts(post_count)
+    cleaning_filter, tokenization_filter, stopword_filter = TextCleaningFilter(), TokenizationFilter(), StopWordFilter()
+
+    sequence_data, sequence_time, sequence_peak = measure(
+        [cleaning_filter, tokenization_filter, stopword_filter], posts)
+    fused_data, fused_time, fused_peak = measure(
+        [PreprocessingFilter(cleaning_filter, tokenization_filter, stopword_filter)], posts)
+    fast_data, fast_time, fast_peak = measure(
+        [PreprocessingFilter(cleaning_filter, TokenizationFilter(backend='fast'), stopword_filter)], posts)
+
+    print(f"posts: {post_count}")
+    print(f"sequence: {sequence_time:.3f}s, peak {sequence_peak / 2 ** 20:.1f} MiB")
+    print(f"fused:    {fused_time:.3f}s, peak {fused_peak / 2 ** 20:.1f} MiB")
+    print(f"fast:     {fast_time:.3f}s, peak {fast_peak / 2 ** 20:.1f} MiB")
+    print(f"identical output: {fused_data == sequence_data and fast_data == sequence_data}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
@@ -0,0 +1,57 @@
+"""
+Benchmark of the scalar and vectorized paths of the WeightedAggregator.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_weighted_aggregator [post_count]
+"""
+import random
+import sys
+import time
+
+from src.dataanalysis.aggregator import WeightedAggregator
+from src.dataanalysis.normalizer import RedditResultNormalizer, VADERNormalizer, TextBlobNormalizer
+
+MODEL_KEYS = ["vader", "textblob"]
+WEIGHTS = {
+    "vader": {"title_sentiment": 0.3, "selftext_sentiment": 0.2, "comments_sentiment": 0.5},
+    "textblob": {"title_sentiment": 0.4, "selftext_sentiment": 0.4, "comments_sentiment": 0.2},
+    "model_weights": {"vader": 0.6, "textblob": 0.4}
+}
+
+
+def generate_posts(post_count, seed=42):
+    generator = random.Random(seed)
+
+    def model_output():
+        return {
+            "title_sentiment": generator.uniform(-1, 1),
+            "selftext_sentiment": generator.uniform(-1, 1),
+            "comments_sentiment": [generator.uniform(-1, 1) for _ in range(generator.randint(0, 20))]
+        }
+
+    return [{"model_output": {model: model_output() for model in MODEL_KEYS}} for _ in range(post_count)]
+
+
+def main(post_count=100_000):
+    posts = generate_posts(post_count)
+    normalizer = RedditResultNormalizer({"vader": VADERNormalizer(), "textblob": TextBlobNormalizer()})
+    strategies = {model: normalizer.model_normalizers[model].strategy for model in MODEL_KEYS}
+    aggregator = WeightedAggregator()
+
+    start = time.perf_counter()
+    scalar_scores = [aggregator.aggregate(normalizer.normalize(post), MODEL_KEYS, WEIGHTS) for post in posts]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_scores = aggregator.aggregate_batch(posts, MODEL_KEYS, WEIGHTS, strategies)
+    batch_time = time.perf_counter() - start
+
+    max_difference = max(abs(a - b) for a, b in zip(scalar_scores, batch_scores.tolist()))
+    print(f"posts: {post_count}")
+    print(f"scalar: {scalar_time:.3f}s")
+    print(f"batch:  {batch_time:.3f}s ({scalar_time / batch_time:.1f}x)")
+    print(f"max difference: {max_difference:.3g}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
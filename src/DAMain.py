@@ -1,7 +1,23 @@
+import os
 from datetime import datetime
 from dataanalysis.data_analysis import DataAnalysis
+from dataanalysis.dataclient import DataClientManager
+from dataanalysis.date_range import get_timezone
 
-da = DataAnalysis()
-da.execute(update_type='daily')
-if datetime.now().day == 1:
-    da.execute(update_type='monthly')
\ No newline at end of file
+
+def main():
+    # Optional: number of indicators processed concurrently, and of processes the aggregation of posts is spread over
+    max_workers = int(os.getenv("DA_MAX_WORKERS", "1"))
+    aggregation_processes = int(os.getenv("DA_AGGREGATION_PROCESSES", "0"))
+
+    da = DataAnalysis(max_workers=max_workers, aggregation_processes=aggregation_processes)
+    da.execute(update_type='daily')
+    if datetime.now(get_timezone()).day == 1:
+        da.execute(update_type='monthly')
+    da.close()
+    DataClientManager.close_all_clients()
+
+
+# Worker processes are spawned from a fresh interpreter that imports this module, so only run it as a script
+if __name__ == '__main__':
+    main()
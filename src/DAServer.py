@@ -3,6 +3,7 @@ import grpc
 import da_dv_pb2
 import da_dv_pb2_grpc
 from dataanalysis.data_analysis import DataAnalysis
+from dataanalysis.dataclient import DataClientManager
 
 class RecalculateIndicator(da_dv_pb2_grpc.RecalculateIndicatorServicer):
     def __init__(self):
@@ -25,7 +26,10 @@ def serve():
     da_dv_pb2_grpc.add_RecalculateAggregateServicer_to_server(RecalculateAggregate(), server)
     server.add_insecure_port('[::]:50051')
     server.start()
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        DataClientManager.close_all_clients()
 
 if __name__ == '__main__':
     print("Starting DAServer...")
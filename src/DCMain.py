@@ -1,10 +1,26 @@
+import os
 import time
 
 from datacollection.DataCollectionManager import DataCollectionManager
 
+# Optional: subreddits to poll continuously with their polling interval in seconds, e.g. "singapore=300,stocks=120"
+subreddits = os.getenv("DC_SUBREDDITS")
+# Polling interval of the subreddits listed without one
+defaultInterval = float(os.getenv("DC_DEFAULT_INTERVAL", "300"))
+
 start_time = time.time()
 
 dataCollectionManager = DataCollectionManager()
-dataCollectionManager.getLatestSubredditData("singapore")
+if subreddits:
+    subredditIntervals = {}
+    for entry in subreddits.split(","):
+        subreddit, _, interval = entry.strip().partition("=")
+        subredditIntervals[subreddit] = float(interval) if interval else defaultInterval
+    try:
+        dataCollectionManager.scheduleSubredditData(subredditIntervals)
+    except KeyboardInterrupt:
+        print("Data collection stopped after: " + str(time.time() - start_time) + "s")
+else:
+    dataCollectionManager.getLatestSubredditData("singapore")
 
-print("Data collection cycle successfully completed in: " + str(time.time() - start_time) + "s")
\ No newline at end of file
+    print("Data collection cycle successfully completed in: " + str(time.time() - start_time) + "s")
@@ -1,38 +1,88 @@
+import argparse
 import os
 from dotenv import load_dotenv
 
 from datamanagement import ELT
-from datamanagement.dataclient import DataClientConfig
-
-# Load environment variables from the .env file
-load_dotenv()
-
-# Extract variables from .env
-mongo_uri = os.getenv("MONGODB_URI")
-database_name = os.getenv("DATABASE_NAME")
-source_collection = os.getenv("SOURCE_COLLECTION")
-target_collection = os.getenv("TARGET_COLLECTION")
-
-# Create source and target DataClientConfig objects
-source_db_config = DataClientConfig(
-    db_type="mongodb", 
-    uri=mongo_uri, 
-    db_name=database_name, 
-    collection=source_collection
-)
-
-target_db_config = DataClientConfig(
-    db_type="mongodb", 
-    uri=mongo_uri, 
-    db_name=database_name, 
-    collection=target_collection
-)
-
-# Example transformationss
-transformations = ['vader', 'textblob', 'lda']
-
-# Initialize the ELT process with source_db and target_db
-elt_process = ELT(source_db=source_db_config, target_db=target_db_config, transformations=transformations)
-
-# Execute the ELT process
-elt_process.execute()
\ No newline at end of file
+from datamanagement.dataclient import DataClientConfig, DataClientManager
+from datamanagement.resources import resource_manager, ResourceUnavailableError
+from datamanagement.transformationmodels import SQLiteSentimentStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the Data Management ELT process.")
+    parser.add_argument("--full-rebuild", action="store_true",
+                        help="Reprocess the entire source collection instead of only the posts added since the last run, "
+                             "rebuilding the daily sentiment rollups from scratch. Run it once after enabling the "
+                             "rollups, so that they cover the posts stored before (until then, the Data Analysis "
+                             "module aggregates the posts of earlier days instead).")
+    args = parser.parse_args()
+
+    # Load environment variables from the .env file
+    load_dotenv()
+
+    # Extract variables from .env
+    mongo_uri = os.getenv("MONGODB_URI")
+    database_name = os.getenv("DATABASE_NAME")
+    source_collection = os.getenv("SOURCE_COLLECTION")
+    target_collection = os.getenv("TARGET_COLLECTION")
+    # Optional: stream the source collection in batches of this size instead of loading it all at once
+    batch_size = int(os.getenv("BATCH_SIZE")) if os.getenv("BATCH_SIZE") else None
+    # Field used as the high-water mark for incremental runs (e.g. '_id' or 'created_utc')
+    watermark_field = os.getenv("WATERMARK_FIELD", "_id")
+    # Optional: path of the corpus-level LDA model, which is updated by every run instead of training a model per post
+    lda_model_path = os.getenv("LDA_MODEL_PATH")
+    # Optional: number of worker processes the posts are sharded across during the transformation
+    processes = int(os.getenv("ELT_PROCESSES")) if os.getenv("ELT_PROCESSES") else None
+    # Optional: path of the SQLite database persisting the VADER and TextBlob scores between runs
+    sentiment_cache_path = os.getenv("SENTIMENT_CACHE_PATH")
+    # Optional: process the selected posts as one batch in columnar form, e.g. to fit millions of posts in memory
+    columnar = os.getenv("ELT_COLUMNAR", "").lower() in ("1", "true", "yes")
+
+    # In offline mode, fail before loading any data if a resource was not provisioned
+    missing_resources = resource_manager.missing() if resource_manager.offline else []
+    if missing_resources:
+        raise ResourceUnavailableError(f"Missing resources {missing_resources}, "
+                                       "provision them with 'python -m datamanagement.provision'.")
+
+    # Create source and target DataClientConfig objects
+    source_db_config = DataClientConfig(
+        db_type="mongodb", 
+        uri=mongo_uri, 
+        db_name=database_name, 
+        collection=source_collection
+    )
+
+    target_db_config = DataClientConfig(
+        db_type="mongodb", 
+        uri=mongo_uri, 
+        db_name=database_name, 
+        collection=target_collection
+    )
+
+    # Example transformationss
+    transformations = ['vader', 'textblob', 'lda']
+    model_options = {}
+    # With a corpus LDA model, TF-IDF filtering uses the document frequencies of all posts, persisted next to it
+    if lda_model_path:
+        model_options['lda'] = {'corpus_mode': True, 'model_path': lda_model_path, 'passes': 5,
+                                'corpus_tfidf': True, 'tfidf_path': f"{lda_model_path}.tfidf"}
+    if sentiment_cache_path:
+        model_options['vader'] = {'cache_store': SQLiteSentimentStore(sentiment_cache_path)}
+        model_options['textblob'] = {'cache_store': SQLiteSentimentStore(sentiment_cache_path)}
+
+    # Initialize the ELT process with source_db and target_db, keeping daily sentiment rollups bucketed in the timezone named
+    # by TIMEZONE (e.g. 'Asia/Singapore', UTC if not set), which must match the Data Analysis module's
+    elt_process = ELT(source_db=source_db_config, target_db=target_db_config, transformations=transformations,
+                      batch_size=batch_size, incremental=True, watermark_field=watermark_field, rollups=True,
+                      model_options=model_options, processes=processes, columnar=columnar)
+
+    # Execute the ELT process, only processing new posts unless a full rebuild is requested
+    elt_process.execute(full_rebuild=args.full_rebuild)
+
+    # Close the shared database connection pools
+    DataClientManager.close_all_clients()
+
+
+# Worker processes are spawned from a fresh interpreter that imports this module, so only run it as a script
+if __name__ == '__main__':
+    main()
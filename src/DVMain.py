@@ -6,6 +6,7 @@ import da_dv_pb2_grpc
 from typing import List
 from fastapi import FastAPI, HTTPException, Query
 from datavisualisation import DataVisualisationAPI
+from datavisualisation.dataclient import DataClientManager
 from custom_types import AggregateData, IndicatorData
 
 app = FastAPI()
@@ -15,6 +16,10 @@ dvapi = DataVisualisationAPI()
 grpc_server_address = os.getenv("GRPC_SERVER_ADDRESS", "localhost:50051")
 print(grpc_server_address)
 
+@app.on_event("shutdown")
+def close_database_clients():
+    DataClientManager.close_all_clients()
+
 @app.get("/getmodeldescription", response_model=str)
 def get_model_description(name: str):
     models = dvapi.get_models()
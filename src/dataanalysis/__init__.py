@@ -1,4 +1,4 @@
 from .data_analysis import DataAnalysis
 from .date_range import DateRange
 from .normalizer import ModelNormalizer, NormalizationStrategy, RedditResultNormalizer, ResultNormalizer
-from .aggregator import OverallAggregator, WeightedAggregator
\ No newline at end of file
+from .aggregator import OverallAggregator, WeightedAggregator, PipelineAggregator
\ No newline at end of file
@@ -1,2 +1,4 @@
 from .weighted_aggregator import WeightedAggregator
-from .overall_aggregator import OverallAggregator
\ No newline at end of file
+from .overall_aggregator import OverallAggregator, PostCache
+from .pipeline_aggregator import PipelineAggregator
+from .rollup_aggregator import RollupAggregator
\ No newline at end of file
@@ -1,11 +1,105 @@
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
-from ..date_range import DateRange
+from ..date_range import DateRange, get_timezone
 from ..normalizer import ResultNormalizer
+from ..normalizer.normalization_strategy import MinMaxNormalizationStrategy, NormalizationStrategy
 from .weighted_aggregator import WeightedAggregator
 
+# Number of posts aggregated by a worker process at a time
+DEFAULT_PROCESS_CHUNK_SIZE = 10000
+# Maximum number of posts kept by a PostCache
+DEFAULT_POST_CACHE_SIZE = 200000
+# Fields of the precomputed normalized scores of a model that are not scores, see the Data Management
+# module's ScoreNormalizer
+COMMENTS_COUNT_FIELD = 'comments_count'
+SCORE_RANGE_FIELD = 'score_range'
+
+
+def aggregate_posts(result_normalizer: ResultNormalizer, weighted_aggregator: WeightedAggregator,
+                    posts: List[Dict], model_keys: List[str], weights: Dict[str, Dict[str, float]]) -> List[float]:
+    """
+    Aggregates the sentiment scores of posts in a worker process.
+
+    :param result_normalizer: ResultNormalizer instance that normalizes sentiment data for each post.
+    :param weighted_aggregator: WeightedAggregator instance to combine the model averages into a final score.
+    :param posts: A list of dictionaries representing posts with sentiment data from multiple models.
+    :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+    :param weights: Dictionary of weights for each model's components and overall model weights.
+    :return: The aggregated sentiment score of each post, in the order of the posts.
+    """
+    aggregator = OverallAggregator(None, result_normalizer, weighted_aggregator)
+    aggregator.debug = False
+    return aggregator.process_posts(posts, model_keys, weights)
+
+
+class PostCache:
+    """
+    Thread-safe cache of the posts loaded for each keyword set, e.g. during an update of many indicators.
+    The posts of a keyword set are filtered from the cached posts of a subset of the keywords if there are any.
+
+    Up to `max_posts` posts are kept in total, evicting the least recently used keyword sets first.
+    """
+
+    def __init__(self, max_posts: int = DEFAULT_POST_CACHE_SIZE):
+        """
+        Initializes the PostCache with the maximum number of posts it keeps.
+
+        :param max_posts: The maximum number of posts kept over all keyword sets.
+        """
+        if max_posts <= 0:
+            raise ValueError(f"max_posts must be a positive integer, got {max_posts}")
+
+        self.max_posts = max_posts
+        self.entries = OrderedDict()
+        self.post_count = 0
+        self.lock = threading.Lock()
+
+    def get(self, keywords: Tuple[str, ...]) -> Optional[List[Dict]]:
+        """
+        Retrieves the cached posts of a keyword set.
+
+        :param keywords: The sorted lowercase keywords that a post must all contain.
+        :return: The posts containing all keywords, or None if neither they nor the posts of a subset are cached.
+        """
+        with self.lock:
+            if keywords in self.entries:
+                self.entries.move_to_end(keywords)
+                return self.entries[keywords]
+
+            subset_posts = next((cached_posts for cached_key, cached_posts in self.entries.items()
+                                 if cached_key and set(cached_key) <= set(keywords)), None)
+
+        if subset_posts is None:
+            return None
+
+        posts = [post for post in subset_posts if all(keyword in post['keywords'] for keyword in keywords)]
+        self.put(keywords, posts)
+        return posts
+
+    def put(self, keywords: Tuple[str, ...], posts: List[Dict]) -> None:
+        """
+        Caches the posts of a keyword set, evicting the least recently used keyword sets if it is full.
+        Posts of a keyword set larger than the cache are not cached.
+
+        :param keywords: The sorted lowercase keywords that a post must all contain.
+        :param posts: The posts containing all keywords.
+        """
+        if len(posts) > self.max_posts:
+            return
+
+        with self.lock:
+            if keywords in self.entries:
+                self.post_count -= len(self.entries.pop(keywords))
+            self.entries[keywords] = posts
+            self.post_count += len(posts)
+
+            while self.post_count > self.max_posts:
+                _, evicted_posts = self.entries.popitem(last=False)
+                self.post_count -= len(evicted_posts)
+
 
 class OverallAggregator:
     def __init__(self, db_handler, result_normalizer: ResultNormalizer, weighted_aggregator: WeightedAggregator):
@@ -21,6 +115,9 @@ class OverallAggregator:
         self.result_normalizer = result_normalizer
         self.weighted_aggregator = weighted_aggregator
         self.debug = True  # enable debug logging
+        # Optional executor (e.g. ProcessPoolExecutor) the aggregation of many posts is spread over
+        self.process_pool = None
+        self.process_chunk_size = DEFAULT_PROCESS_CHUNK_SIZE
 
     def aggregate_data(self,
                        model_keys: List[str],
@@ -45,10 +142,12 @@ class OverallAggregator:
             model_keys: List[str],
             weights: Dict[str, Dict[str, float]],
             filters=None,
-            date_range: DateRange = DateRange.ONE_DAY
+            date_range: DateRange = DateRange.ONE_DAY,
+            post_cache: Optional[PostCache] = None
     ) -> List[Dict[str, float]]:
         # Determine start and end dates
-        end_date = datetime.now()
+        timezone = get_timezone()
+        end_date = datetime.now(timezone)
         start_date = end_date - timedelta(days=date_range.value)
         date_format = '%Y-%m-%d' if date_range == DateRange.ONE_DAY or date_range == DateRange.ONE_MONTH else '%Y-%m'
 
@@ -58,16 +157,21 @@ class OverallAggregator:
 
         # Fetch data from the database
         filters = [keyword.lower() for keyword in filters]
-        query = {"keywords": {"$all": filters}}
-        data = self.db_handler.load_data(filters=query)
+        data = self.load_posts(filters, post_cache)
 
-        # Process each post and aggregate scores for each date
+        # Keep the posts within the date range
+        posts_in_range = []
+        post_dates = []
         for post in data:
-            post_date = datetime.fromtimestamp(post['created_utc'])
+            post_date = datetime.fromtimestamp(post['created_utc'], timezone)
             if start_date <= post_date <= end_date:
-                formatted_date = post_date.strftime(date_format)
-                aggregated_score = self.process_post(post, model_keys, weights)
-                date_aggregated_scores[formatted_date].append(aggregated_score)
+                posts_in_range.append(post)
+                post_dates.append(post_date.strftime(date_format))
+
+        # Process the posts and aggregate scores for each date
+        aggregated_scores = self.process_posts(posts_in_range, model_keys, weights)
+        for formatted_date, aggregated_score in zip(post_dates, aggregated_scores):
+            date_aggregated_scores[formatted_date].append(aggregated_score)
 
         # Calculate the average score for each date, using 0.0 if there were no scores
         average_scores_by_date = [
@@ -80,6 +184,25 @@ class OverallAggregator:
 
         return average_scores_by_date
 
+    def load_posts(self, keywords: List[str], post_cache: Optional[PostCache] = None) -> List[Dict]:
+        """
+        Loads the posts containing all keywords. If a post cache is given, the posts of a keyword set
+        are only loaded once while they are cached.
+
+        :param keywords: List of lowercase keywords that a post must all contain.
+        :param post_cache: Optional PostCache shared by the aggregations of an update.
+        :return: The posts containing all keywords.
+        """
+        if post_cache is None:
+            return self.db_handler.load_data(filters={"keywords": {"$all": keywords}})
+
+        key = tuple(sorted(set(keywords)))
+        posts = post_cache.get(key)
+        if posts is None:
+            posts = self.db_handler.load_data(filters={"keywords": {"$all": keywords}})
+            post_cache.put(key, posts)
+        return posts
+
     def initialize_expected_dates(self, start_date, end_date, date_format):
         """Generate a dictionary of dates with an empty list for each expected date in the range."""
         expected_dates = defaultdict(list)
@@ -97,6 +220,9 @@ class OverallAggregator:
         """
         Processes a single post, normalizing its sentiment scores and aggregating them.
 
+        If the normalized scores were precomputed when the post was stored, they are used as is
+        instead of normalizing the post again.
+
         :param post: A dictionary representing a single post with sentiment data from multiple models.
         :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
         :param weights: Dictionary of weights for each model's components (title, selftext, comments),
@@ -104,8 +230,10 @@ class OverallAggregator:
         :return: The aggregated sentiment score for the post.
         """
 
-        # Normalize the entire post using the ResultNormalizer
-        normalized_post = self.result_normalizer.normalize(post)
+        # Use the precomputed normalized scores, or normalize the entire post using the ResultNormalizer
+        normalized_post = self.get_precomputed_post(post, model_keys)
+        if normalized_post is None:
+            normalized_post = self.result_normalizer.normalize(post)
 
         # Send the normalized post to the WeightedAggregator
         aggregated_score = self.weighted_aggregator.aggregate(
@@ -113,6 +241,159 @@ class OverallAggregator:
 
         return aggregated_score
 
+    def process_posts(self, posts: List[Dict], model_keys: List[str],
+                      weights: Dict[str, Dict[str, float]]) -> List[float]:
+        """
+        Processes many posts at once with the vectorized batch path of the WeightedAggregator. The
+        scores are the same as processing each post with `process_post`.
+
+        Falls back to processing each post individually if the aggregator has no batch path or a
+        model normalizer has no normalization strategy that can be applied to arrays of scores.
+
+        :param posts: A list of dictionaries representing posts with sentiment data from multiple models.
+        :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :return: The aggregated sentiment score of each post, in the order of the posts.
+        """
+        if self.process_pool is not None and len(posts) > self.process_chunk_size:
+            return self._process_posts_in_pool(posts, model_keys, weights)
+
+        strategies = self.get_normalization_strategies(model_keys)
+        if strategies is None or not isinstance(self.weighted_aggregator, WeightedAggregator):
+            return [self.process_post(post, model_keys, weights) for post in posts]
+
+        # Posts with precomputed normalized scores must not be normalized again
+        precomputed_indices, precomputed_posts = [], []
+        raw_indices, raw_posts = [], []
+        for index, post in enumerate(posts):
+            precomputed_post = self.get_precomputed_post(post, model_keys)
+            if precomputed_post is None:
+                raw_indices.append(index)
+                raw_posts.append(post)
+            else:
+                precomputed_indices.append(index)
+                precomputed_posts.append(precomputed_post)
+
+        aggregated_scores = [0.0] * len(posts)
+        for indices, batch, batch_strategies in ((precomputed_indices, precomputed_posts, None),
+                                                 (raw_indices, raw_posts, strategies)):
+            if not batch:
+                continue
+
+            batch_scores = self.weighted_aggregator.aggregate_batch(batch, model_keys, weights, batch_strategies)
+            for index, score in zip(indices, batch_scores.tolist()):
+                aggregated_scores[index] = score
+
+        return aggregated_scores
+
+    def _process_posts_in_pool(self, posts: List[Dict], model_keys: List[str],
+                               weights: Dict[str, Dict[str, float]]) -> List[float]:
+        """
+        Spreads the aggregation of the posts over the process pool in chunks of `process_chunk_size` posts.
+
+        :param posts: A list of dictionaries representing posts with sentiment data from multiple models.
+        :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :return: The aggregated sentiment score of each post, in the order of the posts.
+        """
+        futures = [
+            self.process_pool.submit(aggregate_posts, self.result_normalizer, self.weighted_aggregator,
+                                     posts[start:start + self.process_chunk_size], model_keys, weights)
+            for start in range(0, len(posts), self.process_chunk_size)
+        ]
+
+        # Collect the chunks in order, so that the scores stay aligned with the posts
+        return [score for future in futures for score in future.result()]
+
+    def get_normalization_strategies(self, model_keys: List[str]) -> Optional[Dict[str, NormalizationStrategy]]:
+        """
+        Retrieves the normalization strategy of each model's normalizer.
+
+        :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+        :return: Dictionary mapping each normalized model to its strategy, or None if a model normalizer
+                 has no normalization strategy.
+        """
+        model_normalizers = getattr(self.result_normalizer, 'model_normalizers', None)
+        if model_normalizers is None:
+            return None
+
+        strategies = {}
+        for model in model_keys:
+            if model not in model_normalizers:
+                continue  # Scores of models without normalizer are left unchanged
+
+            strategy = getattr(model_normalizers[model], 'strategy', None)
+            if not isinstance(strategy, NormalizationStrategy):
+                return None
+            strategies[model] = strategy
+
+        return strategies
+
+    def get_normalization_ranges(self, model_keys: List[str]) -> Optional[Dict[str, Tuple[float, float]]]:
+        """
+        Retrieves the min-max range each model's scores are normalized with.
+
+        :param model_keys: List of model keys to be processed.
+        :return: Dictionary mapping each normalized model to its (min_value, max_value), or None if a
+                 model uses a normalizer that is not a min-max normalization.
+        """
+        model_normalizers = getattr(self.result_normalizer, 'model_normalizers', None)
+        if model_normalizers is None:
+            return None
+
+        normalization_ranges = {}
+        for model in model_keys:
+            if model not in model_normalizers:
+                continue  # Scores of models without normalizer are left unchanged
+
+            strategy = getattr(model_normalizers[model], 'strategy', None)
+            if not isinstance(strategy, MinMaxNormalizationStrategy):
+                return None
+            normalization_ranges[model] = (strategy.min_value, strategy.max_value)
+
+        return normalization_ranges
+
+    def get_precomputed_post(self, post: Dict, model_keys: List[str]) -> Optional[Dict]:
+        """
+        Builds a normalized post from the 'normalized_scores' precomputed by the Data Management module,
+        which hold the normalized title and selftext scores and the mean normalized comment score of each model.
+
+        The scores of a model are only used if they were normalized with the same range as the model's
+        normalizer, which is stored with them as 'score_range'.
+
+        :param post: A dictionary representing a single post with sentiment data from multiple models.
+        :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+        :return: The normalized post, or None if the scores of a processed model were not precomputed
+                 or were normalized with another range.
+        """
+        normalized_scores = post.get('normalized_scores')
+        if not normalized_scores:
+            return None
+
+        normalization_ranges = self.get_normalization_ranges(model_keys)
+        if normalization_ranges is None:
+            return None
+
+        normalized_output = {}
+        for model in model_keys:
+            if model not in post.get('model_output', {}):
+                continue
+
+            # Scores are only precomputed for models that are normalized
+            if model not in normalized_scores or model not in normalization_ranges:
+                return None
+
+            model_scores = normalized_scores[model]
+            if tuple(model_scores.get(SCORE_RANGE_FIELD, ())) != normalization_ranges[model]:
+                return None
+
+            normalized_output[model] = {
+                component: score for component, score in model_scores.items()
+                if component not in (COMMENTS_COUNT_FIELD, SCORE_RANGE_FIELD)
+            }
+
+        return {**post, 'model_output': normalized_output}
+
     def calculate_overall_average_score(self, data: Dict, model_keys: List[str],
                                         weights: Dict[str, Dict[str, float]]) -> float:
         """
@@ -126,10 +407,8 @@ class OverallAggregator:
         total_aggregated_score = 0.0
         post_count = 0
 
-        # Process each post and aggregate the scores
-        for post in data:
-            aggregated_post_result = self.process_post(
-                post, model_keys, weights)
+        # Process the posts and aggregate the scores
+        for aggregated_post_result in self.process_posts(list(data), model_keys, weights):
             total_aggregated_score += aggregated_post_result
             post_count += 1
 
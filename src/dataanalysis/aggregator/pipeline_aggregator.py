@@ -0,0 +1,222 @@
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+
+from ..date_range import DateRange, get_timezone
+from .overall_aggregator import OverallAggregator, PostCache, SCORE_RANGE_FIELD
+
+
+class PipelineAggregator(OverallAggregator):
+    """
+    OverallAggregator that pushes the date window, keyword filtering, normalization, weighting
+    and grouping by date down into a database aggregation pipeline, so that only one small
+    document per date bucket is returned instead of every matching post.
+
+    The Python implementation of OverallAggregator is kept as the reference implementation and is
+    used as a fallback whenever a model normalizer cannot be expressed inside the pipeline.
+    """
+
+    def aggregate_data_by_date(
+            self,
+            model_keys: List[str],
+            weights: Dict[str, Dict[str, float]],
+            filters=None,
+            date_range: DateRange = DateRange.ONE_DAY,
+            post_cache: Optional[PostCache] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Aggregates the sentiment scores of the posts matching all keywords by date, inside the database.
+
+        :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :param filters: List of keywords that a post must all contain.
+        :param date_range: DateRange to aggregate over, ending now.
+        :param post_cache: Optional PostCache used if the posts are aggregated by the reference implementation.
+        :return: A list of dictionaries with the date and the average score of the posts on that date.
+        """
+        normalization_ranges = self.get_normalization_ranges(model_keys)
+        if normalization_ranges is None:
+            self.debug and print("aggregate_data_by_date(): Normalizers cannot be pushed down, "
+                                 "using the reference implementation.")
+            return super().aggregate_data_by_date(model_keys, weights, filters, date_range, post_cache)
+
+        # Determine start and end dates
+        end_date = datetime.now(get_timezone())
+        start_date = end_date - timedelta(days=date_range.value)
+        date_format = '%Y-%m-%d' if date_range == DateRange.ONE_DAY or date_range == DateRange.ONE_MONTH else '%Y-%m'
+
+        # Initialize the average score of all expected dates in range to 0.0
+        average_scores = {
+            date: 0.0 for date in self.initialize_expected_dates(start_date, end_date, date_format)
+        }
+
+        # Run the aggregation inside the database
+        filters = [keyword.lower() for keyword in filters]
+        pipeline = self.build_pipeline(
+            model_keys, weights, filters, start_date, end_date, date_format, normalization_ranges)
+        buckets = self.db_handler.aggregate_data(pipeline)
+
+        for bucket in sorted(buckets, key=lambda bucket: bucket['_id']):
+            average_scores[bucket['_id']] = bucket['average_score']
+
+        return [
+            {"date": date, "average_score": average_score}
+            for date, average_score in average_scores.items()
+        ]
+
+    def build_pipeline(self, model_keys: List[str], weights: Dict[str, Dict[str, float]], filters: List[str],
+                       start_date: datetime, end_date: datetime, date_format: str,
+                       normalization_ranges: Dict[str, Tuple[float, float]]) -> List[Dict]:
+        """
+        Builds the aggregation pipeline that computes the average score of the matching posts per date.
+
+        :param model_keys: List of model keys to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :param filters: List of lowercase keywords that a post must all contain.
+        :param start_date: The start of the date window.
+        :param end_date: The end of the date window.
+        :param date_format: The strftime format of the date buckets.
+        :param normalization_ranges: Dictionary mapping each normalized model to its (min_value, max_value).
+        :return: The list of aggregation stages.
+        """
+        # Group in the timezone of get_timezone, like the reference implementation. Its IANA name is passed
+        # instead of its current UTC offset, so that posts on both sides of a DST change are bucketed alike
+        timezone = get_timezone().key
+
+        return [
+            {"$match": {
+                "created_utc": {"$gte": start_date.timestamp(), "$lte": end_date.timestamp()},
+                "keywords": {"$all": filters}
+            }},
+            {"$project": {
+                "created_utc": 1,
+                "score": self.build_score_expression(model_keys, weights, normalization_ranges)
+            }},
+            {"$group": {
+                "_id": {"$dateToString": {
+                    "format": date_format,
+                    "date": {"$toDate": {"$multiply": ["$created_utc", 1000]}},
+                    "timezone": timezone
+                }},
+                "average_score": {"$avg": "$score"},
+                "count": {"$sum": 1}
+            }}
+        ]
+
+    def build_score_expression(self, model_keys: List[str], weights: Dict[str, Dict[str, float]],
+                               normalization_ranges: Dict[str, Tuple[float, float]]) -> Dict:
+        """
+        Builds the aggregation expression of a post's aggregated score. It mirrors the normalization
+        of RedditResultNormalizer and the weighting of WeightedAggregator.
+
+        :param model_keys: List of model keys to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :param normalization_ranges: Dictionary mapping each normalized model to its (min_value, max_value).
+        :return: The aggregation expression of the post's score.
+        """
+        weighted_model_scores = []
+        present_model_weights = []
+
+        for model in model_keys:
+            model_weight = weights['model_weights'].get(model, 0)
+
+            # Skip models with zero weights, like the WeightedAggregator does
+            if model_weight == 0:
+                continue
+
+            normalization_range = normalization_ranges.get(model)
+            weighted_score = []
+            total_component_weight = 0.0
+
+            for component, weight in weights.get(model, {}).items():
+                if weight == 0:
+                    continue  # Skip components with zero weight
+
+                component_score = self._component_score_expression(model, component, normalization_range)
+                weighted_score.append({"$multiply": [component_score, weight]})
+                total_component_weight += weight
+
+            model_score = 0.0
+            if total_component_weight > 0:
+                model_score = {"$divide": [{"$add": weighted_score}, total_component_weight]}
+
+            # Models missing from a post do not count towards its total model weight
+            is_present = {"$ne": [{"$type": f"$model_output.{model}"}, "missing"]}
+            weighted_model_scores.append(
+                {"$cond": [is_present, {"$multiply": [model_score, model_weight]}, 0]})
+            present_model_weights.append({"$cond": [is_present, model_weight, 0]})
+
+        if not weighted_model_scores:
+            return {"$literal": 0.0}
+
+        return {"$let": {
+            "vars": {
+                "weighted_sum": {"$add": weighted_model_scores},
+                "total_model_weight": {"$add": present_model_weights}
+            },
+            "in": {"$cond": [
+                {"$gt": ["$$total_model_weight", 0]},
+                {"$divide": ["$$weighted_sum", "$$total_model_weight"]},
+                0.0
+            ]}
+        }}
+
+    def _component_score_expression(self, model: str, component: str,
+                                    normalization_range: Optional[Tuple[float, float]]) -> Dict:
+        """
+        Builds the aggregation expression of a single component's normalized score. Lists of scores
+        (e.g. comments sentiments) are averaged and missing components score 0.
+
+        The normalized scores precomputed by the Data Management module are used when the post has them
+        and they were normalized with the same range.
+
+        :param model: The model key of the component.
+        :param component: The component (e.g. title_sentiment) to score.
+        :param normalization_range: The (min_value, max_value) of the model, or None if not normalized.
+        :return: The aggregation expression of the component's score.
+        """
+        field = f"$model_output.{model}.{component}"
+        score = {"$cond": [
+            {"$eq": [{"$type": field}, "missing"]},
+            0,
+            {"$cond": [
+                {"$isArray": field},
+                {"$cond": [
+                    {"$gt": [{"$size": field}, 0]},
+                    {"$avg": {"$map": {
+                        "input": field,
+                        "as": "score",
+                        "in": self._normalize_expression("$$score", normalization_range)
+                    }}},
+                    0
+                ]},
+                self._normalize_expression(field, normalization_range)
+            ]}
+        ]}
+
+        # Scores are only precomputed for models that are normalized
+        if normalization_range is None:
+            return score
+
+        precomputed_scores = f"$normalized_scores.{model}"
+        return {"$cond": [
+            {"$eq": [f"{precomputed_scores}.{SCORE_RANGE_FIELD}", list(normalization_range)]},
+            {"$ifNull": [f"{precomputed_scores}.{component}", 0]},
+            score
+        ]}
+
+    def _normalize_expression(self, score, normalization_range: Optional[Tuple[float, float]]):
+        """
+        Builds the aggregation expression of MinMaxNormalizationStrategy, clamped between 0 and 100.
+
+        :param score: The expression of the score to normalize.
+        :param normalization_range: The (min_value, max_value) of the model, or None if not normalized.
+        :return: The aggregation expression of the normalized score.
+        """
+        if normalization_range is None:
+            return score
+
+        min_value, max_value = normalization_range
+        normalized_score = {"$multiply": [
+            {"$divide": [{"$subtract": [score, min_value]}, max_value - min_value]}, 100
+        ]}
+        return {"$max": [0, {"$min": [100, normalized_score]}]}
@@ -0,0 +1,167 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+
+from ..date_range import DateRange, get_timezone
+from .overall_aggregator import PostCache
+from .pipeline_aggregator import PipelineAggregator
+
+# '_id' of the document recording from which day on the rollups hold every stored post, see the Data
+# Management module's SentimentRollupStore
+ROLLUP_COVERAGE_KEY = 'coverage'
+
+
+class RollupAggregator(PipelineAggregator):
+    """
+    PipelineAggregator that derives the average scores by date from the daily sentiment rollups
+    maintained by the Data Management module, instead of reading the posts themselves.
+
+    Each rollup holds the number of posts of a keyword on a day with a given set of models, and the
+    sums of their normalized component scores. The rollups are used for indicators filtering on a
+    single keyword whose weighted models are all normalized, otherwise the pipeline aggregation is used.
+
+    The rollups only hold the posts stored since they were enabled, unless they were rebuilt from scratch,
+    so they are only used for date windows that start on or after the first day they cover. Date windows
+    are aligned to whole days in the timezone of `get_timezone`, as the rollups hold whole days in it.
+    """
+
+    def __init__(self, db_handler, result_normalizer, weighted_aggregator, rollup_handler):
+        """
+        Initializes the RollupAggregator with necessary components.
+
+        :param db_handler: handler to fetch posts from a data source.
+        :param result_normalizer: ResultNormalizer instance that normalizes sentiment data for each post.
+        :param weighted_aggregator: WeightedAggregator instance to combine the model averages into a final score.
+        :param rollup_handler: handler to fetch the daily sentiment rollups from a data source.
+        """
+        super().__init__(db_handler, result_normalizer, weighted_aggregator)
+        self.rollup_handler = rollup_handler
+
+    def aggregate_data_by_date(
+            self,
+            model_keys: List[str],
+            weights: Dict[str, Dict[str, float]],
+            filters=None,
+            date_range: DateRange = DateRange.ONE_DAY,
+            post_cache: Optional[PostCache] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Aggregates the sentiment scores of the posts matching all keywords by date, from the daily rollups.
+
+        :param model_keys: List of model keys (e.g., "vader", "textblob") to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :param filters: List of keywords that a post must all contain.
+        :param date_range: DateRange to aggregate over, ending now.
+        :param post_cache: Optional PostCache used if the posts are aggregated by the reference implementation.
+        :return: A list of dictionaries with the date and the average score of the posts on that date.
+        """
+        # Determine start and end dates
+        end_date = datetime.now(get_timezone())
+        start_date = end_date - timedelta(days=date_range.value)
+        date_format = '%Y-%m-%d' if date_range == DateRange.ONE_DAY or date_range == DateRange.ONE_MONTH else '%Y-%m'
+
+        if not self.can_use_rollups(model_keys, weights, filters) or \
+                not self.rollups_cover(start_date, model_keys, weights):
+            self.debug and print("aggregate_data_by_date(): Rollups cannot be used, aggregating the posts.")
+            return super().aggregate_data_by_date(model_keys, weights, filters, date_range, post_cache)
+
+        # Fetch the rollups of the keyword on every day in range
+        rollups = self.rollup_handler.load_data(filters={
+            "keyword": filters[0].lower(),
+            "day": {"$gte": start_date.strftime('%Y-%m-%d'), "$lte": end_date.strftime('%Y-%m-%d')}
+        })
+
+        # Sum the scores and the number of posts of each date
+        total_scores = defaultdict(float)
+        post_counts = defaultdict(int)
+        for rollup in rollups:
+            formatted_date = datetime.strptime(rollup['day'], '%Y-%m-%d').strftime(date_format)
+            total_scores[formatted_date] += self.score_rollup(rollup, model_keys, weights)
+            post_counts[formatted_date] += rollup['count']
+
+        # Calculate the average score for each expected date, using 0.0 if there were no posts
+        return [
+            {
+                "date": date,
+                "average_score": total_scores[date] / post_counts[date] if post_counts[date] > 0 else 0.0
+            }
+            for date in self.initialize_expected_dates(start_date, end_date, date_format)
+        ]
+
+    def can_use_rollups(self, model_keys: List[str], weights: Dict[str, Dict[str, float]], filters=None) -> bool:
+        """
+        Checks whether the average scores can be derived from the rollups, which are kept per keyword
+        for the normalized models only.
+
+        :param model_keys: List of model keys to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :param filters: List of keywords that a post must all contain.
+        :return: True if the rollups can be used, False otherwise.
+        """
+        if self.rollup_handler is None or not filters or len(set(keyword.lower() for keyword in filters)) != 1:
+            return False
+
+        normalization_ranges = self.get_normalization_ranges(model_keys)
+        if normalization_ranges is None:
+            return False
+
+        return all(model in normalization_ranges for model in model_keys
+                   if weights['model_weights'].get(model, 0) != 0)
+
+    def rollups_cover(self, start_date: datetime, model_keys: List[str], weights: Dict[str, Dict[str, float]]) -> bool:
+        """
+        Checks whether the rollups hold every stored post from the given date on, with the scores of
+        the weighted models normalized with the same range as their normalizers.
+
+        :param start_date: The start of the date window.
+        :param model_keys: List of model keys to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :return: True if the rollups cover the date window, False if they were never started, only
+                 cover later days or were normalized with other ranges.
+        """
+        coverage = self.rollup_handler.load_data(filters={"_id": ROLLUP_COVERAGE_KEY})
+        if not coverage:
+            return False
+
+        score_ranges = coverage[0].get('score_ranges') or {}
+        normalization_ranges = self.get_normalization_ranges(model_keys)
+        if any(tuple(score_ranges.get(model, ())) != normalization_ranges[model] for model in model_keys
+               if weights['model_weights'].get(model, 0) != 0):
+            return False
+
+        return coverage[0]['since'] <= start_date.strftime('%Y-%m-%d')
+
+    def score_rollup(self, rollup: Dict, model_keys: List[str], weights: Dict[str, Dict[str, float]]) -> float:
+        """
+        Computes the sum of the aggregated scores of the posts in a rollup, mirroring the weighting
+        of the WeightedAggregator.
+
+        :param rollup: The rollup of the posts of a keyword on a day with the same set of models.
+        :param model_keys: List of model keys to be processed.
+        :param weights: Dictionary of weights for each model's components and overall model weights.
+        :return: The sum of the aggregated scores of the posts.
+        """
+        # Only the models present in the posts count towards their total model weight
+        present_models = [
+            model for model in model_keys
+            if weights['model_weights'].get(model, 0) != 0 and model in rollup.get('models', [])
+        ]
+        total_model_weight = sum(weights['model_weights'][model] for model in present_models)
+        if total_model_weight == 0:
+            return 0.0
+
+        total_score = 0.0
+        for model in present_models:
+            sums = rollup.get('sums', {}).get(model, {})
+            component_weights = {
+                component: weight for component, weight in weights.get(model, {}).items() if weight != 0
+            }
+            total_component_weight = sum(component_weights.values())
+            if total_component_weight == 0:
+                continue
+
+            # Missing components score 0, so the sum of a model's scores is linear in the component sums
+            model_score = sum(sums.get(component, 0.0) * weight for component, weight in component_weights.items())
+            total_score += model_score / total_component_weight * weights['model_weights'][model]
+
+        return total_score / total_model_weight
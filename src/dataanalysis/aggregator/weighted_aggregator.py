@@ -1,4 +1,8 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..normalizer.normalization_strategy import NormalizationStrategy
 
 
 class WeightedAggregator:
@@ -72,4 +76,128 @@ class WeightedAggregator:
                 for model in model_scores
             ) / total_model_weight
 
-        return final_score
\ No newline at end of file
+        return final_score
+
+    def compile_weights(self, model_keys: List[str],
+                        weights: Dict[str, Dict[str, float]]) -> Tuple[List[str], List[str], np.ndarray, np.ndarray]:
+        """
+        Compiles the weights dictionary into a model x component weight matrix, so that it can be applied
+        to many posts at once. Models with zero weights are left out, like in `aggregate`.
+
+        :param model_keys: The list of model keys to be processed.
+        :param weights: A dictionary with weights for each model's components and overall model weights.
+        :return: A tuple of the models, the components, the (models x components) component weight matrix
+                 and the vector of model weights.
+        """
+        models = [model for model in model_keys if weights['model_weights'].get(model, 0) != 0]
+
+        components = []
+        for model in models:
+            for component in weights.get(model, {}):
+                if component not in components:
+                    components.append(component)
+
+        component_weights = np.zeros((len(models), len(components)))
+        for model_index, model in enumerate(models):
+            for component, weight in weights.get(model, {}).items():
+                component_weights[model_index, components.index(component)] = weight
+
+        model_weights = np.array([weights['model_weights'][model] for model in models], dtype=float)
+
+        return models, components, component_weights, model_weights
+
+    def aggregate_batch(self, posts: List[Dict], model_keys: List[str], weights: Dict[str, Dict[str, float]],
+                        strategies: Optional[Dict[str, NormalizationStrategy]] = None) -> np.ndarray:
+        """
+        Aggregates the sentiment scores of many posts at once, with the same semantics as `aggregate`.
+
+        Normalization, clamping, the averaging of lists of scores and the weighting are applied as
+        array operations over all posts instead of one post at a time.
+
+        :param posts: The posts to aggregate.
+        :param model_keys: The list of model keys to be processed.
+        :param weights: A dictionary with weights for each model's components and overall model weights.
+        :param strategies: Optional dictionary of the normalization strategy of each model. If given, the
+                           scores of the posts are normalized first, otherwise the posts must already
+                           contain normalized scores.
+        :return: An array with the aggregated sentiment score of each post.
+        """
+        if any('model_output' not in post for post in posts):
+            raise ValueError("Every post must contain a 'model_output' field.")
+
+        strategies = strategies or {}
+        models, components, component_weights, model_weights = self.compile_weights(model_keys, weights)
+
+        post_count = len(posts)
+        scores = np.zeros((post_count, len(models), len(components)))
+        present = np.zeros((post_count, len(models)), dtype=bool)
+
+        for model_index, model in enumerate(models):
+            model_outputs = [post['model_output'].get(model) for post in posts]
+            present[:, model_index] = [output is not None for output in model_outputs]
+
+            for component_index, component in enumerate(components):
+                if component_weights[model_index, component_index] == 0:
+                    continue  # Skip components with zero weight
+
+                scores[:, model_index, component_index] = self._component_scores(
+                    model_outputs, component, strategies.get(model))
+
+        # Weighted average of the components of each model, skewed results are avoided by
+        # normalizing with the sum of the component weights
+        total_component_weights = component_weights.sum(axis=1)
+        weighted_scores = (scores * component_weights).sum(axis=2)
+        model_scores = np.divide(weighted_scores, total_component_weights,
+                                 out=np.zeros_like(weighted_scores), where=total_component_weights > 0)
+
+        # Weighted average of the models that are present in each post
+        present_model_weights = present * model_weights
+        total_model_weights = present_model_weights.sum(axis=1)
+        final_scores = (model_scores * present_model_weights).sum(axis=1)
+        return np.divide(final_scores, total_model_weights,
+                         out=np.zeros(post_count), where=total_model_weights > 0)
+
+    def _component_scores(self, model_outputs: List[Optional[Dict]], component: str,
+                          strategy: Optional[NormalizationStrategy]) -> np.ndarray:
+        """
+        Gathers the (normalized) score of a component for every post. Lists of scores are averaged,
+        and empty lists as well as missing components or models score 0.
+
+        :param model_outputs: The output of the model for each post, or None if the model is missing.
+        :param component: The component (e.g. title_sentiment) to gather.
+        :param strategy: Optional normalization strategy to apply to the scores.
+        :return: An array with the score of the component for each post.
+        """
+        post_count = len(model_outputs)
+        single_indices, single_scores = [], []
+        list_owners, list_scores = [], []
+
+        for index, output in enumerate(model_outputs):
+            if output is None or component not in output:
+                continue
+
+            score = output[component]
+            if isinstance(score, list):
+                list_owners.extend([index] * len(score))
+                list_scores.extend(score)
+            else:
+                single_indices.append(index)
+                single_scores.append(score)
+
+        component_scores = np.zeros(post_count)
+
+        if single_scores:
+            single_scores = np.array(single_scores, dtype=float)
+            if strategy is not None:
+                single_scores = strategy.normalize_array(single_scores)
+            component_scores[single_indices] = single_scores
+
+        if list_scores:
+            list_scores = np.array(list_scores, dtype=float)
+            if strategy is not None:
+                list_scores = strategy.normalize_array(list_scores)
+            sums = np.bincount(list_owners, weights=list_scores, minlength=post_count)
+            counts = np.bincount(list_owners, minlength=post_count)
+            np.divide(sums, counts, out=component_scores, where=counts > 0)
+
+        return component_scores
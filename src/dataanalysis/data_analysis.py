@@ -1,19 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
+import multiprocessing
 import os
 from typing import List, Optional, Dict
 
-from .date_range import DateRange
+from .date_range import DateRange, get_timezone
+from .indicator_planner import IndicatorPlanner
 from .dataclient import DataClientManager, DataClientConfig
 from .normalizer.result_normalizer import RedditResultNormalizer
 from .normalizer import VADERNormalizer, TextBlobNormalizer
-from .aggregator import WeightedAggregator, OverallAggregator
+from .aggregator import WeightedAggregator, RollupAggregator
 
 
 class DataAnalysis:
-    def __init__(self):
-        """Initializes the DataAnalysis class with necessary components."""
+    def __init__(self, max_workers: int = 1, aggregation_processes: int = 0):
+        """
+        Initializes the DataAnalysis class with necessary components.
+
+        :param max_workers: int, the number of indicators processed concurrently by a thread pool.
+                            Indicators are processed one after another if 1.
+        :param aggregation_processes: int, the number of worker processes the aggregation of posts
+                                      is spread over. Posts are aggregated in the calling thread if 0.
+                                      Only the posts aggregated by the reference implementation are,
+                                      i.e. when the aggregation cannot use the rollups or the pipeline.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+        if aggregation_processes < 0:
+            raise ValueError(f"aggregation_processes must not be negative, got {aggregation_processes}")
+
         self.debug = True  # Enable debug logging
+        self.max_workers = max_workers
         self.data_aggregator = self.initialize_components()
+        if aggregation_processes > 0:
+            # Spawn the workers, as forking would copy the MongoClient and the threads of this process
+            self.data_aggregator.process_pool = ProcessPoolExecutor(
+                max_workers=aggregation_processes, mp_context=multiprocessing.get_context("spawn"))
 
     def load_data_from_db(self, collection_name: str, filters: dict = None) -> List[Dict]:
         """
@@ -84,7 +106,8 @@ class DataAnalysis:
         """
         Initializes and returns the aggregator and normalizers for data processing.
 
-        :return: OverallAggregator, a configured aggregator for sentiment analysis.
+        :return: RollupAggregator, a configured aggregator for sentiment analysis that aggregates
+                 by date from the daily sentiment rollups, or inside the database if they cannot be used.
         """
         model_normalizers = {
             "vader": VADERNormalizer(), "textblob": TextBlobNormalizer()}
@@ -98,7 +121,15 @@ class DataAnalysis:
             collection="reddit_posts_transformed"
         )
         db_handler = DataClientManager.get_database_client(source_db_config)
-        return OverallAggregator(db_handler, reddit_normalizer, weighted_aggregator)
+
+        rollup_db_config = DataClientConfig(
+            db_type="mongodb",
+            uri=os.getenv("MONGODB_URI"),
+            db_name=os.getenv("DATABASE_NAME"),
+            collection="sentiment_rollups"
+        )
+        rollup_handler = DataClientManager.get_database_client(rollup_db_config)
+        return RollupAggregator(db_handler, reddit_normalizer, weighted_aggregator, rollup_handler)
 
     def build_filters(self, aggregate_name, indicator_names):
         """
@@ -116,14 +147,18 @@ class DataAnalysis:
             return {"aggregateName": aggregate_name}
         return {}
 
-    def load_aggregate_weights(self, aggregate_name: str):
+    def load_aggregate_weights(self, aggregate_name: str, planner: Optional[IndicatorPlanner] = None):
         """
         Loads weights for data aggregation based on the aggregate name.
 
         :param aggregate_name: str, the name of the aggregate.
+        :param planner: Optional IndicatorPlanner of the `execute` call, caching the weights of each aggregate.
 
         :return: tuple, containing a dictionary of weights and a list of model keys.
         """
+        if planner is not None and aggregate_name in planner.aggregate_weights:
+            return planner.aggregate_weights[aggregate_name]
+
         aggregate = self.load_data_from_db(
             "aggregates", {"aggregateName": aggregate_name})[0]
         aggregate_weights = {'model_weights': {}}
@@ -139,9 +174,34 @@ class DataAnalysis:
             aggregate_weights['model_weights'][model_name] = weight['model_weight']
             model_keys.append(model_name)
 
+        if planner is not None:
+            planner.aggregate_weights[aggregate_name] = (aggregate_weights, model_keys)
         return aggregate_weights, model_keys
 
-    def compute_daily_results(self, indicator, model_keys, weights, filters, latest_day):
+    def aggregate_data_by_date(self, aggregate_name: Optional[str], model_keys: List[str],
+                               weights: Dict[str, Dict[str, float]], filters: List[str],
+                               date_range: DateRange,
+                               planner: Optional[IndicatorPlanner] = None) -> List[Dict[str, float]]:
+        """
+        Aggregates the posts matching the filters by date, sharing the aggregation with the other
+        indicators of the same keyword set and aggregate during an `execute` call.
+
+        :param aggregate_name: str, the name of the aggregate with the weights.
+        :param model_keys: list of str, the model keys to use for aggregation.
+        :param weights: dict, weights for each model and its components.
+        :param filters: list of str, the keywords that a post must all contain.
+        :param date_range: DateRange to aggregate over.
+        :param planner: Optional IndicatorPlanner of the `execute` call.
+        :return: list of dicts, each containing the date and the average score on that date.
+        """
+        if planner is not None:
+            return planner.aggregate_data_by_date(aggregate_name, model_keys, weights, filters, date_range)
+
+        return self.data_aggregator.aggregate_data_by_date(
+            model_keys=model_keys, weights=weights, filters=filters, date_range=date_range
+        )
+
+    def compute_daily_results(self, indicator, model_keys, weights, filters, latest_day, planner=None):
         """
         Computes daily results for the indicator if they are missing or outdated.
 
@@ -150,24 +210,25 @@ class DataAnalysis:
         :param weights: dict, weights for each model and its components.
         :param filters: list, filters applied to data.
         :param latest_day: str, the latest computed date for daily results.
+        :param planner: Optional IndicatorPlanner of the `execute` call.
 
         :return: list of dicts, each containing daily aggregated sentiment scores.
         """
-        today_str = datetime.now().strftime("%Y-%m-%d")
+        today_str = datetime.now(get_timezone()).strftime("%Y-%m-%d")
         # returns default past 30 days if indicator does not have the field
         if "resultsByDay" not in indicator or indicator.get("resultsByDay") == []:
-            return self.data_aggregator.aggregate_data_by_date(
-                model_keys=model_keys, weights=weights, filters=filters, date_range=DateRange.ONE_MONTH
+            return self.aggregate_data_by_date(
+                indicator.get('aggregateName'), model_keys, weights, filters, DateRange.ONE_MONTH, planner
             )
         # else returns new daily result
         elif latest_day != today_str:
-            daily_result = self.data_aggregator.aggregate_data_by_date(
-                model_keys=model_keys, weights=weights, filters=filters, date_range=DateRange.ONE_DAY
+            daily_result = self.aggregate_data_by_date(
+                indicator.get('aggregateName'), model_keys, weights, filters, DateRange.ONE_DAY, planner
             )
             return [{"date": today_str, "average_score": daily_result[0].get("average_score")}]
         return []
 
-    def compute_monthly_results(self, indicator, model_keys, weights, filters, latest_month):
+    def compute_monthly_results(self, indicator, model_keys, weights, filters, latest_month, planner=None):
         """
         Computes monthly results for the indicator if they are missing or outdated.
 
@@ -176,19 +237,21 @@ class DataAnalysis:
         :param weights: dict, weights for each model and its components.
         :param filters: list, filters applied to data.
         :param latest_month: str, the latest computed date for monthly results.
+        :param planner: Optional IndicatorPlanner of the `execute` call.
 
         :return: list of dicts, each containing monthly aggregated sentiment scores.
         """
-        current_month_str = datetime.now().strftime("%Y-%m")
+        now = datetime.now(get_timezone())
+        current_month_str = now.strftime("%Y-%m")
         # returns default past 6 months if indicator does not have the field
         if "resultsByMonth" not in indicator or indicator.get("resultsByMonth") == []:
-            return self.data_aggregator.aggregate_data_by_date(
-                model_keys=model_keys, weights=weights, filters=filters, date_range=DateRange.SIX_MONTHS
+            return self.aggregate_data_by_date(
+                indicator.get('aggregateName'), model_keys, weights, filters, DateRange.SIX_MONTHS, planner
             )
         # else returns new monthly result
-        elif datetime.now().day != 1 and latest_month != current_month_str:
-            monthly_result = self.data_aggregator.aggregate_data_by_date(
-                model_keys=model_keys, weights=weights, filters=filters, date_range=DateRange.ONE_MONTH
+        elif now.day != 1 and latest_month != current_month_str:
+            monthly_result = self.aggregate_data_by_date(
+                indicator.get('aggregateName'), model_keys, weights, filters, DateRange.ONE_MONTH, planner
             )
             return [{"date": current_month_str, "average_score": monthly_result[-1].get("average_score")}]
         return []
@@ -210,18 +273,19 @@ class DataAnalysis:
         latest_date = max(entry["date"] for entry in entries if "date" in entry)
         return latest_date
 
-    def process_update(self, indicator: Dict, update_type: str):
+    def process_update(self, indicator: Dict, update_type: str, planner: Optional[IndicatorPlanner] = None):
         """
         Processes daily, monthly, or all updates for a single indicator, managing data limits.
 
         :param indicator: dict, the indicator document to process.
         :param update_type: str, either 'daily', 'monthly', or 'all'.
+        :param planner: Optional IndicatorPlanner sharing aggregations with the other indicators of the `execute` call.
         """
         try:
             indicator_name = indicator.get('indicatorName')
             filters = indicator.get('filters', [])
             aggregate_name = indicator.get('aggregateName')
-            aggregate_weights, model_keys = self.load_aggregate_weights(aggregate_name)
+            aggregate_weights, model_keys = self.load_aggregate_weights(aggregate_name, planner)
 
             # Determine max entries and compute method based on update_type
             if update_type == 'all':
@@ -231,11 +295,11 @@ class DataAnalysis:
                 self.save_result_to_db(indicator_name, {"resultsByDay": [], "resultsByMonth": []}, delete=True)
 
                 # Recompute for the last 30 days and 6 months
-                daily_results = self.data_aggregator.aggregate_data_by_date(
-                    model_keys=model_keys, weights=aggregate_weights, filters=filters, date_range=DateRange.ONE_MONTH
+                daily_results = self.aggregate_data_by_date(
+                    aggregate_name, model_keys, aggregate_weights, filters, DateRange.ONE_MONTH, planner
                 )
-                monthly_results = self.data_aggregator.aggregate_data_by_date(
-                    model_keys=model_keys, weights=aggregate_weights, filters=filters, date_range=DateRange.SIX_MONTHS
+                monthly_results = self.aggregate_data_by_date(
+                    aggregate_name, model_keys, aggregate_weights, filters, DateRange.SIX_MONTHS, planner
                 )
 
                 # Trim and save new results
@@ -250,8 +314,8 @@ class DataAnalysis:
                 latest_date_str = self.get_latest_date(indicator, results_field)
 
                 # Compute new results for either daily or monthly
-                new_results = self.compute_daily_results(indicator, model_keys, aggregate_weights, filters, latest_date_str) if update_type == 'daily' \
-                    else self.compute_monthly_results(indicator, model_keys, aggregate_weights, filters, latest_date_str)
+                new_results = self.compute_daily_results(indicator, model_keys, aggregate_weights, filters, latest_date_str, planner) if update_type == 'daily' \
+                    else self.compute_monthly_results(indicator, model_keys, aggregate_weights, filters, latest_date_str, planner)
 
                 # Update indicator with new results if applicable
                 if new_results:
@@ -277,9 +341,51 @@ class DataAnalysis:
         filters = self.build_filters(
             aggregate_name=aggregate_name, indicator_names=indicator_names)
         indicators = self.load_data_from_db("indicators", filters)
-        
+
+        # Indicators with the same keyword set and aggregate share their aggregations, and indicators
+        # with overlapping keyword sets share the posts loaded from the database. The planner is local to
+        # this call, since concurrent calls (e.g. from the DAServer) share this instance
+        planner = IndicatorPlanner(self.data_aggregator)
+        groups = planner.group(indicators)
+
+        if self.max_workers == 1 or len(groups) <= 1:
+            for group in groups:
+                self.process_group(group, update_type, planner)
+            return
+
+        # Each group is loaded, aggregated and saved independently, so they can be processed concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.process_group, group, update_type, planner) for group in groups]
+            for future in futures:
+                future.result()
+
+    def process_group(self, indicators: List[Dict], update_type: str, planner: Optional[IndicatorPlanner] = None):
+        """
+        Processes the updates of a group of indicators sharing their keyword set and aggregate, one after another.
+
+        :param indicators: list of indicator documents of the group.
+        :param update_type: str, either 'daily', 'monthly', or 'all'.
+        :param planner: Optional IndicatorPlanner of the `execute` call.
+        """
         for indicator in indicators:
-            try:
-                self.process_update(indicator, update_type)
-            except Exception as e:
-                self.debug and print(f"Error processing {update_type} update for indicator '{indicator.get('indicatorName')}': {e}")
+            self.process_indicator(indicator, update_type, planner)
+
+    def process_indicator(self, indicator: Dict, update_type: str, planner: Optional[IndicatorPlanner] = None):
+        """
+        Processes the update of a single indicator, so that an error does not stop the other indicators.
+
+        :param indicator: dict, the indicator document to process.
+        :param update_type: str, either 'daily', 'monthly', or 'all'.
+        :param planner: Optional IndicatorPlanner of the `execute` call.
+        """
+        try:
+            self.process_update(indicator, update_type, planner)
+        except Exception as e:
+            self.debug and print(f"Error processing {update_type} update for indicator '{indicator.get('indicatorName')}': {e}")
+
+    def close(self):
+        """Shuts down the worker processes of the aggregation, if any."""
+        process_pool = getattr(self.data_aggregator, 'process_pool', None)
+        if process_pool is not None:
+            process_pool.shutdown()
+            self.data_aggregator.process_pool = None
@@ -1,5 +1,6 @@
 """__init__ for Data Client Package."""
-from .data_client import DataClient
+from .data_client import DataClient, PartialWriteError
 from .data_client_manager import DataClientManager
 from .mongodb_client import MongoDBClient
 from .data_client_config import DataClientConfig
+from .mongo_client_registry import MongoClientRegistry
@@ -2,6 +2,21 @@
 from abc import ABC, abstractmethod
 
 
+class PartialWriteError(Exception):
+    """
+    Raised when some documents failed to be written, after the rest of the documents were written.
+    """
+
+    def __init__(self, failed_keys: list, results: list):
+        """
+        :param failed_keys: The key field values of the documents that failed to be written.
+        :param results: The number of upserted, modified and failed documents per batch.
+        """
+        super().__init__(f"{len(failed_keys)} documents failed to be written.")
+        self.failed_keys = failed_keys
+        self.results = results
+
+
 class DataClient(ABC):
     """
     Abstract class for database clients, providing a unified interface
@@ -26,6 +41,18 @@ class DataClient(ABC):
         :return: A list of documents (records) from the specified collection.
         """
 
+    def aggregate_data(self, pipeline: list):
+        """
+        Runs an aggregation pipeline on the specified collection in the database, so that
+        filtering, computation and grouping happen inside the database.
+
+        Clients of databases without aggregation support do not need to implement this method.
+
+        :param pipeline: The list of aggregation stages to run.
+        :return: A list of the resulting documents.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support aggregation pipelines")
+
     @abstractmethod
     def upsert_data(self, data, key_field: str = '_id'):
         """
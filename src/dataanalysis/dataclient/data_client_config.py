@@ -5,8 +5,12 @@ class DataClientConfig:
     """
     This class serves as a Config object to define the details needed for a database client.
     """
-    def __init__(self, db_type: str, uri: str, db_name: str, collection: str):
+    def __init__(self, db_type: str, uri: str, db_name: str, collection: str,
+                 max_pool_size: int = None, min_pool_size: int = None):
         self.db_type = db_type
         self.uri = uri
         self.db_name = db_name
         self.collection = collection
+        # Optional connection pool sizes, the driver defaults are used if not given
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
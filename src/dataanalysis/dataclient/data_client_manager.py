@@ -1,6 +1,7 @@
 """Module for DataClientManager."""
 from .data_client_config import DataClientConfig
 from .mongodb_client import MongoDBClient
+from .mongo_client_registry import MongoClientRegistry
 
 
 class DataClientManager:
@@ -14,16 +15,27 @@ class DataClientManager:
         """
         Factory method to get the correct database client.
 
+        Clients for the same URI share one process-wide connection pool, which stays open
+        until `close_all_clients` is called.
+
         :param db_config: DataClientConfig containing the db_type
         :return: The specified database client to open a connection with.
         """
 
         try:
             if db_config.db_type == 'mongodb':
-                return MongoDBClient(db_config)
+                return MongoDBClient(db_config, client=MongoClientRegistry.get_client(db_config))
             else:
                 raise ValueError(f"Unsupported database type: {db_config.db_type}")
 
         except ValueError as e:
             print(f"Error creating database client: {e}")
             raise
+
+    @staticmethod
+    def close_all_clients():
+        """
+        Closes the shared connection pools of every database client. To be called once on shutdown.
+        """
+
+        MongoClientRegistry.close_all()
@@ -1,10 +1,13 @@
 
 """Module for MongoDBClient."""
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, PyMongoError
-from .data_client import DataClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, PyMongoError
+from .data_client import DataClient, PartialWriteError
 from .data_client_config import DataClientConfig
 
+# Default number of upserts sent to MongoDB in a single bulk write
+DEFAULT_UPSERT_BATCH_SIZE = 1000
+
 
 class MongoDBClient(DataClient):
     """
@@ -12,20 +15,24 @@ class MongoDBClient(DataClient):
     relating to this connection.
     """
 
-    def __init__(self, db_config: DataClientConfig):
+    def __init__(self, db_config: DataClientConfig, client: MongoClient = None):
         """
         Init method that defines the target collection, mongo client, and database.
 
         :param db_config: DataClientConfig that contains connection details.
+        :param client: Optional shared MongoClient to use. If not given, a dedicated MongoClient
+                       is created, which is closed together with this instance.
         """
 
         self.collection = db_config.collection
-        self.client = MongoClient(db_config.uri)
+        self.owns_client = client is None
+        self.client = client if client is not None else MongoClient(db_config.uri)
         self.db = self.client[db_config.db_name]
         self.debug = False # enable debug log
 
-        # Ping the MongoDB server to test the connection
-        self.ping_server()
+        # Ping the MongoDB server to test the connection, shared clients are tested on creation
+        if self.owns_client:
+            self.ping_server()
 
     def ping_server(self):
         """
@@ -70,21 +77,52 @@ class MongoDBClient(DataClient):
             self.debug and print(f"load_data(): Error loading data from MongoDB: {e}")
             raise
 
+    def aggregate_data(self, pipeline: list):
+        """
+        Method that runs an aggregation pipeline on the specified collection.
+
+        :param pipeline: The list of aggregation stages to run.
+        :return: The resulting documents of the aggregation.
+        """
+
+        try:
+            collection = self.db[self.collection]
+            self.debug and print(f"aggregate_data(): pipeline used: {pipeline}")
+
+            data = list(collection.aggregate(pipeline))
+
+            self.debug and print(f"aggregate_data(): data: {data}")
+            return data
+
+        except (ConnectionFailure, PyMongoError) as e:
+            self.debug and print(f"aggregate_data(): Error running aggregation on MongoDB: {e}")
+            raise
+
     def close(self):
         """
         Method to close connection to current Mongo Client.
+        Shared clients are left open for other collections and are closed on shutdown instead.
         """
-        self.client.close()
+        if self.owns_client:
+            self.client.close()
 
-    def upsert_data(self, data, key_field: str = '_id'):
+    def upsert_data(self, data, key_field: str = '_id', batch_size: int = DEFAULT_UPSERT_BATCH_SIZE):
         """
         Method that stores the data into the specified collection based on the connection source.
 
+        Documents are written with unordered bulk writes of up to `batch_size` upserts each,
+        so that a single network round trip is made per batch instead of per document.
+
         :param data: Data to store into MongoDB source.
         :param key_field: key id specified for MongoDB.
-        :return: Collection of data from the MongoDB source.
+        :param batch_size: The maximum number of upserts sent in a single bulk write.
+        :return: A list with the number of upserted, modified and failed documents per batch.
+        :raises PartialWriteError: If any document failed to be written, once every batch was written.
         """
 
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
         try:
             if self.collection in self.db.list_collection_names():
                 self.debug and print(f"upsert_data(): Collection '{self.collection}' exists.")
@@ -92,13 +130,55 @@ class MongoDBClient(DataClient):
                 self.debug and print(f"upsert_data(): Collection '{self.collection}' does not exist. New collection will be created.")
 
             collection = self.db[self.collection]
-            for document in data:
-                collection.update_one(
-                    {key_field: document[key_field]},
-                    {'$set': document},
-                    upsert=True
-                )
+            batch_results = []
+            failed_keys = []
+            for start in range(0, len(data), batch_size):
+                batch = data[start:start + batch_size]
+                batch_result = self._bulk_upsert(collection, batch, key_field)
+                failed_keys.extend(batch_result.pop('failed_keys'))
+                batch_results.append(batch_result)
+
+            if failed_keys:
+                raise PartialWriteError(failed_keys, batch_results)
+            return batch_results
 
         except (ConnectionFailure, PyMongoError) as e:
             self.debug and print(f"upsert_data(): Error inserting data into MongoDB: {e}")
             raise
+
+    def _bulk_upsert(self, collection, batch, key_field: str) -> dict:
+        """
+        Helper method that upserts a batch of documents with a single unordered bulk write.
+
+        Documents that fail to be written do not stop the rest of the batch from being written.
+
+        :param collection: The MongoDB collection to write to.
+        :param batch: The documents to upsert.
+        :param key_field: key id specified for MongoDB.
+        :return: The number of upserted, modified and failed documents in the batch, and the
+                 key field values of the failed documents.
+        """
+
+        operations = [
+            UpdateOne({key_field: document[key_field]}, {'$set': document}, upsert=True)
+            for document in batch
+        ]
+
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            return {
+                'upserted': result.upserted_count,
+                'modified': result.modified_count,
+                'failed': 0,
+                'failed_keys': []
+            }
+
+        except BulkWriteError as e:
+            details = e.details
+            self.debug and print(f"upsert_data(): {len(details.get('writeErrors', []))} documents failed to be written.")
+            return {
+                'upserted': details.get('nUpserted', 0),
+                'modified': details.get('nModified', 0),
+                'failed': len(details.get('writeErrors', [])),
+                'failed_keys': [batch[error['index']][key_field] for error in details.get('writeErrors', [])]
+            }
@@ -1,5 +1,7 @@
 from enum import Enum
 from datetime import datetime, timedelta
+import os
+from zoneinfo import ZoneInfo
 
 class DateRange(Enum):
     SIX_MONTHS = 180
@@ -7,3 +9,12 @@ class DateRange(Enum):
     NEW_MONTH = 30
     TWELVE_MONTHS = 365
     ONE_DAY = 0
+
+
+def get_timezone() -> ZoneInfo:
+    """
+    Returns the timezone posts are bucketed into days and months in, named by the TIMEZONE environment
+    variable (e.g. 'Asia/Singapore'), or UTC if it is not set. The Data Management module buckets the
+    daily sentiment rollups in the same timezone.
+    """
+    return ZoneInfo(os.getenv("TIMEZONE", "UTC"))
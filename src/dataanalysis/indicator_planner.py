@@ -0,0 +1,81 @@
+import threading
+from typing import List, Dict, Optional, Tuple
+
+from .date_range import DateRange
+from .aggregator import PostCache
+
+
+class IndicatorPlanner:
+    """
+    Plans the updates of the indicators of a single `execute` call. Indicators are grouped by their
+    keyword set and aggregate, and the aggregation of each group is computed once and shared by
+    every indicator of the group, instead of querying and aggregating the same posts for each one.
+    Indicators with overlapping keyword sets share the posts loaded from the database through a PostCache.
+
+    A planner holds the state of one `execute` call only, so concurrent calls each use their own.
+    """
+
+    def __init__(self, data_aggregator, post_cache: Optional[PostCache] = None):
+        """
+        Initializes the IndicatorPlanner with the aggregator computing the shared aggregations.
+
+        :param data_aggregator: the aggregator (e.g. OverallAggregator) used to aggregate the posts.
+        :param post_cache: Optional PostCache of the posts loaded by the aggregations. A new one is
+                           created if not given.
+        """
+        self.data_aggregator = data_aggregator
+        self.post_cache = post_cache if post_cache is not None else PostCache()
+        self.results = {}
+        self.aggregate_weights = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def build_key(filters: List[str], aggregate_name: Optional[str]) -> Tuple[Tuple[str, ...], Optional[str]]:
+        """
+        Builds the key that identifies the posts and the weighting an indicator aggregates.
+
+        :param filters: list of str, the keywords that a post must all contain.
+        :param aggregate_name: str, the name of the aggregate with the weights.
+        :return: tuple of the sorted lowercase keywords and the aggregate name.
+        """
+        return tuple(sorted({keyword.lower() for keyword in filters or []})), aggregate_name
+
+    def group(self, indicators: List[Dict]) -> List[List[Dict]]:
+        """
+        Groups the indicators that aggregate the same posts with the same aggregate.
+
+        :param indicators: list of indicator documents.
+        :return: list of groups of indicators, in the order the groups and indicators first appear.
+        """
+        groups = {}
+        for indicator in indicators:
+            key = self.build_key(indicator.get('filters', []), indicator.get('aggregateName'))
+            groups.setdefault(key, []).append(indicator)
+        return list(groups.values())
+
+    def aggregate_data_by_date(self, aggregate_name: Optional[str], model_keys: List[str],
+                               weights: Dict[str, Dict[str, float]], filters: List[str],
+                               date_range: DateRange) -> List[Dict[str, float]]:
+        """
+        Aggregates the posts by date, reusing the result of an earlier indicator of the same group.
+
+        :param aggregate_name: str, the name of the aggregate with the weights.
+        :param model_keys: list of str, the model keys to use for aggregation.
+        :param weights: dict, weights for each model and its components.
+        :param filters: list of str, the keywords that a post must all contain.
+        :param date_range: DateRange to aggregate over.
+        :return: list of dicts, each containing the date and the average score on that date.
+        """
+        key = (self.build_key(filters, aggregate_name), date_range)
+        with self.lock:
+            if key in self.results:
+                return self.results[key]
+
+        result = self.data_aggregator.aggregate_data_by_date(
+            model_keys=model_keys, weights=weights, filters=filters, date_range=date_range,
+            post_cache=self.post_cache
+        )
+
+        with self.lock:
+            self.results[key] = result
+        return result
@@ -1,12 +1,24 @@
 from abc import ABC, abstractmethod
 from typing import Union, List
 
+import numpy as np
+
 
 class NormalizationStrategy(ABC):
     @abstractmethod
     def normalize(self, score: Union[float, List[float]]) -> Union[float, List[float]]:
         pass
 
+    def normalize_array(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Normalize an array of scores at once. Strategies that can be expressed as array operations
+        should override this method, the default implementation normalizes each score individually.
+
+        :param scores: A one-dimensional array of scores.
+        :return: An array with the normalized scores.
+        """
+        return np.array([self.normalize(float(score)) for score in scores], dtype=float)
+
 
 class MinMaxNormalizationStrategy(NormalizationStrategy):
     def __init__(self, min_value: float, max_value: float):
@@ -23,5 +35,10 @@ class MinMaxNormalizationStrategy(NormalizationStrategy):
         # Clamp the value to ensure it stays between 0 and 100
         return max(0, min(100, normalized_score))
 
+    def normalize_array(self, scores: np.ndarray) -> np.ndarray:
+        normalized_scores = (scores - self.min_value) / (self.max_value - self.min_value) * 100
+        # Clamp the values to ensure they stay between 0 and 100
+        return np.clip(normalized_scores, 0, 100)
+
 
 # TODO: Implement Z-Score/Scaling Normalization
@@ -25,4 +25,15 @@ class DataCollection(ABC):
         Returns up to the 1000 most recent posts as a JSON string.
         (Exact number of posts depeends on the number of posts exposed by the reddit API, this can range from 500-1000)
         """
+        pass
+
+    @classmethod
+    @abstractmethod
+    def scheduleSubredditData(self, subredditIntervals: dict, stopEvent=None) -> None:
+        """
+        Polls the latest posts of several subreddits concurrently, each at its own interval in seconds,
+        until the stop event is set.
+
+        The intervals adapt to the posting activity of each subreddit, so busier subreddits are polled more often.
+        """
         pass
\ No newline at end of file
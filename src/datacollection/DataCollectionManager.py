@@ -1,8 +1,12 @@
+import threading
+
 from .DataCollection import DataCollection
 from .DCKafkaClient import DCKafkaClient
 from .query import QueryConstants
 from .parser.QueryParser import QueryParser
 from .parser.ResultParser import ResultParser
+from .scheduler.SubredditScheduler import SubredditScheduler
+from .api.SeenPostIndex import seenPostIndex
 
 class DataCollectionManager(DataCollection):
     """
@@ -32,6 +36,8 @@ class DataCollectionManager(DataCollection):
         resultList = query.execute()
         filteredResults = self._resultParser.parseRedditData(resultList)
         self._kafkaClient.sendToRedditTopic(filteredResults)
+        # Only record the posts once they are sent, so that they are collected again if sending fails
+        seenPostIndex.markSeen(resultList)
 
     @classmethod
     def getLatestSubredditData(self, subreddit: str) -> None:
@@ -41,7 +47,28 @@ class DataCollectionManager(DataCollection):
         Calls on the QueryParser to process the query, then executes the query
         and calls the ResultParser to extract and format the relevant fields.
         """
+        self._collectSubredditData(subreddit)
+
+    @classmethod
+    def scheduleSubredditData(self, subredditIntervals: dict, stopEvent: threading.Event = None) -> None:
+        """
+        Provides the concrete implementation of the scheduleSubredditData method.
+
+        Polls the subreddits concurrently with a SubredditScheduler until the stop event is set. Each poll sends
+        its results to Kafka as soon as it finishes.
+        """
+        scheduler = SubredditScheduler(self._collectSubredditData, subredditIntervals)
+        scheduler.run(stopEvent)
+
+    @classmethod
+    def _collectSubredditData(self, subreddit: str) -> list:
+        """
+        Collects the latest posts of a subreddit and sends them to Kafka, returning the raw results.
+        """
         query = self._queryParser.parseQuery(QueryConstants.DATA_SOURCE_REDDIT, QueryConstants.QUERY_TYPE_SUBREDDIT_LATEST, subreddit)
         resultList = query.execute()
         filteredResults = self._resultParser.parseRedditData(resultList)
         self._kafkaClient.sendToRedditTopic(filteredResults)
+        # Only record the posts once they are sent, so that they are collected again if sending fails
+        seenPostIndex.markSeen(resultList)
+        return resultList
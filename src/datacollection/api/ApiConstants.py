@@ -24,6 +24,34 @@ MAXIMUM_AUTHENTICATION_ATTEMPTS = 3
 MAXIMUM_QUERY_ATTEMPTS = 5
 MAXIMUM_COMMENT_RETRIEVAL_ATTEMPTS = 5
 
+# Reddit allows 100 requests per minute per OAuth client, shared by all concurrent requests.
+# This rate is used until the X-Ratelimit headers of a response report the actual budget.
+REDDIT_RATE_LIMIT_REQUESTS = 100
+REDDIT_RATE_LIMIT_WINDOW = 60
+# Number of posts whose comments are retrieved concurrently
+COMMENT_RETRIEVAL_WORKERS = 8
+# Number of requests that can be made at once while pacing the reported rate limit budget
+RATE_LIMIT_BURST = COMMENT_RETRIEVAL_WORKERS
+# Failed requests are reattempted after a random delay of up to BACKOFF_BASE_SECONDS * 2^attempt seconds,
+# capped at BACKOFF_MAX_SECONDS
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 60
+
+# Connections to Reddit kept alive by the shared session, one per concurrent comment retrieval
+# of each subreddit polled at once (up to MAXIMUM_CONCURRENT_POLLS in SchedulerConstants)
+HTTP_POOL_SIZE = COMMENT_RETRIEVAL_WORKERS * 4
+# Seconds to wait for Reddit to respond to a request
+REQUEST_TIMEOUT = 30
+# Access tokens are requested again this many seconds before they expire. Reddit tokens last 1 hour.
+ACCESS_TOKEN_REFRESH_MARGIN = 60
+ACCESS_TOKEN_DEFAULT_LIFETIME = 3600
+
+# Local SQLite index of the collected posts, so that later cycles only collect new posts and changed comments
+SEEN_POST_INDEX_PATH = os.getenv("SEEN_POST_INDEX_PATH", "seen_posts.sqlite3")
+# Seconds after which a post that was not collected again is removed from the index
+SEEN_POST_RETENTION = 30 * 24 * 3600
+
 REQUEST_SUCCESS_CODE = 200
+REQUEST_UNAUTHORIZED_CODE = 401
 REQUEST_FORBIDDEN_CODE = 403
 REQUEST_EXCEEDED_CODE = 429
\ No newline at end of file
@@ -0,0 +1,121 @@
+import random
+import threading
+import time
+
+from . import ApiConstants
+
+class RateLimiter:
+    """
+    Token bucket shared by the threads making Reddit API calls.
+
+    Until Reddit reports its rate limit, the bucket holds up to `maxRequests` tokens and refills at `maxRequests`
+    tokens per `windowSeconds`. Every response's X-Ratelimit-Remaining and X-Ratelimit-Reset headers then
+    resynchronise the bucket with the budget Reddit actually has left: the remaining requests are spread evenly
+    over the seconds until the window resets, in bursts of up to `burstSize` requests, and once the budget is
+    spent, requests wait for the reset.
+
+    Each request takes a token, waiting for one to be refilled if the bucket is empty, so concurrent requests never
+    exceed the rate limit together. A 'Too many requests' response pauses every thread.
+    """
+
+    def __init__(self, maxRequests: int, windowSeconds: float, burstSize: int = ApiConstants.RATE_LIMIT_BURST):
+        self._maxRequests = maxRequests
+        self._windowSeconds = windowSeconds
+        self._burstSize = burstSize
+        self._capacity = maxRequests
+        self._refillRate = maxRequests / windowSeconds
+        self._tokens = float(maxRequests)
+        self._lastRefillTime = time.monotonic()
+        # Requests left in the current window and the time the window resets, as reported by Reddit
+        self._remaining = None
+        self._resetTime = 0.0
+        self._pausedUntil = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Takes a token from the bucket, blocking until one is available.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._remaining is not None and now >= self._resetTime:
+                    self._startWindow()
+                if now >= self._pausedUntil and self._tokens >= 1 and (self._remaining is None or self._remaining >= 1):
+                    self._tokens -= 1
+                    if self._remaining is not None:
+                        self._remaining -= 1
+                    return
+                if self._remaining is not None and self._remaining < 1:
+                    waitTime = self._resetTime - now
+                else:
+                    waitTime = (1 - self._tokens) / self._refillRate
+                waitTime = max(waitTime, self._pausedUntil - now)
+            time.sleep(waitTime)
+
+    def update(self, headers) -> None:
+        """
+        Resynchronises the bucket with the X-Ratelimit-Remaining and X-Ratelimit-Reset headers of a response.
+        Responses without the headers are ignored.
+        """
+        remainingHeader = headers.get("X-Ratelimit-Remaining")
+        resetHeader = headers.get("X-Ratelimit-Reset")
+        if remainingHeader is None or resetHeader is None:
+            return
+        try:
+            remaining = float(remainingHeader)
+            secondsUntilReset = max(float(resetHeader), 1.0)
+        except ValueError:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            resetTime = now + secondsUntilReset
+            # Responses of concurrent requests arrive out of order: within a window, the lowest budget is the latest
+            if self._remaining is not None and abs(resetTime - self._resetTime) < 1:
+                remaining = min(remaining, self._remaining)
+            self._remaining = remaining
+            self._resetTime = resetTime
+            self._capacity = max(1, min(self._burstSize, remaining))
+            self._refillRate = max(remaining, 1) / secondsUntilReset
+            self._tokens = min(self._tokens, self._capacity)
+
+    def getBackoffDelay(self, attempt: int, exceeded: bool = False) -> float:
+        """
+        Returns the number of seconds to wait before reattempting a failed request: a random delay of up to
+        BACKOFF_BASE_SECONDS * 2^attempt, capped at BACKOFF_MAX_SECONDS. After a 'Too many requests' error,
+        the delay lasts at least until the rate limit window resets, if Reddit reported it.
+        """
+        delay = random.uniform(0, min(ApiConstants.BACKOFF_MAX_SECONDS, ApiConstants.BACKOFF_BASE_SECONDS * 2 ** attempt))
+        if exceeded:
+            with self._lock:
+                if self._remaining is not None:
+                    delay = max(delay, self._resetTime - time.monotonic())
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stops every thread from making requests for the given number of seconds.
+        """
+        with self._lock:
+            self._pausedUntil = max(self._pausedUntil, time.monotonic() + seconds)
+
+    def _refill(self, now: float) -> None:
+        """
+        Adds the tokens refilled since the last refill, up to the capacity of the bucket.
+        """
+        self._tokens = min(self._capacity, self._tokens + (now - self._lastRefillTime) * self._refillRate)
+        self._lastRefillTime = now
+
+    def _startWindow(self) -> None:
+        """
+        Goes back to the configured rate once the reported window has reset, until Reddit reports the new budget.
+        """
+        self._remaining = None
+        self._capacity = self._burstSize
+        self._refillRate = self._maxRequests / self._windowSeconds
+        self._tokens = float(self._burstSize)
+
+redditRateLimiter = RateLimiter(ApiConstants.REDDIT_RATE_LIMIT_REQUESTS, ApiConstants.REDDIT_RATE_LIMIT_WINDOW)
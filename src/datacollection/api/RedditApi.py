@@ -1,71 +1,110 @@
 import requests
 import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from .Api import Api
 from . import ApiConstants
+from .RateLimiter import redditRateLimiter
+from .RedditHttpClient import redditHttpClient
+from .SeenPostIndex import seenPostIndex
 from ..query import QueryConstants
 
 class RedditApi(Api):
     """
     Abstract class containing the template method for Reddit API calls.
+
+    Each instance holds its own query, so that several queries can be executed concurrently.
     """
 
-    @classmethod
     def callApi(self) -> list:
         """
         Delegates the work to the Template Method
         """
         return self.callRedditApiTemplate()
     
-    @classmethod
     def callRedditApiTemplate(self) -> list:
         """
         Template method for all Reddit API calls.
         """
         authKey = self._getAuthKey()
         authHeader = {"Authorization": f"bearer {authKey}"}
-        resultList = self._makeApiCall(self, authHeader)
-        return self._retrieveComments(self, resultList, authHeader)
+        resultList = self._makeApiCall(authHeader)
+        return self._retrieveComments(resultList, authHeader)
 
+    @staticmethod
     def _getAuthKey() -> str:
-        auth = requests.auth.HTTPBasicAuth(ApiConstants.REDDIT_APP_ID, ApiConstants.REDDIT_SECRET_KEY)
-        data = ApiConstants.data
+        """
+        Returns the access token shared by all RedditApi subclasses, which is only requested again near its expiry.
+        """
+        return redditHttpClient.getAccessToken()
 
-        authenticationCounter = 0
-        while authenticationCounter < ApiConstants.MAXIMUM_AUTHENTICATION_ATTEMPTS:
-            authenticationResponse = requests.post(ApiConstants.AUTH_URL, auth=auth, data=data)
-            authenticationResponseCode = authenticationResponse.status_code
-            if authenticationResponseCode == ApiConstants.REQUEST_SUCCESS_CODE:
-                return authenticationResponse.json()["access_token"]
-            elif authenticationResponseCode == ApiConstants.REQUEST_EXCEEDED_CODE:
-                authenticationCounter += 1
-                print("'Too many requests' error encountered during authentication. Reattempting in 15s...")
-                time.sleep(15)
-            else:
-                authenticationCounter += 1
-                print("Unknown Request Error encountered during authentication: " + str(authenticationResponseCode)
-                    + ". Reattempting in 15s...")
-                time.sleep(15)
-        else:
-            raise ValueError("Maximum number of authentication attempts (" + str(ApiConstants.MAXIMUM_AUTHENTICATION_ATTEMPTS)
-                + ") reached. Please try again later.")
+    @staticmethod
+    def _sendGetRequest(query: str, authHeader: dict) -> requests.Response:
+        """
+        Sends a GET request to the Reddit API through the shared session under the shared rate limit, and updates
+        the rate limit with the X-Ratelimit headers of the response.
+
+        If Reddit rejects the access token (e.g. it expired during a long collection cycle), a new token is set in
+        the auth header, which is shared by the requests of the cycle, and the request is sent again.
+        """
+        redditRateLimiter.acquire()
+        sentAuthorization = authHeader["Authorization"]
+        response = redditHttpClient.get(query, {**authHeader, "Authorization": sentAuthorization})
+        redditRateLimiter.update(response.headers)
+        if response.status_code == ApiConstants.REQUEST_UNAUTHORIZED_CODE:
+            redditHttpClient.invalidateAccessToken(sentAuthorization.removeprefix("bearer "))
+            authHeader["Authorization"] = f"bearer {redditHttpClient.getAccessToken()}"
+            redditRateLimiter.acquire()
+            response = redditHttpClient.get(query, authHeader)
+            redditRateLimiter.update(response.headers)
+        return response
 
     @abstractmethod
-    def _makeApiCall(authHeader: str) -> list:
+    def _makeApiCall(self, authHeader: str) -> list:
         pass
 
     def _retrieveComments(self, postList: list, authHeader: str) -> list:
-        for i in range(len(postList)):
-            post = postList[i]
-            post["comments"] = self._getCommentsFromPost(authHeader, post["data"]["id"], post["data"]["subreddit"])
+        """
+        Retrieves the comments of every post concurrently, with up to COMMENT_RETRIEVAL_WORKERS requests in flight
+        under the shared rate limit.
+
+        Posts collected by a previous cycle whose number of comments has not changed since are left out of the
+        results, without retrieving their comments. Posts whose comments could not be retrieved are flagged with
+        "commentRetrievalFailed", so that they are not recorded as collected.
+        """
+        seenCommentCounts = seenPostIndex.getCommentCounts([post["data"]["id"] for post in postList])
+        postList = [post for post in postList
+                    if seenCommentCounts.get(post["data"]["id"]) != post["data"].get("num_comments", 0)]
+        with ThreadPoolExecutor(max_workers=ApiConstants.COMMENT_RETRIEVAL_WORKERS) as executor:
+            commentsLists = executor.map(
+                lambda post: self._getCommentsFromPost(authHeader, post["data"]["id"], post["data"]["subreddit"]),
+                postList)
+            for post, commentsList in zip(postList, commentsLists):
+                if commentsList is None:
+                    post["comments"] = []
+                    post["commentRetrievalFailed"] = True
+                else:
+                    post["comments"] = commentsList
         return postList
+
+    @staticmethod
+    def _hasSeenPost(postList: list) -> bool:
+        """
+        Checks whether any of the posts was collected by a previous cycle. As listings are sorted from newest to
+        oldest, the posts after it were collected too and paging can stop.
+        """
+        return len(seenPostIndex.getCommentCounts([post["data"]["id"] for post in postList])) > 0
     
+    @staticmethod
     def _getCommentsFromPost(authHeader:str, postId: str, postSubreddit: str) -> list:
+        """
+        Retrieves the comments of a post, or None if they could not be retrieved.
+        """
         query = QueryConstants.REDDIT_GET_COMMENTS_URL.substitute(subreddit=postSubreddit, postId=postId)
         commentRetrievalCounter = 0
         while commentRetrievalCounter < ApiConstants.MAXIMUM_COMMENT_RETRIEVAL_ATTEMPTS:
-            commentRetrievalResponse = requests.get(query, headers=authHeader)
+            commentRetrievalResponse = RedditApi._sendGetRequest(query, authHeader)
             commentResponseCode = commentRetrievalResponse.status_code
             if commentResponseCode == ApiConstants.REQUEST_SUCCESS_CODE:
                 # The response is a json array (python list) consisting of 2 objects: the post and the comments.
@@ -73,15 +112,19 @@ class RedditApi(Api):
                 commentsList = commentRetrievalResponse.json()[1]["data"]["children"]
                 return commentsList
             elif commentResponseCode == ApiConstants.REQUEST_EXCEEDED_CODE:
+                delay = redditRateLimiter.getBackoffDelay(commentRetrievalCounter, exceeded=True)
                 commentRetrievalCounter += 1
-                print("'Too many requests' error encountered during comment retrieval for post " + postId + ". Reattempting in 15s...")
-                time.sleep(15)
+                print("'Too many requests' error encountered during comment retrieval for post " + postId + ". Reattempting in "
+                    + str(round(delay, 1)) + "s...")
+                # Pause the other threads too, as they share the exceeded rate limit
+                redditRateLimiter.pause(delay)
             else:
+                delay = redditRateLimiter.getBackoffDelay(commentRetrievalCounter)
                 commentRetrievalCounter += 1
                 print("Unknown Request Error encountered during comment retrieval for post" + postId + ": " + str(commentResponseCode)
-                    + ". Reattempting in 15s...")
-                time.sleep(15)
+                    + ". Reattempting in " + str(round(delay, 1)) + "s...")
+                time.sleep(delay)
         else:
             print("Maximum number of comment retrieval attempts (" + str(ApiConstants.MAXIMUM_COMMENT_RETRIEVAL_ATTEMPTS)
                 + ") reached. Please try again later.")
-            return []
\ No newline at end of file
+            return None
\ No newline at end of file
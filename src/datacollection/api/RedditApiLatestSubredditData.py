@@ -1,16 +1,15 @@
-import requests
 from string import Template
 import time
 
 from . import ApiConstants
 from .RedditApi import RedditApi
+from .RateLimiter import redditRateLimiter
 
 class RedditApiLatestSubredditData(RedditApi):
     """
     Handles calling the Reddit API for the latest posts on the specified subreddit.
     """
 
-    @classmethod
     def __init__(self, query: str):
         self.query = Template(query)
 
@@ -28,25 +27,30 @@ class RedditApiLatestSubredditData(RedditApi):
             after = queryData['data']['after']
             count += queryData['data']['dist']
             compiledResults.extend(queryData['data']['children'])
-            time.sleep(1)
+            # The rest of the listing was collected by a previous cycle
+            if self._hasSeenPost(queryData['data']['children']):
+                break
         return compiledResults
         
+    @staticmethod
     def _getPageData(query: str, authHeader: str) -> dict:
         queryCounter = 0
         while queryCounter < ApiConstants.MAXIMUM_QUERY_ATTEMPTS:
-            queryResponse = requests.get(query, headers=authHeader)
+            queryResponse = RedditApi._sendGetRequest(query, authHeader)
             queryResponseCode = queryResponse.status_code
             if queryResponseCode == ApiConstants.REQUEST_SUCCESS_CODE:
                 return queryResponse.json()
             elif queryResponseCode == ApiConstants.REQUEST_EXCEEDED_CODE:
+                delay = redditRateLimiter.getBackoffDelay(queryCounter, exceeded=True)
                 queryCounter += 1
-                print("'Too many requests' error encountered during query. Reattempting in 15s...")
-                time.sleep(15)
+                print("'Too many requests' error encountered during query. Reattempting in " + str(round(delay, 1)) + "s...")
+                redditRateLimiter.pause(delay)
             else:
+                delay = redditRateLimiter.getBackoffDelay(queryCounter)
                 queryCounter += 1
                 print("Unknown Request Error encountered during query: " + str(queryResponseCode)
-                    + ". Reattempting in 15s...")
-                time.sleep(15)
+                    + ". Reattempting in " + str(round(delay, 1)) + "s...")
+                time.sleep(delay)
         else:
             raise Exception("Maximum number of query attempts (" + str(ApiConstants.MAXIMUM_QUERY_ATTEMPTS)
                 + ") reached. Please try again later.")
\ No newline at end of file
@@ -0,0 +1,98 @@
+import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+
+from . import ApiConstants
+from .RateLimiter import redditRateLimiter
+
+class RedditHttpClient:
+    """
+    HTTP layer shared by all RedditApi subclasses.
+
+    Requests go through one persistent session, which keeps the connections to Reddit alive and pools them across
+    the threads retrieving comments, so that a TLS handshake is not made for every request. The OAuth access token
+    is cached and only requested again when it is about to expire, instead of authenticating for every query.
+    """
+
+    def __init__(self):
+        self._session = None
+        self._accessToken = None
+        self._accessTokenExpiryTime = 0.0
+        self._sessionLock = threading.Lock()
+        self._accessTokenLock = threading.Lock()
+
+    def getSession(self) -> requests.Session:
+        """
+        Returns the shared session, creating it on first use.
+        """
+        with self._sessionLock:
+            if self._session is None:
+                self._session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=ApiConstants.HTTP_POOL_SIZE)
+                self._session.mount("https://", adapter)
+                self._session.mount("http://", adapter)
+            return self._session
+
+    def get(self, url: str, headers: dict) -> requests.Response:
+        """
+        Sends a GET request through the shared session.
+        """
+        return self.getSession().get(url, headers=headers, timeout=ApiConstants.REQUEST_TIMEOUT)
+
+    def getAccessToken(self) -> str:
+        """
+        Returns the cached access token, requesting a new one if there is none or it expires within
+        ACCESS_TOKEN_REFRESH_MARGIN seconds.
+        """
+        session = self.getSession()
+        with self._accessTokenLock:
+            if self._accessToken is None or time.monotonic() >= self._accessTokenExpiryTime - ApiConstants.ACCESS_TOKEN_REFRESH_MARGIN:
+                self._accessToken, expiresIn = self._requestAccessToken(session)
+                self._accessTokenExpiryTime = time.monotonic() + expiresIn
+            return self._accessToken
+
+    def invalidateAccessToken(self, accessToken: str) -> None:
+        """
+        Discards the cached access token after Reddit rejected it, unless another thread already replaced it.
+        """
+        with self._accessTokenLock:
+            if self._accessToken == accessToken:
+                self._accessToken = None
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections of the session.
+        """
+        with self._sessionLock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _requestAccessToken(self, session: requests.Session) -> tuple:
+        """
+        Requests a new access token, returning it with the number of seconds it is valid for.
+        """
+        auth = requests.auth.HTTPBasicAuth(ApiConstants.REDDIT_APP_ID, ApiConstants.REDDIT_SECRET_KEY)
+        data = ApiConstants.data
+
+        authenticationCounter = 0
+        while authenticationCounter < ApiConstants.MAXIMUM_AUTHENTICATION_ATTEMPTS:
+            authenticationResponse = session.post(ApiConstants.AUTH_URL, auth=auth, data=data, timeout=ApiConstants.REQUEST_TIMEOUT)
+            authenticationResponseCode = authenticationResponse.status_code
+            if authenticationResponseCode == ApiConstants.REQUEST_SUCCESS_CODE:
+                authenticationData = authenticationResponse.json()
+                return authenticationData["access_token"], authenticationData.get("expires_in", ApiConstants.ACCESS_TOKEN_DEFAULT_LIFETIME)
+            delay = redditRateLimiter.getBackoffDelay(authenticationCounter)
+            authenticationCounter += 1
+            if authenticationResponseCode == ApiConstants.REQUEST_EXCEEDED_CODE:
+                print("'Too many requests' error encountered during authentication. Reattempting in " + str(round(delay, 1)) + "s...")
+            else:
+                print("Unknown Request Error encountered during authentication: " + str(authenticationResponseCode)
+                    + ". Reattempting in " + str(round(delay, 1)) + "s...")
+            time.sleep(delay)
+        else:
+            raise ValueError("Maximum number of authentication attempts (" + str(ApiConstants.MAXIMUM_AUTHENTICATION_ATTEMPTS)
+                + ") reached. Please try again later.")
+
+redditHttpClient = RedditHttpClient()
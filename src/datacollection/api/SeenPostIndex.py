@@ -0,0 +1,75 @@
+import os
+import sqlite3
+import threading
+import time
+
+from . import ApiConstants
+
+class SeenPostIndex:
+    """
+    Index of the posts collected by previous cycles, persisted locally in SQLite.
+
+    For each post, the index keeps the number of comments it had when it was collected and when it was last collected,
+    so that collection can stop paging at posts that were already collected and skip the comment retrieval of posts
+    whose number of comments has not changed. Posts not collected for SEEN_POST_RETENTION seconds are removed.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def getCommentCounts(self, postIds: list) -> dict:
+        """
+        Returns the number of comments of each given post that was collected before, by post id.
+        Posts that were never collected are left out.
+        """
+        commentCounts = {}
+        with self._lock:
+            connection = self._getConnection()
+            # Stay under SQLite's limit on the number of query parameters
+            for start in range(0, len(postIds), 900):
+                batch = postIds[start:start + 900]
+                rows = connection.execute("SELECT post_id, num_comments FROM seen_posts WHERE post_id IN ("
+                    + ",".join("?" * len(batch)) + ")", batch)
+                commentCounts.update(rows.fetchall())
+        return commentCounts
+
+    def markSeen(self, postList: list) -> None:
+        """
+        Records the given raw Reddit posts as collected, with their current number of comments.
+        Posts whose comments could not be retrieved are not recorded, so that they are collected again.
+        """
+        now = time.time()
+        rows = [(post["data"]["id"], post["data"].get("num_comments", 0), now) for post in postList
+                if not post.get("commentRetrievalFailed", False)]
+        with self._lock:
+            connection = self._getConnection()
+            with connection:
+                connection.executemany("INSERT OR REPLACE INTO seen_posts (post_id, num_comments, last_seen) VALUES (?, ?, ?)", rows)
+                connection.execute("DELETE FROM seen_posts WHERE last_seen < ?", (now - ApiConstants.SEEN_POST_RETENTION,))
+
+    def close(self) -> None:
+        """
+        Closes the connection to the index.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _getConnection(self) -> sqlite3.Connection:
+        """
+        Opens the index on first use, creating it if it does not exist.
+        """
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self._path))
+            os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS seen_posts "
+                "(post_id TEXT PRIMARY KEY, num_comments INTEGER NOT NULL, last_seen REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS seen_posts_last_seen ON seen_posts (last_seen)")
+            self._connection.commit()
+        return self._connection
+
+seenPostIndex = SeenPostIndex(ApiConstants.SEEN_POST_INDEX_PATH)
@@ -7,11 +7,9 @@ class RedditLatestDataQuery(Query):
     Query class that handles the collection of the latest reddit data on /new.
     """
 
-    @classmethod
     def __init__(self):
         self.query = QueryConstants.REDDIT_LATEST_DATA_URL
 
-    @classmethod
     def execute(self) -> list:
         """
         Initiates the relevant API call to collect the latest data from /new.
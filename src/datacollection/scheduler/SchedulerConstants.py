@@ -0,0 +1,10 @@
+""" This module contains the constants used in the scheduling of collections. """
+
+# Number of subreddits polled at once. Their requests share the global Reddit rate limit.
+MAXIMUM_CONCURRENT_POLLS = 4
+
+# Each subreddit's polling interval adapts to its posting activity, so that a poll finds about this many new posts
+TARGET_NEW_POSTS_PER_POLL = 25
+# Bounds of the adapted polling interval, relative to the subreddit's configured interval
+MINIMUM_INTERVAL_FACTOR = 0.25
+MAXIMUM_INTERVAL_FACTOR = 4
@@ -0,0 +1,110 @@
+import heapq
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable
+
+from . import SchedulerConstants
+
+class SubredditScheduler:
+    """
+    Polls several subreddits concurrently, each at its own interval.
+
+    Every subreddit starts at its configured polling interval, which then adapts to its posting activity: the interval
+    is set so that the next poll finds about TARGET_NEW_POSTS_PER_POLL new posts, within MINIMUM_INTERVAL_FACTOR and
+    MAXIMUM_INTERVAL_FACTOR times the configured interval. Busy subreddits are therefore polled more often than quiet ones.
+
+    Up to MAXIMUM_CONCURRENT_POLLS subreddits are polled at once. The polls share the global Reddit rate limit, and
+    each poll handles its own results as soon as it finishes, so a slow subreddit does not hold back the others.
+    """
+
+    def __init__(self, pollSubreddit: Callable[[str], list], subredditIntervals: dict,
+                 maximumConcurrentPolls: int = SchedulerConstants.MAXIMUM_CONCURRENT_POLLS):
+        """
+        pollSubreddit collects the latest posts of a subreddit and returns them as raw Reddit data.
+        subredditIntervals maps each subreddit to its polling interval in seconds.
+        """
+        if len(subredditIntervals) == 0:
+            raise ValueError("At least one subreddit must be scheduled")
+        if any(interval <= 0 for interval in subredditIntervals.values()):
+            raise ValueError("Polling intervals must be positive")
+
+        self._pollSubreddit = pollSubreddit
+        self._configuredIntervals = dict(subredditIntervals)
+        self._intervals = dict(subredditIntervals)
+        self._lastPollTimes = {}
+        self._maximumConcurrentPolls = maximumConcurrentPolls
+        # Every subreddit is due right away, in the given order
+        self._queue = [(0.0, position, subreddit) for position, subreddit in enumerate(subredditIntervals)]
+
+    def getInterval(self, subreddit: str) -> float:
+        """
+        Returns the current polling interval of a subreddit in seconds.
+        """
+        return self._intervals[subreddit]
+
+    def run(self, stopEvent: threading.Event = None, maximumPolls: int = None) -> None:
+        """
+        Polls the subreddits until the stop event is set, or until maximumPolls polls have been made if it is given.
+        """
+        stopEvent = stopEvent or threading.Event()
+        pollCount = 0
+        runningPolls = {}
+        with ThreadPoolExecutor(max_workers=self._maximumConcurrentPolls) as executor:
+            while not stopEvent.is_set():
+                # Start the due polls
+                now = time.monotonic()
+                while (self._queue and self._queue[0][0] <= now and len(runningPolls) < self._maximumConcurrentPolls
+                        and (maximumPolls is None or pollCount < maximumPolls)):
+                    _, position, subreddit = heapq.heappop(self._queue)
+                    runningPolls[executor.submit(self._poll, subreddit)] = (position, subreddit)
+                    pollCount += 1
+
+                if maximumPolls is not None and pollCount >= maximumPolls and not runningPolls:
+                    return
+
+                # Wait for a poll to finish or the next poll to be due
+                timeout = max(0.0, self._queue[0][0] - now) if self._queue else None
+                if runningPolls:
+                    if len(runningPolls) >= self._maximumConcurrentPolls:
+                        timeout = None
+                    finishedPolls, _ = wait(runningPolls, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for finishedPoll in finishedPolls:
+                        position, subreddit = runningPolls.pop(finishedPoll)
+                        heapq.heappush(self._queue, (time.monotonic() + self._intervals[subreddit], position, subreddit))
+                else:
+                    stopEvent.wait(timeout)
+
+            # Let the running polls finish, without starting new ones
+            wait(runningPolls)
+
+    def _poll(self, subreddit: str) -> None:
+        """
+        Polls a subreddit, then adapts its polling interval to the number of posts created since its previous poll.
+        """
+        pollTime = time.time()
+        try:
+            resultList = self._pollSubreddit(subreddit)
+        except Exception as e:
+            print("Error encountered while polling r/" + subreddit + ": " + str(e))
+            return
+
+        lastPollTime = self._lastPollTimes.get(subreddit)
+        self._lastPollTimes[subreddit] = pollTime
+        if lastPollTime is not None:
+            newPostCount = sum(1 for post in resultList if post["data"]["created_utc"] > lastPollTime)
+            self._intervals[subreddit] = self._getAdaptedInterval(subreddit, newPostCount, pollTime - lastPollTime)
+        print("Polled r/" + subreddit + ", next poll in " + str(round(self._intervals[subreddit], 1)) + "s")
+
+    def _getAdaptedInterval(self, subreddit: str, newPostCount: int, elapsedTime: float) -> float:
+        """
+        Returns the interval at which TARGET_NEW_POSTS_PER_POLL posts are expected, at the rate the new posts were created,
+        within the bounds of the subreddit's configured interval.
+        """
+        configuredInterval = self._configuredIntervals[subreddit]
+        if newPostCount == 0:
+            interval = self._intervals[subreddit] * 2
+        else:
+            interval = SchedulerConstants.TARGET_NEW_POSTS_PER_POLL * elapsedTime / newPostCount
+        return min(max(interval, configuredInterval * SchedulerConstants.MINIMUM_INTERVAL_FACTOR),
+                   configuredInterval * SchedulerConstants.MAXIMUM_INTERVAL_FACTOR)
@@ -2,6 +2,21 @@
 from abc import ABC, abstractmethod
 
 
+class PartialWriteError(Exception):
+    """
+    Raised when some documents failed to be written, after the rest of the documents were written.
+    """
+
+    def __init__(self, failed_keys: list, results: list):
+        """
+        :param failed_keys: The key field values of the documents that failed to be written.
+        :param results: The number of upserted, modified and failed documents per batch.
+        """
+        super().__init__(f"{len(failed_keys)} documents failed to be written.")
+        self.failed_keys = failed_keys
+        self.results = results
+
+
 class DataClient(ABC):
     """
     Abstract class for database clients, providing a unified interface 
@@ -9,7 +24,7 @@ class DataClient(ABC):
     """
 
     @abstractmethod
-    def load_data(self):
+    def load_data(self, filters: dict = None):
         """
         Loads data from the specified collection in the database.
 
@@ -21,11 +36,29 @@ class DataClient(ABC):
         - If the `collection_name` is "users", this method will load data from the "users" 
           collection, which stores documents representing user data.
 
-        :param collection_name: The name of the collection (e.g., "users", "orders") 
-                                from which data will be loaded.
+        :param filters: Optional query used to select the documents to load.
         :return: A list of documents (records) from the specified collection.
         """
 
+    def load_data_in_batches(self, batch_size: int, filters: dict = None, sort_field: str = None):
+        """
+        Loads data from the specified collection in fixed-size batches.
+
+        Clients that can stream from a server-side cursor should override this method so that
+        only one batch is held in memory at a time. The default implementation falls back to
+        slicing the result of `load_data`.
+
+        :param batch_size: The maximum number of documents in each batch.
+        :param filters: Optional query used to select the documents to load.
+        :param sort_field: Optional field to return the documents in ascending order of.
+        :return: A generator yielding lists of documents (records).
+        """
+        data = self.load_data(filters=filters)
+        if sort_field:
+            data = sorted(data, key=lambda document: document[sort_field])
+        for start in range(0, len(data), batch_size):
+            yield data[start:start + batch_size]
+
     @abstractmethod
     def upsert_data(self, data, key_field: str = '_id'):
         """
@@ -48,6 +81,29 @@ class DataClient(ABC):
                           (default is "_id").
         """
 
+    def increment_data(self, increments: dict, defaults: dict = None):
+        """
+        Increments numeric fields of documents in the specified collection of the database,
+        creating the documents that do not exist yet.
+
+        Clients that support atomic increments should override this method.
+
+        :param increments: A dictionary mapping the key of each document to a dictionary of
+                           (dotted) field paths and the amounts to increment them by.
+        :param defaults: Optional dictionary mapping the key of each document to the fields
+                         to set when the document is created.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support incrementing data.")
+
+    def delete_data(self, filters: dict = None):
+        """
+        Deletes documents from the specified collection in the database.
+
+        :param filters: Optional query used to select the documents to delete. Every document
+                        is deleted if no query is given.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deleting data.")
+
     @abstractmethod
     def close(self):
         """
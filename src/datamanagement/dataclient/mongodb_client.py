@@ -1,10 +1,13 @@
 """Module for MongoDBClient."""
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, PyMongoError
+from pymongo import MongoClient, UpdateOne, ASCENDING
+from pymongo.errors import BulkWriteError, ConnectionFailure, PyMongoError
 from tqdm import tqdm
-from .data_client import DataClient
+from .data_client import DataClient, PartialWriteError
 from .data_client_config import DataClientConfig
 
+# Default number of upserts sent to MongoDB in a single bulk write
+DEFAULT_UPSERT_BATCH_SIZE = 1000
+
 
 class MongoDBClient(DataClient):
     """
@@ -12,19 +15,23 @@ class MongoDBClient(DataClient):
     relating to this connection.
     """
 
-    def __init__(self, db_config: DataClientConfig):
+    def __init__(self, db_config: DataClientConfig, client: MongoClient = None):
         """
         Init method that defines the target collection, mongo client, and database.
 
         :param db_config: DataClientConfig that contains connection details.
+        :param client: Optional shared MongoClient to use. If not given, a dedicated MongoClient
+                       is created, which is closed together with this instance.
         """
 
         self.collection = db_config.collection
-        self.client = MongoClient(db_config.uri)
+        self.owns_client = client is None
+        self.client = client if client is not None else MongoClient(db_config.uri)
         self.db = self.client[db_config.db_name]
 
-        # Ping the MongoDB server to test the connection
-        self.ping_server()
+        # Ping the MongoDB server to test the connection, shared clients are tested on creation
+        if self.owns_client:
+            self.ping_server()
 
     def ping_server(self):
         """
@@ -39,10 +46,11 @@ class MongoDBClient(DataClient):
             print("ping(): Failed to connect to MongoDB server")
             raise  # Re-raise the exception to handle it outside
 
-    def load_data(self):
+    def load_data(self, filters: dict = None):
         """
         Method that loads specified collection from the connection source.
 
+        :param filters: Optional MongoDB query used to select the documents to load.
         :return: Collection of data from the MongoDB source.
         """
 
@@ -55,7 +63,7 @@ class MongoDBClient(DataClient):
             collection = self.db[self.collection]
 
             # Fetch and return the data from the collection
-            data = list(collection.find())
+            data = list(collection.find(filters if filters else {}))
 
             return data
 
@@ -63,15 +71,64 @@ class MongoDBClient(DataClient):
             print(f"load_data(): Error loading data from MongoDB: {e}")
             raise
 
-    def upsert_data(self, data, key_field: str = '_id'):
+    def load_data_in_batches(self, batch_size: int, filters: dict = None, sort_field: str = None):
+        """
+        Method that streams the specified collection from the connection source in batches.
+
+        Documents are pulled from a server-side cursor, so only a single batch is held in
+        memory at any point in time.
+
+        :param batch_size: The maximum number of documents in each batch.
+        :param filters: Optional MongoDB query used to select the documents to load.
+        :param sort_field: Optional field to return the documents in ascending order of.
+        :return: A generator yielding lists of documents from the MongoDB source.
+        """
+
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+        try:
+            collection = self.db[self.collection]
+            cursor = collection.find(filters if filters else {})
+            if sort_field:
+                cursor = cursor.sort(sort_field, ASCENDING)
+            cursor = cursor.batch_size(batch_size)
+
+            try:
+                batch = []
+                for document in cursor:
+                    batch.append(document)
+                    if len(batch) == batch_size:
+                        yield batch
+                        batch = []
+
+                if batch:
+                    yield batch
+
+            finally:
+                cursor.close()
+
+        except (ConnectionFailure, PyMongoError) as e:
+            print(f"load_data_in_batches(): Error loading data from MongoDB: {e}")
+            raise
+
+    def upsert_data(self, data, key_field: str = '_id', batch_size: int = DEFAULT_UPSERT_BATCH_SIZE):
         """
         Method that stores the data into the specified collection based on the connection source.
 
+        Documents are written with unordered bulk writes of up to `batch_size` upserts each,
+        so that a single network round trip is made per batch instead of per document.
+
         :param data: Data to store into MongoDB source.
         :param key_field: key id specified for MongoDB.
-        :return: Collection of data from the MongoDB source.
+        :param batch_size: The maximum number of upserts sent in a single bulk write.
+        :return: A list with the number of upserted, modified and failed documents per batch.
+        :raises PartialWriteError: If any document failed to be written, once every batch was written.
         """
 
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
         try:
             if self.collection in self.db.list_collection_names():
                 print(f"upsert_data(): Collection '{self.collection}' exists.")
@@ -79,19 +136,114 @@ class MongoDBClient(DataClient):
                 print(f"upsert_data(): Collection '{self.collection}' does not exist. New collection will be created.")
 
             collection = self.db[self.collection]
-            for document in tqdm(data, desc="Writing to mongoDB", unit="document"):
-                collection.update_one(
-                    {key_field: document[key_field]},
-                    {'$set': document},
-                    upsert=True
-                )
+            batch_results = []
+            failed_keys = []
+            progress = tqdm(total=len(data), desc="Writing to mongoDB", unit="document")
+            for start in range(0, len(data), batch_size):
+                batch = data[start:start + batch_size]
+                batch_result = self._bulk_upsert(collection, batch, key_field)
+                failed_keys.extend(batch_result.pop('failed_keys'))
+                batch_results.append(batch_result)
+                progress.update(len(batch))
+            progress.close()
+
+            if failed_keys:
+                raise PartialWriteError(failed_keys, batch_results)
+            return batch_results
 
         except (ConnectionFailure, PyMongoError) as e:
             print(f"upsert_data(): Error inserting data into MongoDB: {e}")
             raise
 
+    def _bulk_upsert(self, collection, batch, key_field: str) -> dict:
+        """
+        Helper method that upserts a batch of documents with a single unordered bulk write.
+
+        Documents that fail to be written do not stop the rest of the batch from being written.
+
+        :param collection: The MongoDB collection to write to.
+        :param batch: The documents to upsert.
+        :param key_field: key id specified for MongoDB.
+        :return: The number of upserted, modified and failed documents in the batch, and the
+                 key field values of the failed documents.
+        """
+
+        operations = [
+            UpdateOne({key_field: document[key_field]}, {'$set': document}, upsert=True)
+            for document in batch
+        ]
+
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            return {
+                'upserted': result.upserted_count,
+                'modified': result.modified_count,
+                'failed': 0,
+                'failed_keys': []
+            }
+
+        except BulkWriteError as e:
+            details = e.details
+            print(f"upsert_data(): {len(details.get('writeErrors', []))} documents failed to be written.")
+            return {
+                'upserted': details.get('nUpserted', 0),
+                'modified': details.get('nModified', 0),
+                'failed': len(details.get('writeErrors', [])),
+                'failed_keys': [batch[error['index']][key_field] for error in details.get('writeErrors', [])]
+            }
+
+    def increment_data(self, increments: dict, defaults: dict = None,
+                       batch_size: int = DEFAULT_UPSERT_BATCH_SIZE):
+        """
+        Method that atomically increments fields of documents in the specified collection,
+        creating the documents that do not exist yet.
+
+        :param increments: A dictionary mapping the '_id' of each document to a dictionary of
+                           (dotted) field paths and the amounts to increment them by.
+        :param defaults: Optional dictionary mapping the '_id' of each document to the fields
+                         to set when the document is created.
+        :param batch_size: The maximum number of updates sent in a single bulk write.
+        """
+
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+
+        defaults = defaults or {}
+        operations = []
+        for key, fields in increments.items():
+            update = {'$inc': fields}
+            if defaults.get(key):
+                update['$setOnInsert'] = defaults[key]
+            operations.append(UpdateOne({'_id': key}, update, upsert=True))
+
+        try:
+            collection = self.db[self.collection]
+            for start in range(0, len(operations), batch_size):
+                collection.bulk_write(operations[start:start + batch_size], ordered=False)
+
+        except (ConnectionFailure, PyMongoError) as e:
+            print(f"increment_data(): Error incrementing data in MongoDB: {e}")
+            raise
+
+    def delete_data(self, filters: dict = None):
+        """
+        Method that deletes documents from the specified collection.
+
+        :param filters: Optional MongoDB query used to select the documents to delete.
+        """
+
+        try:
+            result = self.db[self.collection].delete_many(filters if filters else {})
+            print(f"delete_data(): Deleted {result.deleted_count} documents from '{self.collection}'.")
+
+        except (ConnectionFailure, PyMongoError) as e:
+            print(f"delete_data(): Error deleting data from MongoDB: {e}")
+            raise
+
     def close(self):
         """
         Method to close connection to current Mongo Client.
+        Shared clients are left open for other collections and are closed on shutdown instead.
         """
-        self.client.close()
+        if self.owns_client:
+            self.client.close()
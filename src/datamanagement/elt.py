@@ -1,7 +1,13 @@
 """ELT Module"""
-from .filters import TextCleaningFilter, TokenizationFilter, StopWordFilter, pipe_filter
-from .dataclient import DataClientManager, DataClientConfig
-from .transformationmodels import TextBlobSentimentAnalysis, VaderSentimentAnalysis, LDATopicModeling
+from typing import Callable, Optional
+from .filters import PreprocessingFilter, TokenizationFilter, ColumnarPipe, ColumnarPosts, pipe_filter
+from .dataclient import DataClientManager, DataClientConfig, PartialWriteError
+from .watermark_store import WatermarkStore
+from .sentiment_rollup_store import SentimentRollupStore
+from .transformationmodels import ScoreNormalizer, ParallelTransformationExecutor, model_registry
+
+# Number of documents converted to and from dicts at a time in columnar mode, if batch_size is not set
+COLUMNAR_CHUNK_SIZE = 10000
 
 
 class ELT:
@@ -11,7 +17,12 @@ class ELT:
     """
 
     def __init__(self, source_db: DataClientConfig, target_db: DataClientConfig,
-                 transformations: list):
+                 transformations: list, batch_size: Optional[int] = None,
+                 incremental: bool = False, watermark_field: str = '_id',
+                 watermark_db: Optional[DataClientConfig] = None,
+                 rollups: bool = False, rollup_db: Optional[DataClientConfig] = None,
+                 model_options: Optional[dict] = None, processes: Optional[int] = None,
+                 columnar: bool = False):
         """
         Initializes the ELT component with source and target database configurations.
 
@@ -19,34 +30,99 @@ class ELT:
         :param target_db: A DatabaseConfig object containing the target database details.
         :param transformations: A list of transformation strings to apply during 
                                 the process. (e.g. 'vader')
+        :param batch_size: Optional number of documents to process per batch. If set, the
+                           process streams the source collection batch by batch instead of
+                           loading it into memory all at once.
+        :param incremental: If True, only documents whose watermark field is greater than the
+                            persisted high-water mark of the previous run are processed.
+        :param watermark_field: The monotonically increasing field used as the high-water mark
+                                (e.g. '_id' or 'created_utc').
+        :param watermark_db: Optional DataClientConfig of the collection to persist watermarks in.
+                             Defaults to the 'elt_watermarks' collection of the target database.
+        :param rollups: If True, the daily sentiment rollups of the stored posts are kept up to date.
+        :param rollup_db: Optional DataClientConfig of the collection to persist rollups in.
+                          Defaults to the 'sentiment_rollups' collection of the target database.
+        :param model_options: Optional dictionary mapping model names to the keyword arguments the
+                              models are instantiated with. (e.g. {'lda': {'corpus_mode': True}})
+        :param processes: Optional number of worker processes the posts are sharded across during
+                          the transformation. The models run in the current process if not set.
+        :param columnar: If True, the selected posts are processed as one batch in columnar form (see
+                         ColumnarPosts), which takes a fraction of the memory of dicts. The documents
+                         are loaded and stored `batch_size` documents at a time (COLUMNAR_CHUNK_SIZE
+                         by default), only converting each chunk from and to dicts at the boundary.
         """
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+        if processes is not None and processes <= 0:
+            raise ValueError(f"processes must be a positive integer, got {processes}")
+        if columnar and processes is not None and processes > 1:
+            raise ValueError("columnar mode runs the models in the current process, processes cannot be set")
+
         self.source_db = source_db
         self.source_client = None
         self.target_db = target_db
         self.target_client = None
         self.transformations = transformations
+        self.model_options = model_options or {}
+        self.processes = processes
+        self.executor = None
+        self.batch_size = batch_size
+        self.columnar = columnar
+        self.incremental = incremental
+        self.watermark_field = watermark_field
+        self.watermark_store = None
+        self.watermark_key = None
+        self.rollup_store = None
+
+        if incremental:
+            if watermark_db is None:
+                watermark_db = DataClientConfig(
+                    db_type=target_db.db_type,
+                    uri=target_db.uri,
+                    db_name=target_db.db_name,
+                    collection='elt_watermarks'
+                )
+            self.watermark_store = WatermarkStore(watermark_db)
+            self.watermark_key = WatermarkStore.build_key(source_db, target_db)
+
+        if rollups:
+            if rollup_db is None:
+                rollup_db = DataClientConfig(
+                    db_type=target_db.db_type,
+                    uri=target_db.uri,
+                    db_name=target_db.db_name,
+                    collection='sentiment_rollups'
+                )
+            self.rollup_store = SentimentRollupStore(rollup_db)
 
     def get_models(self, model_names: list[str]) -> list:
         """
         Given a list of strings containing the model names, returns a 
-        list of instantiated model objects.
+        list of instantiated model objects. Instances are cached by the model registry,
+        so that later calls reuse the loaded models.
 
         :param model_names: A list of model names in string.
         :returns: The model/class representation of models mapped from the string.
         """
 
-        # Dictionary to map strings to their corresponding classes
-        model_mapping = {
-            'vader': VaderSentimentAnalysis,
-            'textblob': TextBlobSentimentAnalysis,
-            'lda': LDATopicModeling
-        }
+        return [model_registry.get_model(model, self.model_options.get(model, {}))
+                for model in model_names if model_registry.is_registered(model)]
+
+    def get_model_specs(self, model_names: list[str]) -> list:
+        """
+        Given a list of strings containing the model names, returns the class
+        and keyword arguments each model is instantiated with.
+
+        :param model_names: A list of model names in string.
+        :returns: A list of (model class, keyword arguments) tuples.
+        """
 
-        return [model_mapping[model]() for model in model_names if model in model_mapping]
+        return [(model_registry.get_class(model), self.model_options.get(model, {}))
+                for model in model_names if model_registry.is_registered(model)]
 
     def preprocess(self, raw_data):
         """
-        Preprocesses the raw data by applying a series of filters.
+        Preprocesses the raw data by cleaning, tokenizing and removing stop words in a single pass.
 
         :param raw_data: The raw data loaded from the source.
         :return: Preprocessed data after applying the filters.
@@ -56,47 +132,285 @@ class ELT:
         pipe = pipe_filter.Pipe()
         pipe.set_data(raw_data)
 
-        # Apply preprocessing filters
-        cleaning_filter = TextCleaningFilter()
-        tokenization_filter = TokenizationFilter()
-        stopword_filter = StopWordFilter()
-
-        # Execute each filter on the data
-        cleaning_filter.execute(pipe)
-        tokenization_filter.execute(pipe)
-        stopword_filter.execute(pipe)
+        # Apply the fused preprocessing filter, tokenizing the cleaned text without NLTK's rules
+        preprocessing_filter = PreprocessingFilter(tokenization_filter=TokenizationFilter(backend='fast'))
+        preprocessing_filter.execute(pipe)
 
         # Return the preprocessed data from the pipe
         return pipe.get_data()
 
-    def load(self):
+    def preprocess_columns(self, posts: ColumnarPosts) -> ColumnarPosts:
+        """
+        Preprocesses posts in columnar form, like `preprocess` does with dicts.
+
+        :param posts: The raw posts in columnar form.
+        :return: The preprocessed posts in columnar form.
+        """
+
+        pipe = ColumnarPipe()
+        pipe.set_columns(posts)
+
+        preprocessing_filter = PreprocessingFilter(tokenization_filter=TokenizationFilter(backend='fast'))
+        preprocessing_filter.execute(pipe)
+
+        return pipe.get_columns()
+
+    def build_load_filters(self, full_rebuild: bool = False) -> Optional[dict]:
+        """
+        Builds the query that selects the documents to load from the data source.
+
+        In incremental mode, only documents past the persisted watermark are selected,
+        unless a full rebuild is requested.
+
+        :param full_rebuild: If True, the persisted watermark is ignored.
+        :return: The query in dict, or None if every document should be loaded.
+        """
+
+        if not self.incremental or full_rebuild:
+            return None
+
+        watermark = self.watermark_store.get(self.watermark_key, self.watermark_field)
+        if watermark is None:
+            return None
+
+        return {self.watermark_field: {'$gt': watermark}}
+
+    def update_watermark(self, processed_data) -> None:
+        """
+        Advances the persisted watermark to the largest watermark field value of the
+        processed data. Does nothing outside of incremental mode.
+
+        :param processed_data: The documents that have been stored in the target database.
+        """
+
+        if not self.incremental:
+            return
+
+        values = [document[self.watermark_field] for document in processed_data
+                  if self.watermark_field in document]
+        if values:
+            self.watermark_store.set(
+                self.watermark_key, self.watermark_field, max(values))
+
+    def load_previous_versions(self, data) -> list:
+        """
+        Loads the currently stored versions of the given documents from the target database,
+        so that they can be removed from the rollups before they are overwritten.
+
+        :param data: The documents about to be stored.
+        :return: The stored versions of the documents, or an empty list if rollups are disabled.
+        """
+
+        ids = [document['_id'] for document in data if '_id' in document]
+        if self.rollup_store is None or not ids:
+            return []
+
+        target_client = DataClientManager.get_database_client(self.target_db)
+        try:
+            return target_client.load_data(filters={'_id': {'$in': ids}})
+        finally:
+            target_client.close()
+
+    def update_rollups(self, processed_data, previous_data, failed_keys: Optional[list] = None) -> None:
+        """
+        Updates the daily sentiment rollups with the stored data. Does nothing if rollups are disabled.
+
+        :param processed_data: The documents that have been stored in the target database.
+        :param previous_data: The versions of the documents that were stored before.
+        :param failed_keys: Optional '_id' of the documents that failed to be stored, which are left
+                            out of the rollups as their previous versions are still stored.
+        """
+
+        if self.rollup_store is None:
+            return
+
+        if failed_keys:
+            failed_keys = set(failed_keys)
+            processed_data = [document for document in processed_data if document.get('_id') not in failed_keys]
+            previous_data = [document for document in previous_data if document.get('_id') not in failed_keys]
+        self.rollup_store.update(processed_data, previous_data)
+
+    def reset_rollups(self, full_rebuild: bool = False) -> None:
+        """
+        Clears the rollups before a full rebuild, as every document is added to them again. Otherwise,
+        records that the rollups cover the days to come if they were just enabled.
+
+        :param full_rebuild: If True, the rollups are cleared.
+        """
+
+        if self.rollup_store is None:
+            return
+
+        if full_rebuild:
+            self.rollup_store.clear()
+        else:
+            self.rollup_store.start_coverage()
+
+    def complete_rollups(self, full_rebuild: bool = False) -> None:
+        """
+        Records that the rollups cover every day once a full rebuild has stored every document.
+
+        :param full_rebuild: If True, the rollups were rebuilt from scratch.
+        """
+
+        if self.rollup_store is not None and full_rebuild:
+            self.rollup_store.set_coverage('')
+
+    def reset_models(self, models: list, full_rebuild: bool = False) -> None:
+        """
+        Resets the state the models accumulated over earlier runs before a full rebuild, as every
+        document is transformed again.
+
+        :param models: The instantiated models.
+        :param full_rebuild: If True, the models are reset.
+        """
+
+        if full_rebuild:
+            for model in models:
+                model.reset()
+
+    def commit_models(self, models: list) -> None:
+        """
+        Persists the state the models accumulated over the transformed documents, once they have been
+        stored, so that documents that are processed again after a failure are not counted twice.
+
+        :param models: The instantiated models.
+        """
+
+        for model in models:
+            model.commit()
+
+    def rollback_models(self, models: list) -> None:
+        """
+        Discards the state the models accumulated since their last commit, after a failure.
+
+        :param models: The instantiated models.
+        """
+
+        for model in models:
+            model.rollback()
+
+    def load(self, filters: Optional[dict] = None):
         """
         Loads raw data from the data source.
 
+        :param filters: Optional query used to select the documents to load.
         :return: raw_data the data that is retrieved from the specified database source.
         """
 
         self.source_client = DataClientManager.get_database_client(
             self.source_db)
-        raw_data = self.source_client.load_data()
+        raw_data = self.source_client.load_data(filters=filters)
         self.source_client.close()
 
         return raw_data
 
-    def transform(self, data):
+    def load_batches(self, filters: Optional[dict] = None, batch_size: Optional[int] = None):
+        """
+        Streams raw data from the data source in batches of `batch_size` documents.
+
+        In incremental mode, the documents are streamed in ascending order of the watermark
+        field so that the watermark can be advanced after every batch.
+
+        :param filters: Optional query used to select the documents to load.
+        :param batch_size: Optional number of documents per batch. Defaults to `batch_size`.
+        :return: A generator yielding lists of raw documents from the specified database source.
+        """
+
+        sort_field = self.watermark_field if self.incremental else None
+        self.source_client = DataClientManager.get_database_client(
+            self.source_db)
+        try:
+            yield from self.source_client.load_data_in_batches(
+                batch_size or self.batch_size, filters=filters, sort_field=sort_field)
+        finally:
+            self.source_client.close()
+
+    def load_columns(self, filters: Optional[dict] = None) -> ColumnarPosts:
+        """
+        Loads raw data from the data source into columnar form, converting the documents chunk by chunk.
+
+        :param filters: Optional query used to select the documents to load.
+        :return: The raw posts in columnar form.
+        """
+
+        posts = ColumnarPosts()
+        for raw_batch in self.load_batches(filters, self.batch_size or COLUMNAR_CHUNK_SIZE):
+            for document in raw_batch:
+                posts.append(document)
+
+        return posts
+
+    def transform(self, data, models: Optional[list] = None):
         """Applies a series of transformations to the data.
 
         :param data: The preprocessed data that needs to be transformed.
+        :param models: Optional list of already instantiated models to reuse. If not given, 
+                       the models are instantiated from the configured transformations.
         :return: The transformed data after applying all transformations.
         """
 
-        models = self.get_models(self.transformations)
+        if models is None:
+            models = self.get_models(self.transformations)
+
+        # Shard the posts across worker processes, which apply the models in order
+        if self.processes is not None and self.processes > 1:
+            return self.get_executor().transform(data, models)
+
         for model in models:
             # Each transformation object has an apply method
             data = model.apply(data)
 
         return data
 
+    def transform_columns(self, posts: ColumnarPosts, models: Optional[list] = None) -> ColumnarPosts:
+        """Applies a series of transformations to posts in columnar form.
+
+        :param posts: The preprocessed posts in columnar form.
+        :param models: Optional list of already instantiated models to reuse.
+        :return: The transformed posts in columnar form.
+        """
+
+        if models is None:
+            models = self.get_models(self.transformations)
+
+        for model in models:
+            posts = model.apply_columns(posts)
+
+        return posts
+
+    def get_executor(self) -> ParallelTransformationExecutor:
+        """
+        Returns the executor that shards the transformation across worker processes, creating it
+        on first use so that the workers are started once per run.
+
+        :return: The ParallelTransformationExecutor of the configured transformations.
+        """
+
+        if self.executor is None:
+            self.executor = ParallelTransformationExecutor(
+                self.get_model_specs(self.transformations), processes=self.processes)
+        return self.executor
+
+    def close_executor(self) -> None:
+        """
+        Shuts down the worker processes of the transformation, if any.
+        """
+
+        if self.executor is not None:
+            self.executor.close()
+            self.executor = None
+
+    def normalize_scores(self, transformed_data):
+        """
+        Precomputes the normalized sentiment scores of each post for the Data Analysis module.
+
+        :param transformed_data: The data after applying all transformations.
+        :return: The transformed data with the normalized scores of each model.
+        """
+
+        return ScoreNormalizer().apply(transformed_data)
+
     def store(self, transformed_data):
         """
         Stores the transformed data in the target database.
@@ -106,32 +420,178 @@ class ELT:
 
         self.target_client = DataClientManager.get_database_client(
             self.target_db)
-        self.target_client.upsert_data(transformed_data)
+        try:
+            self.target_client.upsert_data(transformed_data)
+        finally:
+            self.target_client.close()
 
-        self.target_client.close()
+    def commit(self, write: Callable, transformed_data, previous_data) -> None:
+        """
+        Writes the transformed data to the target database, then updates the rollups and advances the
+        watermark past it.
+
+        If some documents fail to be written, the rollups are only updated with the documents that were
+        written and the error is re-raised before the watermark is advanced, so that the next run
+        processes the failed documents again.
 
-    def execute(self):
+        :param write: The function storing the documents in the target database.
+        :param transformed_data: The transformed data to store.
+        :param previous_data: The versions of the documents that were stored before.
+        """
+
+        try:
+            write(transformed_data)
+        except PartialWriteError as e:
+            self.update_rollups(transformed_data, previous_data, e.failed_keys)
+            raise
+
+        self.update_rollups(transformed_data, previous_data)
+        self.update_watermark(transformed_data)
+
+    def execute(self, full_rebuild: bool = False):
         """
         Executes the ETL process.
+
+        :param full_rebuild: If True, the whole source collection is reprocessed even in
+                             incremental mode.
         """
 
+        if self.columnar:
+            return self.execute_columnar(full_rebuild)
+        if self.batch_size is not None:
+            return self.execute_in_batches(full_rebuild)
+
+        models = []
         try:
-            # Step 1: Load raw data from the source database
-            raw_data = self.load()
+            # Step 1: Load raw data (past the watermark, if any) from the source database
+            filters = self.build_load_filters(full_rebuild)
+            raw_data = self.load(filters)
             if not raw_data:
+                if filters:
+                    return {'status': 'success', 'message': 'No new data found in source.'}
                 return {'status': 'error', 'message': 'No data found in source.'}
 
+            models = self.get_models(self.transformations)
+            self.reset_models(models, full_rebuild)
+
             # Step 2: Preprocess the data
             preprocessed_data = self.preprocess(raw_data)
             # print(preprocessed_data)
 
-            # Step 3: Transform the data
+            # Step 3: Transform the data and precompute the normalized scores
             transformed_data = self.transform(preprocessed_data)
+            transformed_data = self.normalize_scores(transformed_data)
 
             # Step 4: Store (upsert) the transformed data into the target database
-            self.store(transformed_data)
+            self.reset_rollups(full_rebuild)
+            previous_data = [] if full_rebuild else self.load_previous_versions(transformed_data)
+            # Step 5: Update the rollups and advance the watermark past the stored data
+            self.commit(self.store, transformed_data, previous_data)
+            self.complete_rollups(full_rebuild)
+            self.commit_models(models)
 
             return {'status': 'success', 'message': 'ELT process completed successfully.'}
 
         except Exception as e:
+            self.rollback_models(models)
+            return {'status': 'error', 'message': str(e)}
+
+        finally:
+            self.close_executor()
+
+    def execute_in_batches(self, full_rebuild: bool = False):
+        """
+        Executes the ELT process in streaming mode.
+
+        Each batch is preprocessed, transformed and upserted into the target database before
+        the next batch is fetched, so peak memory usage is bounded by the batch size rather
+        than by the size of the source collection.
+
+        :param full_rebuild: If True, the whole source collection is reprocessed even in
+                             incremental mode.
+        """
+
+        models = []
+        try:
+            filters = self.build_load_filters(full_rebuild)
+            # Instantiate the models once and reuse them for every batch
+            models = self.get_models(self.transformations)
+            processed_count = 0
+
+            self.reset_models(models, full_rebuild)
+            self.reset_rollups(full_rebuild)
+            self.target_client = DataClientManager.get_database_client(
+                self.target_db)
+            try:
+                for raw_batch in self.load_batches(filters):
+                    preprocessed_batch = self.preprocess(raw_batch)
+                    transformed_batch = self.transform(preprocessed_batch, models)
+                    transformed_batch = self.normalize_scores(transformed_batch)
+                    previous_batch = [] if full_rebuild else self.load_previous_versions(transformed_batch)
+                    self.commit(self.target_client.upsert_data, transformed_batch, previous_batch)
+                    self.commit_models(models)
+                    processed_count += len(transformed_batch)
+            finally:
+                self.target_client.close()
+            self.complete_rollups(full_rebuild)
+
+            if processed_count == 0:
+                if filters:
+                    return {'status': 'success', 'message': 'No new data found in source.'}
+                return {'status': 'error', 'message': 'No data found in source.'}
+
+            return {'status': 'success',
+                    'message': f'ELT process completed successfully. {processed_count} documents processed.'}
+
+        except Exception as e:
+            self.rollback_models(models)
+            return {'status': 'error', 'message': str(e)}
+
+        finally:
+            self.close_executor()
+
+    def execute_columnar(self, full_rebuild: bool = False):
+        """
+        Executes the ELT process in columnar mode.
+
+        The selected documents are loaded into one ColumnarPosts batch, preprocessed and transformed
+        in columnar form, then converted back to dicts and upserted chunk by chunk, so at most one
+        chunk of documents is held as dicts at a time.
+
+        :param full_rebuild: If True, the whole source collection is reprocessed even in
+                             incremental mode.
+        """
+
+        models = []
+        try:
+            filters = self.build_load_filters(full_rebuild)
+            posts = self.load_columns(filters)
+            if len(posts) == 0:
+                if filters:
+                    return {'status': 'success', 'message': 'No new data found in source.'}
+                return {'status': 'error', 'message': 'No data found in source.'}
+
+            models = self.get_models(self.transformations)
+            self.reset_models(models, full_rebuild)
+            posts = self.transform_columns(self.preprocess_columns(posts), models)
+
+            self.reset_rollups(full_rebuild)
+            self.target_client = DataClientManager.get_database_client(
+                self.target_db)
+            try:
+                for transformed_chunk in posts.iter_dicts(self.batch_size or COLUMNAR_CHUNK_SIZE):
+                    transformed_chunk = self.normalize_scores(transformed_chunk)
+                    previous_chunk = [] if full_rebuild else self.load_previous_versions(transformed_chunk)
+                    self.commit(self.target_client.upsert_data, transformed_chunk, previous_chunk)
+            finally:
+                self.target_client.close()
+            self.complete_rollups(full_rebuild)
+            # The models counted every chunk, so their state is only persisted once all chunks are stored
+            self.commit_models(models)
+
+            return {'status': 'success',
+                    'message': f'ELT process completed successfully. {len(posts)} documents processed.'}
+
+        except Exception as e:
+            self.rollback_models(models)
             return {'status': 'error', 'message': str(e)}
@@ -3,3 +3,5 @@ from .pipe_filter import Pipe, Filter
 from .stopword_filter import StopWordFilter
 from .textcleaning_filter import TextCleaningFilter
 from .tokenization_filter import TokenizationFilter
+from .preprocessing_filter import PreprocessingFilter
+from .columnar_pipe import ColumnarPipe, ColumnarPosts
@@ -0,0 +1,503 @@
+"""Module for Columnar Pipe."""
+import math
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from .pipe_filter import Pipe
+
+# Marks a field that is absent from a post
+MISSING = object()
+
+# Path of a field in a post, e.g. ('transformed_data', 'title_tokens')
+FieldPath = Tuple[str, ...]
+
+# Text fields of a post that are scored by the sentiment models
+SCORED_FIELDS = ('selftext', 'title')
+
+
+class TokenVocabulary:
+    """
+    Maps the tokens of a batch to integer ids, so that every token list only stores 4 bytes per token.
+    """
+
+    def __init__(self):
+        self.token_ids: Dict[str, int] = {}
+        self.tokens: List[str] = []
+
+    def encode(self, tokens: List[str]) -> List[int]:
+        """
+        Returns the ids of the given tokens, adding the new tokens to the vocabulary.
+
+        :param tokens: The tokens to encode.
+        :return: The ids of the tokens.
+        """
+        token_ids = self.token_ids
+        ids = []
+        for token in tokens:
+            token_id = token_ids.get(token)
+            if token_id is None:
+                token_id = token_ids[token] = len(self.tokens)
+                self.tokens.append(token)
+            ids.append(token_id)
+        return ids
+
+    def decode(self, ids) -> List[str]:
+        """
+        Returns the tokens of the given ids.
+
+        :param ids: The ids to decode.
+        :return: The tokens.
+        """
+        tokens = self.tokens
+        return [tokens[token_id] for token_id in ids]
+
+
+class Column(ABC):
+    """
+    Abstract column holding one field of every post. A post without the field holds MISSING.
+    """
+
+    @abstractmethod
+    def accepts(self, value: Any) -> bool:
+        """
+        Checks whether a value can be stored in the column. Other values stay in the post's document.
+        """
+
+    @abstractmethod
+    def append(self, value: Any) -> None:
+        """
+        Appends the field of the next post, or MISSING.
+        """
+
+    @abstractmethod
+    def get(self, index: int) -> Any:
+        """
+        Returns the field of a post, or MISSING.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns the number of posts in the column.
+        """
+
+
+class ObjectColumn(Column):
+    """
+    Column of single values, such as ids and texts.
+    """
+
+    def __init__(self, value_type: Optional[type] = None):
+        """
+        :param value_type: Optional type of the values the column accepts. Any value is accepted if not set.
+        """
+        self.value_type = value_type
+        self.values: List[Any] = []
+
+    def accepts(self, value: Any) -> bool:
+        return self.value_type is None or isinstance(value, self.value_type)
+
+    def append(self, value: Any) -> None:
+        self.values.append(value)
+
+    def get(self, index: int) -> Any:
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class FloatColumn(Column):
+    """
+    Column of scores in a flat buffer of doubles, with NaN for the posts without the field.
+    """
+
+    def __init__(self):
+        self.values = array('d')
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, float) and not math.isnan(value)
+
+    def append(self, value: Any) -> None:
+        self.values.append(math.nan if value is MISSING else value)
+
+    def get(self, index: int) -> Any:
+        value = self.values[index]
+        return MISSING if math.isnan(value) else value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ListColumn(Column):
+    """
+    Column of lists stored in one flat buffer, with offsets delimiting the list of each post.
+    """
+
+    def __init__(self, item_type: type, buffer_type: Optional[str] = None):
+        """
+        :param item_type: The type of the items the column accepts.
+        :param buffer_type: Optional array typecode of the flat buffer (e.g. 'd'). A list is used if not set.
+        """
+        self.item_type = item_type
+        self.items = array(buffer_type) if buffer_type else []
+        self.offsets = array('Q', [0])
+        self.present = bytearray()
+
+    def accepts(self, value: Any) -> bool:
+        return isinstance(value, list) and all(type(item) is self.item_type for item in value)  # pylint: disable=unidiomatic-typecheck
+
+    def append(self, value: Any) -> None:
+        if value is MISSING:
+            self.present.append(0)
+        else:
+            self.present.append(1)
+            self.items.extend(value)
+        self.offsets.append(len(self.items))
+
+    def get(self, index: int) -> Any:
+        if not self.present[index]:
+            return MISSING
+        return list(self.items[self.offsets[index]:self.offsets[index + 1]])
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+
+class TokenListColumn(Column):
+    """
+    Column of token lists, stored as vocabulary ids in one flat buffer with offsets delimiting each list.
+    If nested, each post holds a list of token lists (e.g. the tokens of each comment).
+    """
+
+    def __init__(self, vocabulary: TokenVocabulary, nested: bool = False):
+        """
+        :param vocabulary: The vocabulary shared by the token columns of the batch.
+        :param nested: If True, each post holds a list of token lists.
+        """
+        self.vocabulary = vocabulary
+        self.nested = nested
+        self.ids = array('I')
+        self.token_offsets = array('Q', [0])
+        self.list_offsets = array('Q', [0])
+        self.present = bytearray()
+
+    @staticmethod
+    def is_token_list(value: Any) -> bool:
+        """
+        Checks whether a value is a list of str tokens.
+        """
+        return isinstance(value, list) and all(type(token) is str for token in value)  # pylint: disable=unidiomatic-typecheck
+
+    def accepts(self, value: Any) -> bool:
+        if self.nested:
+            return isinstance(value, list) and all(self.is_token_list(tokens) for tokens in value)
+        return self.is_token_list(value)
+
+    def append(self, value: Any) -> None:
+        if value is MISSING:
+            self.present.append(0)
+        else:
+            self.present.append(1)
+            for tokens in (value if self.nested else [value]):
+                self.ids.extend(self.vocabulary.encode(tokens))
+                self.token_offsets.append(len(self.ids))
+        self.list_offsets.append(len(self.token_offsets) - 1)
+
+    def get(self, index: int) -> Any:
+        if not self.present[index]:
+            return MISSING
+        token_lists = [
+            self.vocabulary.decode(self.ids[self.token_offsets[position]:self.token_offsets[position + 1]])
+            for position in range(self.list_offsets[index], self.list_offsets[index + 1])
+        ]
+        return token_lists if self.nested else token_lists[0]
+
+    def get_ids(self, index: int) -> array:
+        """
+        Returns the vocabulary ids of all tokens of a post without decoding them, concatenated if
+        nested. A post without the field has no ids.
+        """
+        if not self.present[index]:
+            return array('I')
+        return self.ids[self.token_offsets[self.list_offsets[index]]:self.token_offsets[self.list_offsets[index + 1]]]
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+
+class ColumnarPosts:
+    """
+    Columnar representation of a batch of posts. Instead of a dict per post, each field is held in a
+    column of parallel arrays: ids, titles and selftexts in lists, comments and scores in flat buffers
+    with offsets, and tokens as vocabulary ids. The fields without a column (e.g. 'created_utc' or
+    'subreddit') stay in a smaller document per post.
+
+    Converting a post to the columnar form and back yields an equal dict. Values that do not fit their
+    column (e.g. a title that is not a str) stay in the post's document.
+    """
+
+    def __init__(self):
+        self.vocabulary = TokenVocabulary()
+        self.columns: Dict[FieldPath, Column] = {
+            ('_id',): ObjectColumn(),
+            ('selftext',): ObjectColumn(str),
+            ('title',): ObjectColumn(str),
+            ('comments',): ListColumn(str),
+            ('transformed_data', 'selftext'): ObjectColumn(str),
+            ('transformed_data', 'title'): ObjectColumn(str),
+            ('transformed_data', 'comments'): ListColumn(str),
+            ('transformed_data', 'selftext_tokens'): TokenListColumn(self.vocabulary),
+            ('transformed_data', 'title_tokens'): TokenListColumn(self.vocabulary),
+            ('transformed_data', 'comments_tokens'): TokenListColumn(self.vocabulary, nested=True)
+        }
+        # Marks the posts in which a dict holding columns exists, even when all its fields are in columns
+        self.containers: Dict[FieldPath, bytearray] = {
+            ('transformed_data',): bytearray(),
+            ('model_output',): bytearray()
+        }
+        # Fields of each post without a column, or None if there are none
+        self.documents: List[Optional[Dict]] = []
+
+    @classmethod
+    def from_dicts(cls, data: List[Dict]) -> 'ColumnarPosts':
+        """
+        Converts posts from the dict form.
+
+        :param data: The posts to convert.
+        :return: The posts in columnar form.
+        """
+        posts = cls()
+        for post in data:
+            posts.append(post)
+        return posts
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def column(self, path: FieldPath) -> Column:
+        """
+        Returns the column of a field.
+
+        :param path: The path of the field.
+        :return: The column.
+        """
+        return self.columns[path]
+
+    def set_column(self, path: FieldPath, column: Column) -> None:
+        """
+        Sets (or replaces) the column of a field. The column must hold a value or MISSING for every post.
+
+        :param path: The path of the field.
+        :param column: The column.
+        """
+        if len(column) != len(self):
+            raise ValueError(f"Column {path} holds {len(column)} values for {len(self)} posts")
+        for depth in range(1, len(path)):
+            self.add_container(path[:depth])
+        self.columns[path] = column
+
+    def add_container(self, path: FieldPath) -> None:
+        """
+        Starts tracking a dict of the posts, for the posts added from now on.
+
+        :param path: The path of the dict.
+        """
+        if path not in self.containers:
+            self.containers[path] = bytearray(len(self))
+
+    def add_model_output(self, model: str) -> None:
+        """
+        Adds the columns of the scores of a sentiment model, for posts added from now on.
+
+        :param model: The name of the model (e.g. 'vader').
+        """
+        path = ('model_output', model)
+        if path in self.containers:
+            return
+
+        self.add_container(path)
+        for field in SCORED_FIELDS:
+            self.columns[path + (f"{field}_sentiment",)] = self.fill(FloatColumn())
+        self.columns[path + ('comments_sentiment',)] = self.fill(ListColumn(float, 'd'))
+
+    def fill(self, column: Column) -> Column:
+        """
+        Fills a new column with MISSING for every post.
+
+        :param column: The new column.
+        :return: The column.
+        """
+        for _ in range(len(self)):
+            column.append(MISSING)
+        return column
+
+    def append(self, post: Dict) -> None:
+        """
+        Adds a post in dict form. The post is not modified.
+
+        :param post: The post to add.
+        """
+        for model, output in (post.get('model_output') or {}).items():
+            if isinstance(output, dict):
+                self.add_model_output(model)
+
+        # Copy the dicts holding columns, so that the fields moved to the columns can be removed
+        document = dict(post)
+        for path in self.containers:
+            parent = self.get_dict(document, path[:-1])
+            if parent is not None and isinstance(parent.get(path[-1]), dict):
+                parent[path[-1]] = dict(parent[path[-1]])
+
+        for path, column in self.columns.items():
+            parent = self.get_dict(document, path[:-1])
+            if parent is not None and path[-1] in parent and column.accepts(parent[path[-1]]):
+                column.append(parent.pop(path[-1]))
+            else:
+                column.append(MISSING)
+
+        # Remove the dicts that were emptied, deepest first, marking that they exist
+        for path in sorted(self.containers, key=len, reverse=True):
+            parent = self.get_dict(document, path[:-1])
+            container = parent.get(path[-1]) if parent is not None else None
+            self.containers[path].append(isinstance(container, dict))
+            if container == {}:
+                del parent[path[-1]]
+
+        self.documents.append(document or None)
+
+    @staticmethod
+    def get_dict(document: Dict, path: FieldPath) -> Optional[Dict]:
+        """
+        Returns the dict at a path of a document, or None if there is none.
+        """
+        for key in path:
+            document = document.get(key)
+            if not isinstance(document, dict):
+                return None
+        return document
+
+    def get_post(self, index: int) -> Dict:
+        """
+        Converts a post to the dict form.
+
+        :param index: The index of the post.
+        :return: The post in dict form.
+        """
+        post = dict(self.documents[index] or {})
+        for path in sorted(self.containers, key=len):
+            if not self.containers[path][index]:
+                continue
+            parent = self.get_dict(post, path[:-1])
+            parent[path[-1]] = dict(parent.get(path[-1], {}))
+
+        for path, column in self.columns.items():
+            value = column.get(index)
+            if value is not MISSING:
+                self.get_dict(post, path[:-1])[path[-1]] = value
+
+        return post
+
+    def to_dicts(self, start: int = 0, end: Optional[int] = None) -> List[Dict]:
+        """
+        Converts posts to the dict form.
+
+        :param start: The index of the first post.
+        :param end: Optional index after the last post. Defaults to the number of posts.
+        :return: The posts in dict form.
+        """
+        return [self.get_post(index) for index in range(start, len(self) if end is None else end)]
+
+    def iter_dicts(self, chunk_size: int) -> Iterator[List[Dict]]:
+        """
+        Converts the posts to the dict form chunk by chunk, e.g. to store them in batches.
+
+        :param chunk_size: The number of posts in each chunk.
+        :return: A generator yielding the chunks of posts in dict form.
+        """
+        for start in range(0, len(self), chunk_size):
+            yield self.to_dicts(start, min(start + chunk_size, len(self)))
+
+    def set_scores(self, model: str, score: Callable[[str], float]) -> None:
+        """
+        Scores the selftext, title and comments of each post with a sentiment model, like the
+        sentiment models do in dict form: every post gets a 'model_output' entry for the model, and
+        the scores of the fields that exist replace the previous ones.
+
+        :param model: The name of the model (e.g. 'vader').
+        :param score: The function scoring a text.
+        """
+        self.add_model_output(model)
+        for path in (('transformed_data',), ('model_output',), ('model_output', model)):
+            self.containers[path] = bytearray(b'\x01' * len(self))
+
+        for field in SCORED_FIELDS:
+            texts = self.columns[(field,)]
+            previous_scores = self.columns[('model_output', model, f"{field}_sentiment")]
+            scores = FloatColumn()
+            for index in range(len(self)):
+                text = texts.get(index)
+                scores.append(previous_scores.get(index) if text is MISSING else score(text))
+            self.columns[('model_output', model, f"{field}_sentiment")] = scores
+
+        comments = self.columns[('comments',)]
+        previous_comment_scores = self.columns[('model_output', model, 'comments_sentiment')]
+        comment_scores = ListColumn(float, 'd')
+        for index in range(len(self)):
+            post_comments = comments.get(index)
+            if post_comments is MISSING:
+                comment_scores.append(previous_comment_scores.get(index))
+            else:
+                comment_scores.append([score(comment) for comment in post_comments])
+        self.columns[('model_output', model, 'comments_sentiment')] = comment_scores
+
+    def texts(self) -> Iterator[str]:
+        """
+        Iterates over the texts the sentiment models score: the selftext, title and comments of each post.
+        """
+        for field in SCORED_FIELDS:
+            yield from (text for text in self.columns[(field,)].values if text is not MISSING)
+        yield from self.columns[('comments',)].items
+
+
+class ColumnarPipe(Pipe):
+    """
+    Pipe holding the data in columnar form (see ColumnarPosts) instead of a list of dicts.
+
+    Filters that support the columnar form read and write the columns directly. Other filters go
+    through `get_data` and `set_data`, which convert the posts to and from the dict form.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.columns = None
+
+    def set_data(self, data: List[Dict]):
+        """
+        Method to set data provided into the pipe, converting it to the columnar form.
+        :param data: the raw data given to store into the pipe for preprocessing.
+        """
+
+        self.columns = ColumnarPosts.from_dicts(data)
+
+    def get_data(self) -> List[Dict]:
+        """
+        Method to get data stored in the pipe, converted to the dict form.
+        :return data: the data that is stored in the pipe.
+        """
+        return self.columns.to_dicts() if self.columns is not None else None
+
+    def set_columns(self, columns: ColumnarPosts):
+        """
+        Method to set data in columnar form into the pipe.
+        :param columns: the posts in columnar form.
+        """
+
+        self.columns = columns
+
+    def get_columns(self) -> ColumnarPosts:
+        """
+        Method to get the data stored in the pipe in columnar form.
+        :return columns: the posts in columnar form.
+        """
+        return self.columns
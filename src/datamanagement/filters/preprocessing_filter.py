@@ -0,0 +1,164 @@
+"""Module for Preprocessing Filter."""
+from typing import List, Optional
+from .pipe_filter import Filter, Pipe
+from .columnar_pipe import ColumnarPipe, ColumnarPosts, ListColumn, MISSING, ObjectColumn, TokenListColumn
+from .textcleaning_filter import TextCleaningFilter
+from .tokenization_filter import TokenizationFilter
+from .stopword_filter import StopWordFilter
+
+
+class PreprocessingFilter(Filter):
+    """
+    Cleans, tokenizes and removes stop words from the text data in a single pass over the posts.
+
+    The output is identical to executing TextCleaningFilter, TokenizationFilter and StopWordFilter
+    one after the other, but each text goes through the three steps at once, so the posts and their
+    'transformed_data' are only traversed once and no intermediate token lists are kept.
+
+    With a ColumnarPipe, the posts are preprocessed in columnar form, without converting them to dicts.
+    """
+
+    def __init__(self, cleaning_filter: Optional[TextCleaningFilter] = None,
+                 tokenization_filter: Optional[TokenizationFilter] = None,
+                 stopword_filter: Optional[StopWordFilter] = None):
+        """
+        Initializes the PreprocessingFilter with the filters whose steps are fused.
+
+        :param cleaning_filter: Optional TextCleaningFilter to clean the texts with.
+        :param tokenization_filter: Optional TokenizationFilter to tokenize the texts with.
+        :param stopword_filter: Optional StopWordFilter to remove the stop words with.
+        """
+        self.cleaning_filter = cleaning_filter or TextCleaningFilter()
+        self.tokenization_filter = tokenization_filter or TokenizationFilter()
+        self.stopword_filter = stopword_filter or StopWordFilter()
+
+    def execute(self, pipe: Pipe) -> None:
+        """
+        Executes the cleaning, tokenization and stop word removal on each document in the pipe.
+
+        :param pipe: The pipe containing the data to filter.
+        """
+
+        try:
+            if isinstance(pipe, ColumnarPipe):
+                self.execute_columns(pipe.get_columns())
+                return
+
+            data = pipe.get_data()
+            for post in data:
+                if 'transformed_data' not in post:
+                    post['transformed_data'] = {}
+                transformed_data = post['transformed_data']
+
+                # Clean the 'selftext' and 'title' fields if they exist
+                for field in ('selftext', 'title'):
+                    if field in post:
+                        transformed_data[field] = self.cleaning_filter.clean_text(post[field])
+
+                # Clean and tokenize each comment at once if the comments exist and are a list
+                comments_tokens = None
+                if 'comments' in post and isinstance(post['comments'], list):
+                    cleaned_comments = []
+                    comments_tokens = []
+                    for comment in post['comments']:
+                        cleaned_comment = self.cleaning_filter.clean_text(comment)
+                        cleaned_comments.append(cleaned_comment)
+                        comments_tokens.append(self.tokenize(cleaned_comment))
+                    transformed_data['comments'] = cleaned_comments
+                elif isinstance(transformed_data.get('comments'), list):
+                    comments_tokens = [self.tokenize(comment) for comment in transformed_data['comments']]
+
+                # Tokenize the cleaned 'selftext' and 'title', or filter previously stored tokens
+                for field in ('selftext', 'title'):
+                    tokens_field = f"{field}_tokens"
+                    if field in transformed_data:
+                        transformed_data[tokens_field] = self.tokenize(transformed_data[field])
+                    elif tokens_field in transformed_data:
+                        transformed_data[tokens_field] = self.stopword_filter.remove_stop_words(
+                            transformed_data[tokens_field])
+
+                if comments_tokens is not None:
+                    transformed_data['comments_tokens'] = comments_tokens
+                elif isinstance(transformed_data.get('comments_tokens'), list):
+                    transformed_data['comments_tokens'] = [
+                        self.stopword_filter.remove_stop_words(tokens)
+                        for tokens in transformed_data['comments_tokens']
+                    ]
+
+            # After preprocessing, update the data in the pipe
+            pipe.set_data(data)
+
+        except KeyError as e:
+            print(f"Key error during preprocessing: {e}")
+            raise
+        except Exception as e:
+            print(f"Unexpected error during preprocessing: {e}")
+            raise
+
+    def execute_columns(self, posts: ColumnarPosts) -> None:
+        """
+        Executes the cleaning, tokenization and stop word removal on posts in columnar form, with the
+        same output as in dict form. Texts that are not str are not in the text columns, so they are
+        skipped instead of failing.
+
+        :param posts: The posts to filter, updated in place.
+        """
+
+        texts = {field: posts.column((field,)) for field in ('selftext', 'title')}
+        comments = posts.column(('comments',))
+        previous = {field: posts.column(('transformed_data', field))
+                    for field in ('selftext', 'title', 'comments', 'selftext_tokens', 'title_tokens', 'comments_tokens')}
+
+        cleaned = {field: ObjectColumn(str) for field in ('selftext', 'title')}
+        tokens = {field: TokenListColumn(posts.vocabulary) for field in ('selftext', 'title')}
+        cleaned_comments = ListColumn(str)
+        comments_tokens = TokenListColumn(posts.vocabulary, nested=True)
+
+        for index in range(len(posts)):
+            # Clean the 'selftext' and 'title', then tokenize them or filter previously stored tokens
+            for field in ('selftext', 'title'):
+                text = texts[field].get(index)
+                cleaned_text = self.cleaning_filter.clean_text(text) if text is not MISSING \
+                    else previous[field].get(index)
+                cleaned[field].append(cleaned_text)
+
+                previous_tokens = previous[f"{field}_tokens"].get(index)
+                if cleaned_text is not MISSING:
+                    tokens[field].append(self.tokenize(cleaned_text))
+                elif previous_tokens is not MISSING:
+                    tokens[field].append(self.stopword_filter.remove_stop_words(previous_tokens))
+                else:
+                    tokens[field].append(MISSING)
+
+            # Same for the comments
+            post_comments = comments.get(index)
+            post_cleaned_comments = [self.cleaning_filter.clean_text(comment) for comment in post_comments] \
+                if post_comments is not MISSING else previous['comments'].get(index)
+            cleaned_comments.append(post_cleaned_comments)
+
+            previous_tokens = previous['comments_tokens'].get(index)
+            if post_cleaned_comments is not MISSING:
+                comments_tokens.append([self.tokenize(comment) for comment in post_cleaned_comments])
+            elif previous_tokens is not MISSING:
+                comments_tokens.append([self.stopword_filter.remove_stop_words(comment_tokens)
+                                        for comment_tokens in previous_tokens])
+            else:
+                comments_tokens.append(MISSING)
+
+        # Every post gets a 'transformed_data' dict, as in dict form
+        posts.containers[('transformed_data',)] = bytearray(b'\x01' * len(posts))
+        for field in ('selftext', 'title'):
+            posts.set_column(('transformed_data', field), cleaned[field])
+            posts.set_column(('transformed_data', f"{field}_tokens"), tokens[field])
+        posts.set_column(('transformed_data', 'comments'), cleaned_comments)
+        posts.set_column(('transformed_data', 'comments_tokens'), comments_tokens)
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Tokenizes a cleaned text and removes its stop words.
+
+        :param text: The cleaned text string.
+        :return: The tokens of the text that are not stop words.
+        """
+
+        return self.stopword_filter.remove_stop_words(self.tokenization_filter.tokenize(text))
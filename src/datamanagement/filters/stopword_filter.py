@@ -1,10 +1,8 @@
 """Module for Stopword filter."""
-import nltk
+from typing import List
 from nltk.corpus import stopwords
 from .pipe_filter import Pipe, Filter
-
-# Ensure NLTK resources are downloaded (if needed)
-nltk.download('stopwords')
+from ..resources import resource_manager
 
 class StopWordFilter(Filter):
     """
@@ -17,7 +15,7 @@ class StopWordFilter(Filter):
         Initializes the StopWordFilter class using NLTK stop words.
         """
         # Use NLTK stop words
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = set(resource_manager.call('stopwords', stopwords.words, 'english'))
 
     def execute(self, pipe: Pipe) -> None:
         """
@@ -33,23 +31,19 @@ class StopWordFilter(Filter):
 
                 # Remove stopwords from 'selftext_tokens' if they exist in 'transformed_data'
                 if 'selftext_tokens' in post['transformed_data']:
-                    post['transformed_data']['selftext_tokens'] = [
-                        word for word in post['transformed_data']['selftext_tokens']
-                        if word not in self.stop_words
-                    ]
+                    post['transformed_data']['selftext_tokens'] = self.remove_stop_words(
+                        post['transformed_data']['selftext_tokens'])
 
                 # Remove stopwords from 'title_tokens' if they exist in 'transformed_data'
                 if 'title_tokens' in post['transformed_data']:
-                    post['transformed_data']['title_tokens'] = [
-                        word for word in post['transformed_data']['title_tokens']
-                        if word not in self.stop_words
-                    ]
+                    post['transformed_data']['title_tokens'] = self.remove_stop_words(
+                        post['transformed_data']['title_tokens'])
 
                 # Remove stopwords from 'comments_tokens' if they exist in 'transformed_data'
                 if 'comments_tokens' in post['transformed_data'] and isinstance(
                         post['transformed_data']['comments_tokens'], list):
                     post['transformed_data']['comments_tokens'] = [
-                        [word for word in comment_tokens if word not in self.stop_words]
+                        self.remove_stop_words(comment_tokens)
                         for comment_tokens in post['transformed_data']['comments_tokens']
                     ]
 
@@ -62,3 +56,13 @@ class StopWordFilter(Filter):
         except Exception as e:
             print(f"Unexpected error during stopword filtering: {e}")
             raise
+
+    def remove_stop_words(self, tokens: List[str]) -> List[str]:
+        """
+        Removes the stop words from a single list of tokens.
+
+        :param tokens: The tokens to filter.
+        :return: The tokens that are not stop words.
+        """
+
+        return [word for word in tokens if word not in self.stop_words]
@@ -2,6 +2,9 @@
 import re
 from .pipe_filter import Filter, Pipe
 
+# Runs of non-alphanumeric characters, replaced by a single space
+NON_WORD_PATTERN = re.compile(r'\W+')
+
 
 class TextCleaningFilter(Filter):
     """
@@ -54,4 +57,4 @@ class TextCleaningFilter(Filter):
         :return: The processed text.
         """
 
-        return re.sub(r'\W+', ' ', text.lower()).strip()
+        return NON_WORD_PATTERN.sub(' ', text.lower()).strip()
@@ -1,16 +1,44 @@
 """Module for Tokenization Filter."""
-import nltk
-nltk.download('punkt_tab')
+import re
+from typing import List
 from nltk.tokenize import word_tokenize
 from .pipe_filter import Filter, Pipe
+from ..resources import resource_manager
+
+# Text as produced by TextCleaningFilter.clean_text: runs of word characters separated by single spaces
+CLEANED_TEXT_PATTERN = re.compile(r'(?:\w+(?: \w+)*)?')
+
+# Words that the Treebank rules of word_tokenize split after their third character, even in cleaned
+# text (e.g. 'cannot' -> 'can', 'not'). The other contractions of these rules contain an apostrophe.
+CONTRACTION_PATTERN = re.compile(r'(?i)\b(?=(?:cannot|gimme|gonna|gotta|lemme|wanna)\b)(\w{3})')
+
+# Names of the available tokenizer backends
+TOKENIZER_BACKENDS = ('nltk', 'fast')
 
 
 class TokenizationFilter(Filter):
     """
     Tokenizes the text data and stores the tokens under the 'transformed_data' key.
     If the keys selftext, title and comments do not exist, the tokenization is skipped.
+
+    Two tokenizer backends are available:
+    - 'nltk' tokenizes every text with NLTK's word_tokenize.
+    - 'fast' recognises text that has been cleaned by TextCleaningFilter, which word_tokenize
+      would only split on spaces and a handful of contractions, and tokenizes it with str.split.
+      Other text falls back to word_tokenize, so both backends produce the same tokens.
     """
 
+    def __init__(self, backend: str = 'nltk'):
+        """
+        Initializes the TokenizationFilter with its tokenizer backend.
+
+        :param backend: The tokenizer backend, 'nltk' or 'fast'.
+        """
+        if backend not in TOKENIZER_BACKENDS:
+            raise ValueError(f"Unknown tokenizer backend '{backend}', expected one of {TOKENIZER_BACKENDS}")
+
+        self.backend = backend
+
     def execute(self, pipe: Pipe) -> None:
         """
         Executes the tokenization process on each document in the pipe.
@@ -26,18 +54,18 @@ class TokenizationFilter(Filter):
 
                 # Tokenize 'selftext' if it exists and store in 'transformed_data'
                 if 'selftext' in post['transformed_data']:
-                    post['transformed_data']['selftext_tokens'] = word_tokenize(
+                    post['transformed_data']['selftext_tokens'] = self.tokenize(
                         post['transformed_data']['selftext'])
 
                 # Tokenize 'title' if it exists and store in 'transformed_data'
                 if 'title' in post['transformed_data']:
-                    post['transformed_data']['title_tokens'] = word_tokenize(
+                    post['transformed_data']['title_tokens'] = self.tokenize(
                         post['transformed_data']['title'])
 
                 # Tokenize 'comments' if they exist and are a list, store in 'transformed_data'
                 if 'comments' in post['transformed_data'] and isinstance(post['transformed_data']['comments'], list):
                     post['transformed_data']['comments_tokens'] = [
-                        word_tokenize(comment) for comment in post['transformed_data']['comments']]
+                        self.tokenize(comment) for comment in post['transformed_data']['comments']]
 
             # After tokenization, update the data in the pipe
             pipe.set_data(data)
@@ -48,3 +76,15 @@ class TokenizationFilter(Filter):
         except Exception as e:
             print(f"Unexpected error during tokenization: {e}")
             raise
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Tokenizes a single text.
+
+        :param text: The text string to be tokenized.
+        :return: The tokens of the text.
+        """
+
+        if self.backend == 'fast' and CLEANED_TEXT_PATTERN.fullmatch(text):
+            return CONTRACTION_PATTERN.sub(r'\1 ', text).split()
+        return resource_manager.call('punkt_tab', word_tokenize, text)
@@ -0,0 +1,39 @@
+"""Module for the resource provisioning command.
+
+Downloads the NLTK and spaCy resources of the Data Management module, once, when the environment
+is built. Run from the folder containing the datamanagement package:
+    python -m datamanagement.provision [--check]
+"""
+import argparse
+import sys
+from typing import List, Optional
+from .resources import ResourceManager
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Downloads every missing resource, or only checks that they are installed.
+
+    :param argv: Optional command line arguments.
+    :return: The exit code.
+    """
+    parser = argparse.ArgumentParser(description="Downloads the NLTK and spaCy resources of the Data Management module.")
+    parser.add_argument("--check", action="store_true",
+                        help="Only check that every resource is installed, without downloading anything.")
+    args = parser.parse_args(argv)
+
+    manager = ResourceManager(offline=args.check)
+    if not args.check:
+        manager.provision()
+
+    missing = manager.missing()
+    if missing:
+        print(f"Missing resources: {', '.join(missing)}")
+        return 1
+
+    print("All resources are installed.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
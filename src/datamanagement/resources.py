@@ -0,0 +1,169 @@
+"""Module for Resource Manager."""
+import importlib
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+import nltk
+
+# NLTK data packages used by the filters and models, with their path in the NLTK data directories
+NLTK_RESOURCES: Dict[str, str] = {
+    'stopwords': 'corpora/stopwords',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'wordnet': 'corpora/wordnet',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng'
+}
+
+# spaCy pipelines used by the models
+SPACY_MODELS: List[str] = ['en_core_web_sm']
+
+# Command that downloads every resource, shown in the error raised when a resource is missing
+PROVISION_COMMAND = "python -m datamanagement.provision"
+
+
+class ResourceUnavailableError(RuntimeError):
+    """
+    Raised when an NLTK or spaCy resource is not installed and cannot be downloaded.
+    """
+
+
+class ResourceManager:
+    """
+    Provides the NLTK data packages and spaCy pipelines of the filters and models on first use,
+    instead of downloading them whenever a module is imported.
+
+    Resources are used as they are installed. Only when a resource turns out to be missing is it
+    downloaded, once per process, unless the manager is offline, in which case a
+    ResourceUnavailableError pointing to the provisioning command is raised right away.
+
+    Offline mode is enabled by setting the DM_OFFLINE environment variable (e.g. DM_OFFLINE=1),
+    typically in images where the resources were provisioned at build time.
+    """
+
+    def __init__(self, offline: Optional[bool] = None):
+        """
+        Initializes the ResourceManager.
+
+        :param offline: If True, missing resources are never downloaded. Defaults to the DM_OFFLINE
+                        environment variable.
+        """
+        if offline is None:
+            offline = os.getenv("DM_OFFLINE", "").lower() in ("1", "true", "yes")
+
+        self.offline = offline
+        self.provisioned = set()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def is_available(resource: str) -> bool:
+        """
+        Checks whether a resource is installed locally.
+
+        :param resource: The name of the NLTK data package or spaCy pipeline.
+        :return: True if the resource is installed, False otherwise.
+        """
+        if resource in NLTK_RESOURCES:
+            try:
+                nltk.data.find(NLTK_RESOURCES[resource])
+                return True
+            except LookupError:
+                return False
+
+        import spacy  # pylint: disable=import-outside-toplevel
+        importlib.invalidate_caches()
+        return spacy.util.is_package(resource)
+
+    @staticmethod
+    def download(resource: str) -> None:
+        """
+        Downloads a resource.
+
+        :param resource: The name of the NLTK data package or spaCy pipeline.
+        :raises ResourceUnavailableError: If the resource could not be downloaded, e.g. because the host
+                                          is offline or the download site cannot be resolved.
+        """
+        kind = "NLTK resource" if resource in NLTK_RESOURCES else "spaCy pipeline"
+        message = (f"Failed to download the {kind} '{resource}'. "
+                   f"Provision the resources with '{PROVISION_COMMAND}'.")
+
+        try:
+            if resource in NLTK_RESOURCES:
+                downloaded = nltk.download(resource)
+            else:
+                from spacy.cli import download  # pylint: disable=import-outside-toplevel
+                download(resource)
+                downloaded = True
+        # spaCy exits when the download fails, and network errors (e.g. a NameResolutionError of
+        # requests) propagate as they are
+        except (SystemExit, Exception) as e:  # pylint: disable=broad-exception-caught
+            raise ResourceUnavailableError(f"{message} ({type(e).__name__}: {e})") from e
+
+        if not downloaded:
+            raise ResourceUnavailableError(message)
+
+    def ensure(self, resource: str) -> None:
+        """
+        Makes sure a resource is installed, downloading it if it is missing and the manager is online.
+
+        :param resource: The name of the NLTK data package or spaCy pipeline.
+        :raises ResourceUnavailableError: If the resource is missing and cannot be downloaded.
+        """
+        with self.lock:
+            if resource in self.provisioned:
+                return
+
+            if not self.is_available(resource):
+                if self.offline:
+                    raise ResourceUnavailableError(
+                        f"The resource '{resource}' is not installed and DM_OFFLINE is set. "
+                        f"Provision the resources with '{PROVISION_COMMAND}'.")
+                print(f"ensure(): Downloading missing resource '{resource}'")
+                self.download(resource)
+                if not self.is_available(resource):
+                    raise ResourceUnavailableError(
+                        f"The resource '{resource}' is still missing after downloading it. "
+                        f"Provision the resources with '{PROVISION_COMMAND}'.")
+
+            self.provisioned.add(resource)
+
+    def call(self, resource: str, function: Callable, *args, **kwargs):
+        """
+        Calls a function that uses a resource. If the resource turns out to be missing, it is
+        provided with `ensure` and the function is called again.
+
+        Nothing is checked while the resource is installed, so this adds no overhead to hot paths.
+
+        :param resource: The name of the NLTK data package or spaCy pipeline the function uses.
+        :param function: The function to call.
+        :return: The result of the function.
+        """
+        missing_error = LookupError if resource in NLTK_RESOURCES else OSError
+        try:
+            return function(*args, **kwargs)
+        except missing_error:
+            if resource in self.provisioned:
+                raise
+            self.ensure(resource)
+            return function(*args, **kwargs)
+
+    def missing(self) -> List[str]:
+        """
+        Lists the resources that are not installed locally.
+
+        :return: The names of the missing resources.
+        """
+        return [resource for resource in [*NLTK_RESOURCES, *SPACY_MODELS] if not self.is_available(resource)]
+
+    def provision(self) -> None:
+        """
+        Downloads every missing resource.
+
+        :raises ResourceUnavailableError: If a resource could not be downloaded.
+        """
+        for resource in self.missing():
+            print(f"provision(): Downloading '{resource}'")
+            self.download(resource)
+
+
+# Resource manager shared by the filters and models of a process
+resource_manager = ResourceManager()
+
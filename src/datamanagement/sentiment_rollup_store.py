@@ -0,0 +1,182 @@
+"""Module for SentimentRollupStore."""
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from .dataclient import DataClientManager, DataClientConfig
+from .transformationmodels.score_normalizer import DEFAULT_SCORE_RANGES, COMMENTS_COUNT_FIELD, SCORE_RANGE_FIELD
+
+# '_id' of the document recording from which day on the rollups hold every stored post
+COVERAGE_KEY = 'coverage'
+
+
+class SentimentRollupStore:
+    """
+    This class maintains daily rollups of the normalized sentiment scores of the stored posts,
+    so that the Data Analysis module can compute the daily and monthly results of an indicator
+    from a handful of rollup documents instead of re-scanning every post.
+
+    One rollup document is kept per keyword, day and set of models present in the posts. It holds
+    the number of posts, and the sum and count of each model's normalized component scores
+    (see ScoreNormalizer). Since a post's aggregated score only depends on which models are present
+    and is otherwise linear in its component scores, the average score of any day can be derived
+    from the rollups with arbitrary weights.
+
+    Days are formatted in the timezone named by the TIMEZONE environment variable (UTC by default),
+    which the Data Analysis module buckets posts in as well.
+
+    Posts stored before the rollups were enabled are not in the rollups until they are rebuilt, so a
+    coverage document records from which day on the rollups hold every stored post: the first whole
+    day after the rollups were started, or every day once they were rebuilt from scratch. The Data
+    Analysis module only reads the rollups of windows they cover.
+
+    The coverage document also records the score ranges the rollups were normalized with. If they
+    change, the coverage restarts from the next day, and the Data Analysis module only reads the
+    rollups if the ranges match its normalizers.
+    """
+
+    def __init__(self, db_config: DataClientConfig, timezone: Optional[str] = None,
+                 score_ranges: Dict[str, Tuple[float, float]] = None):
+        """
+        Initializes the SentimentRollupStore with the database configuration to persist rollups in.
+
+        :param db_config: A DataClientConfig object pointing to the rollup collection.
+        :param timezone: Optional IANA name of the timezone days are formatted in (e.g. 'Asia/Singapore').
+                         Defaults to the TIMEZONE environment variable, or UTC if it is not set.
+        :param score_ranges: Optional dictionary mapping model names to the (min, max) range the scores
+                             were normalized with. Defaults to the ranges of the ScoreNormalizer.
+        """
+        self.db_config = db_config
+        self.timezone = ZoneInfo(timezone or os.getenv('TIMEZONE', 'UTC'))
+        self.score_ranges = score_ranges if score_ranges is not None else DEFAULT_SCORE_RANGES
+
+    @staticmethod
+    def build_key(keyword: str, day: str, models: List[str]) -> str:
+        """
+        Builds the key that identifies the rollup of a keyword, day and set of models.
+
+        :param keyword: The keyword of the posts.
+        :param day: The day of the posts in 'YYYY-MM-DD' format.
+        :param models: The sorted models present in the posts.
+        :return: The rollup key in string.
+        """
+        return f"{keyword}|{day}|{','.join(models)}"
+
+    def build_increments(self, posts: List[Dict], sign: int = 1) -> Tuple[Dict, Dict]:
+        """
+        Builds the rollup increments of the given posts. Posts without keywords or creation time
+        are left out.
+
+        :param posts: The posts with their precomputed 'normalized_scores'.
+        :param sign: 1 to add the posts to the rollups, -1 to remove them.
+        :return: A tuple of the increments and the fields set on creation of each rollup document.
+        """
+        increments = {}
+        defaults = {}
+
+        for post in posts:
+            if 'created_utc' not in post or not post.get('keywords'):
+                continue
+
+            day = datetime.fromtimestamp(post['created_utc'], self.timezone).strftime('%Y-%m-%d')
+            normalized_scores = post.get('normalized_scores', {})
+            models = sorted(normalized_scores)
+
+            for keyword in set(post['keywords']):
+                key = self.build_key(keyword, day, models)
+                defaults[key] = {'keyword': keyword, 'day': day, 'models': models}
+                fields = increments.setdefault(key, {})
+                fields['count'] = fields.get('count', 0) + sign
+
+                for model in models:
+                    for component, score in normalized_scores[model].items():
+                        if component in (COMMENTS_COUNT_FIELD, SCORE_RANGE_FIELD):
+                            continue
+
+                        sum_field = f"sums.{model}.{component}"
+                        count_field = f"counts.{model}.{component}"
+                        fields[sum_field] = fields.get(sum_field, 0.0) + sign * score
+                        fields[count_field] = fields.get(count_field, 0) + sign
+
+        return increments, defaults
+
+    def update(self, posts: List[Dict], previous_posts: List[Dict] = None) -> None:
+        """
+        Adds the given posts to the rollups. The previous versions of posts that were already
+        stored are removed from the rollups first, so that reprocessing a post does not count it twice.
+
+        :param posts: The posts that have been stored.
+        :param previous_posts: Optional previously stored versions of the posts.
+        """
+        increments, defaults = self.build_increments(posts)
+        previous_increments, previous_defaults = self.build_increments(previous_posts or [], sign=-1)
+
+        for key, fields in previous_increments.items():
+            merged_fields = increments.setdefault(key, {})
+            for field, amount in fields.items():
+                merged_fields[field] = merged_fields.get(field, 0) + amount
+            defaults.setdefault(key, previous_defaults[key])
+
+        if not increments:
+            return
+
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            client.increment_data(increments, defaults)
+        finally:
+            client.close()
+
+    def get_coverage(self) -> Optional[str]:
+        """
+        Retrieves from which day on the rollups hold every stored post.
+
+        :return: The first covered day in 'YYYY-MM-DD' format, an empty string if every day is covered,
+                 or None if the rollups were never started or were normalized with other score ranges.
+        """
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            documents = client.load_data(filters={'_id': COVERAGE_KEY})
+        finally:
+            client.close()
+
+        if not documents or documents[0].get('score_ranges') != self.build_score_ranges():
+            return None
+        return documents[0]['since']
+
+    def build_score_ranges(self) -> Dict[str, List[float]]:
+        """
+        Builds the score ranges recorded in the coverage document.
+        """
+        return {model: list(score_range) for model, score_range in self.score_ranges.items()}
+
+    def set_coverage(self, since: str) -> None:
+        """
+        Records from which day on the rollups hold every stored post.
+
+        :param since: The first covered day in 'YYYY-MM-DD' format, or an empty string if every day is covered.
+        """
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            client.upsert_data([{'_id': COVERAGE_KEY, 'since': since, 'score_ranges': self.build_score_ranges()}])
+        finally:
+            client.close()
+
+    def start_coverage(self) -> None:
+        """
+        Records that the rollups cover every day from tomorrow on, if their coverage was never recorded
+        or was recorded with other score ranges. Posts created earlier today may have been stored
+        before the rollups were started.
+        """
+        if self.get_coverage() is None:
+            tomorrow = datetime.now(self.timezone) + timedelta(days=1)
+            self.set_coverage(tomorrow.strftime('%Y-%m-%d'))
+
+    def clear(self) -> None:
+        """
+        Deletes every rollup and their coverage, e.g. before the rollups are rebuilt from scratch.
+        """
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            client.delete_data()
+        finally:
+            client.close()
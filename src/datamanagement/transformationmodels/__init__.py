@@ -1,4 +1,19 @@
 """__init__ for Transformations Package."""
-from .vader_sentiment_analysis import VaderSentimentAnalysis
-from .textblob_sentiment_analysis import TextBlobSentimentAnalysis
-from .lda_topic_modeling import LDATopicModeling
+import importlib
+from .score_normalizer import ScoreNormalizer
+from .sentiment_cache import SentimentCache, SQLiteSentimentStore, MongoSentimentStore
+from .parallel_executor import ParallelTransformationExecutor
+from .model_registry import ModelRegistry, model_registry
+
+# Model classes, imported on first access so that importing the package does not import every model's libraries
+_LAZY_EXPORTS = {
+    'VaderSentimentAnalysis': '.vader_sentiment_analysis',
+    'TextBlobSentimentAnalysis': '.textblob_sentiment_analysis',
+    'LDATopicModeling': '.lda_topic_modeling'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
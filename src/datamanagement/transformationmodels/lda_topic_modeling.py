@@ -1,29 +1,42 @@
 """Module for LDA Topic Modelling"""
-from typing import List, Dict
+import os
+from typing import List, Dict, Optional
 from collections import defaultdict
 import nltk
+import numpy as np
 import spacy
-from spacy.cli import download
 from gensim import corpora
 from gensim.models.ldamodel import LdaModel
 from nltk.stem import WordNetLemmatizer
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
 from tqdm import tqdm
 from .transformation import Transformation
-
-nltk.download('punkt')
-nltk.download('wordnet')
-nltk.download('averaged_perceptron_tagger_eng')
-download("en_core_web_sm")
+from ..filters.columnar_pipe import ColumnarPosts
+from ..resources import resource_manager
 
 
 class LDATopicModeling(Transformation):
     """
     Applies LDA (Latent Dirichlet Allocation) topic modeling to selftext, title, and comments.
     This class assumes that stopword filtering has already been applied.
+
+    In post mode, a separate LDA model is trained on every post. In corpus mode, one model is
+    trained over all posts of a batch (and updated with every following batch), and the keywords
+    of each post are inferred from the shared model. The corpus model can be persisted, so that
+    later runs only update it.
+
+    Before LDA, the tokens of each post are filtered by their TF-IDF score. By default the scores are
+    computed for each post on its own, where IDF is constant and the filter only depends on term
+    frequencies. With corpus TF-IDF, document frequencies are counted over every post seen (and can
+    be persisted across runs), so that words common to most posts are filtered out.
     """
 
-    def __init__(self, num_topics=3, passes=40, top_n_keywords=5, min_word_len=3):
+    def __init__(self, num_topics=3, passes=40, top_n_keywords=5, min_word_len=3,
+                 corpus_mode=False, model_path: Optional[str] = None, ner_batch_size=64, ner_n_process=1,
+                 corpus_tfidf=False, tfidf_path: Optional[str] = None, tfidf_threshold=0.05,
+                 columns_chunk_size=1000, max_vocabulary_size: Optional[int] = 100000):
         """
         Initializes the LDA topic model class.
 
@@ -31,33 +44,99 @@ class LDATopicModeling(Transformation):
         :param passes: Number of passes for the LDA model.
         :param top_n_keywords: Number of top unique keywords to extract.
         :param min_word_len: Minimum word length to consider for LDA.
+        :param corpus_mode: If True, one model is trained over all posts instead of one model per post.
+        :param model_path: Optional path to load the corpus model from and save it to. The dictionary
+                           is stored next to it with the '.dictionary' suffix.
+        :param ner_batch_size: Number of texts spaCy processes at a time when extracting named entities.
+        :param ner_n_process: Number of processes spaCy extracts named entities with.
+        :param corpus_tfidf: If True, TF-IDF scores use the document frequencies of every post seen
+                             instead of each post on its own.
+        :param tfidf_path: Optional path to load the document frequencies of corpus TF-IDF from and
+                           save them to, so that they accumulate across runs.
+        :param tfidf_threshold: Minimum TF-IDF score of the words kept for LDA.
+        :param columns_chunk_size: Number of posts in columnar form whose tokens are decoded and
+                                   preprocessed at a time.
+        :param max_vocabulary_size: Maximum number of words in the dictionary of the corpus model. Past
+                                    it, the words in the fewest posts are dropped and the model is
+                                    rebuilt over the remaining words. None keeps every word.
         """
         self.num_topics = num_topics
         self.passes = passes
         self.top_n_keywords = top_n_keywords
         self.min_word_len = min_word_len
+        self.corpus_mode = corpus_mode
+        self.model_path = model_path
+        self.dictionary = None
+        self.lda_model = None
+        self.ner_batch_size = ner_batch_size
+        self.ner_n_process = ner_n_process
+        self.corpus_tfidf = corpus_tfidf
+        self.tfidf_path = tfidf_path
+        self.tfidf_threshold = tfidf_threshold
+        self.columns_chunk_size = columns_chunk_size
+        self.max_vocabulary_size = max_vocabulary_size
+        self.tfidf_dictionary = None
         self.lemmatizer = WordNetLemmatizer()
-        self.nlp = spacy.load("en_core_web_sm")
+        self._nlp = None
 
         # Exclude certain labels such as time, percent, quantity, ordinal, and cardinal
         self.excluded_labels = {'DATE', 'TIME',
                                 'PERCENT', 'QUANTITY', 'ORDINAL', 'CARDINAL'}
 
-    def preprocess_text(self, tokens):
+    @property
+    def parallelizable(self) -> bool:
+        """
+        Whether the posts can be split across processes. A corpus model must see every post, and so
+        must the document frequencies of corpus TF-IDF, which would otherwise only count the posts of
+        each process's chunks.
+        """
+        return not self.corpus_mode and not self.corpus_tfidf
+
+    @property
+    def nlp(self):
+        """
+        The spaCy pipeline extracting named entities, loaded on first use.
+        """
+        if self._nlp is None:
+            self._nlp = self.load_ner_pipeline()
+        return self._nlp
+
+    @staticmethod
+    def load_ner_pipeline():
+        """
+        Loads the spaCy pipeline with only the components named entity recognition needs enabled,
+        as only the entities of the documents are used. The tagger, parser, lemmatizer, etc. are not run.
+
+        :return: The spaCy pipeline.
+        """
+        nlp = resource_manager.call("en_core_web_sm", spacy.load, "en_core_web_sm")
+
+        # Keep the shared token-to-vector layer only if the entity recognizer listens to it
+        required_components = {'ner'}
+        if 'tok2vec' in nlp.pipe_names and 'ner' in nlp.get_pipe('tok2vec').listening_components:
+            required_components.add('tok2vec')
+
+        nlp.select_pipes(enable=[name for name in nlp.pipe_names if name in required_components])
+        return nlp
+
+    def preprocess_text(self, tokens, named_entities=None):
         """
         Preprocess tokens by POS tagging, lemmatization, and filtering.
         Retains nouns, proper nouns, and named entities (like company names).
+
+        :param tokens: List of tokens.
+        :param named_entities: Optional named entities already extracted from the tokens' text.
         """
-        text = " ".join(tokens)
-        named_entities = self.extract_named_entities(text)
+        if named_entities is None:
+            named_entities = self.extract_named_entities(" ".join(tokens))
 
         # POS tagging and token filtering
-        pos_tagged = nltk.pos_tag(tokens)
+        pos_tagged = resource_manager.call('averaged_perceptron_tagger_eng', nltk.pos_tag, tokens)
         relevant_pos_tags = {'NN', 'NNS', 'NNP', 'NNPS', 'JJ'}
-        filtered_tokens = [
+        filtered_tokens = resource_manager.call('wordnet', lambda: [
             self.lemmatizer.lemmatize(word) for word, pos in pos_tagged
             if pos in relevant_pos_tags and word.isalpha() and len(word) >= self.min_word_len
-        ]
+        ])
 
         return filtered_tokens + named_entities
 
@@ -72,6 +151,18 @@ class LDATopicModeling(Transformation):
         unique_named_entities = list(set(named_entities))
         return unique_named_entities
 
+    def extract_named_entities_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extracts the named entities of many texts at once, streaming them through spaCy in batches.
+
+        :param texts: List of texts.
+        :return: The unique named entities of each text, in the order of the texts.
+        """
+        return [
+            list({ent.text for ent in doc.ents if ent.label_ not in self.excluded_labels})
+            for doc in self.nlp.pipe(texts, batch_size=self.ner_batch_size, n_process=self.ner_n_process)
+        ]
+
     def apply_tfidf_filtering(self, tokens):
         """
         Applies TF-IDF filtering to retain only relevant words.
@@ -94,7 +185,7 @@ class LDATopicModeling(Transformation):
 
             # Keep words with a lower TF-IDF score
             filtered_tokens = [word for word,
-                               score in tfidf_scores.items() if score >= 0.05]
+                               score in tfidf_scores.items() if score >= self.tfidf_threshold]
 
             # Return the original tokens if TF-IDF filtering removes all words
             if not filtered_tokens:
@@ -106,6 +197,202 @@ class LDATopicModeling(Transformation):
             print(f"Error in TF-IDF filtering: {e}")
             return tokens  # Return the original tokens if TF-IDF fails
 
+    def apply_corpus_tfidf_filtering(self, documents: List[List[str]]) -> List[List[str]]:
+        """
+        Applies TF-IDF filtering to the tokens of many posts at once, with the document frequencies
+        of every post seen. The document frequencies are first updated with the given posts. They are
+        only persisted by `commit`, once the posts have been stored.
+
+        Like the per-post filtering, words are lowercased and split on whitespace, scores use
+        TfidfVectorizer's smoothed IDF and L2 normalization, and the unique words passing the
+        threshold are returned in alphabetical order.
+
+        :param documents: The tokens of each post.
+        :return: The filtered tokens of each post, or its original tokens if none pass the filter.
+        """
+        analyzed_documents = [" ".join(tokens).lower().split() for tokens in documents]
+
+        if self.tfidf_dictionary is None:
+            self.load_tfidf()
+
+        # Build the sparse matrix of the term counts of each post, counting the posts' words in the
+        # document frequencies at the same time
+        indptr, indices, counts = [0], [], []
+        for tokens in analyzed_documents:
+            bow = self.tfidf_dictionary.doc2bow(tokens, allow_update=True) if tokens else []
+            indices.extend(word_id for word_id, _ in bow)
+            counts.extend(count for _, count in bow)
+            indptr.append(len(indices))
+
+        vocabulary_size = len(self.tfidf_dictionary)
+        if vocabulary_size == 0:
+            return documents
+        term_counts = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+            shape=(len(analyzed_documents), vocabulary_size))
+
+        # Weigh the term counts by the smoothed IDF of every word, and normalize each post
+        document_frequencies = np.zeros(vocabulary_size)
+        document_frequencies[list(self.tfidf_dictionary.dfs)] = list(self.tfidf_dictionary.dfs.values())
+        idf = np.log((1 + self.tfidf_dictionary.num_docs) / (1 + document_frequencies)) + 1
+        tfidf_matrix = normalize(term_counts.multiply(idf).tocsr())
+
+        words = np.empty(vocabulary_size, dtype=object)
+        words[list(self.tfidf_dictionary.token2id.values())] = list(self.tfidf_dictionary.token2id)
+        kept = tfidf_matrix.data >= self.tfidf_threshold
+        filtered_documents = []
+        for row, tokens in enumerate(documents):
+            start, end = tfidf_matrix.indptr[row], tfidf_matrix.indptr[row + 1]
+            filtered_tokens = sorted(words[tfidf_matrix.indices[start:end][kept[start:end]]])
+
+            # Keep the original tokens if TF-IDF filtering removes all words
+            filtered_documents.append(filtered_tokens or tokens)
+
+        return filtered_documents
+
+    def load_tfidf(self) -> None:
+        """
+        Loads the persisted document frequencies of corpus TF-IDF, if a path is set and they exist.
+        """
+        if self.tfidf_path and os.path.exists(self.tfidf_path):
+            self.tfidf_dictionary = corpora.Dictionary.load(self.tfidf_path)
+        else:
+            self.tfidf_dictionary = corpora.Dictionary()
+
+    def save_tfidf(self) -> None:
+        """
+        Persists the document frequencies of corpus TF-IDF, if a path is set.
+        """
+        if self.tfidf_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.tfidf_path)), exist_ok=True)
+            self.tfidf_dictionary.save(self.tfidf_path)
+
+    def reset(self) -> None:
+        """
+        Discards the corpus model and the document frequencies of corpus TF-IDF, including the
+        persisted ones, as every post is trained on and counted again in a full rebuild.
+        """
+        if self.corpus_mode:
+            self.lda_model = None
+            self.dictionary = None
+            if self.model_path:
+                for path in (self.model_path, f"{self.model_path}.dictionary"):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        if self.corpus_tfidf:
+            self.tfidf_dictionary = corpora.Dictionary()
+            if self.tfidf_path and os.path.exists(self.tfidf_path):
+                os.remove(self.tfidf_path)
+
+    def commit(self) -> None:
+        """
+        Persists the corpus model and the document frequencies of corpus TF-IDF once the posts they
+        were trained on and counted in are stored.
+        """
+        if self.corpus_mode and self.lda_model is not None:
+            self.save_model()
+        if self.corpus_tfidf and self.tfidf_dictionary is not None:
+            self.save_tfidf()
+
+    def rollback(self) -> None:
+        """
+        Discards the training and the document frequencies since the last commit, if they are
+        persisted, so that the posts that failed to be stored are not counted twice when they are
+        processed again. The persisted model and frequencies are loaded again on next use.
+        """
+        if self.corpus_mode and self.model_path:
+            self.lda_model = None
+            self.dictionary = None
+        if self.corpus_tfidf and self.tfidf_path:
+            self.tfidf_dictionary = None
+
+    @staticmethod
+    def combine_tokens(post: Dict) -> List[str]:
+        """
+        Combines the tokens of the post's 'selftext', 'title', and 'comments'.
+
+        :param post: The post containing 'selftext_tokens', 'title_tokens', and 'comments_tokens'.
+        :return: The combined tokens.
+        """
+        transformed_data = post.get('transformed_data', {})
+        return (
+            transformed_data.get('selftext_tokens', []) +
+            transformed_data.get('title_tokens', []) +
+            [token for comment in transformed_data.get(
+                'comments_tokens', []) for token in comment]
+        )
+
+    def process_posts(self, data: List[Dict]) -> List[List[str]]:
+        """
+        Preprocesses and filters the tokens of every post for LDA.
+
+        :param data: The list of posts (each post contains 'selftext_tokens', 'title_tokens',
+                     and 'comments_tokens').
+        :return: The processed tokens of each post, or an empty list if no valid tokens remain.
+        """
+        return self.filter_documents(self.preprocess_documents([self.combine_tokens(post) for post in data]))
+
+    def preprocess_documents(self, combined_tokens: List[List[str]]) -> List[List[str]]:
+        """
+        Preprocesses the combined tokens of many posts. The named entities of all posts are extracted
+        in one batched pass before the tokens of each post are processed.
+
+        :param combined_tokens: The combined tokens of each post.
+        :return: The preprocessed tokens of each post, or an empty list if the post has no tokens.
+        """
+        named_entities = iter(self.extract_named_entities_batch(
+            [" ".join(tokens) for tokens in combined_tokens if tokens]))
+
+        documents = []
+        for tokens in combined_tokens:
+            if not tokens:
+                documents.append([])
+                continue
+
+            # Preprocess tokens: Apply POS tagging, lemmatization, and length filtering
+            documents.append(self.preprocess_text(tokens, next(named_entities)))
+
+        return documents
+
+    def filter_documents(self, documents: List[List[str]]) -> List[List[str]]:
+        """
+        Applies TF-IDF filtering to the preprocessed tokens of every post.
+
+        :param documents: The preprocessed tokens of each post.
+        :return: The filtered tokens of each post.
+        """
+        if self.corpus_tfidf:
+            return self.apply_corpus_tfidf_filtering(documents)
+        return [self.apply_tfidf_filtering(tokens) for tokens in documents]
+
+    def set_keywords(self, post: Dict, top_keywords: List[str]) -> None:
+        """
+        Stores the top keywords in the post, including its subreddit.
+
+        :param post: The post to store the keywords in.
+        :param top_keywords: The top keywords of the post.
+        """
+        # Extract subreddit and include it in the top keywords
+        subreddit = post.get("subreddit", "").lower()
+        if subreddit and subreddit not in top_keywords:
+            top_keywords.insert(0, subreddit)
+
+        # Store top unique keywords in the post
+        post['keywords'] = top_keywords
+
+    def store_keywords(self, post: Dict, top_keywords: Optional[List[str]]) -> None:
+        """
+        Stores the top keywords in the post, or an empty keywords list if LDA was skipped for the post.
+
+        :param post: The post to store the keywords in.
+        :param top_keywords: The top keywords of the post, or None if LDA was skipped.
+        """
+        if top_keywords is None:
+            post['keywords'] = []
+        else:
+            self.set_keywords(post, top_keywords)
+
     def apply(self, data: List[Dict]) -> List[Dict]:
         """
         Applies LDA topic modeling to 'selftext', 'title', and 'comments' fields after stopwords 
@@ -115,31 +402,61 @@ class LDATopicModeling(Transformation):
                      and 'comments_tokens').
         :return: The modified data with 'lda_keywords' field containing the top N unique topic keywords.
         """
-        # Add tqdm to track progress
-        for post in tqdm(data, desc="Processing topics", unit="post"):
-            # Combine tokens from 'selftext', 'title', and 'comments'
-            transformed_data = post.get('transformed_data', {})
-            combined_tokens = (
-                transformed_data.get('selftext_tokens', []) +
-                transformed_data.get('title_tokens', []) +
-                [token for comment in transformed_data.get(
-                    'comments_tokens', []) for token in comment]
-            )
-
-            # Skip LDA processing if no valid tokens remain after filtering
-            if not combined_tokens:
-                post['keywords'] = []  # Assign an empty keywords list
-                continue
+        if self.corpus_mode:
+            return self.apply_corpus(data)
 
-            # Preprocess tokens: Apply POS tagging, lemmatization, and length filtering
-            processed_tokens = self.preprocess_text(combined_tokens)
+        for post, top_keywords in zip(data, self.extract_keywords(self.process_posts(data))):
+            self.store_keywords(post, top_keywords)
 
-            # Apply TF-IDF filtering
-            processed_tokens = self.apply_tfidf_filtering(processed_tokens)
+        return data
+
+    def apply_columns(self, posts: ColumnarPosts) -> ColumnarPosts:
+        """
+        Applies LDA topic modeling to posts in columnar form. The token columns are decoded chunk by
+        chunk, straight from their vocabulary ids into the combined tokens of each post, so that only
+        the processed tokens of the batch are held at once. The keywords are stored with the post's
+        other fields.
+
+        :param posts: The posts in columnar form, after stopword filtering.
+        :return: The posts with their 'keywords'.
+        """
+        token_columns = [posts.column(('transformed_data', field))
+                         for field in ('selftext_tokens', 'title_tokens', 'comments_tokens')]
+
+        documents = []
+        for start in range(0, len(posts), self.columns_chunk_size):
+            end = min(start + self.columns_chunk_size, len(posts))
+            combined_tokens = [
+                [token for column in token_columns for token in column.vocabulary.decode(column.get_ids(index))]
+                for index in range(start, end)
+            ]
+            documents.extend(self.preprocess_documents(combined_tokens))
+
+        documents = self.filter_documents(documents)
+        top_keywords = self.infer_keywords(documents) if self.corpus_mode else self.extract_keywords(documents)
+
+        for index, post_keywords in enumerate(top_keywords):
+            document = posts.documents[index] or {}
+            self.store_keywords(document, post_keywords)
+            posts.documents[index] = document
+
+        return posts
+
+    def extract_keywords(self, documents: List[List[str]]) -> List[Optional[List[str]]]:
+        """
+        Trains a separate LDA model on the processed tokens of every post, and extracts its top keywords.
+
+        :param documents: The processed tokens of each post.
+        :return: The top keywords of each post, or None for the posts without valid tokens.
+        """
+        top_keywords = []
+
+        # Add tqdm to track progress
+        for processed_tokens in tqdm(documents, total=len(documents), desc="Processing topics", unit="post"):
 
             # If after filtering the tokens list is empty, skip LDA
             if not processed_tokens:
-                post['keywords'] = []
+                top_keywords.append(None)
                 continue
 
             # Create a dictionary and corpus for LDA
@@ -148,7 +465,7 @@ class LDATopicModeling(Transformation):
 
             # Skip LDA if the corpus is empty
             if not corpus or all(len(doc) == 0 for doc in corpus):
-                post['keywords'] = []  # Assign an empty keywords list
+                top_keywords.append(None)
                 continue
 
             # Train LDA model
@@ -168,15 +485,156 @@ class LDATopicModeling(Transformation):
             # Sort keywords by their cumulative score and select the top N unique keywords
             sorted_keywords = sorted(
                 keyword_scores.items(), key=lambda x: x[1], reverse=True)
-            top_keywords = [word for word,
-                            _ in sorted_keywords[:self.top_n_keywords]]
+            top_keywords.append([word for word, _ in sorted_keywords[:self.top_n_keywords]])
 
-            # Extract subreddit and include it in the top keywords
-            subreddit = post.get("subreddit", "").lower()
-            if subreddit and subreddit not in top_keywords:
-                top_keywords.insert(0, subreddit)
+        return top_keywords
 
-            # Store top unique keywords in the post
-            post['keywords'] = top_keywords
+    def apply_corpus(self, data: List[Dict]) -> List[Dict]:
+        """
+        Trains (or updates) one LDA model over all posts, and infers the keywords of each post
+        from the shared model.
+
+        :param data: The list of posts (each post contains 'selftext_tokens', 'title_tokens',
+                     and 'comments_tokens').
+        :return: The modified data with 'keywords' field containing the top N unique topic keywords.
+        """
+        for post, top_keywords in zip(data, self.infer_keywords(self.process_posts(data))):
+            self.store_keywords(post, top_keywords)
 
         return data
+
+    def infer_keywords(self, documents: List[List[str]]) -> List[Optional[List[str]]]:
+        """
+        Trains (or updates) the shared LDA model with the processed tokens of every post, and infers
+        the keywords of each post from it.
+
+        The keywords of a post are its words that are most likely under the post's topic mixture,
+        i.e. the words with the highest sum over all topics of P(topic | post) * P(word | topic).
+
+        :param documents: The processed tokens of each post.
+        :return: The top keywords of each post, or None for the posts without valid tokens.
+        """
+        # Train or update the shared model with the posts that have valid tokens
+        self.update_model([tokens for tokens in documents if tokens])
+        topic_word = self.lda_model.get_topics() if self.lda_model is not None else None
+
+        top_keywords = []
+        for tokens in documents:
+            bow = self.dictionary.doc2bow(tokens) if tokens and topic_word is not None else []
+            if not bow:
+                top_keywords.append(None)
+                continue
+
+            # Score the post's words by their likelihood under the post's topic mixture
+            topic_weights = np.zeros(self.lda_model.num_topics)
+            for topic, probability in self.lda_model.get_document_topics(bow, minimum_probability=0.0):
+                topic_weights[topic] = probability
+            word_ids = [word_id for word_id, _ in bow]
+            word_scores = topic_weights @ topic_word[:, word_ids]
+
+            ranked_words = sorted(zip(word_ids, word_scores), key=lambda x: x[1], reverse=True)
+            top_keywords.append([self.dictionary[word_id] for word_id, _ in ranked_words[:self.top_n_keywords]])
+
+        return top_keywords
+
+    def update_model(self, documents: List[List[str]]) -> None:
+        """
+        Trains the shared LDA model on the documents, or updates it if it was trained before.
+        The persisted model is loaded first if a model path is set. It is saved by `commit`, once
+        the posts have been stored.
+
+        :param documents: The processed tokens of each post.
+        """
+        if self.lda_model is None:
+            self.load_model()
+
+        if not documents:
+            return
+
+        # The dictionary is never pruned while documents are added, as pruning renumbers the word ids
+        # the model is indexed by. Its size is limited by limit_vocabulary instead
+        if self.lda_model is None:
+            self.dictionary = corpora.Dictionary(documents, prune_at=None)
+            self.limit_vocabulary()
+            corpus = [self.dictionary.doc2bow(tokens) for tokens in documents]
+            self.lda_model = LdaModel(
+                corpus, num_topics=self.num_topics, id2word=self.dictionary, passes=self.passes,
+                iterations=100, chunksize=10000, eval_every=None)
+        else:
+            # Add the new words to the dictionary, and to the model before updating it
+            self.dictionary.add_documents(documents, prune_at=None)
+            self.extend_vocabulary()
+            self.limit_vocabulary()
+            corpus = [self.dictionary.doc2bow(tokens) for tokens in documents]
+            self.lda_model.update(corpus, passes=self.passes, iterations=100, chunksize=10000, eval_every=None)
+
+    def extend_vocabulary(self) -> None:
+        """
+        Grows the LDA model to the size of the dictionary. gensim cannot add words to a trained
+        model, so the topic-word statistics and the prior of the new words are appended (as
+        unseen words) and the model state is synchronized.
+        """
+        new_terms = len(self.dictionary) - self.lda_model.num_terms
+        if new_terms <= 0:
+            return
+
+        lda_model = self.lda_model
+        dtype = lda_model.dtype
+        if lda_model.eta.ndim == 1:
+            eta = np.concatenate([lda_model.eta, np.full(new_terms, lda_model.eta.mean(), dtype=dtype)])
+        else:
+            eta = np.hstack([lda_model.eta, np.tile(lda_model.eta.mean(axis=1, keepdims=True), new_terms)])
+
+        lda_model.num_terms = len(self.dictionary)
+        lda_model.id2word = self.dictionary
+        lda_model.eta = eta.astype(dtype)
+        lda_model.state.eta = lda_model.eta
+        lda_model.state.sstats = np.hstack([
+            lda_model.state.sstats, np.zeros((lda_model.num_topics, new_terms), dtype=dtype)
+        ])
+        lda_model.sync_state()
+
+    def limit_vocabulary(self) -> None:
+        """
+        Drops the words in the fewest posts from the dictionary once it holds more than
+        max_vocabulary_size words. Filtering renumbers the remaining words, so a trained model is
+        rebuilt over them with their topic-word statistics and prior.
+        """
+        if self.max_vocabulary_size is None or len(self.dictionary) <= self.max_vocabulary_size:
+            return
+
+        previous_ids = dict(self.dictionary.token2id)
+        self.dictionary.filter_extremes(no_below=1, no_above=1.0, keep_n=self.max_vocabulary_size)
+        if self.lda_model is None:
+            return
+
+        # The previous id of every remaining word, in the order of the new ids
+        kept_ids = [previous_ids[self.dictionary[word_id]] for word_id in range(len(self.dictionary))]
+
+        previous_model = self.lda_model
+        eta = previous_model.eta[kept_ids] if previous_model.eta.ndim == 1 else previous_model.eta[:, kept_ids]
+        lda_model = LdaModel(
+            num_topics=previous_model.num_topics, id2word=self.dictionary, alpha=previous_model.alpha,
+            eta=eta, dtype=previous_model.dtype, eval_every=None)
+        lda_model.state.sstats = previous_model.state.sstats[:, kept_ids]
+        lda_model.state.numdocs = previous_model.state.numdocs
+        lda_model.num_updates = previous_model.num_updates
+        lda_model.sync_state()
+        self.lda_model = lda_model
+
+    def load_model(self) -> None:
+        """
+        Loads the persisted LDA model and dictionary, if a model path is set and they exist.
+        """
+        if self.model_path and os.path.exists(self.model_path):
+            self.lda_model = LdaModel.load(self.model_path)
+            self.dictionary = corpora.Dictionary.load(f"{self.model_path}.dictionary")
+
+    def save_model(self) -> None:
+        """
+        Persists the LDA model and dictionary, if a model path is set.
+        """
+        if self.model_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.model_path)), exist_ok=True)
+            self.lda_model.save(self.model_path)
+            self.dictionary.save(f"{self.model_path}.dictionary")
@@ -0,0 +1,137 @@
+"""Module for Model Registry"""
+import importlib
+import threading
+from importlib.metadata import entry_points
+from typing import Dict, List, Type, Union
+from .transformation import Transformation
+
+# Entry point group through which other packages register their transformation models, e.g. in pyproject.toml:
+#   [project.entry-points."datamanagement.transformation_models"]
+#   mymodel = "mypackage.models:MyModel"
+ENTRY_POINT_GROUP = "datamanagement.transformation_models"
+
+# Built-in models, as import paths so that their modules (and libraries) are only imported when used
+BUILTIN_MODELS = {
+    'vader': f"{__package__}.vader_sentiment_analysis:VaderSentimentAnalysis",
+    'textblob': f"{__package__}.textblob_sentiment_analysis:TextBlobSentimentAnalysis",
+    'lda': f"{__package__}.lda_topic_modeling:LDATopicModeling"
+}
+
+
+class ModelRegistry:
+    """
+    Maps model names to transformation model classes, importing each class only when its name is
+    requested, so that e.g. a VADER-only run does not import gensim, spaCy or TextBlob.
+
+    Model instances are cached by name and keyword arguments, so that repeated transformations in a
+    long-lived process reuse the loaded analyzers and pipelines.
+
+    Besides the built-in models, models registered under the 'datamanagement.transformation_models'
+    entry point group are available, the built-in models taking precedence.
+    """
+
+    def __init__(self):
+        """
+        Initializes the ModelRegistry with the built-in models.
+        """
+        self.model_paths: Dict[str, str] = dict(BUILTIN_MODELS)
+        self.model_classes: Dict[str, Type[Transformation]] = {}
+        self.instances: Dict[tuple, Transformation] = {}
+        self.entry_points_loaded = False
+        self.lock = threading.RLock()
+
+    def register(self, name: str, model: Union[str, Type[Transformation]]) -> None:
+        """
+        Registers a model under a name, replacing any model registered under the same name.
+
+        :param name: The name of the model (e.g. 'vader').
+        :param model: The model class, or its import path in 'module:Class' format to import it lazily.
+        """
+        with self.lock:
+            self.model_paths.pop(name, None)
+            self.model_classes.pop(name, None)
+            self.instances = {key: instance for key, instance in self.instances.items() if key[0] != name}
+            if isinstance(model, str):
+                self.model_paths[name] = model
+            else:
+                self.model_classes[name] = model
+
+    def load_entry_points(self) -> None:
+        """
+        Registers the models of the entry point group, once. Their classes are only loaded on request.
+        """
+        with self.lock:
+            if self.entry_points_loaded:
+                return
+            self.entry_points_loaded = True
+
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                if entry_point.name not in self.model_paths and entry_point.name not in self.model_classes:
+                    self.model_paths[entry_point.name] = entry_point.value
+
+    def names(self) -> List[str]:
+        """
+        Lists the names of the registered models.
+
+        :return: The model names.
+        """
+        self.load_entry_points()
+        return sorted({*self.model_paths, *self.model_classes})
+
+    def is_registered(self, name: str) -> bool:
+        """
+        Checks whether a model is registered under a name.
+
+        :param name: The name of the model.
+        :return: True if the model is registered, False otherwise.
+        """
+        return name in self.names()
+
+    def get_class(self, name: str) -> Type[Transformation]:
+        """
+        Returns the class of a model, importing its module on first request.
+
+        :param name: The name of the model.
+        :return: The model class.
+        :raises KeyError: If no model is registered under the name.
+        """
+        self.load_entry_points()
+        with self.lock:
+            if name not in self.model_classes:
+                if name not in self.model_paths:
+                    raise KeyError(f"No transformation model registered under '{name}'")
+
+                module_name, _, class_name = self.model_paths[name].partition(':')
+                model_class = importlib.import_module(module_name)
+                for attribute in class_name.split('.'):
+                    model_class = getattr(model_class, attribute)
+                self.model_classes[name] = model_class
+            return self.model_classes[name]
+
+    def get_model(self, name: str, model_kwargs: dict = None) -> Transformation:
+        """
+        Returns an instance of a model, instantiating it on first request with the given keyword arguments.
+
+        :param name: The name of the model.
+        :param model_kwargs: Optional keyword arguments the model is instantiated with.
+        :return: The model instance, shared by the requests with the same keyword arguments.
+        :raises KeyError: If no model is registered under the name.
+        """
+        model_kwargs = model_kwargs or {}
+        # Arguments are compared by their representation, as they may not be hashable (e.g. dicts)
+        key = (name, repr(sorted(model_kwargs.items())))
+        with self.lock:
+            if key not in self.instances:
+                self.instances[key] = self.get_class(name)(**model_kwargs)
+            return self.instances[key]
+
+    def clear_instances(self) -> None:
+        """
+        Releases the cached model instances.
+        """
+        with self.lock:
+            self.instances = {}
+
+
+# Registry shared by the ELT processes of a Python process
+model_registry = ModelRegistry()
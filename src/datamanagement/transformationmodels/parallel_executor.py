@@ -0,0 +1,129 @@
+"""Module for Parallel Transformation Executor"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple, Type
+from .transformation import Transformation
+
+# Models of each worker process, instantiated from the model specs on first use
+_worker_model_specs: List[Tuple[Type[Transformation], dict]] = []
+_worker_models: Dict[int, Transformation] = {}
+
+
+def _initialize_worker(model_specs: List[Tuple[Type[Transformation], dict]]) -> None:
+    """
+    Initializes a worker process with the specs of the models it may apply.
+
+    :param model_specs: The class and keyword arguments of each model.
+    """
+    global _worker_model_specs  # pylint: disable=global-statement
+    _worker_model_specs = model_specs
+    _worker_models.clear()
+
+
+def _transform_chunk(chunk: List[Dict], model_indexes: List[int]) -> List[Dict]:
+    """
+    Applies the given models to a chunk of posts in a worker process. Each model (and its analyzer
+    or spaCy pipeline) is only instantiated once per worker.
+
+    :param chunk: The posts to transform.
+    :param model_indexes: The indexes of the models to apply, in order.
+    :return: The transformed posts.
+    """
+    for index in model_indexes:
+        if index not in _worker_models:
+            model_class, model_kwargs = _worker_model_specs[index]
+            _worker_models[index] = model_class(**model_kwargs)
+        chunk = _worker_models[index].apply(chunk)
+    return chunk
+
+
+class ParallelTransformationExecutor:
+    """
+    Applies transformation models to the posts by sharding them across a pool of worker processes.
+
+    Models that are not parallelizable (e.g. a corpus-level LDA model, which must see every post)
+    are applied to all posts in the calling process. The transformed posts are returned in the
+    order of the input.
+    """
+
+    def __init__(self, model_specs: List[Tuple[Type[Transformation], dict]],
+                 processes: Optional[int] = None, chunk_size: Optional[int] = None):
+        """
+        Initializes the executor with the models it may apply.
+
+        :param model_specs: The class and keyword arguments of each model, used to instantiate the
+                            models once in each worker process.
+        :param processes: Number of worker processes. Defaults to the number of CPUs.
+        :param chunk_size: Optional number of posts sent to a worker at a time. Defaults to spreading
+                           the posts evenly over four chunks per worker.
+        """
+        if processes is not None and processes <= 0:
+            raise ValueError(f"processes must be a positive integer, got {processes}")
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+
+        self.model_specs = model_specs
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.pool = None
+
+    def get_pool(self) -> ProcessPoolExecutor:
+        """
+        Starts the pool of worker processes, if it is not running yet.
+
+        :return: The pool of worker processes.
+        """
+        if self.pool is None:
+            # Spawn the workers, as forking would copy the MongoClient and the threads of this process
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker, initargs=(self.model_specs,))
+        return self.pool
+
+    def split(self, data: List[Dict]) -> List[List[Dict]]:
+        """
+        Splits the posts into the chunks sent to the worker processes.
+
+        :param data: The posts to split.
+        :return: The chunks of posts, in order.
+        """
+        chunk_size = self.chunk_size or max(1, -(-len(data) // (self.processes * 4)))
+        return [data[start:start + chunk_size] for start in range(0, len(data), chunk_size)]
+
+    def transform(self, data: List[Dict], models: List[Transformation]) -> List[Dict]:
+        """
+        Applies the models to the posts, in order.
+
+        :param data: The posts to transform.
+        :param models: The instantiated models matching the model specs. Non-parallelizable models
+                       are applied with these instances in the calling process.
+        :return: The transformed posts, in the order of the input.
+        """
+        index = 0
+        while index < len(models):
+            if not getattr(models[index], 'parallelizable', True):
+                data = models[index].apply(data)
+                index += 1
+                continue
+
+            # Apply consecutive parallelizable models in a single round trip to the workers
+            model_indexes = []
+            while index < len(models) and getattr(models[index], 'parallelizable', True):
+                model_indexes.append(index)
+                index += 1
+
+            chunks = self.split(data)
+            pool = self.get_pool()
+            data = [post for chunk in pool.map(_transform_chunk, chunks, [model_indexes] * len(chunks))
+                    for post in chunk]
+
+        return data
+
+    def close(self) -> None:
+        """
+        Shuts down the pool of worker processes.
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
@@ -0,0 +1,89 @@
+"""Module for Score Normalizer"""
+from typing import List, Dict, Tuple
+from .transformation import Transformation
+
+# Range of the sentiment scores of each model. The Data Analysis module only uses the normalized scores
+# of a model if they were normalized with the same range as its own normalizer
+DEFAULT_SCORE_RANGES = {
+    'vader': (-1, 1),
+    'textblob': (-1, 1)
+}
+
+SENTIMENT_COMPONENTS = ('title_sentiment', 'selftext_sentiment')
+COMMENTS_COMPONENT = 'comments_sentiment'
+# Fields of a model's normalized scores that are not scores
+COMMENTS_COUNT_FIELD = 'comments_count'
+SCORE_RANGE_FIELD = 'score_range'
+
+
+class ScoreNormalizer(Transformation):
+    """
+    Precomputes the min-max normalized (0 to 100) sentiment scores of each post, so that the
+    Data Analysis module can aggregate them without re-normalizing and re-averaging the
+    comment scores on every indicator recalculation.
+
+    For each model, the normalized title and selftext scores, the mean of the normalized
+    comment scores and the number of comments are stored as flat numeric fields under
+    'normalized_scores'. Components missing from the model output are left out.
+
+    The (min, max) range the scores were normalized with is stored with them as 'score_range', so
+    that scores normalized with an outdated range are recomputed instead of being used.
+    """
+
+    def __init__(self, score_ranges: Dict[str, Tuple[float, float]] = None):
+        """
+        Initializes the ScoreNormalizer with the score range of each model.
+
+        :param score_ranges: A dictionary mapping model names to the (min, max) of their scores.
+        """
+        self.score_ranges = score_ranges if score_ranges is not None else DEFAULT_SCORE_RANGES
+
+    def normalize(self, score: float, score_range: Tuple[float, float]) -> float:
+        """
+        Normalizes a score to the range 0 to 100, clamping scores outside of the model's range.
+
+        :param score: The score to normalize.
+        :param score_range: The (min, max) of the model's scores.
+        :return: The normalized score.
+        """
+        min_value, max_value = score_range
+        normalized_score = (score - min_value) / (max_value - min_value) * 100
+        return max(0, min(100, normalized_score))
+
+    def apply(self, data: List[Dict]) -> List[Dict]:
+        """
+        Implemented method that adds the normalized scores of each model to every post.
+
+        :param data: transformed data that contains the model outputs.
+        :returns data: transformed data that contains the normalized scores of each post.
+        """
+
+        for post in data:
+            model_output = post.get('model_output', {})
+            normalized_scores = {}
+
+            for model, score_range in self.score_ranges.items():
+                if model not in model_output:
+                    continue
+
+                results = model_output[model]
+                model_scores = {SCORE_RANGE_FIELD: list(score_range)}
+
+                for component in SENTIMENT_COMPONENTS:
+                    if component in results:
+                        model_scores[component] = self.normalize(results[component], score_range)
+
+                if COMMENTS_COMPONENT in results:
+                    comment_scores = [
+                        self.normalize(score, score_range) for score in results[COMMENTS_COMPONENT]
+                    ]
+                    model_scores[COMMENTS_COMPONENT] = (
+                        sum(comment_scores) / len(comment_scores) if comment_scores else 0.0)
+                    model_scores[COMMENTS_COUNT_FIELD] = len(comment_scores)
+
+                normalized_scores[model] = model_scores
+
+            if normalized_scores:
+                post['normalized_scores'] = normalized_scores
+
+        return data
@@ -0,0 +1,274 @@
+"""Module for Sentiment Cache"""
+import hashlib
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from importlib import metadata
+from typing import Callable, Dict, Iterable, List, Optional
+from ..dataclient import DataClientManager, DataClientConfig
+
+# Default number of scores kept in the in-memory tier of a cache
+DEFAULT_CACHE_SIZE = 100000
+
+
+def get_package_version(package: str) -> str:
+    """
+    Retrieves the installed version of a package, used to invalidate cached scores on upgrades.
+
+    :param package: The name of the package.
+    :return: The version of the package, or 'unknown' if it is not installed.
+    """
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def collect_texts(data: List[Dict]) -> List[str]:
+    """
+    Collects the texts a sentiment model scores: the selftext, title and comments of each post.
+
+    :param data: The posts to score.
+    :return: The texts of the posts.
+    """
+    texts = []
+    for post in data:
+        texts.extend(post[field] for field in ('selftext', 'title') if field in post)
+        if isinstance(post.get('comments'), list):
+            texts.extend(post['comments'])
+    return texts
+
+
+class SentimentCacheStore(ABC):
+    """
+    Abstract class for the persistent tier of a SentimentCache.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        """
+        Retrieves the stored scores of the given keys.
+
+        :param keys: The cache keys to look up.
+        :return: A dictionary mapping the keys that were found to their scores.
+        """
+
+    @abstractmethod
+    def set_many(self, scores: Dict[str, float]) -> None:
+        """
+        Stores the given scores.
+
+        :param scores: A dictionary mapping cache keys to scores.
+        """
+
+
+class SQLiteSentimentStore(SentimentCacheStore):
+    """
+    Persists cached scores in a local SQLite database. The connection is opened on first use,
+    so that the store can be sent to worker processes.
+    """
+
+    # Maximum number of parameters in a single SQLite query
+    QUERY_BATCH_SIZE = 900
+
+    def __init__(self, path: str):
+        """
+        Initializes the SQLiteSentimentStore with the path of the database file.
+
+        :param path: The path of the SQLite database file.
+        """
+        self.path = path
+        self.connection = None
+
+    def __getstate__(self):
+        return {**self.__dict__, 'connection': None}
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Opens the connection to the database and creates the cache table, if not done yet.
+
+        :return: The connection to the database.
+        """
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, timeout=30)
+            # Allow several ELT processes to read while one of them writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache (key TEXT PRIMARY KEY, score REAL NOT NULL)")
+        return self.connection
+
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        connection = self.connect()
+        scores = {}
+        for start in range(0, len(keys), self.QUERY_BATCH_SIZE):
+            batch = keys[start:start + self.QUERY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = connection.execute(
+                f"SELECT key, score FROM sentiment_cache WHERE key IN ({placeholders})", batch)
+            scores.update(rows)
+        return scores
+
+    def set_many(self, scores: Dict[str, float]) -> None:
+        connection = self.connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO sentiment_cache (key, score) VALUES (?, ?)", scores.items())
+
+
+class MongoSentimentStore(SentimentCacheStore):
+    """
+    Persists cached scores in a MongoDB collection, with the cache key as '_id'.
+    """
+
+    # Maximum number of keys in a single '$in' query, keeping the query well below the BSON size limit
+    QUERY_BATCH_SIZE = 10000
+
+    def __init__(self, db_config: DataClientConfig):
+        """
+        Initializes the MongoSentimentStore with the database configuration to persist scores in.
+
+        :param db_config: A DataClientConfig object pointing to the cache collection.
+        """
+        self.db_config = db_config
+
+    def get_many(self, keys: List[str]) -> Dict[str, float]:
+        client = DataClientManager.get_database_client(self.db_config)
+        scores = {}
+        try:
+            for start in range(0, len(keys), self.QUERY_BATCH_SIZE):
+                batch = keys[start:start + self.QUERY_BATCH_SIZE]
+                documents = client.load_data(filters={'_id': {'$in': batch}})
+                scores.update((document['_id'], document['score']) for document in documents)
+        finally:
+            client.close()
+        return scores
+
+    def set_many(self, scores: Dict[str, float]) -> None:
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            client.upsert_data([{'_id': key, 'score': score} for key, score in scores.items()])
+        finally:
+            client.close()
+
+
+class SentimentCache:
+    """
+    Content-addressed cache of sentiment scores, keyed by model name, model version and the hash
+    of the scored text. Scores are kept in a bounded in-memory LRU tier, and optionally in a
+    persistent store shared between runs.
+
+    The number of hits and misses is counted, where a miss is a text that had to be scored.
+    """
+
+    def __init__(self, model_name: str, model_version: str, max_size: int = DEFAULT_CACHE_SIZE,
+                 store: Optional[SentimentCacheStore] = None):
+        """
+        Initializes the SentimentCache of a model.
+
+        :param model_name: The name of the model (e.g. 'vader').
+        :param model_version: The version of the model, so that upgrades do not reuse stale scores.
+        :param max_size: The maximum number of scores kept in memory.
+        :param store: Optional persistent tier of the cache.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be a positive integer, got {max_size}")
+
+        self.model_name = model_name
+        self.model_version = model_version
+        self.max_size = max_size
+        self.store = store
+        self.scores = OrderedDict()
+        # Persisted scores prefetched for the current batch, kept apart from the LRU tier until the
+        # next flush, so that a batch with more texts than max_size does not evict them before use
+        self.prefetched_scores = {}
+        self.pending_scores = {}
+        self.hits = 0
+        self.misses = 0
+
+    def build_key(self, text: str) -> str:
+        """
+        Builds the cache key of a text.
+
+        :param text: The text to score.
+        :return: The cache key in string.
+        """
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"{self.model_name}:{self.model_version}:{digest}"
+
+    def remember(self, key: str, score: float) -> None:
+        """
+        Adds a score to the in-memory tier, evicting the least recently used score if it is full.
+
+        :param key: The cache key of the score.
+        :param score: The score.
+        """
+        self.scores[key] = score
+        self.scores.move_to_end(key)
+        if len(self.scores) > self.max_size:
+            self.scores.popitem(last=False)
+
+    def prefetch(self, texts: Iterable[str]) -> None:
+        """
+        Loads the persisted scores of the given texts into memory with a single lookup, so that
+        scoring them does not query the persistent store text by text. The scores are kept until
+        the next flush, replacing the scores prefetched before.
+
+        :param texts: The texts about to be scored.
+        """
+        if self.store is None:
+            return
+
+        keys = list({self.build_key(text) for text in texts} - self.scores.keys())
+        self.prefetched_scores = self.store.get_many(keys)
+
+    def score(self, text: str, compute: Callable[[str], float]) -> float:
+        """
+        Returns the cached score of a text, or computes and caches it.
+
+        :param text: The text to score.
+        :param compute: The function that scores a text.
+        :return: The score of the text.
+        """
+        key = self.build_key(text)
+        if key in self.scores:
+            self.hits += 1
+            self.scores.move_to_end(key)
+            return self.scores[key]
+
+        if key in self.prefetched_scores:
+            self.hits += 1
+            score = self.prefetched_scores[key]
+            self.remember(key, score)
+            return score
+
+        self.misses += 1
+        score = compute(text)
+        self.remember(key, score)
+        if self.store is not None:
+            self.pending_scores[key] = score
+        return score
+
+    def flush(self) -> None:
+        """
+        Writes the scores computed since the last flush to the persistent store, and releases the
+        prefetched scores.
+        """
+        if self.store is not None and self.pending_scores:
+            self.store.set_many(self.pending_scores)
+        self.pending_scores = {}
+        self.prefetched_scores = {}
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the hit and miss counters of the cache.
+
+        :return: A dictionary with the number of hits and misses, the hit rate and the number of
+                 scores in memory.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.scores)
+        }
@@ -1,23 +1,42 @@
 """Module for TextBlob Model"""
-from typing import List, Dict
+from typing import List, Dict, Optional
 from textblob import TextBlob
 from textblob.sentiments import PatternAnalyzer
 from tqdm import tqdm
 from .transformation import Transformation
+from ..filters.columnar_pipe import ColumnarPosts
+from .sentiment_cache import SentimentCache, SentimentCacheStore, DEFAULT_CACHE_SIZE, collect_texts, \
+    get_package_version
 
 
 class TextBlobSentimentAnalysis(Transformation):
     """
     This class textblob sentiment analysis to selftext, title, and comments.
     If the keys selftext, title and comments do not exist, the analysis is skipped.
+
+    Scores are cached by the hash of the text, so repeated texts are only scored once.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, cache_store: Optional[SentimentCacheStore] = None):
         """
         Initializes the TextBlobSentimentAnalysis by initalising PatternAnalyser.
+
+        :param cache_size: Maximum number of scores kept in memory.
+        :param cache_store: Optional persistent tier of the score cache (e.g. SQLiteSentimentStore).
         """
 
         self.analyzer = PatternAnalyzer()
+        self.debug = False # enable debug log
+        self.cache = SentimentCache('textblob', get_package_version('textblob'), cache_size, cache_store)
+
+    def score(self, text: str) -> float:
+        """
+        Returns the polarity of a text, from the cache if it was scored before.
+
+        :param text: The text to score.
+        :returns: The polarity score of the text.
+        """
+        return self.cache.score(text, lambda content: TextBlob(content, analyzer=self.analyzer).sentiment.polarity)
 
     def apply(self, data: List[Dict]) -> List[Dict]:
         """
@@ -28,6 +47,8 @@ class TextBlobSentimentAnalysis(Transformation):
         """
 
         try:
+            self.cache.prefetch(collect_texts(data))
+
             for post in tqdm(data, desc="Processing textblob", unit="post"):
                 # Ensure the 'transformed_data' and 'model_output' keys exist
                 post.setdefault('transformed_data', {})
@@ -42,25 +63,20 @@ class TextBlobSentimentAnalysis(Transformation):
 
                 # Analyze sentiment for 'selftext'
                 if 'selftext' in post:
-                    sentiment = TextBlob(
-                        post['selftext'], analyzer=self.analyzer).sentiment
-                    data_results['selftext_sentiment'] = sentiment.polarity
+                    data_results['selftext_sentiment'] = self.score(post['selftext'])
 
                 # Analyze sentiment for 'title'
                 if 'title' in post:
-                    sentiment = TextBlob(
-                        post['title'], analyzer=self.analyzer).sentiment
-                    data_results['title_sentiment'] = sentiment.polarity
+                    data_results['title_sentiment'] = self.score(post['title'])
 
                 # Analyze sentiment for each comment and store all scores
                 if 'comments' in post and isinstance(post['comments'], list):
                     # Store the polarity score for each comment
-                    comment_sentiments = [
-                        TextBlob(comment, analyzer=self.analyzer)
-                        .sentiment.polarity for comment in post['comments']
-                    ]
+                    comment_sentiments = [self.score(comment) for comment in post['comments']]
                     data_results['comments_sentiment'] = comment_sentiments
 
+            self.cache.flush()
+            self.debug and print(f"apply(): textblob cache {self.cache.stats()}")
             return data
 
         except KeyError as e:
@@ -69,3 +85,17 @@ class TextBlobSentimentAnalysis(Transformation):
         except Exception as e:
             print(f"Unexpected error during textblob analysis: {e}")
             raise
+
+    def apply_columns(self, posts: ColumnarPosts) -> ColumnarPosts:
+        """
+        Scores the posts in columnar form, storing the scores in flat buffers instead of dicts.
+
+        :param posts: posts in columnar form, could be pre-processed.
+        :returns posts: the posts with the polarity scores of each post content.
+        """
+
+        self.cache.prefetch(posts.texts())
+        posts.set_scores('textblob', self.score)
+        self.cache.flush()
+        self.debug and print(f"apply_columns(): textblob cache {self.cache.stats()}")
+        return posts
@@ -1,6 +1,7 @@
 """Transformation module"""
 from abc import ABC, abstractmethod
 from typing import List, Dict
+from ..filters.columnar_pipe import ColumnarPosts
 
 class Transformation(ABC):
     """
@@ -13,3 +14,31 @@ class Transformation(ABC):
         
         :param data: data to apply the transformation on.
         """
+
+    def apply_columns(self, posts: ColumnarPosts) -> ColumnarPosts:
+        """
+        Applies the transformation to posts in columnar form. By default, the posts are converted to
+        dicts and back; models override this to read and write the columns directly.
+
+        :param posts: posts in columnar form to apply the transformation on.
+        :returns: the transformed posts in columnar form.
+        """
+        return ColumnarPosts.from_dicts(self.apply(posts.to_dicts()))
+
+    def reset(self) -> None:
+        """
+        Discards the state the transformation accumulated over earlier runs, before a full rebuild
+        transforms every post again. Does nothing by default.
+        """
+
+    def commit(self) -> None:
+        """
+        Persists the state the transformation accumulated over the posts transformed so far, once
+        they have been stored. Does nothing by default.
+        """
+
+    def rollback(self) -> None:
+        """
+        Discards the state the transformation accumulated over the posts transformed since the last
+        commit, as they failed to be stored. Does nothing by default.
+        """
@@ -1,22 +1,42 @@
 """Module for VaderSentiment Model"""
-from typing import List, Dict
+from typing import List, Dict, Optional
 from tqdm import tqdm
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from .transformation import Transformation
+from ..filters.columnar_pipe import ColumnarPosts
+from .sentiment_cache import SentimentCache, SentimentCacheStore, DEFAULT_CACHE_SIZE, collect_texts, \
+    get_package_version
 
 
 class VaderSentimentAnalysis(Transformation):
     """
     Applies vaderSentiment sentiment analysis to selftext, title, and comments.
     If the keys selftext, title and comments do not exist, the analysis is skipped.
+
+    Scores are cached by the hash of the text, so repeated texts (e.g. reposted titles or
+    short comments) are only scored once.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, cache_store: Optional[SentimentCacheStore] = None):
         """
         Initializes the VaderSentimentAnalysis by initalising SentimentIntensityAnalyzer.
+
+        :param cache_size: Maximum number of scores kept in memory.
+        :param cache_store: Optional persistent tier of the score cache (e.g. SQLiteSentimentStore).
         """
 
         self.analyzer = SentimentIntensityAnalyzer()
+        self.debug = False # enable debug log
+        self.cache = SentimentCache('vader', get_package_version('vaderSentiment'), cache_size, cache_store)
+
+    def score(self, text: str) -> float:
+        """
+        Returns the compound score of a text, from the cache if it was scored before.
+
+        :param text: The text to score.
+        :returns: The compound sentiment score of the text.
+        """
+        return self.cache.score(text, lambda content: self.analyzer.polarity_scores(content)['compound'])
 
     def apply(self, data: List[Dict]) -> List[Dict]:
         """
@@ -28,6 +48,8 @@ class VaderSentimentAnalysis(Transformation):
         """
 
         try:
+            self.cache.prefetch(collect_texts(data))
+
             for post in tqdm(data, desc="Processing vader", unit="post"):
                 # Ensure the 'transformation' and 'model_output' keys exist
                 post.setdefault('transformed_data', {})
@@ -41,23 +63,20 @@ class VaderSentimentAnalysis(Transformation):
 
                 # Analyze sentiment for 'selftext'
                 if 'selftext' in post:
-                    sentiment = self.analyzer.polarity_scores(post['selftext'])
-                    data_results['selftext_sentiment'] = sentiment['compound']
+                    data_results['selftext_sentiment'] = self.score(post['selftext'])
 
                 # Analyze sentiment for 'title'
                 if 'title' in post:
-                    sentiment = self.analyzer.polarity_scores(post['title'])
-                    data_results['title_sentiment'] = sentiment['compound']
+                    data_results['title_sentiment'] = self.score(post['title'])
 
                 # Analyze sentiment for each comment and store all scores
                 if 'comments' in post and isinstance(post['comments'], list):
                     # Store the compound score for each comment
-                    comment_sentiments = [
-                        self.analyzer.polarity_scores(comment)['compound']
-                        for comment in post['comments']
-                    ]
+                    comment_sentiments = [self.score(comment) for comment in post['comments']]
                     data_results['comments_sentiment'] = comment_sentiments
 
+            self.cache.flush()
+            self.debug and print(f"apply(): vader cache {self.cache.stats()}")
             return data
 
         except KeyError as e:
@@ -66,3 +85,17 @@ class VaderSentimentAnalysis(Transformation):
         except Exception as e:
             print(f"Unexpected error during sentiment analysis: {e}")
             raise
+
+    def apply_columns(self, posts: ColumnarPosts) -> ColumnarPosts:
+        """
+        Scores the posts in columnar form, storing the scores in flat buffers instead of dicts.
+
+        :param posts: posts in columnar form, could be pre-processed.
+        :returns posts: the posts with the compound sentiment scores of each post content.
+        """
+
+        self.cache.prefetch(posts.texts())
+        posts.set_scores('vader', self.score)
+        self.cache.flush()
+        self.debug and print(f"apply_columns(): vader cache {self.cache.stats()}")
+        return posts
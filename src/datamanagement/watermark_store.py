@@ -0,0 +1,64 @@
+"""Module for WatermarkStore."""
+from typing import Any, Optional
+from .dataclient import DataClientManager, DataClientConfig
+
+
+class WatermarkStore:
+    """
+    This class persists the high-water mark of an incremental ELT process, i.e. the largest
+    value of the watermark field (e.g. '_id' or 'created_utc') that has already been processed
+    for a given source/target pair.
+    """
+
+    def __init__(self, db_config: DataClientConfig):
+        """
+        Initializes the WatermarkStore with the database configuration to persist watermarks in.
+
+        :param db_config: A DataClientConfig object pointing to the watermark collection.
+        """
+        self.db_config = db_config
+
+    @staticmethod
+    def build_key(source_db: DataClientConfig, target_db: DataClientConfig) -> str:
+        """
+        Builds the key that identifies the watermark of a source/target pair.
+
+        :param source_db: The DataClientConfig of the source database.
+        :param target_db: The DataClientConfig of the target database.
+        :return: The watermark key in string.
+        """
+        return (f"{source_db.db_name}.{source_db.collection}"
+                f"->{target_db.db_name}.{target_db.collection}")
+
+    def get(self, key: str, field: str) -> Optional[Any]:
+        """
+        Retrieves the stored watermark for the given key.
+
+        :param key: The key of the source/target pair.
+        :param field: The watermark field the value must have been recorded for.
+        :return: The stored watermark value, or None if no watermark exists for the field.
+        """
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            documents = client.load_data(filters={'_id': key})
+        finally:
+            client.close()
+
+        if not documents or documents[0].get('field') != field:
+            return None
+
+        return documents[0].get('value')
+
+    def set(self, key: str, field: str, value: Any) -> None:
+        """
+        Persists the watermark for the given key.
+
+        :param key: The key of the source/target pair.
+        :param field: The watermark field the value was taken from.
+        :param value: The largest value of the watermark field that has been processed.
+        """
+        client = DataClientManager.get_database_client(self.db_config)
+        try:
+            client.upsert_data([{'_id': key, 'field': field, 'value': value}])
+        finally:
+            client.close()
@@ -2,6 +2,21 @@
 from abc import ABC, abstractmethod
 
 
+class PartialWriteError(Exception):
+    """
+    Raised when some documents failed to be written, after the rest of the documents were written.
+    """
+
+    def __init__(self, failed_keys: list, results: list):
+        """
+        :param failed_keys: The key field values of the documents that failed to be written.
+        :param results: The number of upserted, modified and failed documents per batch.
+        """
+        super().__init__(f"{len(failed_keys)} documents failed to be written.")
+        self.failed_keys = failed_keys
+        self.results = results
+
+
 class DataClient(ABC):
     """
     Abstract class for database clients, providing a unified interface
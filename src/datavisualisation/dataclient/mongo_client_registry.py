@@ -0,0 +1,65 @@
+"""Module for MongoClientRegistry."""
+import threading
+from typing import Dict
+from pymongo import MongoClient
+from pymongo.errors import ConnectionFailure
+from .data_client_config import DataClientConfig
+
+
+class MongoClientRegistry:
+    """
+    This class keeps a single, process-wide MongoClient per connection URI so that all
+    collection-scoped MongoDBClients share one connection pool instead of opening their own.
+
+    The shared clients stay open until `close_all` is called explicitly on shutdown.
+    """
+
+    _clients: Dict[str, MongoClient] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls, db_config: DataClientConfig) -> MongoClient:
+        """
+        Retrieves the shared MongoClient for the URI of the given config, creating it on first use.
+
+        The pool sizes of the config that first creates the client for a URI are used for
+        the lifetime of that client.
+
+        :param db_config: DataClientConfig that contains connection details and pool sizes.
+        :return: The shared MongoClient for the URI.
+        """
+
+        with cls._lock:
+            client = cls._clients.get(db_config.uri)
+            if client is not None:
+                return client
+
+            pool_options = {}
+            if db_config.max_pool_size is not None:
+                pool_options['maxPoolSize'] = db_config.max_pool_size
+            if db_config.min_pool_size is not None:
+                pool_options['minPoolSize'] = db_config.min_pool_size
+
+            client = MongoClient(db_config.uri, **pool_options)
+
+            # Ping the MongoDB server once to test the connection of the new pool
+            try:
+                client.admin.command('ping')
+            except ConnectionFailure:
+                print("get_client(): Failed to connect to MongoDB server")
+                client.close()
+                raise
+
+            cls._clients[db_config.uri] = client
+            return client
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Closes every shared MongoClient and empties the registry.
+        """
+
+        with cls._lock:
+            for client in cls._clients.values():
+                client.close()
+            cls._clients.clear()
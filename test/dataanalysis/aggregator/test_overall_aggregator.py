@@ -1,6 +1,12 @@
+import multiprocessing
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from unittest.mock import MagicMock
-from src.dataanalysis.aggregator.overall_aggregator import OverallAggregator
+from src.dataanalysis.aggregator.overall_aggregator import OverallAggregator, PostCache
+from src.dataanalysis.aggregator.weighted_aggregator import WeightedAggregator
+from src.dataanalysis.date_range import DateRange, get_timezone
+from src.dataanalysis.normalizer import RedditResultNormalizer, VADERNormalizer, TextBlobNormalizer
 
 
 class TestOverallAggregator(unittest.TestCase):
@@ -17,9 +23,10 @@ class TestOverallAggregator(unittest.TestCase):
         )
 
     def test_aggregate_data_by_date(self):
+        created_utc = datetime.now(get_timezone()).timestamp() - 60
         self.mock_db_handler.load_data.return_value = [
-            {"created_utc": 1700000000, "model_output": {"vader": {"title_sentiment": 0.5}}},
-            {"created_utc": 1700000500, "model_output": {"vader": {"title_sentiment": 0.8}}}
+            {"created_utc": created_utc, "model_output": {"vader": {"title_sentiment": 0.5}}},
+            {"created_utc": created_utc, "model_output": {"vader": {"title_sentiment": 0.8}}}
         ]
 
         self.mock_result_normalizer.normalize.side_effect = lambda post: post
@@ -29,10 +36,13 @@ class TestOverallAggregator(unittest.TestCase):
         model_keys = ["vader"]
         weights = {"vader": {"title": 1.0}}
 
-        average_scores_by_date = self.aggregator.aggregate_data_by_date(model_keys, weights)
+        average_scores_by_date = self.aggregator.aggregate_data_by_date(
+            model_keys, weights, ["Apple"], DateRange.SIX_MONTHS)
 
-        expected_result = {"2023-11": 0.65}
-        self.assertEqual(average_scores_by_date, expected_result)
+        current_month = datetime.fromtimestamp(created_utc, get_timezone()).strftime('%Y-%m')
+        self.assertEqual(average_scores_by_date[-1]["date"], current_month)
+        self.assertAlmostEqual(average_scores_by_date[-1]["average_score"], 0.65)
+        self.assertTrue(all(entry["average_score"] == 0.0 for entry in average_scores_by_date[:-1]))
 
     def test_process_post(self):
         post = {"model_output": {"vader": {"title_sentiment": 0.7}}}
@@ -47,6 +57,53 @@ class TestOverallAggregator(unittest.TestCase):
 
         self.assertEqual(aggregated_score, 0.7)
 
+    def test_process_post_precomputed_scores(self):
+        post = {
+            "model_output": {"vader": {"title_sentiment": 0.5, "comments_sentiment": [0.1, 0.2]}},
+            "normalized_scores": {"vader": {"title_sentiment": 75.0, "comments_sentiment": 57.5, "comments_count": 2,
+                                            "score_range": [-1, 1]}}
+        }
+        self.mock_result_normalizer.model_normalizers = {"vader": VADERNormalizer()}
+        self.mock_weighted_aggregator.aggregate.return_value = 66.25
+
+        model_keys = ["vader"]
+        weights = {"vader": {"title_sentiment": 0.5, "comments_sentiment": 0.5}, "model_weights": {"vader": 1.0}}
+
+        aggregated_score = self.aggregator.process_post(post, model_keys, weights)
+
+        self.assertEqual(aggregated_score, 66.25)
+        self.mock_result_normalizer.normalize.assert_not_called()
+        normalized_post = self.mock_weighted_aggregator.aggregate.call_args[0][0]
+        self.assertEqual(normalized_post["model_output"],
+                         {"vader": {"title_sentiment": 75.0, "comments_sentiment": 57.5}})
+
+    def test_process_post_outdated_precomputed_scores(self):
+        post = {
+            "model_output": {"vader": {"title_sentiment": 0.5}},
+            "normalized_scores": {"vader": {"title_sentiment": 75.0, "score_range": [-2, 2]}}
+        }
+        self.mock_result_normalizer.model_normalizers = {"vader": VADERNormalizer()}
+
+        self.aggregator.process_post(post, ["vader"], {})
+        self.mock_result_normalizer.normalize.assert_called_once_with(post)
+
+        # Scores stored without their range are recomputed as well
+        self.mock_result_normalizer.normalize.reset_mock()
+        del post["normalized_scores"]["vader"]["score_range"]
+        self.aggregator.process_post(post, ["vader"], {})
+        self.mock_result_normalizer.normalize.assert_called_once_with(post)
+
+    def test_process_post_missing_precomputed_scores(self):
+        post = {
+            "model_output": {"vader": {"title_sentiment": 0.5}, "textblob": {"title_sentiment": 0.1}},
+            "normalized_scores": {"vader": {"title_sentiment": 75.0, "score_range": [-1, 1]}}
+        }
+        self.mock_result_normalizer.model_normalizers = {"vader": VADERNormalizer(), "textblob": TextBlobNormalizer()}
+
+        self.aggregator.process_post(post, ["vader", "textblob"], {})
+
+        self.mock_result_normalizer.normalize.assert_called_once_with(post)
+
     def test_aggregate_data(self):
         self.mock_db_handler.load_data.return_value = [
             {
@@ -73,3 +130,76 @@ class TestOverallAggregator(unittest.TestCase):
         overall_score = self.aggregator.aggregate_data(model_keys, weights)
 
         self.assertAlmostEqual(overall_score, 0.7, places=5)
+
+    def test_process_posts_matches_process_post(self):
+        aggregator = OverallAggregator(
+            db_handler=self.mock_db_handler,
+            result_normalizer=RedditResultNormalizer({"vader": VADERNormalizer(), "textblob": TextBlobNormalizer()}),
+            weighted_aggregator=WeightedAggregator()
+        )
+        posts = [
+            {"model_output": {"vader": {"title_sentiment": 0.5, "comments_sentiment": [0.1, -0.4]},
+                              "textblob": {"title_sentiment": -0.2}}},
+            {"model_output": {"vader": {"title_sentiment": 0.8, "comments_sentiment": [1.0]}},
+             "normalized_scores": {"vader": {"title_sentiment": 90.0, "comments_sentiment": 100.0,
+                                             "comments_count": 1, "score_range": [-1, 1]}}},
+            {"model_output": {"textblob": {"title_sentiment": 2.0, "comments_sentiment": []}}},
+        ]
+        model_keys = ["vader", "textblob"]
+        weights = {
+            "vader": {"title_sentiment": 0.4, "comments_sentiment": 0.6},
+            "textblob": {"title_sentiment": 0.7, "comments_sentiment": 0.3},
+            "model_weights": {"vader": 0.6, "textblob": 0.4}
+        }
+
+        result = aggregator.process_posts(posts, model_keys, weights)
+
+        expected = [aggregator.process_post(post, model_keys, weights) for post in posts]
+        self.assertEqual(len(result), len(expected))
+        for score, expected_score in zip(result, expected):
+            self.assertAlmostEqual(score, expected_score, places=9)
+
+    def test_process_posts_in_process_pool(self):
+        aggregator = OverallAggregator(
+            db_handler=self.mock_db_handler,
+            result_normalizer=RedditResultNormalizer({"vader": VADERNormalizer()}),
+            weighted_aggregator=WeightedAggregator()
+        )
+        posts = [{"model_output": {"vader": {"title_sentiment": i / 10 - 1, "comments_sentiment": [i / 20]}}}
+                 for i in range(20)]
+        weights = {"vader": {"title_sentiment": 0.5, "comments_sentiment": 0.5}, "model_weights": {"vader": 1.0}}
+        expected = aggregator.process_posts(posts, ["vader"], weights)
+
+        aggregator.process_chunk_size = 6
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as process_pool:
+            aggregator.process_pool = process_pool
+            result = aggregator.process_posts(posts, ["vader"], weights)
+
+        self.assertEqual(result, expected)
+
+    def test_load_posts_cache(self):
+        self.mock_db_handler.load_data.return_value = [
+            {"keywords": ["apple", "iphone"]}, {"keywords": ["apple"]}
+        ]
+        post_cache = PostCache()
+
+        apple_posts = self.aggregator.load_posts(["apple"], post_cache)
+        self.assertIs(self.aggregator.load_posts(["apple"], post_cache), apple_posts)
+        iphone_posts = self.aggregator.load_posts(["iphone", "apple"], post_cache)
+
+        self.mock_db_handler.load_data.assert_called_once_with(filters={"keywords": {"$all": ["apple"]}})
+        self.assertEqual(iphone_posts, [{"keywords": ["apple", "iphone"]}])
+
+    def test_post_cache_evicts_least_recently_used(self):
+        post_cache = PostCache(max_posts=3)
+        post_cache.put(("apple",), [{"keywords": ["apple"]}] * 2)
+        post_cache.put(("banana",), [{"keywords": ["banana"]}])
+        post_cache.get(("apple",))
+        post_cache.put(("cherry",), [{"keywords": ["cherry"]}])
+        post_cache.put(("durian",), [{"keywords": ["durian"]}] * 4)
+
+        self.assertIsNone(post_cache.get(("banana",)))
+        self.assertIsNone(post_cache.get(("durian",)))
+        self.assertIsNotNone(post_cache.get(("apple",)))
+        self.assertIsNotNone(post_cache.get(("cherry",)))
+        self.assertEqual(post_cache.post_count, 3)
@@ -0,0 +1,225 @@
+import os
+import unittest
+from copy import deepcopy
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from pymongo import MongoClient
+
+from src.dataanalysis.aggregator import OverallAggregator, PipelineAggregator, WeightedAggregator
+from src.dataanalysis.dataclient import DataClientConfig, MongoDBClient
+from src.dataanalysis.date_range import DateRange, get_timezone
+from src.dataanalysis.normalizer import RedditResultNormalizer, VADERNormalizer, TextBlobNormalizer, ModelNormalizer
+
+# The parity tests run the aggregation pipeline on a real MongoDB server, e.g. mongodb://localhost:27017,
+# and are skipped if it is not set
+MONGODB_TEST_URI = os.getenv("MONGODB_TEST_URI")
+
+
+@unittest.skipUnless(MONGODB_TEST_URI, "MONGODB_TEST_URI is not set")
+class TestPipelineAggregatorParity(unittest.TestCase):
+
+    def setUp(self):
+        now = datetime.now()
+
+        def created(days_ago, hours_ago=1):
+            return (now - timedelta(days=days_ago, hours=hours_ago)).timestamp()
+
+        self.posts = [
+            {"created_utc": created(0), "keywords": ["apple", "iphone"], "model_output": {
+                "vader": {"title_sentiment": 0.5, "selftext_sentiment": -0.2, "comments_sentiment": [0.1, 0.9, -1.0]},
+                "textblob": {"title_sentiment": 0.3, "selftext_sentiment": 0.0, "comments_sentiment": []}}},
+            {"created_utc": created(0, 3), "keywords": ["apple"], "model_output": {
+                "vader": {"title_sentiment": 1.5, "comments_sentiment": [-3.0]}}},
+            {"created_utc": created(2), "keywords": ["apple"], "model_output": {
+                "textblob": {"title_sentiment": -0.7, "selftext_sentiment": 0.4, "comments_sentiment": [0.2]}}},
+            {"created_utc": created(5), "keywords": ["apple", "samsung"], "model_output": {
+                "vader": {"title_sentiment": -0.9, "selftext_sentiment": 0.9, "comments_sentiment": [0.0, 0.5]},
+                "textblob": {"title_sentiment": 0.1},
+                "custom": {"title_sentiment": 42.0}}},
+            {"created_utc": created(5), "keywords": ["samsung"], "model_output": {
+                "vader": {"title_sentiment": 0.9, "selftext_sentiment": 0.9, "comments_sentiment": [0.9]}}},
+            {"created_utc": created(60), "keywords": ["apple"], "model_output": {
+                "vader": {"title_sentiment": -0.4, "selftext_sentiment": 0.1, "comments_sentiment": [0.3]}}},
+            {"created_utc": created(400), "keywords": ["apple"], "model_output": {
+                "vader": {"title_sentiment": 0.8, "selftext_sentiment": 0.8, "comments_sentiment": [0.8]}}},
+            {"created_utc": created(10), "keywords": ["apple"], "model_output": {}},
+        ]
+        self.weights = {
+            "vader": {"title_sentiment": 0.3, "selftext_sentiment": 0.2, "comments_sentiment": 0.5},
+            "textblob": {"title_sentiment": 0.6, "selftext_sentiment": 0, "comments_sentiment": 0.4},
+            "custom": {"title_sentiment": 1.0},
+            "model_weights": {"vader": 0.7, "textblob": 0.3, "custom": 0.5}
+        }
+        self.model_keys = ["vader", "textblob", "custom"]
+
+        self.client = MongoClient(MONGODB_TEST_URI)
+        self.db_name = f"test_pipeline_aggregator_{os.getpid()}"
+        db_config = DataClientConfig(db_type="mongodb", uri=MONGODB_TEST_URI, db_name=self.db_name,
+                                     collection="posts")
+        self.handler = MongoDBClient(db_config, client=self.client)
+        normalizer = RedditResultNormalizer({"vader": VADERNormalizer(), "textblob": TextBlobNormalizer()})
+        self.reference = OverallAggregator(self.handler, normalizer, WeightedAggregator())
+        self.pipeline = PipelineAggregator(self.handler, normalizer, WeightedAggregator())
+
+    def tearDown(self):
+        self.client.drop_database(self.db_name)
+        self.client.close()
+
+    def store_posts(self):
+        """Replaces the stored posts with the fixture posts, using their index as _id."""
+        collection = self.client[self.db_name]["posts"]
+        collection.delete_many({})
+        collection.insert_many([{**deepcopy(post), "_id": index} for index, post in enumerate(self.posts)])
+
+    def evaluate(self, expression):
+        """Evaluates the score expression on every stored post and returns the scores by _id."""
+        results = self.handler.aggregate_data([{"$project": {"score": expression}}])
+        return {result["_id"]: result["score"] for result in results}
+
+    def assert_parity(self, model_keys, weights, filters, date_range):
+        self.store_posts()
+        expected = self.reference.aggregate_data_by_date(model_keys, weights, filters, date_range)
+        result = self.pipeline.aggregate_data_by_date(model_keys, weights, filters, date_range)
+
+        self.assertEqual([entry["date"] for entry in result], [entry["date"] for entry in expected])
+        for entry, expected_entry in zip(result, expected):
+            self.assertAlmostEqual(entry["average_score"], expected_entry["average_score"], places=9)
+
+    def test_parity_with_reference_by_day(self):
+        self.assert_parity(self.model_keys, self.weights, ["Apple"], DateRange.ONE_MONTH)
+
+    def test_parity_with_reference_by_month(self):
+        self.assert_parity(self.model_keys, self.weights, ["apple"], DateRange.SIX_MONTHS)
+
+    def test_parity_with_reference_single_day(self):
+        self.assert_parity(self.model_keys, self.weights, ["apple"], DateRange.ONE_DAY)
+
+    def test_parity_with_reference_multiple_keywords(self):
+        self.assert_parity(self.model_keys, self.weights, ["apple", "samsung"], DateRange.ONE_MONTH)
+
+    def test_parity_with_reference_zero_model_weights(self):
+        weights = {**self.weights, "model_weights": {"vader": 0, "textblob": 1.0}}
+        self.assert_parity(self.model_keys, weights, ["apple"], DateRange.ONE_MONTH)
+
+        weights = {**self.weights, "model_weights": {}}
+        self.assert_parity(self.model_keys, weights, ["apple"], DateRange.ONE_MONTH)
+
+    def test_parity_with_reference_precomputed_scores(self):
+        for post in self.posts:
+            post["normalized_scores"] = self.precompute_scores(post)
+        self.assert_parity(self.model_keys, self.weights, ["apple"], DateRange.ONE_MONTH)
+
+    def test_precomputed_scores_are_used(self):
+        post = self.posts[0]
+        post["normalized_scores"] = self.precompute_scores(post)
+        post["normalized_scores"]["vader"]["comments_sentiment"] = 12.0
+        expected = self.reference.process_post(post, self.model_keys, self.weights)
+
+        normalization_ranges = self.pipeline.get_normalization_ranges(self.model_keys)
+        expression = self.pipeline.build_score_expression(self.model_keys, self.weights, normalization_ranges)
+
+        self.store_posts()
+        self.assertAlmostEqual(self.evaluate(expression)[0], expected, places=9)
+
+        # Scores normalized with another range are recomputed
+        post["normalized_scores"]["vader"]["score_range"] = [-2, 2]
+        recomputed = self.reference.process_post(post, self.model_keys, self.weights)
+        self.assertNotAlmostEqual(recomputed, expected)
+        self.store_posts()
+        self.assertAlmostEqual(self.evaluate(expression)[0], recomputed, places=9)
+        del post["normalized_scores"]
+        self.assertAlmostEqual(self.reference.process_post(post, self.model_keys, self.weights), recomputed)
+
+    @staticmethod
+    def precompute_scores(post):
+        """Computes the normalized scores the Data Management module stores with each post."""
+        def normalize(score):
+            return max(0, min(100, (score + 1) / 2 * 100))
+
+        normalized_scores = {}
+        for model in ("vader", "textblob"):
+            if model not in post["model_output"]:
+                continue
+            results = post["model_output"][model]
+            scores = {component: normalize(results[component])
+                      for component in ("title_sentiment", "selftext_sentiment") if component in results}
+            if "comments_sentiment" in results:
+                comments = [normalize(score) for score in results["comments_sentiment"]]
+                scores["comments_sentiment"] = sum(comments) / len(comments) if comments else 0.0
+                scores["comments_count"] = len(comments)
+            scores["score_range"] = [-1, 1]
+            normalized_scores[model] = scores
+        return normalized_scores
+
+    def test_score_expression_parity_per_post(self):
+        normalization_ranges = self.pipeline.get_normalization_ranges(self.model_keys)
+        expression = self.pipeline.build_score_expression(self.model_keys, self.weights, normalization_ranges)
+
+        self.store_posts()
+        scores = self.evaluate(expression)
+
+        for index, post in enumerate(self.posts):
+            expected = self.reference.process_post(post, self.model_keys, self.weights)
+            self.assertAlmostEqual(scores[index], expected, places=9)
+
+    @patch.dict(os.environ, {"TIMEZONE": "America/New_York"})
+    def test_parity_with_reference_across_dst_changes(self):
+        # Posts just before and after local midnight at each month end, so that grouping by a fixed
+        # UTC offset would move some of them into the neighbouring month
+        timezone = get_timezone()
+        now = datetime.now(timezone)
+        vader = {"vader": {"title_sentiment": 0.5, "selftext_sentiment": -0.5, "comments_sentiment": [0.2]}}
+        self.posts = []
+        for days_ago in range(1, 175):
+            day = (now - timedelta(days=days_ago)).date()
+            next_day = day + timedelta(days=1)
+            if day.month == next_day.month:
+                continue
+            before_midnight = datetime(day.year, day.month, day.day, 23, 30, tzinfo=timezone)
+            after_midnight = datetime(next_day.year, next_day.month, next_day.day, 0, 30, tzinfo=timezone)
+            self.posts.append({"created_utc": before_midnight.timestamp(), "keywords": ["apple"],
+                               "model_output": vader})
+            self.posts.append({"created_utc": after_midnight.timestamp(), "keywords": ["apple"],
+                               "model_output": {"vader": {**vader["vader"], "title_sentiment": -0.8}}})
+
+        self.assert_parity(["vader"], self.weights, ["apple"], DateRange.SIX_MONTHS)
+
+
+class TestPipelineAggregator(unittest.TestCase):
+
+    def setUp(self):
+        self.weights = {"vader": {"title_sentiment": 0.3, "selftext_sentiment": 0.2, "comments_sentiment": 0.5},
+                        "model_weights": {"vader": 1.0}}
+
+    def test_fallback_to_reference_for_unsupported_normalizer(self):
+        class CustomNormalizer(ModelNormalizer):
+            def normalize(self, data):
+                return data
+
+        db_handler = MagicMock()
+        db_handler.load_data.return_value = []
+        normalizer = RedditResultNormalizer({"vader": CustomNormalizer()})
+        aggregator = PipelineAggregator(db_handler, normalizer, WeightedAggregator())
+
+        result = aggregator.aggregate_data_by_date(["vader"], self.weights, ["apple"], DateRange.ONE_DAY)
+
+        db_handler.aggregate_data.assert_not_called()
+        db_handler.load_data.assert_called_once_with(filters={"keywords": {"$all": ["apple"]}})
+        self.assertEqual(result, [{"date": datetime.now(get_timezone()).strftime('%Y-%m-%d'), "average_score": 0.0}])
+
+    def test_pipeline_stages(self):
+        db_handler = MagicMock()
+        db_handler.aggregate_data.return_value = []
+        normalizer = RedditResultNormalizer({"vader": VADERNormalizer()})
+        aggregator = PipelineAggregator(db_handler, normalizer, WeightedAggregator())
+
+        with patch.dict(os.environ, {"TIMEZONE": "America/New_York"}):
+            aggregator.aggregate_data_by_date(["vader"], self.weights, ["Apple"], DateRange.SIX_MONTHS)
+
+        pipeline = db_handler.aggregate_data.call_args[0][0]
+        self.assertEqual([list(stage)[0] for stage in pipeline], ["$match", "$project", "$group"])
+        self.assertEqual(pipeline[0]["$match"]["keywords"], {"$all": ["apple"]})
+        self.assertEqual(pipeline[2]["$group"]["_id"]["$dateToString"]["format"], "%Y-%m")
+        # Grouped by the zone name rather than its current offset, which changes with DST
+        self.assertEqual(pipeline[2]["$group"]["_id"]["$dateToString"]["timezone"], "America/New_York")
@@ -0,0 +1,188 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from src.dataanalysis.aggregator import OverallAggregator, RollupAggregator, WeightedAggregator
+from src.dataanalysis.date_range import DateRange, get_timezone
+from src.dataanalysis.normalizer import RedditResultNormalizer, VADERNormalizer, TextBlobNormalizer
+
+
+class FakeHandler:
+    """In-memory db_handler that answers keyword queries on posts and day range queries on rollups."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def load_data(self, filters=None):
+        if "_id" in filters:
+            return [document for document in self.documents if document.get("_id") == filters["_id"]]
+        if "keywords" in filters:
+            keywords = filters["keywords"]["$all"]
+            return [post for post in self.documents if all(keyword in post["keywords"] for keyword in keywords)]
+        return [rollup for rollup in self.documents
+                if rollup.get("keyword") == filters["keyword"]
+                and filters["day"]["$gte"] <= rollup["day"] <= filters["day"]["$lte"]]
+
+
+def build_rollups(posts, since="", score_ranges=None):
+    """Builds the rollups the Data Management module maintains for the posts, covering every day from `since` on."""
+    rollups = {}
+    for post in posts:
+        day = datetime.fromtimestamp(post["created_utc"], get_timezone()).strftime('%Y-%m-%d')
+        models = sorted(post["normalized_scores"])
+        for keyword in set(post["keywords"]):
+            rollup = rollups.setdefault((keyword, day, tuple(models)), {
+                "keyword": keyword, "day": day, "models": models, "count": 0, "sums": {}, "counts": {}})
+            rollup["count"] += 1
+            for model in models:
+                for component, score in post["normalized_scores"][model].items():
+                    if component in ("comments_count", "score_range"):
+                        continue
+                    sums = rollup["sums"].setdefault(model, {})
+                    sums[component] = sums.get(component, 0.0) + score
+    coverage = {"_id": "coverage", "since": since,
+                "score_ranges": score_ranges or {"vader": [-1, 1], "textblob": [-1, 1]}}
+    return [coverage] + list(rollups.values())
+
+
+def normalize(score):
+    return max(0, min(100, (score + 1) / 2 * 100))
+
+
+class TestRollupAggregator(unittest.TestCase):
+
+    def setUp(self):
+        now = datetime.now(get_timezone())
+
+        def created(days_ago, hours_ago=1):
+            return (now - timedelta(days=days_ago, hours=hours_ago)).timestamp()
+
+        self.posts = [
+            {"created_utc": created(0), "keywords": ["apple", "iphone"], "model_output": {
+                "vader": {"title_sentiment": 0.5, "selftext_sentiment": -0.2, "comments_sentiment": [0.1, 0.9, -1.0]},
+                "textblob": {"title_sentiment": 0.3, "selftext_sentiment": 0.0, "comments_sentiment": []}}},
+            {"created_utc": created(0, 3), "keywords": ["apple"], "model_output": {
+                "vader": {"title_sentiment": 1.5, "comments_sentiment": [-3.0]}}},
+            {"created_utc": created(2), "keywords": ["apple"], "model_output": {
+                "textblob": {"title_sentiment": -0.7, "selftext_sentiment": 0.4, "comments_sentiment": [0.2]}}},
+            {"created_utc": created(5), "keywords": ["apple", "samsung"], "model_output": {
+                "vader": {"title_sentiment": -0.9, "selftext_sentiment": 0.9, "comments_sentiment": [0.0, 0.5]},
+                "textblob": {"title_sentiment": 0.1}}},
+            {"created_utc": created(5), "keywords": ["samsung"], "model_output": {
+                "vader": {"title_sentiment": 0.9, "selftext_sentiment": 0.9, "comments_sentiment": [0.9]}}},
+            {"created_utc": created(60), "keywords": ["apple"], "model_output": {
+                "vader": {"title_sentiment": -0.4, "selftext_sentiment": 0.1, "comments_sentiment": [0.3]}}},
+            {"created_utc": created(10), "keywords": ["apple"], "model_output": {}},
+        ]
+        for post in self.posts:
+            post["normalized_scores"] = self.precompute_scores(post)
+
+        self.weights = {
+            "vader": {"title_sentiment": 0.3, "selftext_sentiment": 0.2, "comments_sentiment": 0.5},
+            "textblob": {"title_sentiment": 0.6, "selftext_sentiment": 0, "comments_sentiment": 0.4},
+            "model_weights": {"vader": 0.7, "textblob": 0.3}
+        }
+        self.model_keys = ["vader", "textblob"]
+
+        handler = FakeHandler(self.posts)
+        self.rollup_handler = FakeHandler(build_rollups(self.posts))
+        normalizer = RedditResultNormalizer({"vader": VADERNormalizer(), "textblob": TextBlobNormalizer()})
+        self.reference = OverallAggregator(handler, normalizer, WeightedAggregator())
+        self.rollup = RollupAggregator(handler, normalizer, WeightedAggregator(), self.rollup_handler)
+        self.rollup.db_handler = MagicMock(wraps=handler)
+
+    @staticmethod
+    def precompute_scores(post):
+        """Computes the normalized scores the Data Management module stores with each post."""
+        normalized_scores = {}
+        for model, results in post["model_output"].items():
+            scores = {component: normalize(results[component])
+                      for component in ("title_sentiment", "selftext_sentiment") if component in results}
+            if "comments_sentiment" in results:
+                comments = [normalize(score) for score in results["comments_sentiment"]]
+                scores["comments_sentiment"] = sum(comments) / len(comments) if comments else 0.0
+                scores["comments_count"] = len(comments)
+            scores["score_range"] = [-1, 1]
+            normalized_scores[model] = scores
+        return normalized_scores
+
+    def assert_parity(self, model_keys, weights, filters, date_range):
+        expected = self.reference.aggregate_data_by_date(model_keys, weights, filters, date_range)
+        result = self.rollup.aggregate_data_by_date(model_keys, weights, filters, date_range)
+
+        self.assertEqual([entry["date"] for entry in result], [entry["date"] for entry in expected])
+        for entry, expected_entry in zip(result, expected):
+            self.assertAlmostEqual(entry["average_score"], expected_entry["average_score"], places=9)
+
+    def test_parity_with_reference_by_day(self):
+        self.assert_parity(self.model_keys, self.weights, ["Apple"], DateRange.ONE_MONTH)
+        self.rollup.db_handler.load_data.assert_not_called()
+
+    def test_parity_with_reference_by_month(self):
+        self.assert_parity(self.model_keys, self.weights, ["apple"], DateRange.SIX_MONTHS)
+        self.rollup.db_handler.load_data.assert_not_called()
+
+    def test_parity_with_reference_other_weights(self):
+        weights = {
+            "vader": {"title_sentiment": 1.0, "selftext_sentiment": 0, "comments_sentiment": 0},
+            "textblob": {"title_sentiment": 0, "selftext_sentiment": 0, "comments_sentiment": 0},
+            "model_weights": {"vader": 0.2, "textblob": 0.8}
+        }
+        self.assert_parity(self.model_keys, weights, ["samsung"], DateRange.ONE_MONTH)
+
+        weights = {**self.weights, "model_weights": {"vader": 0, "textblob": 1.0}}
+        self.assert_parity(self.model_keys, weights, ["apple"], DateRange.ONE_MONTH)
+
+    def test_multiple_keywords_use_posts(self):
+        self.rollup.rollup_handler = MagicMock()
+        self.rollup.db_handler.aggregate_data = MagicMock(return_value=[])
+
+        self.rollup.aggregate_data_by_date(self.model_keys, self.weights, ["apple", "samsung"], DateRange.ONE_MONTH)
+
+        self.rollup.rollup_handler.load_data.assert_not_called()
+        self.rollup.db_handler.aggregate_data.assert_called_once()
+
+    def test_uncovered_window_uses_posts(self):
+        self.rollup.db_handler.aggregate_data = MagicMock(return_value=[])
+        today = datetime.now(get_timezone())
+
+        # The rollups were never started, or only cover the last week
+        for since in (None, (today - timedelta(days=7)).strftime('%Y-%m-%d')):
+            documents = build_rollups(self.posts, since)
+            self.rollup.rollup_handler = FakeHandler(documents if since is not None else documents[1:])
+            self.rollup.db_handler.aggregate_data.reset_mock()
+
+            self.rollup.aggregate_data_by_date(self.model_keys, self.weights, ["apple"], DateRange.ONE_MONTH)
+            self.rollup.db_handler.aggregate_data.assert_called_once()
+
+        # The rollups cover the whole window
+        self.rollup.rollup_handler = FakeHandler(build_rollups(self.posts, (today - timedelta(days=30)).strftime('%Y-%m-%d')))
+        self.rollup.db_handler.aggregate_data.reset_mock()
+        self.assert_parity(self.model_keys, self.weights, ["apple"], DateRange.ONE_MONTH)
+        self.rollup.db_handler.aggregate_data.assert_not_called()
+
+    def test_outdated_score_ranges_use_posts(self):
+        self.rollup.db_handler.aggregate_data = MagicMock(return_value=[])
+        self.rollup.rollup_handler = FakeHandler(
+            build_rollups(self.posts, score_ranges={"vader": [-2, 2], "textblob": [-1, 1]}))
+
+        self.rollup.aggregate_data_by_date(self.model_keys, self.weights, ["apple"], DateRange.ONE_MONTH)
+        self.rollup.db_handler.aggregate_data.assert_called_once()
+
+        # The ranges of models without weight do not matter
+        self.rollup.db_handler.aggregate_data.reset_mock()
+        weights = {**self.weights, "model_weights": {"vader": 0, "textblob": 1.0}}
+        self.rollup.aggregate_data_by_date(self.model_keys, weights, ["apple"], DateRange.ONE_MONTH)
+        self.rollup.db_handler.aggregate_data.assert_not_called()
+
+    def test_unnormalized_model_uses_posts(self):
+        weights = {**self.weights, "custom": {"title_sentiment": 1.0},
+                   "model_weights": {"vader": 0.7, "custom": 0.3}}
+        self.assertFalse(self.rollup.can_use_rollups(["vader", "custom"], weights, ["apple"]))
+
+        weights["model_weights"]["custom"] = 0
+        self.assertTrue(self.rollup.can_use_rollups(["vader", "custom"], weights, ["apple"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from src.dataanalysis.aggregator import WeightedAggregator
+from src.dataanalysis.normalizer import RedditResultNormalizer, VADERNormalizer, TextBlobNormalizer
 
 
 class TestWeightedAggregator(unittest.TestCase):
@@ -104,6 +105,61 @@ class TestWeightedAggregator(unittest.TestCase):
         # Only 'title_sentiment' should be used with weight of 1.0
         self.assertAlmostEqual(result, 30.0, places=5)
 
+    def test_aggregate_batch_matches_aggregate(self):
+        posts = [
+            {"model_output": {
+                "vader": {"title_sentiment": 0.5, "selftext_sentiment": -0.2, "comments_sentiment": [0.1, 0.9, -1.0]},
+                "textblob": {"title_sentiment": 0.3, "selftext_sentiment": 0.0, "comments_sentiment": []}}},
+            {"model_output": {"vader": {"title_sentiment": 1.5, "comments_sentiment": [-3.0]}}},
+            {"model_output": {"textblob": {"title_sentiment": -0.7, "comments_sentiment": [0.2]}}},
+            {"model_output": {"vader": {"title_sentiment": -0.9}, "custom": {"title_sentiment": 42.0}}},
+            {"model_output": {}},
+        ]
+        model_keys = ["vader", "textblob", "custom"]
+        weights = {
+            "vader": {"title_sentiment": 0.3, "selftext_sentiment": 0.2, "comments_sentiment": 0.5},
+            "textblob": {"title_sentiment": 0.6, "selftext_sentiment": 0, "comments_sentiment": 0.4},
+            "custom": {"title_sentiment": 1.0},
+            "model_weights": {"vader": 0.7, "textblob": 0.3, "custom": 0.5}
+        }
+        normalizer = RedditResultNormalizer({"vader": VADERNormalizer(), "textblob": TextBlobNormalizer()})
+        strategies = {model: normalizer.model_normalizers[model].strategy for model in ("vader", "textblob")}
+
+        result = self.aggregator.aggregate_batch(posts, model_keys, weights, strategies)
+
+        expected = [self.aggregator.aggregate(normalizer.normalize(post), model_keys, weights) for post in posts]
+        self.assertEqual(len(result), len(posts))
+        for score, expected_score in zip(result, expected):
+            self.assertAlmostEqual(score, expected_score, places=9)
+
+    def test_aggregate_batch_normalized_posts(self):
+        posts = [
+            {"model_output": {"vader": {"title_sentiment": 50.0, "selftext_sentiment": 70.0,
+                                        "comments_sentiment": [60.0, 80.0, 70.0]}}},
+            {"model_output": {"vader": {"title_sentiment": 30.0}}},
+        ]
+        weights = {
+            "vader": {"title_sentiment": 0.3, "selftext_sentiment": 0.2, "comments_sentiment": 0.5},
+            "model_weights": {"vader": 1.0}
+        }
+
+        result = self.aggregator.aggregate_batch(posts, ["vader"], weights)
+
+        self.assertAlmostEqual(result[0], 64.0, places=5)
+        self.assertAlmostEqual(result[1], 9.0, places=5)
+
+    def test_aggregate_batch_zero_model_weights(self):
+        posts = [{"model_output": {"vader": {"title_sentiment": 50.0}}}]
+        weights = {"vader": {"title_sentiment": 1.0}, "model_weights": {"vader": 0}}
+
+        result = self.aggregator.aggregate_batch(posts, ["vader"], weights)
+
+        self.assertEqual(result.tolist(), [0.0])
+
+    def test_aggregate_batch_missing_model_output(self):
+        with self.assertRaises(ValueError):
+            self.aggregator.aggregate_batch([{}], ["vader"], {"model_weights": {"vader": 1.0}})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+
+import numpy as np
+
 from src.dataanalysis.normalizer.normalization_strategy import MinMaxNormalizationStrategy
 
 
@@ -34,3 +37,8 @@ class TestMinMaxNormalizationStrategy(unittest.TestCase):
     def test_normalize_None(self):
         with self.assertRaises(TypeError):
             self.min_max_normalizer.normalize(None)
+
+    def test_normalize_array(self):
+        scores = np.array([-2.0, -1.0, 0.0, 0.5, 3.0])
+        result = self.min_max_normalizer.normalize_array(scores)
+        self.assertEqual(result.tolist(), [self.min_max_normalizer.normalize(score) for score in scores.tolist()])
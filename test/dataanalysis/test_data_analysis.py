@@ -0,0 +1,132 @@
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.dataanalysis.data_analysis import DataAnalysis
+
+
+class TestDataAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(DataAnalysis, 'initialize_components', return_value=MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.indicators = [{"indicatorName": f"indicator_{i}", "filters": [f"keyword_{i}"], "aggregateName": "aggregate"}
+                           for i in range(8)]
+
+    def test_execute_serial(self):
+        da = DataAnalysis()
+        processed = []
+
+        with patch.object(da, 'load_data_from_db', return_value=self.indicators), \
+                patch.object(da, 'process_update', side_effect=lambda indicator, _, planner=None: processed.append(indicator)):
+            da.execute(update_type='daily')
+
+        self.assertEqual(processed, self.indicators)
+
+    def test_execute_concurrent(self):
+        da = DataAnalysis(max_workers=4)
+        processed = []
+        thread_names = set()
+
+        def process_update(indicator, update_type, planner=None):
+            thread_names.add(threading.current_thread().name)
+            processed.append(indicator["indicatorName"])
+
+        with patch.object(da, 'load_data_from_db', return_value=self.indicators), \
+                patch.object(da, 'process_update', side_effect=process_update):
+            da.execute(update_type='daily')
+
+        self.assertEqual(sorted(processed), sorted(indicator["indicatorName"] for indicator in self.indicators))
+        self.assertNotIn(threading.current_thread().name, thread_names)
+
+    def test_execute_concurrent_isolates_errors(self):
+        da = DataAnalysis(max_workers=4)
+        processed = []
+
+        def process_update(indicator, update_type, planner=None):
+            if indicator["indicatorName"] == "indicator_3":
+                raise RuntimeError("failed")
+            processed.append(indicator["indicatorName"])
+
+        with patch.object(da, 'load_data_from_db', return_value=self.indicators), \
+                patch.object(da, 'process_update', side_effect=process_update):
+            da.execute(update_type='all')
+
+        self.assertEqual(len(processed), len(self.indicators) - 1)
+        self.assertNotIn("indicator_3", processed)
+
+    def test_invalid_worker_counts(self):
+        with self.assertRaises(ValueError):
+            DataAnalysis(max_workers=0)
+        with self.assertRaises(ValueError):
+            DataAnalysis(aggregation_processes=-1)
+
+    @patch('src.dataanalysis.data_analysis.ProcessPoolExecutor')
+    def test_process_pool_spawns_workers(self, mock_pool_class):
+        da = DataAnalysis(aggregation_processes=2)
+
+        self.assertIs(da.data_aggregator.process_pool, mock_pool_class.return_value)
+        self.assertEqual(mock_pool_class.call_args.kwargs['max_workers'], 2)
+        self.assertEqual(mock_pool_class.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+
+    def test_close_shuts_down_process_pool(self):
+        da = DataAnalysis()
+        process_pool = MagicMock()
+        da.data_aggregator.process_pool = process_pool
+
+        da.close()
+
+        process_pool.shutdown.assert_called_once()
+        self.assertIsNone(da.data_aggregator.process_pool)
+
+
+    def test_execute_shares_aggregations(self):
+        da = DataAnalysis(max_workers=4)
+        indicators = [
+            {"indicatorName": "a", "filters": ["Apple", "iPhone"], "aggregateName": "aggregate"},
+            {"indicatorName": "b", "filters": ["iphone", "apple"], "aggregateName": "aggregate"},
+            {"indicatorName": "c", "filters": ["apple"], "aggregateName": "aggregate"},
+            {"indicatorName": "d", "filters": ["apple"], "aggregateName": "other"},
+        ]
+        weights = ({"model_weights": {"vader": 1.0}, "vader": {"title_sentiment": 1.0}}, ["vader"])
+        da.data_aggregator.aggregate_data_by_date.return_value = [{"date": "2024-05-01", "average_score": 50.0}]
+
+        with patch.object(da, 'load_data_from_db', return_value=indicators), \
+                patch.object(DataAnalysis, 'load_aggregate_weights', return_value=weights), \
+                patch.object(da, 'save_result_to_db') as mock_save:
+            da.execute(update_type='all')
+
+        # One aggregation per keyword set, aggregate and date range
+        self.assertEqual(da.data_aggregator.aggregate_data_by_date.call_count, 6)
+        saved_indicators = [call.args[0] for call in mock_save.call_args_list if not call.kwargs.get("delete")]
+        self.assertEqual(sorted(saved_indicators), ["a", "b", "c", "d"])
+
+    def test_execute_uses_planner_per_call(self):
+        da = DataAnalysis(max_workers=4)
+        planners = {}
+        barrier = threading.Barrier(2)
+
+        def process_update(indicator, update_type, planner=None):
+            planners.setdefault(update_type, set()).add(id(planner))
+
+        def execute(update_type):
+            barrier.wait()
+            da.execute(update_type=update_type)
+
+        with patch.object(da, 'load_data_from_db', return_value=self.indicators), \
+                patch.object(da, 'process_update', side_effect=process_update):
+            threads = [threading.Thread(target=execute, args=(update_type,)) for update_type in ('daily', 'monthly')]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Concurrent calls on the same instance each share one planner between their own indicators only
+        self.assertEqual(len(planners['daily']), 1)
+        self.assertEqual(len(planners['monthly']), 1)
+        self.assertNotEqual(planners['daily'], planners['monthly'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.dataanalysis.date_range import DateRange
+from src.dataanalysis.indicator_planner import IndicatorPlanner
+
+
+class TestIndicatorPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.data_aggregator = MagicMock()
+        self.planner = IndicatorPlanner(self.data_aggregator)
+
+    def test_build_key(self):
+        self.assertEqual(IndicatorPlanner.build_key(["iPhone", "Apple", "apple"], "aggregate"),
+                         (("apple", "iphone"), "aggregate"))
+
+    def test_group(self):
+        indicators = [
+            {"indicatorName": "a", "filters": ["apple"], "aggregateName": "x"},
+            {"indicatorName": "b", "filters": ["samsung"], "aggregateName": "x"},
+            {"indicatorName": "c", "filters": ["Apple"], "aggregateName": "x"},
+            {"indicatorName": "d", "filters": ["apple"], "aggregateName": "y"},
+        ]
+
+        groups = self.planner.group(indicators)
+
+        self.assertEqual([[indicator["indicatorName"] for indicator in group] for group in groups],
+                         [["a", "c"], ["b"], ["d"]])
+
+    def test_aggregate_data_by_date_shares_results(self):
+        self.data_aggregator.aggregate_data_by_date.side_effect = lambda **kwargs: [{"date": "2024-05", "average_score": 1.0}]
+
+        first = self.planner.aggregate_data_by_date("x", ["vader"], {}, ["Apple"], DateRange.SIX_MONTHS)
+        second = self.planner.aggregate_data_by_date("x", ["vader"], {}, ["apple"], DateRange.SIX_MONTHS)
+        self.planner.aggregate_data_by_date("x", ["vader"], {}, ["apple"], DateRange.ONE_MONTH)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.data_aggregator.aggregate_data_by_date.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.datacollection.api.RateLimiter import RateLimiter
+
+class test_RateLimiter(unittest.TestCase):
+    """
+    Unit Tests for the RateLimiter class.
+    """
+    def test_acquire_burstWithinCapacity(self):
+        """
+        Test that requests within the capacity of the bucket are not delayed.
+        """
+        rateLimiter = RateLimiter(10, 60)
+        startTime = time.monotonic()
+        for _ in range(10):
+            rateLimiter.acquire()
+        self.assertLess(time.monotonic() - startTime, 0.1)
+
+    def test_acquire_sharedByThreads(self):
+        """
+        Test that threads sharing the bucket wait for tokens to be refilled once it is empty.
+        """
+        rateLimiter = RateLimiter(5, 0.5)
+        startTime = time.monotonic()
+        threads = [threading.Thread(target=rateLimiter.acquire) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 5 requests are made right away, the 5 others as the tokens are refilled at 10 per second
+        self.assertGreaterEqual(time.monotonic() - startTime, 0.45)
+
+    def test_pause(self):
+        """
+        Test that no request is made while the rate limiter is paused.
+        """
+        rateLimiter = RateLimiter(10, 60)
+        rateLimiter.pause(0.2)
+        startTime = time.monotonic()
+        rateLimiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - startTime, 0.19)
+
+    def test_update_waitsForReset(self):
+        """
+        Test that once the budget reported by Reddit is spent, requests wait for the window to reset.
+        """
+        rateLimiter = RateLimiter(100, 1)
+        rateLimiter.update({"X-Ratelimit-Remaining": "2.0", "X-Ratelimit-Reset": "1"})
+        startTime = time.monotonic()
+        rateLimiter.acquire()
+        rateLimiter.acquire()
+        self.assertLess(time.monotonic() - startTime, 0.1)
+        rateLimiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - startTime, 0.9)
+
+    def test_update_pacesRemainingBudget(self):
+        """
+        Test that the remaining budget is spread evenly over the seconds until the window resets.
+        """
+        rateLimiter = RateLimiter(100, 1, burstSize=1)
+        rateLimiter.update({"X-Ratelimit-Remaining": "20.0", "X-Ratelimit-Reset": "2"})
+        startTime = time.monotonic()
+        for _ in range(4):
+            rateLimiter.acquire()
+        # 10 requests per second, the first one from the burst
+        self.assertGreaterEqual(time.monotonic() - startTime, 0.25)
+        self.assertLess(time.monotonic() - startTime, 0.6)
+
+    def test_update_ignoresMissingHeaders(self):
+        """
+        Test that responses without rate limit headers leave the configured rate unchanged.
+        """
+        rateLimiter = RateLimiter(10, 60)
+        rateLimiter.update({})
+        rateLimiter.update({"X-Ratelimit-Remaining": "invalid", "X-Ratelimit-Reset": "10"})
+        startTime = time.monotonic()
+        for _ in range(10):
+            rateLimiter.acquire()
+        self.assertLess(time.monotonic() - startTime, 0.1)
+
+    @patch("src.datacollection.api.ApiConstants.BACKOFF_MAX_SECONDS", 60)
+    @patch("src.datacollection.api.ApiConstants.BACKOFF_BASE_SECONDS", 2)
+    def test_getBackoffDelay(self):
+        """
+        Test that the backoff delay is jittered, grows exponentially with the attempts and is capped.
+        """
+        rateLimiter = RateLimiter(10, 60)
+        with patch("src.datacollection.api.RateLimiter.random.uniform", side_effect=lambda low, high: high):
+            self.assertEqual([rateLimiter.getBackoffDelay(attempt) for attempt in range(7)], [2, 4, 8, 16, 32, 60, 60])
+        for attempt in range(5):
+            self.assertTrue(0 <= rateLimiter.getBackoffDelay(attempt) <= 2 * 2 ** attempt)
+
+        # After a 'Too many requests' error, the delay lasts until the reported window resets
+        rateLimiter.update({"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "120"})
+        self.assertGreater(rateLimiter.getBackoffDelay(0, exceeded=True), 119)
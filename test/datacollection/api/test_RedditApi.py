@@ -1,13 +1,180 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from unittest.mock import patch
+
+from src.datacollection.api.RateLimiter import RateLimiter
+from src.datacollection.api.RedditHttpClient import RedditHttpClient
 from src.datacollection.api.RedditApi import RedditApi
+from src.datacollection.api.RedditApiLatestSubredditData import RedditApiLatestSubredditData
+from src.datacollection.api.SeenPostIndex import SeenPostIndex
+
+class StubRedditHandler(BaseHTTPRequestHandler):
+    """
+    Serves the comments of a post like the Reddit API, after a delay, counting the requests in flight.
+    Posts listed in the server's `exceededPosts` get one 'Too many requests' response first.
+    """
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.inFlight += 1
+            server.maxInFlight = max(server.maxInFlight, server.inFlight)
+        time.sleep(server.delay)
+        postId = re.search(r"/comments/(\w+)\.json", self.path).group(1)
+        with server.lock:
+            server.inFlight -= 1
+            exceeded = postId in server.exceededPosts
+            server.exceededPosts.discard(postId)
+
+        if self.headers.get("Authorization") == "bearer expired":
+            self.send_response(401)
+            self.end_headers()
+            return
+        if exceeded:
+            self.send_response(429)
+            self.end_headers()
+            return
+        body = json.dumps([{"data": {}}, {"data": {"children": [{"data": {"body": "Comment on " + postId}}]}}]).encode()
+        self.send_response(200)
+        for header, value in server.rateLimitHeaders.items():
+            self.send_header(header, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
 
 class test_RedditApi(unittest.TestCase):
     # Sprint 4 Task - Ask Prof. about API testing practices.
     """
     Unit Tests for the RedditApi class.
     """
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubRedditHandler)
+        self.server.lock = threading.Lock()
+        self.server.inFlight = 0
+        self.server.maxInFlight = 0
+        self.server.delay = 0.1
+        self.server.exceededPosts = set()
+        self.server.rateLimitHeaders = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        indexDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(indexDirectory.cleanup)
+        self.seenPostIndex = SeenPostIndex(os.path.join(indexDirectory.name, "seen_posts.sqlite3"))
+        self.addCleanup(self.seenPostIndex.close)
+
+        commentsUrl = Template("http://127.0.0.1:" + str(self.server.server_port) + "/r/$subreddit/comments/$postId.json")
+        for patcher in [patch("src.datacollection.query.QueryConstants.REDDIT_GET_COMMENTS_URL", commentsUrl),
+                        patch("src.datacollection.api.RedditApi.redditRateLimiter", RateLimiter(1000, 1)),
+                        patch("src.datacollection.api.RedditApi.redditHttpClient", RedditHttpClient()),
+                        patch("src.datacollection.api.RedditApi.seenPostIndex", self.seenPostIndex),
+                        patch("src.datacollection.api.ApiConstants.BACKOFF_BASE_SECONDS", 0.01)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.postList = [{"data": {"id": "post" + str(i), "subreddit": "singapore", "num_comments": 1}} for i in range(16)]
+
     def test_init_cannotInstantiateAbstractClass(self):
         """
         Test that the RedditApi class cannot be instantiated.
         """
-        self.assertRaises(TypeError, RedditApi)
\ No newline at end of file
+        self.assertRaises(TypeError, RedditApi)
+
+    def test_retrieveComments_concurrent(self):
+        """
+        Test that the comments of the posts are retrieved concurrently and stored in each post.
+        """
+        startTime = time.time()
+        resultList = RedditApi._retrieveComments(RedditApi, self.postList, {"Authorization": "bearer token"})
+
+        self.assertLess(time.time() - startTime, len(self.postList) * self.server.delay / 2)
+        self.assertGreater(self.server.maxInFlight, 1)
+        self.assertEqual(resultList, self.postList)
+        for post in resultList:
+            self.assertEqual(post["comments"], [{"data": {"body": "Comment on " + post["data"]["id"]}}])
+
+    def test_retrieveComments_tooManyRequests(self):
+        """
+        Test that comment retrieval is reattempted after a 'Too many requests' error.
+        """
+        self.server.exceededPosts = {"post3", "post7"}
+        resultList = RedditApi._retrieveComments(RedditApi, self.postList, {"Authorization": "bearer token"})
+
+        self.assertEqual(resultList[3]["comments"], [{"data": {"body": "Comment on post3"}}])
+        self.assertEqual(resultList[7]["comments"], [{"data": {"body": "Comment on post7"}}])
+
+    def test_retrieveComments_rateLimitHeaders(self):
+        """
+        Test that comment retrieval waits for the rate limit window to reset once Reddit reports the budget is spent.
+        """
+        self.server.rateLimitHeaders = {"X-Ratelimit-Remaining": "0.0", "X-Ratelimit-Reset": "1"}
+        startTime = time.time()
+        with patch("src.datacollection.api.ApiConstants.COMMENT_RETRIEVAL_WORKERS", 1):
+            resultList = RedditApi._retrieveComments(RedditApi, self.postList[:2], {"Authorization": "bearer token"})
+
+        self.assertGreaterEqual(time.time() - startTime, 1)
+        self.assertEqual(resultList[1]["comments"], [{"data": {"body": "Comment on post1"}}])
+
+    @patch.object(RedditHttpClient, "_requestAccessToken", return_value=("fresh", 3600))
+    def test_retrieveComments_expiredAccessToken(self, mockRequestAccessToken):
+        """
+        Test that requests rejected because the access token expired are sent again with one new access token.
+        """
+        authHeader = {"Authorization": "bearer expired"}
+        resultList = RedditApi._retrieveComments(RedditApi, self.postList, authHeader)
+
+        mockRequestAccessToken.assert_called_once()
+        self.assertEqual(authHeader, {"Authorization": "bearer fresh"})
+        for post in resultList:
+            self.assertEqual(post["comments"], [{"data": {"body": "Comment on " + post["data"]["id"]}}])
+
+    def test_retrieveComments_skipsUnchangedPosts(self):
+        """
+        Test that posts collected before are left out unless their number of comments changed.
+        """
+        self.seenPostIndex.markSeen(self.postList[:2])
+        self.postList[1]["data"]["num_comments"] = 2
+        resultList = RedditApi._retrieveComments(RedditApi, self.postList[:3], {"Authorization": "bearer token"})
+
+        self.assertEqual([post["data"]["id"] for post in resultList], ["post1", "post2"])
+        self.assertEqual(resultList[0]["comments"], [{"data": {"body": "Comment on post1"}}])
+
+    def test_retrieveComments_failedRetrieval(self):
+        """
+        Test that posts whose comments could not be retrieved are flagged and not recorded as collected.
+        """
+        self.server.exceededPosts = {"post0"}
+        with patch("src.datacollection.api.ApiConstants.MAXIMUM_COMMENT_RETRIEVAL_ATTEMPTS", 1):
+            resultList = RedditApi._retrieveComments(RedditApi, self.postList[:2], {"Authorization": "bearer token"})
+        self.seenPostIndex.markSeen(resultList)
+
+        self.assertEqual(resultList[0]["comments"], [])
+        self.assertTrue(resultList[0]["commentRetrievalFailed"])
+        self.assertNotIn("commentRetrievalFailed", resultList[1])
+        self.assertEqual(self.seenPostIndex.getCommentCounts(["post0", "post1"]), {"post1": 1})
+
+    def test_makeApiCall_stopsAtSeenPost(self):
+        """
+        Test that paging stops after the first page containing a post collected before.
+        """
+        pages = [self.postList[0:4], self.postList[4:8], self.postList[8:12]]
+        pageData = [{"data": {"after": "t3_page" + str(i), "dist": len(page), "children": page}} for i, page in enumerate(pages)]
+        self.seenPostIndex.markSeen([self.postList[6]])
+
+        api = RedditApiLatestSubredditData("https://oauth.reddit.com/r/singapore/new?count=$count&after=$after")
+        with patch.object(RedditApiLatestSubredditData, "_getPageData", side_effect=pageData) as mockGetPageData:
+            resultList = api._makeApiCall({"Authorization": "bearer token"})
+
+        self.assertEqual(mockGetPageData.call_count, 2)
+        self.assertEqual(resultList, self.postList[:8])
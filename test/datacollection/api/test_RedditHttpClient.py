@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.datacollection.api.RedditHttpClient import RedditHttpClient
+
+class test_RedditHttpClient(unittest.TestCase):
+    """
+    Unit Tests for the RedditHttpClient class.
+    """
+    def setUp(self):
+        patcher = patch("src.datacollection.api.RedditHttpClient.requests.Session")
+        self.mockSession = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.mockSession.post.return_value.status_code = 200
+        self.mockSession.post.return_value.json.return_value = {"access_token": "token", "expires_in": 3600}
+        self.httpClient = RedditHttpClient()
+
+    def test_getSession_reused(self):
+        """
+        Test that every request goes through the same pooled session.
+        """
+        self.httpClient.get("https://oauth.reddit.com/new.json", {})
+        self.httpClient.get("https://oauth.reddit.com/new.json", {})
+        self.assertIs(self.httpClient.getSession(), self.mockSession)
+        self.assertEqual(self.mockSession.get.call_count, 2)
+        self.mockSession.mount.assert_any_call("https://", unittest.mock.ANY)
+
+    def test_getAccessToken_cached(self):
+        """
+        Test that the access token is only requested once while it is valid.
+        """
+        self.assertEqual(self.httpClient.getAccessToken(), "token")
+        self.assertEqual(self.httpClient.getAccessToken(), "token")
+        self.mockSession.post.assert_called_once()
+
+    def test_getAccessToken_refreshedNearExpiry(self):
+        """
+        Test that an access token about to expire is requested again.
+        """
+        self.mockSession.post.return_value.json.return_value = {"access_token": "token", "expires_in": 30}
+        self.httpClient.getAccessToken()
+        self.httpClient.getAccessToken()
+        self.assertEqual(self.mockSession.post.call_count, 2)
+
+    def test_invalidateAccessToken(self):
+        """
+        Test that a rejected access token is requested again, unless it was already replaced.
+        """
+        self.httpClient.getAccessToken()
+        self.httpClient.invalidateAccessToken("outdated")
+        self.httpClient.getAccessToken()
+        self.mockSession.post.assert_called_once()
+
+        self.httpClient.invalidateAccessToken("token")
+        self.httpClient.getAccessToken()
+        self.assertEqual(self.mockSession.post.call_count, 2)
+
+    @patch("src.datacollection.api.RedditHttpClient.time.sleep")
+    def test_getAccessToken_maximumAttempts(self, mockSleep):
+        """
+        Test that authentication is reattempted with backoff, up to the maximum number of attempts.
+        """
+        self.mockSession.post.return_value.status_code = 429
+        self.assertRaises(ValueError, self.httpClient.getAccessToken)
+        self.assertEqual(self.mockSession.post.call_count, 3)
+        self.assertEqual(mockSleep.call_count, 3)
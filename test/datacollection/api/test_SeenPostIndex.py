@@ -0,0 +1,65 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from src.datacollection.api.SeenPostIndex import SeenPostIndex
+
+class test_SeenPostIndex(unittest.TestCase):
+    """
+    Unit Tests for the SeenPostIndex class.
+    """
+    def setUp(self):
+        indexDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(indexDirectory.cleanup)
+        self.path = os.path.join(indexDirectory.name, "index", "seen_posts.sqlite3")
+        self.seenPostIndex = SeenPostIndex(self.path)
+        self.addCleanup(self.seenPostIndex.close)
+
+    def test_getCommentCounts_unseenPosts(self):
+        """
+        Test that posts never collected are left out.
+        """
+        self.assertEqual(self.seenPostIndex.getCommentCounts(["abc", "def"]), {})
+
+    def test_markSeen_updatesCommentCounts(self):
+        """
+        Test that the latest number of comments of each collected post is recorded.
+        """
+        self.seenPostIndex.markSeen([{"data": {"id": "abc", "num_comments": 3}}, {"data": {"id": "def"}}])
+        self.seenPostIndex.markSeen([{"data": {"id": "abc", "num_comments": 5}}])
+
+        self.assertEqual(self.seenPostIndex.getCommentCounts(["abc", "def", "ghi"]), {"abc": 5, "def": 0})
+
+    def test_markSeen_persists(self):
+        """
+        Test that the index is kept across instances.
+        """
+        self.seenPostIndex.markSeen([{"data": {"id": "abc", "num_comments": 3}}])
+        self.seenPostIndex.close()
+
+        reopenedIndex = SeenPostIndex(self.path)
+        self.addCleanup(reopenedIndex.close)
+        self.assertEqual(reopenedIndex.getCommentCounts(["abc"]), {"abc": 3})
+
+    def test_markSeen_removesExpiredPosts(self):
+        """
+        Test that posts not collected again within the retention period are removed.
+        """
+        with patch("src.datacollection.api.SeenPostIndex.time.time", return_value=time.time() - 3600):
+            self.seenPostIndex.markSeen([{"data": {"id": "abc", "num_comments": 3}}])
+        with patch("src.datacollection.api.ApiConstants.SEEN_POST_RETENTION", 60):
+            self.seenPostIndex.markSeen([{"data": {"id": "def", "num_comments": 1}}])
+
+        self.assertEqual(self.seenPostIndex.getCommentCounts(["abc", "def"]), {"def": 1})
+
+    def test_getCommentCounts_manyPosts(self):
+        """
+        Test that looking up more posts than SQLite allows parameters in one query works.
+        """
+        self.seenPostIndex.markSeen([{"data": {"id": str(i), "num_comments": i}} for i in range(2000)])
+
+        commentCounts = self.seenPostIndex.getCommentCounts([str(i) for i in range(2500)])
+        self.assertEqual(len(commentCounts), 2000)
+        self.assertEqual(commentCounts["1999"], 1999)
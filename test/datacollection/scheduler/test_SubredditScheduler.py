@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+
+from src.datacollection.scheduler.SubredditScheduler import SubredditScheduler
+
+class test_SubredditScheduler(unittest.TestCase):
+    """
+    Unit Tests for the SubredditScheduler class.
+    """
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.polls = []
+        self.runningPolls = 0
+        self.maximumRunningPolls = 0
+
+    def pollSubreddit(self, subreddit: str, duration: float = 0.2) -> list:
+        """
+        Stub poll recording the polls in the order they finish.
+        """
+        with self.lock:
+            self.runningPolls += 1
+            self.maximumRunningPolls = max(self.maximumRunningPolls, self.runningPolls)
+        time.sleep(duration)
+        with self.lock:
+            self.runningPolls -= 1
+            self.polls.append(subreddit)
+        return []
+
+    def test_init_invalidIntervals(self):
+        """
+        Test that a ValueError is raised when no subreddit or a non-positive interval is given.
+        """
+        self.assertRaises(ValueError, SubredditScheduler, self.pollSubreddit, {})
+        self.assertRaises(ValueError, SubredditScheduler, self.pollSubreddit, {"singapore": 0})
+
+    def test_run_concurrentPolls(self):
+        """
+        Test that the subreddits are polled concurrently.
+        """
+        scheduler = SubredditScheduler(self.pollSubreddit, {"singapore": 60, "stocks": 60, "python": 60})
+        startTime = time.monotonic()
+        scheduler.run(maximumPolls=3)
+
+        self.assertLess(time.monotonic() - startTime, 0.5)
+        self.assertEqual(self.maximumRunningPolls, 3)
+        self.assertCountEqual(self.polls, ["singapore", "stocks", "python"])
+
+    def test_run_slowSubredditDoesNotHoldBack(self):
+        """
+        Test that a subreddit with a short interval is polled repeatedly while a slow poll is running.
+        """
+        def pollSubreddit(subreddit):
+            return self.pollSubreddit(subreddit, 0.6 if subreddit == "slow" else 0.05)
+
+        scheduler = SubredditScheduler(pollSubreddit, {"slow": 60, "fast": 0.05})
+        scheduler.run(maximumPolls=4)
+
+        self.assertEqual(self.polls, ["fast", "fast", "fast", "slow"])
+
+    def test_run_stopEvent(self):
+        """
+        Test that polling stops once the stop event is set.
+        """
+        stopEvent = threading.Event()
+        threading.Timer(0.3, stopEvent.set).start()
+        scheduler = SubredditScheduler(lambda subreddit: self.pollSubreddit(subreddit, 0.01), {"singapore": 0.1})
+        scheduler.run(stopEvent)
+
+        self.assertGreaterEqual(len(self.polls), 2)
+        self.assertLessEqual(len(self.polls), 4)
+
+    def test_run_failedPoll(self):
+        """
+        Test that a failing subreddit does not stop the others from being polled.
+        """
+        def pollSubreddit(subreddit):
+            if subreddit == "private":
+                raise ValueError("Forbidden")
+            return self.pollSubreddit(subreddit, 0.01)
+
+        scheduler = SubredditScheduler(pollSubreddit, {"private": 0.05, "singapore": 0.05})
+        scheduler.run(maximumPolls=4)
+
+        self.assertEqual(self.polls, ["singapore", "singapore"])
+
+    def test_poll_adaptsInterval(self):
+        """
+        Test that busy subreddits are polled more often and quiet subreddits less often.
+        """
+        posts = [{"data": {"created_utc": time.time()}} for _ in range(50)]
+        scheduler = SubredditScheduler(lambda subreddit: posts if subreddit == "busy" else [],
+                                       {"busy": 120, "normal": 120, "quiet": 120})
+        for subreddit in ["busy", "normal", "quiet"]:
+            scheduler._poll(subreddit)
+            self.assertEqual(scheduler.getInterval(subreddit), 120)
+
+        # 50 new posts in 60s: 25 new posts are expected every 30s
+        scheduler._lastPollTimes["busy"] = time.time() - 60
+        scheduler._poll("busy")
+        self.assertAlmostEqual(scheduler.getInterval("busy"), 30, delta=1)
+
+        # No new posts: the interval doubles, up to 4 times the configured interval
+        for _ in range(3):
+            scheduler._poll("quiet")
+        self.assertEqual(scheduler.getInterval("quiet"), 480)
@@ -35,6 +35,28 @@ class TestDataClientManager(unittest.TestCase):
         # Ensure that the close method was called on the mocked client
         mock_client_instance.close.assert_called_once()
 
+    @patch("src.datamanagement.dataclient.data_client_manager.MongoClientRegistry")
+    def test_get_database_client_shares_pool(self, mock_registry):
+        """
+        Method to test that database clients are built on the shared client of the registry.
+        """
+        config = DataClientConfig(db_type="mongodb", uri="mongodb://localhost",
+                                  db_name="test_db", collection="test_collection")
+
+        client = DataClientManager.get_database_client(config)
+
+        mock_registry.get_client.assert_called_once_with(config)
+        self.assertIs(client.client, mock_registry.get_client.return_value)
+        self.assertFalse(client.owns_client)
+
+    @patch("src.datamanagement.dataclient.data_client_manager.MongoClientRegistry")
+    def test_close_all_clients(self, mock_registry):
+        """
+        Method to test that shutting down closes the shared clients.
+        """
+        DataClientManager.close_all_clients()
+        mock_registry.close_all.assert_called_once()
+
     def test_unsupported_db_type(self):
         """
         Method to test error raised for unsupported database type.
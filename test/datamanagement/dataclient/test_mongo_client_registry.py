@@ -0,0 +1,73 @@
+"""Module for Test MongoClientRegistry"""
+import unittest
+from unittest.mock import patch
+from src.datamanagement.dataclient import MongoClientRegistry, MongoDBClient, DataClientConfig
+
+
+class TestMongoClientRegistry(unittest.TestCase):
+    """
+    Test class for MongoClientRegistry Unit Testing.
+    """
+
+    def setUp(self):
+        """
+        Set up method for defining common test variables.
+        """
+        self.config = DataClientConfig(db_type="mongodb", uri="mongodb://localhost",
+                                       db_name="test_db", collection="test_collection",
+                                       max_pool_size=50, min_pool_size=5)
+        MongoClientRegistry.close_all()
+
+    def tearDown(self):
+        """
+        Empties the registry after each test.
+        """
+        MongoClientRegistry.close_all()
+
+    @patch("src.datamanagement.dataclient.mongo_client_registry.MongoClient")
+    def test_get_client_is_shared_per_uri(self, mock_mongo_client):
+        """
+        Method to test that one MongoClient is created and pinged per URI, with the configured pool sizes.
+        """
+        other_collection = DataClientConfig(db_type="mongodb", uri="mongodb://localhost",
+                                            db_name="test_db", collection="other_collection")
+
+        first = MongoClientRegistry.get_client(self.config)
+        second = MongoClientRegistry.get_client(other_collection)
+
+        self.assertIs(first, second)
+        mock_mongo_client.assert_called_once_with(
+            "mongodb://localhost", maxPoolSize=50, minPoolSize=5)
+        mock_mongo_client.return_value.admin.command.assert_called_once_with('ping')
+
+    @patch("src.datamanagement.dataclient.mongo_client_registry.MongoClient")
+    def test_close_all(self, mock_mongo_client):
+        """
+        Method to test that close_all closes the shared clients and empties the registry.
+        """
+        MongoClientRegistry.get_client(self.config)
+        MongoClientRegistry.close_all()
+
+        mock_mongo_client.return_value.close.assert_called_once()
+        MongoClientRegistry.get_client(self.config)
+        self.assertEqual(mock_mongo_client.call_count, 2)
+
+    @patch("src.datamanagement.dataclient.mongodb_client.MongoClient")
+    @patch("src.datamanagement.dataclient.mongo_client_registry.MongoClient")
+    def test_shared_client_not_closed_by_collection_client(self, mock_shared_client, mock_dedicated_client):
+        """
+        Method to test that closing a collection-scoped client leaves the shared pool open.
+        """
+        client = MongoClientRegistry.get_client(self.config)
+        client.reset_mock()
+
+        collection_client = MongoDBClient(self.config, client=client)
+        collection_client.close()
+
+        mock_dedicated_client.assert_not_called()
+        client.admin.command.assert_not_called()
+        client.close.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
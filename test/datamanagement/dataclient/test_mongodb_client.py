@@ -1,7 +1,9 @@
 """Module for Test MongoDBClient"""
 import unittest
 from unittest.mock import patch, MagicMock
-from src.datamanagement.dataclient import MongoDBClient, DataClientConfig
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from src.datamanagement.dataclient import MongoDBClient, DataClientConfig, PartialWriteError
 
 
 class TestMongoDBClient(unittest.TestCase):
@@ -45,17 +47,114 @@ class TestMongoDBClient(unittest.TestCase):
         data = self.client.load_data()
         self.assertEqual(data, [{"_id": 1, "value": "test"}])
 
+    def test_load_data_in_batches(self):
+        """
+        Method to test streaming data from MongoDB in fixed-size batches.
+        """
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter(
+            [{"_id": 1}, {"_id": 2}, {"_id": 3}])
+        self.mock_collection.find.return_value = MagicMock()
+        self.mock_collection.find.return_value.batch_size.return_value = mock_cursor
+
+        batches = list(self.client.load_data_in_batches(2))
+
+        self.assertEqual(batches, [[{"_id": 1}, {"_id": 2}], [{"_id": 3}]])
+        self.mock_collection.find.return_value.batch_size.assert_called_once_with(2)
+        mock_cursor.close.assert_called_once()
+
+    def test_load_data_in_batches_sorted(self):
+        """
+        Method to test streaming filtered data from MongoDB in ascending order of a field.
+        """
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([{"_id": 3}])
+        self.mock_collection.find.return_value = MagicMock()
+        self.mock_collection.find.return_value.sort.return_value.batch_size.return_value = mock_cursor
+
+        batches = list(self.client.load_data_in_batches(
+            2, filters={"_id": {"$gt": 2}}, sort_field="_id"))
+
+        self.assertEqual(batches, [[{"_id": 3}]])
+        self.mock_collection.find.assert_called_once_with({"_id": {"$gt": 2}})
+        self.mock_collection.find.return_value.sort.assert_called_once_with("_id", 1)
+
+    def test_load_data_in_batches_invalid_size(self):
+        """
+        Method to test that a non-positive batch size is rejected.
+        """
+        with self.assertRaises(ValueError):
+            list(self.client.load_data_in_batches(0))
+
     def test_upsert_data(self):
         """
         Method to test upserting data to MongoDB.
         """
+        self.mock_collection.bulk_write.return_value = MagicMock(
+            upserted_count=1, modified_count=0)
+
         # Call the upsert_data method
-        self.client.upsert_data([{"_id": 1, "value": "test"}])
+        results = self.client.upsert_data([{"_id": 1, "value": "test"}])
 
-        # Check that update_one was called with the expected parameters
-        self.mock_collection.update_one.assert_called_with(
-            {"_id": 1}, {"$set": {"_id": 1, "value": "test"}}, upsert=True
+        # Check that a single unordered bulk write was issued with the expected upsert
+        self.mock_collection.bulk_write.assert_called_once_with(
+            [UpdateOne({"_id": 1}, {"$set": {"_id": 1, "value": "test"}}, upsert=True)],
+            ordered=False
         )
+        self.assertEqual(results, [{"upserted": 1, "modified": 0, "failed": 0}])
+
+    def test_upsert_data_in_batches(self):
+        """
+        Method to test that upserts are split into bulk writes of at most batch_size operations.
+        """
+        self.mock_collection.bulk_write.return_value = MagicMock(
+            upserted_count=0, modified_count=2)
+        data = [{"_id": i} for i in range(5)]
+
+        results = self.client.upsert_data(data, batch_size=2)
+
+        self.assertEqual(self.mock_collection.bulk_write.call_count, 3)
+        batch_sizes = [len(call.args[0]) for call in self.mock_collection.bulk_write.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+        self.assertEqual(len(results), 3)
+
+    def test_upsert_data_partial_failure(self):
+        """
+        Method to test that failed writes are raised once every batch was written.
+        """
+        self.mock_collection.bulk_write.side_effect = [
+            BulkWriteError({"nUpserted": 1, "nModified": 0, "writeErrors": [{"index": 1, "errmsg": "error"}]}),
+            MagicMock(upserted_count=1, modified_count=0)
+        ]
+
+        with self.assertRaises(PartialWriteError) as context:
+            self.client.upsert_data([{"_id": 1}, {"_id": 2}, {"_id": 3}], batch_size=2)
+
+        self.assertEqual(self.mock_collection.bulk_write.call_count, 2)
+        self.assertEqual(context.exception.failed_keys, [2])
+        self.assertEqual(context.exception.results, [{"upserted": 1, "modified": 0, "failed": 1},
+                                                     {"upserted": 1, "modified": 0, "failed": 0}])
+
+    def test_increment_data(self):
+        """
+        Method to test incrementing fields, setting the defaults of new documents only.
+        """
+        self.client.increment_data(
+            {"a": {"count": 1, "sums.vader.title_sentiment": 50.0}, "b": {"count": -1}},
+            {"a": {"keyword": "apple"}})
+
+        self.mock_collection.bulk_write.assert_called_once_with([
+            UpdateOne({"_id": "a"}, {"$inc": {"count": 1, "sums.vader.title_sentiment": 50.0},
+                                     "$setOnInsert": {"keyword": "apple"}}, upsert=True),
+            UpdateOne({"_id": "b"}, {"$inc": {"count": -1}}, upsert=True)
+        ], ordered=False)
+
+    def test_delete_data(self):
+        """
+        Method to test deleting the documents matching a query.
+        """
+        self.client.delete_data({"keyword": "apple"})
+        self.mock_collection.delete_many.assert_called_once_with({"keyword": "apple"})
 
     def test_ping_server_success(self):
         """
@@ -0,0 +1,164 @@
+"""Module for Test Columnar Pipe."""
+import copy
+import unittest
+from unittest.mock import MagicMock, patch
+from src.datamanagement.filters import ColumnarPipe, ColumnarPosts, Pipe, PreprocessingFilter, TokenizationFilter
+from src.datamanagement.filters.columnar_pipe import Column, MISSING
+from src.datamanagement.transformationmodels.vader_sentiment_analysis import VaderSentimentAnalysis
+from src.datamanagement.transformationmodels.transformation import Transformation
+
+
+class TestColumnarPipe(unittest.TestCase):
+    """
+    Test class for Columnar Pipe Unit Testing.
+    """
+    # pylint: disable=abstract-class-instantiated, unused-variable, too-few-public-methods
+
+    def setUp(self):
+        """
+        Set up method to define test variables.
+        """
+        mock_stopwords = MagicMock()
+        mock_stopwords.words.return_value = ['this', 'is', 'a', 'the', 'with']
+        stopwords_patcher = patch('src.datamanagement.filters.stopword_filter.stopwords', new=mock_stopwords)
+        stopwords_patcher.start()
+        self.addCleanup(stopwords_patcher.stop)
+
+        self.test_data = [
+            {
+                "_id": "1",
+                "selftext": "This is a TEST!",
+                "title": "Test TITLE, with the punctuation...",
+                "comments": ["Great Post!", "", "The end?!"],
+                "subreddit": "stocks",
+                "created_utc": 1700000000.0
+            },
+            {
+                "_id": "2",
+                "title": "Only a title"
+            },
+            {
+                "_id": "3",
+                "comments": "not a list",
+                "transformed_data": {
+                    "comments": ["already cleaned with stop words"],
+                    "selftext_tokens": ["this", "token"]
+                },
+                "model_output": {"vader": {"title_sentiment": 0.5}, "other": {"label": "x"}}
+            },
+            {}
+        ]
+
+    def test_round_trip(self):
+        """
+        Test converting posts to the columnar form and back yields equal posts.
+        """
+        posts = ColumnarPosts.from_dicts(self.test_data)
+
+        self.assertEqual(len(posts), 4)
+        self.assertEqual(posts.to_dicts(), self.test_data)
+        self.assertEqual(posts.column(('title',)).get(0), "Test TITLE, with the punctuation...")
+        self.assertIs(posts.column(('selftext',)).get(1), MISSING)
+        # Fields without a column stay in the post's document, the rest is moved to the columns
+        self.assertEqual(posts.documents[0], {"subreddit": "stocks", "created_utc": 1700000000.0})
+        self.assertEqual(posts.documents[2], {"comments": "not a list", "model_output": {"other": {"label": "x"}}})
+        self.assertIsNone(posts.documents[3])
+
+    def test_round_trip_does_not_modify_posts(self):
+        """
+        Test the conversion leaves the original posts unchanged.
+        """
+        data = copy.deepcopy(self.test_data)
+        ColumnarPosts.from_dicts(data)
+        self.assertEqual(data, self.test_data)
+
+    def test_iter_dicts(self):
+        """
+        Test the posts are converted back chunk by chunk.
+        """
+        posts = ColumnarPosts.from_dicts(self.test_data)
+        self.assertEqual([len(chunk) for chunk in posts.iter_dicts(3)], [3, 1])
+        self.assertEqual([post for chunk in posts.iter_dicts(3) for post in chunk], self.test_data)
+
+    def test_tokens_share_vocabulary(self):
+        """
+        Test token lists are stored as ids of a shared vocabulary.
+        """
+        posts = ColumnarPosts.from_dicts([
+            {"transformed_data": {"title_tokens": ["stock", "moon"], "comments_tokens": [["moon"], []]}}])
+
+        self.assertEqual(posts.vocabulary.tokens, ["stock", "moon"])
+        self.assertEqual(list(posts.column(('transformed_data', 'comments_tokens')).ids), [1])
+        self.assertEqual(posts.column(('transformed_data', 'comments_tokens')).get(0), [["moon"], []])
+        self.assertEqual(list(posts.column(('transformed_data', 'title_tokens')).get_ids(0)), [0, 1])
+        self.assertEqual(list(posts.column(('transformed_data', 'selftext_tokens')).get_ids(0)), [])
+
+    def test_column_is_abstract(self):
+        """
+        Test a column must implement the abstract methods.
+        """
+        class IncompleteColumn(Column):
+            def accepts(self, value):
+                return True
+
+        with self.assertRaises(TypeError):
+            IncompleteColumn()
+
+    def test_pipe_converts_at_boundary(self):
+        """
+        Test the columnar pipe converts the data from and to dicts for filters using get_data and set_data.
+        """
+        pipe = ColumnarPipe()
+        pipe.set_data(self.test_data)
+
+        self.assertIsInstance(pipe.get_columns(), ColumnarPosts)
+        self.assertEqual(pipe.get_data(), self.test_data)
+
+    @patch('src.datamanagement.filters.tokenization_filter.word_tokenize', side_effect=str.split)
+    def test_preprocessing_matches_dicts(self, mock_tokenize):
+        """
+        Test preprocessing in columnar form yields the same posts as in dict form.
+        """
+        for backend in ('nltk', 'fast'):
+            preprocessing_filter = PreprocessingFilter(tokenization_filter=TokenizationFilter(backend=backend))
+
+            pipe = Pipe()
+            pipe.set_data(copy.deepcopy(self.test_data))
+            preprocessing_filter.execute(pipe)
+
+            columnar_pipe = ColumnarPipe()
+            columnar_pipe.set_data(self.test_data)
+            preprocessing_filter.execute(columnar_pipe)
+
+            self.assertEqual(columnar_pipe.get_data(), pipe.get_data())
+
+    def test_vader_matches_dicts(self):
+        """
+        Test VADER scoring in columnar form yields the same posts as in dict form.
+        """
+        model = VaderSentimentAnalysis()
+
+        expected = model.apply(copy.deepcopy(self.test_data))
+        posts = model.apply_columns(ColumnarPosts.from_dicts(self.test_data))
+
+        self.assertEqual(posts.to_dicts(), expected)
+        self.assertEqual(len(posts.column(('model_output', 'vader', 'comments_sentiment')).items), 3)
+
+    def test_transformation_default_converts(self):
+        """
+        Test models without columnar support are applied to the posts converted to dicts.
+        """
+        class LabelModel(Transformation):
+            """Model labelling each post."""
+            def apply(self, data):
+                for post in data:
+                    post['label'] = 'positive'
+                return data
+
+        posts = LabelModel().apply_columns(ColumnarPosts.from_dicts(self.test_data))
+
+        self.assertEqual(posts.to_dicts(), [{**post, 'label': 'positive'} for post in self.test_data])
+
+
+if __name__ == '__main__':
+    unittest.main()
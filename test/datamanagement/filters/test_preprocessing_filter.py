@@ -0,0 +1,100 @@
+"""Module for Test Preprocessing Filter."""
+import copy
+import unittest
+from unittest.mock import MagicMock, patch
+from src.datamanagement.filters import (Pipe, PreprocessingFilter, TextCleaningFilter, TokenizationFilter,
+                                        StopWordFilter)
+
+
+class TestPreprocessingFilter(unittest.TestCase):
+    """
+    Test class for Preprocessing Filter Unit Testing.
+    """
+    # pylint: disable=abstract-class-instantiated, unused-variable, too-few-public-methods
+
+    def setUp(self):
+        """
+        Set up method to define test variables.
+        """
+        mock_stopwords = MagicMock()
+        mock_stopwords.words.return_value = ['this', 'is', 'a', 'the', 'with']
+        stopwords_patcher = patch('src.datamanagement.filters.stopword_filter.stopwords', new=mock_stopwords)
+        tokenize_patcher = patch('src.datamanagement.filters.tokenization_filter.word_tokenize',
+                                 side_effect=str.split)
+        stopwords_patcher.start()
+        tokenize_patcher.start()
+        self.addCleanup(stopwords_patcher.stop)
+        self.addCleanup(tokenize_patcher.stop)
+
+        self.test_data = [
+            {
+                "selftext": "This is a TEST!",
+                "title": "Test TITLE, with the punctuation...",
+                "comments": ["Great Post!", "", "The end?!"]
+            },
+            {
+                "title": "Only a title"
+            },
+            {
+                "comments": "not a list",
+                "transformed_data": {
+                    "comments": ["already cleaned with stop words"],
+                    "selftext_tokens": ["this", "token"]
+                }
+            },
+            {}
+        ]
+
+    def execute_filters(self, filters, data):
+        """
+        Executes the given filters on a copy of the data, in order.
+
+        :param filters: The filters to execute.
+        :param data: The data to filter.
+        :return: The filtered data.
+        """
+        pipe = Pipe()
+        pipe.set_data(copy.deepcopy(data))
+        for pipe_filter in filters:
+            pipe_filter.execute(pipe)
+        return pipe.get_data()
+
+    def test_matches_filter_sequence(self):
+        """
+        Method to test that the fused filter produces the output of the three filters, key order included.
+        """
+        expected = self.execute_filters([TextCleaningFilter(), TokenizationFilter(), StopWordFilter()],
+                                        self.test_data)
+        result = self.execute_filters([PreprocessingFilter()], self.test_data)
+
+        self.assertEqual(result, expected)
+        for post, expected_post in zip(result, expected):
+            self.assertEqual(list(post['transformed_data']), list(expected_post['transformed_data']))
+
+    def test_preprocessing(self):
+        """
+        Method to test cleaning, tokenization and stop word removal of a post.
+        """
+        result = self.execute_filters([PreprocessingFilter()], self.test_data[:1])
+
+        transformed_data = result[0]['transformed_data']
+        self.assertEqual(transformed_data['selftext'], "this is a test")
+        self.assertEqual(transformed_data['selftext_tokens'], ["test"])
+        self.assertEqual(transformed_data['title_tokens'], ["test", "title", "punctuation"])
+        self.assertEqual(transformed_data['comments_tokens'], [["great", "post"], [], ["end"]])
+
+    def test_uses_given_filters(self):
+        """
+        Method to test that the steps of the given filters are used.
+        """
+        tokenization_filter = TokenizationFilter()
+        with patch.object(tokenization_filter, 'tokenize', return_value=["token"]) as mock_tokenize:
+            result = self.execute_filters([PreprocessingFilter(tokenization_filter=tokenization_filter)],
+                                          self.test_data[1:2])
+
+        mock_tokenize.assert_called_once_with("only a title")
+        self.assertEqual(result[0]['transformed_data']['title_tokens'], ["token"])
+
+
+if __name__ == '__main__':
+    unittest.main()
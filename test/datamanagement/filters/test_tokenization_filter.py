@@ -1,6 +1,8 @@
 """Module for Test Tokenization Filter."""
 import unittest
-from src.datamanagement.filters import Pipe, TokenizationFilter
+from unittest.mock import patch
+from nltk.tokenize import word_tokenize
+from src.datamanagement.filters import Pipe, TokenizationFilter, TextCleaningFilter
 
 
 class TestTokenizationFilter(unittest.TestCase):
@@ -34,6 +36,18 @@ class TestTokenizationFilter(unittest.TestCase):
             }
         ]
         self.filter = TokenizationFilter()
+        self.fast_filter = TokenizationFilter(backend='fast')
+        self.corpus = [
+            "This is a TEST!",
+            "I cannot believe it's not butter... gonna buy more, gotta say: wanna try?",
+            "Gimme a sec, lemme check -- CANNOT find it. Whaddya think? 'Tis fine.",
+            "Prices up 1,000% on r/wallstreetbets_daily!!! $GME to the moon 🚀🚀",
+            "Café naïve façade: ünïcödé wörds, ª and ²3 and ﬁ",
+            "can not, can't, gon na, wan na",
+            "   lots   of\twhitespace\n\nand newlines  ",
+            "",
+            "!!!"
+        ]
 
     def test_valid_text(self):
         """
@@ -63,6 +77,49 @@ class TestTokenizationFilter(unittest.TestCase):
             self.assertEqual(
                 result['transformed_data'], {})
 
+    def test_fast_backend_matches_word_tokenize(self):
+        """
+        Method to test that the fast backend produces the tokens of word_tokenize on cleaned text.
+        Sentence splitting is skipped, as cleaned text has no sentence-ending punctuation.
+        """
+        cleaning_filter = TextCleaningFilter()
+        for text in self.corpus:
+            cleaned_text = cleaning_filter.clean_text(text)
+            with self.subTest(text=cleaned_text):
+                self.assertEqual(self.fast_filter.tokenize(cleaned_text),
+                                 word_tokenize(cleaned_text, preserve_line=True))
+
+    def test_fast_backend_splits_contractions(self):
+        """
+        Method to test the cleaned words where word_tokenize differs from splitting on spaces.
+        """
+        text = "i cannot gimme gonna gotta lemme wanna CANNOT cannot_x cannots"
+
+        self.assertNotEqual(text.split(), word_tokenize(text, preserve_line=True))
+        self.assertEqual(self.fast_filter.tokenize(text), [
+            "i", "can", "not", "gim", "me", "gon", "na", "got", "ta", "lem", "me", "wan", "na",
+            "CAN", "NOT", "cannot_x", "cannots"
+        ])
+
+    def test_fast_backend_falls_back_on_raw_text(self):
+        """
+        Method to test that text which is not cleaned is tokenized with word_tokenize.
+        """
+        with patch('src.datamanagement.filters.tokenization_filter.word_tokenize',
+                   return_value=["raw"]) as mock_tokenize:
+            self.assertEqual(self.fast_filter.tokenize("this test"), ["this", "test"])
+            self.assertEqual(self.fast_filter.tokenize("This is a TEST!"), ["raw"])
+            self.assertEqual(self.fast_filter.tokenize(" two  spaces"), ["raw"])
+
+        self.assertEqual(mock_tokenize.call_count, 2)
+
+    def test_unknown_backend(self):
+        """
+        Method to test that an unknown backend is rejected.
+        """
+        with self.assertRaises(ValueError):
+            TokenizationFilter(backend='spacy')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,10 @@
 """Module for Test ELT"""
 import unittest
 from unittest.mock import patch, MagicMock
+from src.datamanagement.dataclient.data_client import PartialWriteError
 from src.datamanagement.dataclient.data_client_config import DataClientConfig
 from src.datamanagement.elt import ELT
+from src.datamanagement.transformationmodels import ModelRegistry
 
 
 class TestELT(unittest.TestCase):
@@ -27,31 +29,42 @@ class TestELT(unittest.TestCase):
         self.elt = ELT(self.source_db_config,
                        self.target_db_config, self.transformations)
 
-    @patch('src.datamanagement.elt.VaderSentimentAnalysis')
-    @patch('src.datamanagement.elt.TextBlobSentimentAnalysis')
-    def test_get_models(self, mock_vader, mock_textblob):
+        # Register mock models in a registry of the test's own
+        self.mock_vader = MagicMock()
+        self.mock_textblob = MagicMock()
+        self.registry = ModelRegistry()
+        self.registry.register('vader', self.mock_vader)
+        self.registry.register('textblob', self.mock_textblob)
+        patcher = patch('src.datamanagement.elt.model_registry', self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_models(self):
         """
         Test get_models() returns the correct transformation objects.
         """
-        models = self.elt.get_models(self.transformations)
-        self.assertEqual(len(models), 2)
-        self.assertIsInstance(models[0], MagicMock)
-        self.assertIsInstance(models[1], MagicMock)
+        models = self.elt.get_models(self.transformations + ['unknown'])
+        self.assertEqual(models, [self.mock_vader.return_value, self.mock_textblob.return_value])
+
+    def test_get_models_reuses_instances(self):
+        """
+        Test get_models() reuses the model instances of earlier calls.
+        """
+        self.elt.get_models(self.transformations)
+        self.elt.get_models(self.transformations)
+        self.mock_vader.assert_called_once_with()
+        self.mock_textblob.assert_called_once_with()
 
     @patch('src.datamanagement.filters.pipe_filter.Pipe')
-    @patch('src.datamanagement.elt.TextCleaningFilter')
-    @patch('src.datamanagement.elt.TokenizationFilter')
-    @patch('src.datamanagement.elt.StopWordFilter')
-    def test_preprocess(self, mock_stopword, mock_tokenization, mock_cleaning, mock_pipe):
+    @patch('src.datamanagement.elt.PreprocessingFilter')
+    def test_preprocess(self, mock_preprocessing, mock_pipe):
         """
-        Test preprocess() applies filters to the raw data.
+        Test preprocess() applies the fused preprocessing filter to the raw data.
         """
         raw_data = [{'selftext': 'Test text'}]
         mock_pipe_instance = mock_pipe.return_value
         self.elt.preprocess(raw_data)
-        mock_cleaning().execute.assert_called_once_with(mock_pipe_instance)
-        mock_tokenization().execute.assert_called_once_with(mock_pipe_instance)
-        mock_stopword().execute.assert_called_once_with(mock_pipe_instance)
+        mock_preprocessing().execute.assert_called_once_with(mock_pipe_instance)
 
     @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
     def test_load(self, mock_get_db_client):
@@ -67,15 +80,13 @@ class TestELT(unittest.TestCase):
         self.assertEqual(data, [{'selftext': 'Test text'}])
         mock_client.close.assert_called_once()
 
-    @patch('src.datamanagement.elt.VaderSentimentAnalysis')
-    @patch('src.datamanagement.elt.TextBlobSentimentAnalysis')
-    def test_transform(self, mock_textblob, mock_vader):
+    def test_transform(self):
         """
         Test transform() applies the transformations to the data.
         """
         data = [{'selftext': 'Test text'}]
-        mock_vader_instance = mock_vader.return_value
-        mock_textblob_instance = mock_textblob.return_value
+        mock_vader_instance = self.mock_vader.return_value
+        mock_textblob_instance = self.mock_textblob.return_value
         transformed_data = self.elt.transform(data)
         mock_vader_instance.apply.assert_called_once_with(data)
         mock_textblob_instance.apply.assert_called_once_with(
@@ -137,6 +148,308 @@ class TestELT(unittest.TestCase):
         self.assertEqual(result, {'status': 'error',
                          'message': 'Unexpected error'})
 
+    def test_invalid_batch_size(self):
+        """
+        Test that a non-positive batch size is rejected.
+        """
+        with self.assertRaises(ValueError):
+            ELT(self.source_db_config, self.target_db_config,
+                self.transformations, batch_size=0)
+
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    def test_load_batches(self, mock_get_db_client):
+        """
+        Test load_batches() streams batches from the source database and closes the client.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_client.load_data_in_batches.return_value = iter(
+            [[{'_id': 1}, {'_id': 2}], [{'_id': 3}]])
+        self.elt.batch_size = 2
+
+        batches = list(self.elt.load_batches())
+
+        mock_client.load_data_in_batches.assert_called_once_with(
+            2, filters=None, sort_field=None)
+        self.assertEqual(batches, [[{'_id': 1}, {'_id': 2}], [{'_id': 3}]])
+        mock_client.close.assert_called_once()
+
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.get_models')
+    @patch('src.datamanagement.elt.ELT.preprocess', side_effect=lambda batch: batch)
+    @patch('src.datamanagement.elt.ELT.load_batches')
+    def test_execute_in_batches(self, mock_load_batches, mock_preprocess,
+                                mock_get_models, mock_get_db_client):
+        """
+        Test execute() in streaming mode upserts each batch before the next one is processed.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_model = MagicMock()
+        mock_model.apply.side_effect = lambda batch: batch
+        mock_get_models.return_value = [mock_model]
+        mock_load_batches.return_value = iter([[{'_id': 1}, {'_id': 2}], [{'_id': 3}]])
+
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, batch_size=2)
+        result = elt.execute()
+
+        mock_get_models.assert_called_once()
+        self.assertEqual(mock_model.apply.call_count, 2)
+        self.assertEqual(mock_client.upsert_data.call_count, 2)
+        mock_client.upsert_data.assert_called_with([{'_id': 3}])
+        mock_client.close.assert_called_once()
+        self.assertEqual(result['status'], 'success')
+
+    @patch('src.datamanagement.elt.SentimentRollupStore')
+    @patch('src.datamanagement.elt.WatermarkStore')
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.get_models', return_value=[])
+    @patch('src.datamanagement.elt.ELT.preprocess', side_effect=lambda batch: batch)
+    @patch('src.datamanagement.elt.ELT.load_batches')
+    def test_execute_in_batches_partial_write(self, mock_load_batches, mock_preprocess, mock_get_models,
+                                              mock_get_db_client, mock_watermark_store_class,
+                                              mock_rollup_store_class):
+        """
+        Test execute() stops before advancing the watermark past documents that failed to be written,
+        only adding the written documents to the rollups.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_client.load_data.return_value = [{'_id': 3, 'keywords': ['apple']}]
+        mock_client.upsert_data.side_effect = [None, PartialWriteError([4], [])]
+        mock_watermark_store_class.return_value.get.return_value = None
+        mock_load_batches.return_value = iter([[{'_id': 1}, {'_id': 2}], [{'_id': 3}, {'_id': 4}], [{'_id': 5}]])
+
+        elt = ELT(self.source_db_config, self.target_db_config, self.transformations,
+                  batch_size=2, incremental=True, rollups=True)
+        result = elt.execute()
+
+        self.assertEqual(result, {'status': 'error', 'message': '1 documents failed to be written.'})
+        self.assertEqual(mock_client.upsert_data.call_count, 2)
+        mock_watermark_store_class.return_value.set.assert_called_once_with(
+            mock_watermark_store_class.build_key.return_value, '_id', 2)
+        mock_rollup_store = mock_rollup_store_class.return_value
+        self.assertEqual(mock_rollup_store.update.call_count, 2)
+        mock_rollup_store.update.assert_called_with([{'_id': 3}], [{'_id': 3, 'keywords': ['apple']}])
+        mock_rollup_store.set_coverage.assert_not_called()
+
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.get_models')
+    @patch('src.datamanagement.elt.ELT.preprocess', side_effect=lambda batch: batch)
+    @patch('src.datamanagement.elt.ELT.load_batches')
+    def test_execute_in_batches_commits_models(self, mock_load_batches, mock_preprocess,
+                                               mock_get_models, mock_get_db_client):
+        """
+        Test execute() resets the models before a full rebuild, commits them after every stored batch,
+        and rolls them back when a batch fails to be stored.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_client.upsert_data.side_effect = [None, PartialWriteError([3], [])]
+        mock_model = MagicMock()
+        mock_model.apply.side_effect = lambda batch: batch
+        mock_get_models.return_value = [mock_model]
+        mock_load_batches.return_value = iter([[{'_id': 1}, {'_id': 2}], [{'_id': 3}]])
+
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, batch_size=2)
+        result = elt.execute(full_rebuild=True)
+
+        self.assertEqual(result['status'], 'error')
+        self.assertEqual([call[0] for call in mock_model.method_calls if call[0] != 'apply'],
+                         ['reset', 'commit', 'rollback'])
+
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.get_models', return_value=[])
+    @patch('src.datamanagement.elt.ELT.load_batches', return_value=iter([]))
+    def test_execute_in_batches_no_data(self, mock_load_batches, mock_get_models,
+                                        mock_get_db_client):
+        """
+        Test execute() in streaming mode returns an error if no data is found.
+        """
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, batch_size=2)
+        result = elt.execute()
+        self.assertEqual(result, {'status': 'error',
+                         'message': 'No data found in source.'})
+
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.get_models')
+    @patch('src.datamanagement.elt.ELT.preprocess_columns', side_effect=lambda posts: posts)
+    @patch('src.datamanagement.elt.ELT.load_batches')
+    def test_execute_columnar(self, mock_load_batches, mock_preprocess_columns,
+                              mock_get_models, mock_get_db_client):
+        """
+        Test execute() in columnar mode transforms all posts at once and stores them chunk by chunk.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_model = MagicMock()
+        mock_model.apply_columns.side_effect = lambda posts: posts
+        mock_get_models.return_value = [mock_model]
+        mock_load_batches.return_value = iter([[{'_id': 1, 'title': 'a'}, {'_id': 2}], [{'_id': 3}]])
+
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, batch_size=2, columnar=True)
+        result = elt.execute()
+
+        mock_load_batches.assert_called_once_with(None, 2)
+        mock_model.apply_columns.assert_called_once()
+        self.assertEqual(len(mock_model.apply_columns.call_args[0][0]), 3)
+        self.assertEqual(mock_client.upsert_data.call_count, 2)
+        mock_client.upsert_data.assert_any_call([{'_id': 1, 'title': 'a'}, {'_id': 2}])
+        mock_client.upsert_data.assert_called_with([{'_id': 3}])
+        self.assertEqual(result['status'], 'success')
+
+    def test_columnar_rejects_processes(self):
+        """
+        Test columnar mode cannot be combined with worker processes.
+        """
+        with self.assertRaises(ValueError):
+            ELT(self.source_db_config, self.target_db_config,
+                self.transformations, processes=2, columnar=True)
+
+    @patch('src.datamanagement.elt.WatermarkStore')
+    def test_build_load_filters(self, mock_store_class):
+        """
+        Test build_load_filters() only selects documents past the watermark in incremental mode.
+        """
+        self.assertIsNone(self.elt.build_load_filters())
+
+        mock_store_class.return_value.get.return_value = 100
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, incremental=True, watermark_field='created_utc')
+
+        self.assertEqual(elt.build_load_filters(), {'created_utc': {'$gt': 100}})
+        self.assertIsNone(elt.build_load_filters(full_rebuild=True))
+
+        mock_store_class.return_value.get.return_value = None
+        self.assertIsNone(elt.build_load_filters())
+
+    @patch('src.datamanagement.elt.WatermarkStore')
+    def test_default_watermark_db(self, mock_store_class):
+        """
+        Test that watermarks are stored in the target database by default.
+        """
+        ELT(self.source_db_config, self.target_db_config,
+            self.transformations, incremental=True)
+        watermark_db = mock_store_class.call_args[0][0]
+        self.assertEqual(watermark_db.db_name, 'target_db')
+        self.assertEqual(watermark_db.collection, 'elt_watermarks')
+
+    @patch('src.datamanagement.elt.WatermarkStore')
+    @patch('src.datamanagement.elt.ELT.load')
+    @patch('src.datamanagement.elt.ELT.preprocess', side_effect=lambda data: data)
+    @patch('src.datamanagement.elt.ELT.transform', side_effect=lambda data: data)
+    @patch('src.datamanagement.elt.ELT.store')
+    def test_execute_incremental(self, mock_store, mock_transform, mock_preprocess,
+                                 mock_load, mock_store_class):
+        """
+        Test execute() in incremental mode loads past the watermark and advances it.
+        """
+        mock_watermark_store = mock_store_class.return_value
+        mock_watermark_store.get.return_value = 2
+        mock_store_class.build_key.return_value = 'source->target'
+        mock_load.return_value = [{'_id': 3}, {'_id': 5}, {'_id': 4}]
+
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, incremental=True)
+        result = elt.execute()
+
+        mock_load.assert_called_once_with({'_id': {'$gt': 2}})
+        mock_watermark_store.set.assert_called_once_with('source->target', '_id', 5)
+        self.assertEqual(result['status'], 'success')
+
+    @patch('src.datamanagement.elt.WatermarkStore')
+    @patch('src.datamanagement.elt.ELT.load', return_value=[])
+    def test_execute_incremental_no_new_data(self, mock_load, mock_store_class):
+        """
+        Test execute() in incremental mode succeeds without work if nothing is past the watermark.
+        """
+        mock_store_class.return_value.get.return_value = 2
+        elt = ELT(self.source_db_config, self.target_db_config,
+                  self.transformations, incremental=True)
+        result = elt.execute()
+
+        self.assertEqual(result, {'status': 'success',
+                         'message': 'No new data found in source.'})
+        mock_store_class.return_value.set.assert_not_called()
+
+    @patch('src.datamanagement.elt.SentimentRollupStore')
+    def test_default_rollup_db(self, mock_rollup_store_class):
+        """
+        Test the rollups are kept in the target database by default.
+        """
+        ELT(self.source_db_config, self.target_db_config, self.transformations, rollups=True)
+        rollup_db = mock_rollup_store_class.call_args[0][0]
+        self.assertEqual(rollup_db.db_name, 'target_db')
+        self.assertEqual(rollup_db.collection, 'sentiment_rollups')
+
+    @patch('src.datamanagement.elt.SentimentRollupStore')
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.load', return_value=[{'_id': 1}, {'_id': 2}])
+    @patch('src.datamanagement.elt.ELT.preprocess', side_effect=lambda data: data)
+    @patch('src.datamanagement.elt.ELT.transform', side_effect=lambda data: data)
+    @patch('src.datamanagement.elt.ELT.store')
+    def test_execute_updates_rollups(self, mock_store, mock_transform, mock_preprocess,
+                                     mock_load, mock_get_db_client, mock_rollup_store_class):
+        """
+        Test execute() replaces the previously stored versions of the posts in the rollups.
+        """
+        previous_data = [{'_id': 1, 'keywords': ['apple']}]
+        mock_get_db_client.return_value.load_data.return_value = previous_data
+
+        elt = ELT(self.source_db_config, self.target_db_config, self.transformations, rollups=True)
+        result = elt.execute()
+
+        self.assertEqual(result['status'], 'success')
+        mock_get_db_client.return_value.load_data.assert_called_once_with(
+            filters={'_id': {'$in': [1, 2]}})
+        mock_rollup_store = mock_rollup_store_class.return_value
+        mock_rollup_store.clear.assert_not_called()
+        mock_rollup_store.start_coverage.assert_called_once()
+        mock_rollup_store.set_coverage.assert_not_called()
+        mock_rollup_store.update.assert_called_once_with([{'_id': 1}, {'_id': 2}], previous_data)
+
+    @patch('src.datamanagement.elt.SentimentRollupStore')
+    @patch('src.datamanagement.dataclient.DataClientManager.get_database_client')
+    @patch('src.datamanagement.elt.ELT.load', return_value=[{'_id': 1}])
+    @patch('src.datamanagement.elt.ELT.preprocess', side_effect=lambda data: data)
+    @patch('src.datamanagement.elt.ELT.transform', side_effect=lambda data: data)
+    @patch('src.datamanagement.elt.ELT.store')
+    def test_execute_full_rebuild_rebuilds_rollups(self, mock_store, mock_transform, mock_preprocess,
+                                                   mock_load, mock_get_db_client, mock_rollup_store_class):
+        """
+        Test execute() with a full rebuild clears the rollups and adds every post again.
+        """
+        elt = ELT(self.source_db_config, self.target_db_config, self.transformations, rollups=True)
+        elt.execute(full_rebuild=True)
+
+        mock_rollup_store = mock_rollup_store_class.return_value
+        mock_rollup_store.clear.assert_called_once()
+        mock_rollup_store.update.assert_called_once_with([{'_id': 1}], [])
+        mock_rollup_store.set_coverage.assert_called_once_with('')
+        mock_get_db_client.return_value.load_data.assert_not_called()
+
+    @patch('src.datamanagement.elt.ParallelTransformationExecutor')
+    def test_transform_in_processes(self, mock_executor_class):
+        """
+        Test transform() shards the posts across worker processes and shuts them down once done.
+        """
+        elt = ELT(self.source_db_config, self.target_db_config, self.transformations,
+                  processes=4, model_options={'vader': {'option': 1}})
+        mock_executor = mock_executor_class.return_value
+        mock_executor.transform.return_value = [{'transformed': True}]
+
+        result = elt.transform([{'raw': True}])
+
+        self.assertEqual(result, [{'transformed': True}])
+        mock_executor_class.assert_called_once_with(
+            [(self.mock_vader, {'option': 1}), (self.mock_textblob, {})], processes=4)
+        elt.close_executor()
+        mock_executor.close.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
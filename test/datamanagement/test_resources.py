@@ -0,0 +1,145 @@
+"""Module for Test ResourceManager"""
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+from src.datamanagement.resources import ResourceManager, ResourceUnavailableError
+from src.datamanagement.provision import main
+
+
+class TestResourceManager(unittest.TestCase):
+    """
+    Unit test class for ResourceManager.
+    """
+    # pylint: disable=arguments-differ, unused-variable, unused-argument, too-few-public-methods
+
+    @patch.object(ResourceManager, 'download')
+    @patch.object(ResourceManager, 'is_available', return_value=False)
+    def test_offline_fails_fast(self, mock_is_available, mock_download):
+        """
+        Test ensure() raises a clear error for a missing resource in offline mode, without downloading it.
+        """
+        manager = ResourceManager(offline=True)
+
+        with self.assertRaises(ResourceUnavailableError) as context:
+            manager.ensure('stopwords')
+
+        self.assertIn('stopwords', str(context.exception))
+        self.assertIn('python -m datamanagement.provision', str(context.exception))
+        mock_download.assert_not_called()
+
+    @patch.dict(os.environ, {'DM_OFFLINE': '1'})
+    def test_offline_from_environment(self):
+        """
+        Test the offline mode defaults to the DM_OFFLINE environment variable.
+        """
+        self.assertTrue(ResourceManager().offline)
+        self.assertFalse(ResourceManager(offline=False).offline)
+
+    @patch.object(ResourceManager, 'download')
+    @patch.object(ResourceManager, 'is_available', side_effect=[False, True])
+    def test_ensure_downloads_once(self, mock_is_available, mock_download):
+        """
+        Test ensure() downloads a missing resource once per process.
+        """
+        manager = ResourceManager(offline=False)
+
+        manager.ensure('wordnet')
+        manager.ensure('wordnet')
+
+        mock_download.assert_called_once_with('wordnet')
+        self.assertEqual(mock_is_available.call_count, 2)
+
+    @patch.object(ResourceManager, 'ensure')
+    def test_call_does_not_check_installed_resources(self, mock_ensure):
+        """
+        Test call() runs the function directly while the resource is installed.
+        """
+        manager = ResourceManager(offline=False)
+
+        self.assertEqual(manager.call('stopwords', lambda language: [language], 'english'), ['english'])
+        mock_ensure.assert_not_called()
+
+    @patch.object(ResourceManager, 'ensure')
+    def test_call_provides_missing_resource(self, mock_ensure):
+        """
+        Test call() provides a missing resource and calls the function again.
+        """
+        manager = ResourceManager(offline=False)
+        function = MagicMock(side_effect=[LookupError("missing"), ['the']])
+
+        self.assertEqual(manager.call('stopwords', function, 'english'), ['the'])
+        mock_ensure.assert_called_once_with('stopwords')
+        self.assertEqual(function.call_count, 2)
+
+    @patch.object(ResourceManager, 'ensure')
+    def test_call_spacy_model(self, mock_ensure):
+        """
+        Test call() treats an OSError as a missing spaCy pipeline.
+        """
+        manager = ResourceManager(offline=False)
+        function = MagicMock(side_effect=[OSError("E050"), 'nlp'])
+
+        self.assertEqual(manager.call('en_core_web_sm', function, 'en_core_web_sm'), 'nlp')
+        mock_ensure.assert_called_once_with('en_core_web_sm')
+
+    @patch.object(ResourceManager, 'download')
+    @patch.object(ResourceManager, 'is_available', side_effect=lambda resource: resource != 'wordnet')
+    def test_provision(self, mock_is_available, mock_download):
+        """
+        Test provision() only downloads the missing resources.
+        """
+        ResourceManager().provision()
+        mock_download.assert_called_once_with('wordnet')
+
+    @patch.object(ResourceManager, 'download')
+    @patch.object(ResourceManager, 'is_available', side_effect=lambda resource: resource != 'wordnet')
+    def test_main_check(self, mock_is_available, mock_download):
+        """
+        Test the provisioning command only reports the missing resources with --check.
+        """
+        self.assertEqual(main(['--check']), 1)
+        mock_download.assert_not_called()
+
+    def test_download_wraps_network_errors(self):
+        """
+        Test download() turns a failed download into a ResourceUnavailableError naming the provisioning command.
+        """
+        error = ConnectionError("Failed to resolve 'raw.githubusercontent.com'")
+        for resource, target in (('en_core_web_sm', 'spacy.cli.download'),
+                                 ('wordnet', 'src.datamanagement.resources.nltk.download')):
+            with self.subTest(resource=resource), patch(target, side_effect=error):
+                with self.assertRaises(ResourceUnavailableError) as context:
+                    ResourceManager.download(resource)
+
+                self.assertIn(resource, str(context.exception))
+                self.assertIn('python -m datamanagement.provision', str(context.exception))
+                self.assertIs(context.exception.__cause__, error)
+
+        with patch('spacy.cli.download', side_effect=SystemExit(1)):
+            with self.assertRaises(ResourceUnavailableError):
+                ResourceManager.download('en_core_web_sm')
+
+        with patch('src.datamanagement.resources.nltk.download', return_value=False):
+            with self.assertRaises(ResourceUnavailableError):
+                ResourceManager.download('wordnet')
+
+    def test_import_does_not_download(self):
+        """
+        Test importing the filters and models downloads nothing.
+        """
+        code = (
+            "import nltk, spacy.cli\n"
+            "def fail(*args, **kwargs): raise AssertionError('download on import')\n"
+            "nltk.download = spacy.cli.download = fail\n"
+            "import src.datamanagement\n"
+            "import src.datamanagement.transformationmodels.lda_topic_modeling\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=False)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
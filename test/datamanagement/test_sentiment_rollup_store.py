@@ -0,0 +1,166 @@
+"""Module for Test SentimentRollupStore"""
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+from src.datamanagement.dataclient.data_client_config import DataClientConfig
+from src.datamanagement.sentiment_rollup_store import SentimentRollupStore
+
+
+class TestSentimentRollupStore(unittest.TestCase):
+    """
+    Unit test class for SentimentRollupStore.
+    """
+    # pylint: disable=arguments-differ, unused-variable, unused-argument, too-few-public-methods
+
+    def setUp(self):
+        """
+        Set up mock configurations and SentimentRollupStore instance.
+        """
+        self.db_config = DataClientConfig(
+            db_type="mongodb", uri="mongodb://localhost", db_name="target_db",
+            collection="sentiment_rollups"
+        )
+        self.store = SentimentRollupStore(self.db_config, timezone='UTC')
+        self.created_utc = datetime(2024, 5, 1, 12, tzinfo=timezone.utc).timestamp()
+        self.post = {
+            '_id': 1, 'created_utc': self.created_utc, 'keywords': ['apple', 'iphone', 'apple'],
+            'normalized_scores': {
+                'vader': {'title_sentiment': 75.0, 'comments_sentiment': 40.0, 'comments_count': 2},
+                'textblob': {'title_sentiment': 50.0}
+            }
+        }
+
+    def test_build_key(self):
+        """
+        Test build_key() identifies the keyword, day and set of models.
+        """
+        self.assertEqual(SentimentRollupStore.build_key('apple', '2024-05-01', ['textblob', 'vader']),
+                         'apple|2024-05-01|textblob,vader')
+
+    def test_build_increments(self):
+        """
+        Test build_increments() adds each post once to the rollup of each of its keywords.
+        """
+        increments, defaults = self.store.build_increments([self.post, self.post])
+
+        key = 'apple|2024-05-01|textblob,vader'
+        self.assertEqual(set(increments), {key, 'iphone|2024-05-01|textblob,vader'})
+        self.assertEqual(increments[key], {
+            'count': 2,
+            'sums.textblob.title_sentiment': 100.0,
+            'counts.textblob.title_sentiment': 2,
+            'sums.vader.title_sentiment': 150.0,
+            'counts.vader.title_sentiment': 2,
+            'sums.vader.comments_sentiment': 80.0,
+            'counts.vader.comments_sentiment': 2
+        })
+        self.assertEqual(defaults[key], {'keyword': 'apple', 'day': '2024-05-01',
+                                         'models': ['textblob', 'vader']})
+
+    def test_build_increments_skips_posts_without_keywords(self):
+        """
+        Test build_increments() leaves out posts without keywords or creation time.
+        """
+        increments, defaults = self.store.build_increments([
+            {'_id': 1, 'created_utc': self.created_utc, 'keywords': []},
+            {'_id': 2, 'keywords': ['apple']}
+        ])
+        self.assertEqual(increments, {})
+
+    @patch('src.datamanagement.sentiment_rollup_store.DataClientManager.get_database_client')
+    def test_update_replaces_previous_versions(self, mock_get_db_client):
+        """
+        Test update() removes the previously stored version of a post from the rollups.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        previous_post = {**self.post, 'keywords': ['apple'],
+                         'normalized_scores': {'vader': {'title_sentiment': 25.0}}}
+
+        self.store.update([self.post], [previous_post])
+
+        increments, defaults = mock_client.increment_data.call_args[0]
+        self.assertEqual(increments['apple|2024-05-01|vader'],
+                         {'count': -1, 'sums.vader.title_sentiment': -25.0, 'counts.vader.title_sentiment': -1})
+        self.assertEqual(increments['apple|2024-05-01|textblob,vader']['count'], 1)
+        self.assertIn('apple|2024-05-01|vader', defaults)
+        mock_client.close.assert_called_once()
+
+    @patch('src.datamanagement.sentiment_rollup_store.DataClientManager.get_database_client')
+    def test_update_unchanged_post(self, mock_get_db_client):
+        """
+        Test update() leaves the rollups unchanged when a post is reprocessed as is.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+
+        self.store.update([self.post], [self.post])
+
+        increments, _ = mock_client.increment_data.call_args[0]
+        for fields in increments.values():
+            self.assertTrue(all(amount == 0 for amount in fields.values()))
+
+    @patch('src.datamanagement.sentiment_rollup_store.DataClientManager.get_database_client')
+    def test_update_no_posts(self, mock_get_db_client):
+        """
+        Test update() does not connect to the database without posts to add.
+        """
+        self.store.update([])
+        mock_get_db_client.assert_not_called()
+
+    def test_build_increments_in_timezone(self):
+        """
+        Test build_increments() formats the days in the configured timezone.
+        """
+        store = SentimentRollupStore(self.db_config, timezone='Asia/Singapore')
+        post = {**self.post, 'created_utc': datetime(2024, 5, 1, 20, tzinfo=timezone.utc).timestamp()}
+
+        increments, _ = store.build_increments([post])
+
+        self.assertIn('apple|2024-05-02|textblob,vader', increments)
+
+    @patch('src.datamanagement.sentiment_rollup_store.DataClientManager.get_database_client')
+    def test_start_coverage(self, mock_get_db_client):
+        """
+        Test start_coverage() records that the rollups cover the days from tomorrow on, unless already recorded.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_client.load_data.return_value = []
+
+        self.store.start_coverage()
+
+        tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).strftime('%Y-%m-%d')
+        mock_client.load_data.assert_called_once_with(filters={'_id': 'coverage'})
+        score_ranges = {'vader': [-1, 1], 'textblob': [-1, 1]}
+        mock_client.upsert_data.assert_called_once_with(
+            [{'_id': 'coverage', 'since': tomorrow, 'score_ranges': score_ranges}])
+
+        mock_client.reset_mock()
+        mock_client.load_data.return_value = [{'_id': 'coverage', 'since': '', 'score_ranges': score_ranges}]
+        self.store.start_coverage()
+        mock_client.upsert_data.assert_not_called()
+
+        # The coverage restarts if the rollups were normalized with other score ranges
+        mock_client.load_data.return_value = [
+            {'_id': 'coverage', 'since': '', 'score_ranges': {'vader': [-2, 2], 'textblob': [-1, 1]}}]
+        self.store.start_coverage()
+        mock_client.upsert_data.assert_called_once_with(
+            [{'_id': 'coverage', 'since': tomorrow, 'score_ranges': score_ranges}])
+
+    @patch('src.datamanagement.sentiment_rollup_store.DataClientManager.get_database_client')
+    def test_clear(self, mock_get_db_client):
+        """
+        Test clear() deletes every rollup.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+
+        self.store.clear()
+
+        mock_client.delete_data.assert_called_once_with()
+        mock_client.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Module for Test WatermarkStore"""
+import unittest
+from unittest.mock import patch, MagicMock
+from src.datamanagement.dataclient.data_client_config import DataClientConfig
+from src.datamanagement.watermark_store import WatermarkStore
+
+
+class TestWatermarkStore(unittest.TestCase):
+    """
+    Unit test class for WatermarkStore.
+    """
+    # pylint: disable=arguments-differ, unused-variable, unused-argument, too-few-public-methods
+
+    def setUp(self):
+        """
+        Set up mock configurations and WatermarkStore instance.
+        """
+        self.db_config = DataClientConfig(
+            db_type="mongodb", uri="mongodb://localhost", db_name="target_db",
+            collection="elt_watermarks"
+        )
+        self.store = WatermarkStore(self.db_config)
+
+    def test_build_key(self):
+        """
+        Test build_key() identifies the source/target pair.
+        """
+        source = DataClientConfig("mongodb", "mongodb://localhost", "db", "raw")
+        target = DataClientConfig("mongodb", "mongodb://localhost", "db", "transformed")
+        self.assertEqual(WatermarkStore.build_key(source, target), "db.raw->db.transformed")
+
+    @patch('src.datamanagement.watermark_store.DataClientManager.get_database_client')
+    def test_get(self, mock_get_db_client):
+        """
+        Test get() returns the stored watermark value for the matching field.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+        mock_client.load_data.return_value = [{'_id': 'key', 'field': '_id', 'value': 42}]
+
+        self.assertEqual(self.store.get('key', '_id'), 42)
+        mock_get_db_client.assert_called_once_with(self.db_config)
+        mock_client.load_data.assert_called_once_with(filters={'_id': 'key'})
+        mock_client.close.assert_called_once()
+
+    @patch('src.datamanagement.watermark_store.DataClientManager.get_database_client')
+    def test_get_missing_or_other_field(self, mock_get_db_client):
+        """
+        Test get() returns None if no watermark exists or it was recorded for another field.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+
+        mock_client.load_data.return_value = []
+        self.assertIsNone(self.store.get('key', '_id'))
+
+        mock_client.load_data.return_value = [{'_id': 'key', 'field': 'created_utc', 'value': 1}]
+        self.assertIsNone(self.store.get('key', '_id'))
+
+    @patch('src.datamanagement.watermark_store.DataClientManager.get_database_client')
+    def test_set(self, mock_get_db_client):
+        """
+        Test set() upserts the watermark document.
+        """
+        mock_client = MagicMock()
+        mock_get_db_client.return_value = mock_client
+
+        self.store.set('key', 'created_utc', 1700000000)
+
+        mock_client.upsert_data.assert_called_once_with(
+            [{'_id': 'key', 'field': 'created_utc', 'value': 1700000000}])
+        mock_client.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,12 @@
 """Module for Test LDA Topic Modeling"""
+import os
+import tempfile
 import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+import numpy as np
+from gensim import corpora
+from src.datamanagement.filters import ColumnarPosts
 from src.datamanagement.transformationmodels import LDATopicModeling
 
 
@@ -60,5 +67,313 @@ class TestLDATopicModeling(unittest.TestCase):
             self.assertEqual(len(post["keywords"]), 0)  # Ensure no keywords are generated
 
 
+class TestLDATopicModelingCorpusMode(unittest.TestCase):
+    """
+    Test class for the corpus mode of LDATopicModeling.
+    """
+
+    def setUp(self):
+        """
+        Method to define test variables, without the NLP models that preprocessing requires.
+        """
+        patcher = patch('src.datamanagement.transformationmodels.lda_topic_modeling.spacy.load')
+        mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_load.return_value.pipe.side_effect = lambda texts, **kwargs: [SimpleNamespace(ents=[]) for _ in texts]
+        patcher = patch.object(LDATopicModeling, 'preprocess_text',
+                               side_effect=lambda tokens, named_entities: tokens)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.model_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.model_dir.cleanup)
+        self.model_path = os.path.join(self.model_dir.name, "lda.model")
+
+    @staticmethod
+    def build_post(subreddit, tokens):
+        """
+        Builds a post with the given tokens in its title.
+        """
+        return {
+            "subreddit": subreddit,
+            "transformed_data": {"selftext_tokens": [], "title_tokens": tokens, "comments_tokens": []}
+        }
+
+    def test_corpus_mode_keywords(self):
+        """
+        Method to test that keywords are inferred from the post's own words with one shared model.
+        """
+        data = [
+            self.build_post("python", ["python", "programming", "language", "code", "python"]),
+            self.build_post("stocks", ["market", "shares", "price", "trading"]),
+            self.build_post("python", []),
+        ]
+        lda_modeling = LDATopicModeling(num_topics=2, passes=2, top_n_keywords=3, corpus_mode=True)
+
+        result = lda_modeling.apply(data)
+
+        self.assertIn("python", result[0]["keywords"])
+        self.assertTrue(set(result[0]["keywords"]) <= {"python", "programming", "language", "code"})
+        self.assertEqual(result[1]["keywords"][0], "stocks")
+        self.assertEqual(len(result[1]["keywords"]), 4)
+        self.assertTrue(set(result[1]["keywords"][1:]) <= {"market", "shares", "price", "trading"})
+        self.assertEqual(result[2]["keywords"], [])
+        self.assertEqual(len(lda_modeling.dictionary), 8)
+
+    def test_corpus_mode_persists_and_updates_model(self):
+        """
+        Method to test that a later run loads the persisted model and extends it with new words.
+        """
+        first_run = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True, model_path=self.model_path)
+        first_run.apply([self.build_post("python", ["python", "programming", "language"])])
+        self.assertFalse(os.path.exists(self.model_path))
+        first_run.commit()
+        self.assertTrue(os.path.exists(self.model_path))
+
+        second_run = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True, model_path=self.model_path)
+        result = second_run.apply([self.build_post("rust", ["rust", "programming", "borrow", "checker"])])
+
+        self.assertEqual(len(second_run.dictionary), 6)
+        self.assertEqual(second_run.lda_model.num_terms, 6)
+        self.assertEqual(second_run.lda_model.get_topics().shape, (2, 6))
+        self.assertIn("rust", result[0]["keywords"])
+        self.assertTrue(set(result[0]["keywords"]) <= {"rust", "programming", "borrow", "checker"})
+
+    def test_corpus_mode_rollback_and_reset(self):
+        """
+        Method to test that a rollback discards the training since the last commit, and that a reset
+        discards the persisted model.
+        """
+        lda_modeling = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True, model_path=self.model_path)
+        lda_modeling.apply([self.build_post("python", ["python", "programming", "language"])])
+        lda_modeling.commit()
+
+        lda_modeling.apply([self.build_post("rust", ["rust", "borrow", "checker"])])
+        lda_modeling.rollback()
+        self.assertIsNone(lda_modeling.lda_model)
+        lda_modeling.update_model([])
+        self.assertEqual(sorted(lda_modeling.dictionary.token2id), ["language", "programming", "python"])
+        self.assertEqual(lda_modeling.dictionary.num_docs, 1)
+
+        lda_modeling.reset()
+        self.assertIsNone(lda_modeling.lda_model)
+        self.assertFalse(os.path.exists(self.model_path))
+        self.assertFalse(os.path.exists(f"{self.model_path}.dictionary"))
+        lda_modeling.apply([self.build_post("rust", ["rust", "borrow", "checker"])])
+        self.assertEqual(sorted(lda_modeling.dictionary.token2id), ["borrow", "checker", "rust"])
+
+    def test_corpus_mode_limits_vocabulary(self):
+        """
+        Method to test that the dictionary keeps its ids while documents are added, and that the model
+        is rebuilt with the statistics of the remaining words once the vocabulary limit is reached.
+        """
+        lda_modeling = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True, max_vocabulary_size=5)
+        lda_modeling.apply([
+            self.build_post("python", ["python", "programming", "language"]),
+            self.build_post("python", ["python", "programming", "code"]),
+        ])
+        sstats = lda_modeling.lda_model.state.sstats
+        previous_sstats = {word: sstats[:, word_id] for word, word_id in lda_modeling.dictionary.token2id.items()}
+
+        lda_modeling.dictionary.add_documents([["python", "rust", "borrow"]], prune_at=None)
+        lda_modeling.extend_vocabulary()
+        lda_modeling.limit_vocabulary()
+
+        self.assertEqual(len(lda_modeling.dictionary), 5)
+        self.assertEqual(lda_modeling.lda_model.num_terms, 5)
+        self.assertEqual(lda_modeling.lda_model.get_topics().shape, (2, 5))
+        self.assertIn("python", lda_modeling.dictionary.token2id)
+        self.assertIn("programming", lda_modeling.dictionary.token2id)
+        for word in previous_sstats.keys() & lda_modeling.dictionary.token2id.keys():
+            word_id = lda_modeling.dictionary.token2id[word]
+            np.testing.assert_allclose(lda_modeling.lda_model.state.sstats[:, word_id], previous_sstats[word])
+
+        # The rebuilt model can be updated further
+        lda_modeling.update_model([["python", "checker", "compiler"]])
+        self.assertEqual(lda_modeling.lda_model.get_topics().shape, (2, 5))
+
+    def test_corpus_mode_does_not_prune_while_adding_documents(self):
+        """
+        Method to test that updating the model adds documents to the dictionary without pruning it.
+        """
+        lda_modeling = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True)
+        lda_modeling.apply([self.build_post("python", ["python", "programming", "language"])])
+        word_ids = dict(lda_modeling.dictionary.token2id)
+
+        with patch.object(corpora.Dictionary, 'add_documents', autospec=True,
+                          side_effect=corpora.Dictionary.add_documents) as mock_add_documents:
+            lda_modeling.update_model([["rust", "programming", "borrow"]])
+
+        self.assertIsNone(mock_add_documents.call_args.kwargs["prune_at"])
+        self.assertEqual({word: lda_modeling.dictionary.token2id[word] for word in word_ids}, word_ids)
+        self.assertEqual(lda_modeling.lda_model.num_terms, 5)
+
+    def test_corpus_mode_columns(self):
+        """
+        Method to test that posts in columnar form get the same keywords as in dict form, when their
+        tokens are processed in several chunks.
+        """
+        data = [
+            self.build_post("python", ["python", "programming", "language", "code", "python"]),
+            self.build_post("stocks", ["market", "shares", "price", "trading"]),
+            {"title": "no tokens"},
+            {"subreddit": "rust", "transformed_data": {"title_tokens": ["rust"], "comments_tokens": [["borrow"], []]}},
+        ]
+        # The models are seeded alike through NumPy's global random state
+        np.random.seed(1)
+        expected = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True).apply([dict(post) for post in data])
+
+        np.random.seed(1)
+        posts = LDATopicModeling(num_topics=2, passes=2, corpus_mode=True, columns_chunk_size=3).apply_columns(
+            ColumnarPosts.from_dicts(data))
+
+        self.assertEqual(posts.to_dicts(), expected)
+
+
+class TestLDATopicModelingNamedEntities(unittest.TestCase):
+    """
+    Test class for the batched named entity extraction of LDATopicModeling.
+    """
+
+    @patch('src.datamanagement.transformationmodels.lda_topic_modeling.spacy.load')
+    def test_load_ner_pipeline(self, mock_load):
+        """
+        Method to test that only the components named entity recognition needs are enabled.
+        """
+        nlp = mock_load.return_value
+        nlp.pipe_names = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner']
+        nlp.get_pipe.return_value.listening_components = ['tagger', 'parser']
+
+        lda_modeling = LDATopicModeling()
+        mock_load.assert_not_called()
+        self.assertIs(lda_modeling.nlp, nlp)
+        self.assertIs(lda_modeling.nlp, nlp)
+        mock_load.assert_called_once_with("en_core_web_sm")
+        nlp.select_pipes.assert_called_once_with(enable=['ner'])
+
+        nlp.select_pipes.reset_mock()
+        nlp.get_pipe.return_value.listening_components = ['ner']
+        self.assertIs(LDATopicModeling().nlp, nlp)
+        nlp.select_pipes.assert_called_once_with(enable=['tok2vec', 'ner'])
+
+    @patch('src.datamanagement.transformationmodels.lda_topic_modeling.spacy.load')
+    def test_extract_named_entities_batch(self, mock_load):
+        """
+        Method to test that texts are streamed through spaCy in batches and excluded labels are dropped.
+        """
+        def entity(text, label):
+            return SimpleNamespace(text=text, label_=label)
+
+        mock_load.return_value.pipe.return_value = [
+            SimpleNamespace(ents=[entity("Apple", "ORG"), entity("today", "DATE"), entity("Apple", "ORG")]),
+            SimpleNamespace(ents=[])
+        ]
+        lda_modeling = LDATopicModeling(ner_batch_size=128, ner_n_process=2)
+
+        result = lda_modeling.extract_named_entities_batch(["apple stock today", "nothing"])
+
+        self.assertEqual(result, [["Apple"], []])
+        mock_load.return_value.pipe.assert_called_once_with(
+            ["apple stock today", "nothing"], batch_size=128, n_process=2)
+
+
+
+class TestLDATopicModelingCorpusTfidf(unittest.TestCase):
+    """
+    Test class for the corpus TF-IDF filtering of LDATopicModeling.
+    """
+
+    def setUp(self):
+        """
+        Method to define test variables.
+        """
+        self.tfidf_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tfidf_dir.cleanup)
+        self.tfidf_path = os.path.join(self.tfidf_dir.name, "lda.model.tfidf")
+
+    def test_matches_per_post_filtering_on_single_post(self):
+        """
+        Method to test that corpus TF-IDF over a single post matches the per-post filtering.
+        """
+        documents = [
+            ["Apple", "stock", "market", "market", "Google Inc"],
+            ["word"] * 40 + ["rare"],
+            []
+        ]
+        for tokens in documents:
+            with self.subTest(tokens=tokens):
+                lda_modeling = LDATopicModeling(corpus_tfidf=True)
+                self.assertEqual(lda_modeling.apply_corpus_tfidf_filtering([tokens]),
+                                 [lda_modeling.apply_tfidf_filtering(tokens)])
+
+    def test_filters_words_common_to_the_corpus(self):
+        """
+        Method to test that a word present in every post is filtered out, unlike with per-post filtering.
+        """
+        documents = [["stock"] + [f"word{post}x{word}" for word in range(30)] for post in range(50)]
+        lda_modeling = LDATopicModeling(corpus_tfidf=True)
+        self.assertFalse(lda_modeling.parallelizable)
+
+        result = lda_modeling.apply_corpus_tfidf_filtering(documents)
+
+        self.assertIn("stock", lda_modeling.apply_tfidf_filtering(documents[0]))
+        for tokens, filtered_tokens in zip(documents, result):
+            self.assertNotIn("stock", filtered_tokens)
+            self.assertEqual(filtered_tokens, sorted(tokens[1:]))
+
+    def test_persists_document_frequencies(self):
+        """
+        Method to test that document frequencies accumulate across runs.
+        """
+        first_run = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        first_run.apply_corpus_tfidf_filtering([["stock", "market"], ["stock"]])
+        self.assertFalse(first_run.parallelizable)
+        self.assertFalse(os.path.exists(self.tfidf_path))
+        first_run.commit()
+
+        second_run = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        second_run.apply_corpus_tfidf_filtering([["bread"]])
+
+        self.assertEqual(second_run.tfidf_dictionary.num_docs, 3)
+        self.assertEqual(second_run.tfidf_dictionary.dfs[second_run.tfidf_dictionary.token2id["stock"]], 2)
+
+    def test_rollback_discards_uncommitted_document_frequencies(self):
+        """
+        Method to test that the posts counted since the last commit are not counted again on a retry.
+        """
+        lda_modeling = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        lda_modeling.apply_corpus_tfidf_filtering([["stock", "market"]])
+        lda_modeling.commit()
+
+        lda_modeling.apply_corpus_tfidf_filtering([["stock"]])
+        lda_modeling.rollback()
+        lda_modeling.apply_corpus_tfidf_filtering([["stock"]])
+        lda_modeling.commit()
+
+        persisted = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        persisted.load_tfidf()
+        self.assertEqual(persisted.tfidf_dictionary.num_docs, 2)
+        self.assertEqual(persisted.tfidf_dictionary.dfs[persisted.tfidf_dictionary.token2id["stock"]], 2)
+
+    def test_reset_discards_persisted_document_frequencies(self):
+        """
+        Method to test that a full rebuild counts every post from scratch.
+        """
+        first_run = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        first_run.apply_corpus_tfidf_filtering([["stock", "market"], ["stock"]])
+        first_run.commit()
+
+        second_run = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        second_run.reset()
+        self.assertFalse(os.path.exists(self.tfidf_path))
+        second_run.apply_corpus_tfidf_filtering([["stock", "market"], ["stock"]])
+        second_run.commit()
+
+        persisted = LDATopicModeling(corpus_tfidf=True, tfidf_path=self.tfidf_path)
+        persisted.load_tfidf()
+        self.assertEqual(persisted.tfidf_dictionary.num_docs, 2)
+        self.assertEqual(persisted.tfidf_dictionary.dfs[persisted.tfidf_dictionary.token2id["stock"]], 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+"""Module for Test Model Registry"""
+import subprocess
+import sys
+import os
+import unittest
+from importlib.metadata import EntryPoint
+from unittest.mock import patch, MagicMock
+from src.datamanagement.transformationmodels import ModelRegistry
+from src.datamanagement.transformationmodels.model_registry import ENTRY_POINT_GROUP
+
+
+class TestModelRegistry(unittest.TestCase):
+    """
+    Test class for ModelRegistry Unit Testing.
+    """
+
+    def setUp(self):
+        """
+        Method to define test variables.
+        """
+        self.registry = ModelRegistry()
+        patcher = patch('src.datamanagement.transformationmodels.model_registry.entry_points', return_value=[])
+        self.mock_entry_points = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_builtin_models(self):
+        """
+        Method to test that the built-in models are registered and imported on request.
+        """
+        self.assertEqual(self.registry.names(), ['lda', 'textblob', 'vader'])
+        self.assertEqual(self.registry.get_class('vader').__name__, 'VaderSentimentAnalysis')
+
+    def test_unknown_model(self):
+        """
+        Method to test that requesting an unknown model raises a KeyError.
+        """
+        self.assertFalse(self.registry.is_registered('unknown'))
+        with self.assertRaises(KeyError):
+            self.registry.get_class('unknown')
+
+    def test_get_model_caches_instances(self):
+        """
+        Method to test that instances are shared by the requests with the same keyword arguments.
+        """
+        model_class = MagicMock(side_effect=lambda **kwargs: MagicMock())
+        self.registry.register('custom', model_class)
+
+        model = self.registry.get_model('custom', {'option': {'nested': 1}})
+        self.assertIs(self.registry.get_model('custom', {'option': {'nested': 1}}), model)
+        self.assertIsNot(self.registry.get_model('custom'), model)
+        self.assertEqual(model_class.call_count, 2)
+
+        self.registry.clear_instances()
+        self.assertIsNot(self.registry.get_model('custom', {'option': {'nested': 1}}), model)
+
+    def test_register_import_path(self):
+        """
+        Method to test that a model registered by import path is imported on request.
+        """
+        self.registry.register('normalizer', 'src.datamanagement.transformationmodels.score_normalizer:ScoreNormalizer')
+
+        self.assertEqual(self.registry.get_class('normalizer').__name__, 'ScoreNormalizer')
+
+    def test_entry_points(self):
+        """
+        Method to test that models of the entry point group are registered, without overriding built-in models.
+        """
+        self.mock_entry_points.return_value = [
+            EntryPoint('normalizer', 'src.datamanagement.transformationmodels.score_normalizer:ScoreNormalizer',
+                       ENTRY_POINT_GROUP),
+            EntryPoint('vader', 'thirdparty.models:Vader', ENTRY_POINT_GROUP)
+        ]
+
+        self.assertTrue(self.registry.is_registered('normalizer'))
+        self.assertEqual(self.registry.get_class('normalizer').__name__, 'ScoreNormalizer')
+        self.assertEqual(self.registry.get_class('vader').__name__, 'VaderSentimentAnalysis')
+        self.mock_entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+
+    def test_vader_only_imports(self):
+        """
+        Method to test that requesting VADER does not import the libraries of the other models.
+        scikit-learn is left out, as NLTK imports it itself.
+        """
+        code = (
+            "import sys\n"
+            "from src.datamanagement.transformationmodels import model_registry\n"
+            "model_registry.get_class('vader')\n"
+            "print(sorted({'gensim', 'spacy', 'textblob'} & set(sys.modules)))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=False)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
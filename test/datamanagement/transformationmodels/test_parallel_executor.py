@@ -0,0 +1,108 @@
+"""Module for Test Parallel Transformation Executor"""
+import os
+import unittest
+from unittest.mock import patch
+from src.datamanagement.transformationmodels import ParallelTransformationExecutor, VaderSentimentAnalysis
+from src.datamanagement.transformationmodels.transformation import Transformation
+
+
+class ProcessIdModel(Transformation):
+    """
+    Model that records the process each post was transformed in.
+    """
+
+    def apply(self, data):
+        for post in data:
+            post.setdefault('pids', []).append(os.getpid())
+        return data
+
+
+class CorpusModel(ProcessIdModel):
+    """
+    Non-parallelizable model that records the number of posts it saw at once.
+    """
+    parallelizable = False
+
+    def apply(self, data):
+        for post in data:
+            post['corpus_size'] = len(data)
+        return super().apply(data)
+
+
+class TestParallelTransformationExecutor(unittest.TestCase):
+    """
+    Test class for ParallelTransformationExecutor Unit Testing.
+    """
+
+    def setUp(self):
+        """
+        Method to define test variables.
+        """
+        self.data = [
+            {"id": i, "title": title, "selftext": "", "comments": ["I love it", "I hate it"]}
+            for i, title in enumerate(["Great news!", "Terrible day.", "Okay I guess", "Best ever"] * 5)
+        ]
+
+    def test_transform_matches_serial(self):
+        """
+        Method to test that the parallel results match applying the model serially, in input order.
+        """
+        expected = VaderSentimentAnalysis().apply([dict(post) for post in self.data])
+
+        executor = ParallelTransformationExecutor([(VaderSentimentAnalysis, {})], processes=2, chunk_size=3)
+        try:
+            result = executor.transform([dict(post) for post in self.data], [VaderSentimentAnalysis()])
+        finally:
+            executor.close()
+
+        self.assertEqual([post["id"] for post in result], list(range(len(self.data))))
+        self.assertEqual([post["model_output"] for post in result], [post["model_output"] for post in expected])
+
+    def test_non_parallelizable_models_run_in_process(self):
+        """
+        Method to test that non-parallelizable models see every post in the calling process.
+        """
+        models = [ProcessIdModel(), CorpusModel(), ProcessIdModel()]
+        specs = [(ProcessIdModel, {}), (CorpusModel, {}), (ProcessIdModel, {})]
+
+        executor = ParallelTransformationExecutor(specs, processes=2, chunk_size=4)
+        try:
+            result = executor.transform(self.data, models)
+        finally:
+            executor.close()
+
+        self.assertEqual([post["id"] for post in result], list(range(len(self.data))))
+        for post in result:
+            self.assertEqual(post["corpus_size"], len(self.data))
+            self.assertNotEqual(post["pids"][0], os.getpid())
+            self.assertEqual(post["pids"][1], os.getpid())
+            self.assertNotEqual(post["pids"][2], os.getpid())
+
+    @patch('src.datamanagement.transformationmodels.parallel_executor.ProcessPoolExecutor')
+    def test_pool_spawns_workers(self, mock_pool_class):
+        """
+        Method to test that the workers are spawned instead of forked from the calling process.
+        """
+        executor = ParallelTransformationExecutor([(ProcessIdModel, {})], processes=2)
+
+        self.assertIs(executor.get_pool(), mock_pool_class.return_value)
+        self.assertEqual(mock_pool_class.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+
+    def test_split(self):
+        """
+        Method to test that posts are split evenly over four chunks per worker by default.
+        """
+        executor = ParallelTransformationExecutor([], processes=2)
+        chunks = executor.split(list(range(18)))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 3, 3, 3, 3])
+
+    def test_invalid_processes(self):
+        """
+        Method to test that invalid numbers of processes are rejected.
+        """
+        with self.assertRaises(ValueError):
+            ParallelTransformationExecutor([], processes=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
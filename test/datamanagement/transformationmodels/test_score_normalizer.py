@@ -0,0 +1,62 @@
+"""Module for Test Score Normalizer"""
+import unittest
+from src.datamanagement.transformationmodels import ScoreNormalizer
+
+
+class TestScoreNormalizer(unittest.TestCase):
+    """
+    Test class for ScoreNormalizer Unit Testing.
+    """
+    # pylint: disable=abstract-class-instantiated, unused-variable, too-few-public-methods
+
+    def setUp(self):
+        """
+        Method to define test variables.
+        """
+        self.test_data = [
+            {
+                "model_output": {
+                    "vader": {
+                        "title_sentiment": 0.5,
+                        "selftext_sentiment": -0.2,
+                        "comments_sentiment": [0.1, 0.9, -1.5]
+                    },
+                    "textblob": {
+                        "title_sentiment": 1.0,
+                        "comments_sentiment": []
+                    }
+                }
+            }
+        ]
+        self.normalizer = ScoreNormalizer()
+
+    def test_normalized_scores(self):
+        """
+        Method to test that flat normalized scores are stored for each model.
+        """
+        result = self.normalizer.apply(self.test_data)
+        vader_scores = result[0]["normalized_scores"]["vader"]
+        textblob_scores = result[0]["normalized_scores"]["textblob"]
+
+        self.assertAlmostEqual(vader_scores["title_sentiment"], 75.0)
+        self.assertAlmostEqual(vader_scores["selftext_sentiment"], 40.0)
+        # Comment scores are clamped before being averaged: (55 + 95 + 0) / 3
+        self.assertAlmostEqual(vader_scores["comments_sentiment"], 50.0)
+        self.assertEqual(vader_scores["comments_count"], 3)
+        self.assertEqual(vader_scores["score_range"], [-1, 1])
+
+        self.assertAlmostEqual(textblob_scores["title_sentiment"], 100.0)
+        self.assertNotIn("selftext_sentiment", textblob_scores)
+        self.assertEqual(textblob_scores["comments_sentiment"], 0.0)
+        self.assertEqual(textblob_scores["comments_count"], 0)
+
+    def test_no_model_output(self):
+        """
+        Method to test that posts without model output are left unchanged.
+        """
+        result = self.normalizer.apply([{"selftext": "test"}])
+        self.assertEqual(result, [{"selftext": "test"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Module for Test Sentiment Cache"""
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from src.datamanagement.transformationmodels import SentimentCache, SQLiteSentimentStore, MongoSentimentStore
+from src.datamanagement.transformationmodels.sentiment_cache import collect_texts
+
+
+class TestSentimentCache(unittest.TestCase):
+    """
+    Test class for SentimentCache Unit Testing.
+    """
+
+    def setUp(self):
+        """
+        Method to define test variables.
+        """
+        self.compute = MagicMock(side_effect=lambda text: float(len(text)))
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'cache.db')
+
+    def tearDown(self):
+        """
+        Method to clean up the temporary directory.
+        """
+        self.temp_dir.cleanup()
+
+    def test_score_counts_hits_and_misses(self):
+        """
+        Method to test that a repeated text is only computed once.
+        """
+        cache = SentimentCache('vader', '3.3.2')
+
+        self.assertEqual(cache.score("hello", self.compute), 5.0)
+        self.assertEqual(cache.score("hello", self.compute), 5.0)
+        self.assertEqual(cache.score("hi", self.compute), 2.0)
+
+        self.assertEqual(self.compute.call_count, 2)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2, 'hit_rate': 1 / 3, 'size': 2})
+
+    def test_build_key_depends_on_model_and_version(self):
+        """
+        Method to test that the key of a text differs between models and versions.
+        """
+        keys = {
+            SentimentCache('vader', '3.3.2').build_key("hello"),
+            SentimentCache('vader', '3.3.3').build_key("hello"),
+            SentimentCache('textblob', '3.3.2').build_key("hello")
+        }
+
+        self.assertEqual(len(keys), 3)
+
+    def test_least_recently_used_score_is_evicted(self):
+        """
+        Method to test that the in-memory tier is bounded.
+        """
+        cache = SentimentCache('vader', '3.3.2', max_size=2)
+
+        cache.score("a", self.compute)
+        cache.score("b", self.compute)
+        cache.score("a", self.compute)
+        cache.score("c", self.compute)
+
+        self.assertEqual(len(cache.scores), 2)
+        self.assertIn(cache.build_key("a"), cache.scores)
+        self.assertNotIn(cache.build_key("b"), cache.scores)
+
+    def test_invalid_max_size(self):
+        """
+        Method to test that the in-memory tier cannot be empty.
+        """
+        with self.assertRaises(ValueError):
+            SentimentCache('vader', '3.3.2', max_size=0)
+
+    def test_sqlite_store_persists_scores_between_caches(self):
+        """
+        Method to test that flushed scores are reused by a later cache.
+        """
+        cache = SentimentCache('vader', '3.3.2', store=SQLiteSentimentStore(self.path))
+        cache.score("hello", self.compute)
+        cache.flush()
+
+        cache = SentimentCache('vader', '3.3.2', store=SQLiteSentimentStore(self.path))
+        cache.prefetch(["hello", "unknown"])
+
+        self.assertEqual(cache.score("hello", self.compute), 5.0)
+        self.assertEqual(self.compute.call_count, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_prefetch_larger_than_max_size(self):
+        """
+        Method to test that a batch with more texts than the in-memory tier holds reuses every prefetched score.
+        """
+        cache = SentimentCache('vader', '3.3.2', store=SQLiteSentimentStore(self.path))
+        texts = [f"text {index}" for index in range(5)]
+        for text in texts:
+            cache.score(text, self.compute)
+        cache.flush()
+        self.compute.reset_mock()
+
+        cache = SentimentCache('vader', '3.3.2', max_size=2, store=SQLiteSentimentStore(self.path))
+        cache.prefetch(texts)
+        for text in texts:
+            cache.score(text, self.compute)
+
+        self.compute.assert_not_called()
+        self.assertEqual(cache.hits, 5)
+        self.assertEqual(len(cache.scores), 2)
+
+        cache.flush()
+        self.assertEqual(cache.prefetched_scores, {})
+
+    def test_sqlite_store_is_picklable(self):
+        """
+        Method to test that an opened store can be sent to worker processes.
+        """
+        store = SQLiteSentimentStore(self.path)
+        store.set_many({'key': 0.5})
+
+        store = pickle.loads(pickle.dumps(store))
+
+        self.assertEqual(store.get_many(['key', 'missing']), {'key': 0.5})
+
+    @patch('src.datamanagement.transformationmodels.sentiment_cache.DataClientManager')
+    def test_mongo_store(self, mock_manager):
+        """
+        Method to test that the Mongo store queries and upserts the cache keys as '_id'.
+        """
+        mock_client = mock_manager.get_database_client.return_value
+        mock_client.load_data.return_value = [{'_id': 'key', 'score': 0.5}]
+        store = MongoSentimentStore(MagicMock())
+
+        self.assertEqual(store.get_many(['key', 'missing']), {'key': 0.5})
+        mock_client.load_data.assert_called_once_with(filters={'_id': {'$in': ['key', 'missing']}})
+
+        store.set_many({'other': -0.5})
+        mock_client.upsert_data.assert_called_once_with([{'_id': 'other', 'score': -0.5}])
+
+    @patch('src.datamanagement.transformationmodels.sentiment_cache.DataClientManager')
+    def test_mongo_store_queries_in_batches(self, mock_manager):
+        """
+        Method to test that the Mongo store looks up many keys in several queries.
+        """
+        mock_client = mock_manager.get_database_client.return_value
+        mock_client.load_data.side_effect = lambda filters: [
+            {'_id': key, 'score': 0.5} for key in filters['_id']['$in'] if key != 'key_1']
+        store = MongoSentimentStore(MagicMock())
+        store.QUERY_BATCH_SIZE = 2
+
+        scores = store.get_many([f'key_{index}' for index in range(5)])
+
+        self.assertEqual(sorted(scores), ['key_0', 'key_2', 'key_3', 'key_4'])
+        self.assertEqual([len(call.kwargs['filters']['_id']['$in']) for call in mock_client.load_data.call_args_list],
+                         [2, 2, 1])
+        mock_manager.get_database_client.assert_called_once()
+        mock_client.close.assert_called_once()
+
+    def test_collect_texts(self):
+        """
+        Method to test that the selftext, title and comments of the posts are collected.
+        """
+        data = [{'title': "t", 'selftext': "s", 'comments': ["c1", "c2"]}, {'title': "t2"}]
+
+        self.assertEqual(collect_texts(data), ["s", "t", "c1", "c2", "t2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,6 +42,21 @@ class TestVaderSentimentAnalysis(unittest.TestCase):
             self.assertIn("title_sentiment", post["model_output"]["vader"])
             self.assertIn("comments_sentiment", post["model_output"]["vader"])
 
+    def test_cached_sentiment_analysis(self):
+        """
+        Method to test that cached scores match the scores of the analyzer.
+        """
+        data = [{"title": "Python is great!", "comments": ["Python is great!", "So powerful!"]}]
+
+        result = self.analysis.apply(data)
+
+        scores = result[0]["model_output"]["vader"]
+        self.assertEqual(scores["title_sentiment"],
+                         self.analysis.analyzer.polarity_scores("Python is great!")["compound"])
+        self.assertEqual(scores["comments_sentiment"][0], scores["title_sentiment"])
+        self.assertEqual(self.analysis.cache.hits, 1)
+        self.assertEqual(self.analysis.cache.misses, 2)
+
     def test_empty_sentiment_analysis(self):
         """
         Method to test sentiment analysis when no selftext, title, or comments exist.
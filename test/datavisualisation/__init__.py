@@ -0,0 +1,6 @@
+"""Tests for the Data Visualisation Package."""
+import os
+import sys
+
+# The package imports custom_types as a top-level package, as DVMain is run from the src directory
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
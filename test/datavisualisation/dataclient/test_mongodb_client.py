@@ -0,0 +1,60 @@
+"""Module for Test MongoDBClient"""
+import unittest
+from unittest.mock import patch, MagicMock
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from src.datavisualisation.dataclient import MongoDBClient, DataClientConfig, PartialWriteError
+
+
+class TestMongoDBClient(unittest.TestCase):
+    """
+    Test class for MongoDBClient Unit Testing.
+    """
+
+    @patch("src.datavisualisation.dataclient.mongodb_client.MongoClient")
+    def setUp(self, mock_mongo_client):
+        """
+        Set up method for defining common test variables and mock objects.
+        """
+        self.mock_collection = MagicMock()
+        mock_mongo_client.return_value.__getitem__.return_value.__getitem__.return_value = self.mock_collection
+
+        self.config = DataClientConfig(
+            db_type="mongodb", uri="mongodb://localhost", db_name="test_db", collection="test_collection"
+        )
+        self.client = MongoDBClient(self.config)
+
+    def test_upsert_data(self):
+        """
+        Method to test upserting data with a single unordered bulk write.
+        """
+        self.mock_collection.bulk_write.return_value = MagicMock(upserted_count=0, modified_count=1)
+
+        results = self.client.upsert_data([{"indicatorName": "apple", "resultsByDay": []}],
+                                          key_field="indicatorName")
+
+        self.mock_collection.bulk_write.assert_called_once_with(
+            [UpdateOne({"indicatorName": "apple"}, {"$set": {"indicatorName": "apple", "resultsByDay": []}},
+                       upsert=True)],
+            ordered=False
+        )
+        self.assertEqual(results, [{"upserted": 0, "modified": 1, "failed": 0}])
+
+    def test_upsert_data_partial_failure(self):
+        """
+        Method to test that failed writes are raised once every batch was written.
+        """
+        self.mock_collection.bulk_write.side_effect = [
+            BulkWriteError({"nUpserted": 1, "nModified": 0, "writeErrors": [{"index": 0, "errmsg": "error"}]}),
+            MagicMock(upserted_count=1, modified_count=0)
+        ]
+
+        with self.assertRaises(PartialWriteError) as context:
+            self.client.upsert_data([{"_id": 1}, {"_id": 2}, {"_id": 3}], batch_size=2)
+
+        self.assertEqual(self.mock_collection.bulk_write.call_count, 2)
+        self.assertEqual(context.exception.failed_keys, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()